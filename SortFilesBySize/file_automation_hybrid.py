@@ -8,8 +8,10 @@ License: Proprietary - See LICENSE file
 """
 
 import rumps
+import asyncio
 import subprocess
 import threading
+import hashlib
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 import sys
@@ -22,6 +24,15 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from system_monitor import SystemMonitor
 from file_organizer import FileOrganizer
+from scan_index import ScanIndex
+from watcher import IndexWatcher
+from async_scan import AsyncFileOrganizer, BackgroundLoop, CancellationToken, ScanCancelled
+from records import FileRecords
+from error_ledger import ErrorLedger
+from snapshots import snapshot_path
+from growth import GrowthStore
+from export import export_rows
+from filters import FileFilter, parse_size, parse_time
 
 
 class FileResultsWindow:
@@ -31,11 +42,37 @@ class FileResultsWindow:
         self.parent_app = parent_app
         self.window = None
         self.tree = None
-        self.results: List[Tuple[int, str]] = []
-
-    def show(self, scan_path: str, results: List[Tuple[int, str]]):
+        self.dir_tree = None
+        self.category_tree = None
+        self.change_tree = None
+        self.change_label = None
+        self.notebook = None
+        self.scan_path: Optional[str] = None
+        self.results = FileRecords()
+        self.stats: Optional[Dict] = None
+        self.directories: Optional[Dict] = None
+        self.categories: Optional[Dict] = None
+        self.errors: Optional[ErrorLedger] = None
+        self.changes: Optional[Dict] = None
+
+    def show(
+        self,
+        scan_path: str,
+        results: FileRecords,
+        stats: Optional[Dict] = None,
+        directories: Optional[Dict] = None,
+        categories: Optional[Dict] = None,
+        errors: Optional[ErrorLedger] = None,
+        changes: Optional[Dict] = None
+    ):
         """Display scan results in a professional table."""
+        self.scan_path = scan_path
         self.results = results
+        self.stats = stats
+        self.directories = directories
+        self.categories = categories
+        self.errors = errors
+        self.changes = changes
 
         if self.window is None or not self.window.winfo_exists():
             self._create_window()
@@ -76,9 +113,13 @@ class FileResultsWindow:
         self.summary_label = ttk.Label(header_frame, text="")
         self.summary_label.pack(side=tk.RIGHT)
 
+        # Files and folders tabs
+        self.notebook = ttk.Notebook(self.window)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
         # Treeview with scrollbar
-        tree_frame = ttk.Frame(self.window)
-        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        tree_frame = ttk.Frame(self.notebook)
+        self.notebook.add(tree_frame, text="📄 Largest Files")
 
         scrollbar = ttk.Scrollbar(tree_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -107,6 +148,10 @@ class FileResultsWindow:
 
         self.tree.pack(fill=tk.BOTH, expand=True)
 
+        self._create_folders_tab()
+        self._create_categories_tab()
+        self._create_changes_tab()
+
         # Button frame
         button_frame = ttk.Frame(self.window)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -131,7 +176,7 @@ class FileResultsWindow:
 
         ttk.Button(
             button_frame,
-            text="💾 Export CSV",
+            text="💾 Export...",
             command=self._export_csv
         ).pack(side=tk.LEFT, padx=5)
 
@@ -141,33 +186,279 @@ class FileResultsWindow:
             command=self.window.destroy
         ).pack(side=tk.RIGHT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="⚠️ Unreadable",
+            command=self._show_errors
+        ).pack(side=tk.RIGHT, padx=5)
+
+    def _create_folders_tab(self):
+        """Create the tab ranking folders by recursive size or file count."""
+        folders_frame = ttk.Frame(self.notebook)
+        self.notebook.add(folders_frame, text="📁 Largest Folders")
+
+        options_frame = ttk.Frame(folders_frame)
+        options_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(options_frame, text="Rank by:").pack(side=tk.LEFT, padx=5)
+        self.dir_rank_var = tk.StringVar(value='by_size')
+        for text, value in [("Total size", 'by_size'), ("Number of files", 'by_count')]:
+            ttk.Radiobutton(
+                options_frame,
+                text=text,
+                variable=self.dir_rank_var,
+                value=value,
+                command=self._populate_directories
+            ).pack(side=tk.LEFT, padx=5)
+
+        scrollbar = ttk.Scrollbar(folders_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.dir_tree = ttk.Treeview(
+            folders_frame,
+            columns=('Size', 'Size_MB', 'Files', 'Name', 'Location'),
+            show='headings',
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.dir_tree.yview)
+
+        self.dir_tree.heading('Size', text='Size (Bytes)')
+        self.dir_tree.heading('Size_MB', text='Size')
+        self.dir_tree.heading('Files', text='Files')
+        self.dir_tree.heading('Name', text='Folder Name')
+        self.dir_tree.heading('Location', text='Location')
+
+        self.dir_tree.column('Size', width=0, stretch=False)  # Hidden, for sorting
+        self.dir_tree.column('Size_MB', width=100)
+        self.dir_tree.column('Files', width=90)
+        self.dir_tree.column('Name', width=230)
+        self.dir_tree.column('Location', width=380)
+
+        self.dir_tree.pack(fill=tk.BOTH, expand=True)
+
+    def _show_errors(self):
+        """Summarize the files and folders the scan could not read."""
+        if not self.errors:
+            messagebox.showinfo("Unreadable Files", "Every file and folder could be read")
+            return
+
+        summary = self.errors.summary()
+        lines = self.errors.lines(top_directories=5)
+        lines.append("")
+        lines.append("Examples:")
+        lines.extend(f"  {path}: {message}" for path, message in summary['examples'][:5])
+        messagebox.showwarning("Unreadable Files", "\n".join(lines))
+
+    def _populate_directories(self):
+        """Fill the folders tab with the selected ranking."""
+        for item in self.dir_tree.get_children():
+            self.dir_tree.delete(item)
+
+        if not self.directories:
+            return
+
+        for entry in self.directories[self.dir_rank_var.get()]:
+            folder = Path(entry.path)
+            self.dir_tree.insert('', 'end', values=(
+                entry.size,  # Hidden, for sorting
+                self._format_size(entry.size),
+                f"{entry.file_count:,}",
+                folder.name,
+                str(folder.parent)
+            ))
+
+    def _create_categories_tab(self):
+        """Create the tab showing space per category, expandable to extensions."""
+        categories_frame = ttk.Frame(self.notebook)
+        self.notebook.add(categories_frame, text="🗂️ Categories")
+
+        scrollbar = ttk.Scrollbar(categories_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Tree column holds the category, with its extensions as children
+        self.category_tree = ttk.Treeview(
+            categories_frame,
+            columns=('Size', 'Size_MB', 'Share', 'Files'),
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.category_tree.yview)
+
+        self.category_tree.heading('#0', text='Category / Extension')
+        self.category_tree.heading('Size', text='Size (Bytes)')
+        self.category_tree.heading('Size_MB', text='Size')
+        self.category_tree.heading('Share', text='Share')
+        self.category_tree.heading('Files', text='Files')
+
+        self.category_tree.column('#0', width=300)
+        self.category_tree.column('Size', width=0, stretch=False)  # Hidden, for sorting
+        self.category_tree.column('Size_MB', width=120)
+        self.category_tree.column('Share', width=100)
+        self.category_tree.column('Files', width=120)
+
+        self.category_tree.pack(fill=tk.BOTH, expand=True)
+
+    def _populate_categories(self):
+        """Fill the categories tab, largest category first."""
+        for item in self.category_tree.get_children():
+            self.category_tree.delete(item)
+
+        if not self.categories:
+            return
+
+        total = sum(size for _, _, size in self.categories['categories']) or 1
+        parents = {}
+        for category, count, size in self.categories['categories']:
+            parents[category] = self.category_tree.insert('', 'end', text=category, values=(
+                size,  # Hidden, for sorting
+                self._format_size(size),
+                f"{size / total:.1%}",
+                f"{count:,}"
+            ))
+        for ext, category, count, size in self.categories['extensions']:
+            self.category_tree.insert(parents[category], 'end', text=ext or '(none)', values=(
+                size,
+                self._format_size(size),
+                f"{size / total:.1%}",
+                f"{count:,}"
+            ))
+
+    def _create_changes_tab(self):
+        """Create the tab comparing this scan with the previous one of the folder."""
+        changes_frame = ttk.Frame(self.notebook)
+        self.notebook.add(changes_frame, text="📈 Changes")
+
+        self.change_label = ttk.Label(changes_frame, text="")
+        self.change_label.pack(fill=tk.X, pady=5)
+
+        scrollbar = ttk.Scrollbar(changes_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Tree column holds the kind of change, with the files and folders as children
+        self.change_tree = ttk.Treeview(
+            changes_frame,
+            columns=('Size', 'Change', 'Name', 'Location'),
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.change_tree.yview)
+
+        self.change_tree.heading('#0', text='Change')
+        self.change_tree.heading('Size', text='Change (Bytes)')
+        self.change_tree.heading('Change', text='Size Change')
+        self.change_tree.heading('Name', text='Name')
+        self.change_tree.heading('Location', text='Location')
+
+        self.change_tree.column('#0', width=170)
+        self.change_tree.column('Size', width=0, stretch=False)  # Hidden, for sorting
+        self.change_tree.column('Change', width=110)
+        self.change_tree.column('Name', width=230)
+        self.change_tree.column('Location', width=350)
+
+        self.change_tree.pack(fill=tk.BOTH, expand=True)
+
+    def _populate_changes(self):
+        """Fill the changes tab, biggest growth first."""
+        for item in self.change_tree.get_children():
+            self.change_tree.delete(item)
+
+        diff = self.changes
+        if not diff:
+            self.change_label.config(text="No earlier scan of this folder to compare with yet")
+            return
+
+        since = datetime.fromtimestamp(diff['old']['created']).strftime('%Y-%m-%d %H:%M')
+        counts = diff['counts']
+        net = diff['net_change']
+        self.change_label.config(text=(
+            f"Since {since}: {'+' if net >= 0 else '-'}{self._format_size(abs(net))} • "
+            f"{counts['added']:,} added • {counts['removed']:,} removed • "
+            f"{counts['grown']:,} grew • {counts['shrunk']:,} shrank"
+        ))
+
+        groups = [
+            ("Folders that grew", [(entry.size, entry.path) for entry in diff['directories_grown']]),
+            ("Files that grew", [(change.delta, change.path) for change in diff['grown']]),
+            ("New files", diff['added']),
+            ("Removed files", [(-size, path) for size, path in diff['removed']]),
+            ("Files that shrank", [(change.delta, change.path) for change in diff['shrunk']]),
+            ("Folders that shrank", [(-entry.size, entry.path) for entry in diff['directories_shrunk']]),
+        ]
+        for title, entries in groups:
+            if not entries:
+                continue
+            parent = self.change_tree.insert('', 'end', text=f"{title} ({len(entries)})", open=True)
+            for delta, path in entries:
+                item = Path(path)
+                self.change_tree.insert(parent, 'end', values=(
+                    delta,  # Hidden, for sorting
+                    f"{'+' if delta >= 0 else '-'}{self._format_size(abs(delta))}",
+                    item.name,
+                    str(item.parent)
+                ))
+
+    def _active_tree(self) -> ttk.Treeview:
+        """Return the table of the tab being shown."""
+        trees = (self.tree, self.dir_tree, self.category_tree, self.change_tree)
+        return trees[self.notebook.index(self.notebook.select())]
+
+    def _selected_path(self) -> Optional[Path]:
+        """Return the file or folder selected in the visible tab."""
+        tree = self._active_tree()
+        if tree is self.category_tree:
+            messagebox.showwarning("Files and Folders Only", "Categories have no single location")
+            return None
+
+        selection = tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select an item first")
+            return None
+
+        values = tree.item(selection[0])['values']
+        if not values:
+            messagebox.showwarning("No Selection", "Please select a file or folder, not a group")
+            return None
+        if tree is self.dir_tree:
+            return Path(str(values[4])) / str(values[3])
+        return Path(str(values[3])) / str(values[2])
+
     def _populate_results(self):
         """Fill the tree with results."""
         # Clear existing items
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        total_size = sum(size for size, _ in self.results)
-        self.summary_label.config(
-            text=f"Found {len(self.results)} files • Total: {self._format_size(total_size)}"
-        )
-
-        # Add results
-        for size, path in self.results:
-            file_path = Path(path)
-            try:
-                modified = datetime.fromtimestamp(file_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M')
-            except:
+        total_size = sum(self.results.sizes)
+        summary = f"Found {len(self.results)} files • Total: {self._format_size(total_size)}"
+        if self.stats:
+            summary += (
+                f" • Scanned {self.stats['file_count']:,} files"
+                f" ({self._format_size(self.stats['total_size'])})"
+            )
+        if self.errors:
+            summary += f" • ⚠️ {len(self.errors):,} unreadable"
+        self.summary_label.config(text=summary)
+
+        # Add results; modification times come from the scan, not a new stat
+        records = self.results
+        for index in range(len(records)):
+            size = records.sizes[index]
+            mtime_ns = records.mtimes[index]
+            if mtime_ns:
+                modified = datetime.fromtimestamp(mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M')
+            else:
                 modified = "Unknown"
 
             self.tree.insert('', 'end', values=(
                 size,  # Hidden, for sorting
                 self._format_size(size),
-                file_path.name,
-                str(file_path.parent),
+                records.basename(index),
+                records.directory(index),
                 modified
             ))
 
+        self._populate_directories()
+        self._populate_categories()
+        self._populate_changes()
+
     def _format_size(self, size_bytes: int) -> str:
         """Format bytes to human-readable size."""
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -177,21 +468,19 @@ class FileResultsWindow:
         return f"{size_bytes:.1f} PB"
 
     def _reveal_in_finder(self):
-        """Reveal selected file in Finder."""
-        selection = self.tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a file first")
+        """Reveal selected file or folder in Finder."""
+        full_path = self._selected_path()
+        if full_path is None:
             return
 
-        item = self.tree.item(selection[0])
-        location = item['values'][3]
-        name = item['values'][2]
-        full_path = Path(location) / name
-
         subprocess.run(['open', '-R', str(full_path)])
 
     def _move_to_trash(self):
         """Move selected file to trash."""
+        if self._active_tree() is not self.tree:
+            messagebox.showwarning("Files Only", "Only files can be moved to the trash from here")
+            return
+
         selection = self.tree.selection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a file first")
@@ -211,38 +500,66 @@ class FileResultsWindow:
                 messagebox.showerror("Error", f"Failed to move to trash: {e}")
 
     def _copy_path(self):
-        """Copy file path to clipboard."""
-        selection = self.tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a file first")
+        """Copy file or folder path to clipboard."""
+        full_path = self._selected_path()
+        if full_path is None:
             return
 
-        item = self.tree.item(selection[0])
-        location = item['values'][3]
-        name = item['values'][2]
-        full_path = Path(location) / name
-
         subprocess.run(['osascript', '-e', f'set the clipboard to "{full_path}"'])
-        messagebox.showinfo("Copied", "File path copied to clipboard")
+        messagebox.showinfo("Copied", "Path copied to clipboard")
 
     def _export_csv(self):
-        """Export results to CSV."""
+        """Export every scanned file, or the current tab, to CSV or NDJSON."""
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("NDJSON files", "*.ndjson"),
+                       ("Compressed", "*.csv.gz *.ndjson.gz"), ("All files", "*.*")]
         )
 
-        if file_path:
-            import csv
-            with open(file_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Size (Bytes)', 'Size', 'Name', 'Location', 'Modified'])
+        if not file_path:
+            return
+        if not file_path.lower().endswith(('.csv', '.ndjson', '.jsonl', '.csv.gz', '.ndjson.gz', '.jsonl.gz')):
+            file_path += '.csv'
+
+        tree = self._active_tree()
+        if tree is self.tree and self.scan_path:
+            # Every file of the scan, streamed from the index rather than the table.
+            # A token of its own: the export neither cancels nor is cancelled by a menu scan
+            future = self.parent_app.scan_loop.submit(self.parent_app.async_organizer.export_files(
+                self.scan_path, file_path, token=CancellationToken(),
+                file_filter=self.parent_app.preferences_window.file_filter()
+            ))
+
+            def done(future):
+                try:
+                    message = f"{future.result():,} files exported to {file_path}"
+                except ScanCancelled:
+                    return
+                except Exception as e:
+                    message = f"Export failed: {e}"
+                self.window.after(0, messagebox.showinfo, "Export", message)
+
+            future.add_done_callback(done)
+            return
+
+        if tree is self.dir_tree and self.directories:
+            count = export_rows(file_path, self.directories[self.dir_rank_var.get()])
+            messagebox.showinfo("Exported", f"{count:,} folders exported to {file_path}")
+            return
 
-                for item in self.tree.get_children():
-                    values = self.tree.item(item)['values']
-                    writer.writerow(values)
+        # Small grouped tables are exported as shown
+        fields = [tree.heading(column)['text'] for column in tree['columns']]
+        if tree in (self.category_tree, self.change_tree):
+            # Groups followed by their children, labelled by the tree column
+            fields.insert(0, tree.heading('#0')['text'])
+            rows = [[tree.item(row)['text']] + list(tree.item(row)['values'])
+                    for item in tree.get_children()
+                    for row in (item,) + tree.get_children(item)]
+        else:
+            rows = [tree.item(item)['values'] for item in tree.get_children()]
+        export_rows(file_path, rows, fields=fields)
 
-            messagebox.showinfo("Exported", f"Results exported to {file_path}")
+        messagebox.showinfo("Exported", f"Results exported to {file_path}")
 
 
 class PreferencesWindow:
@@ -251,6 +568,16 @@ class PreferencesWindow:
     def __init__(self, parent_app):
         self.parent_app = parent_app
         self.window = None
+        # Saved scan filter: the FileFilter arguments, None for all files
+        self.filter_settings: Optional[Dict] = None
+        # Number of files and folders listed after a scan
+        self.result_limit = 50
+
+    def file_filter(self) -> Optional[FileFilter]:
+        """Return the saved scan filter, or None to scan all files."""
+        if not self.filter_settings:
+            return None
+        return FileFilter(**self.filter_settings)
 
     def show(self):
         """Show preferences window."""
@@ -368,7 +695,7 @@ class PreferencesWindow:
         # Number of results
         ttk.Label(frame, text="Number of Results to Show:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.result_count = ttk.Spinbox(frame, from_=10, to=500, width=10)
-        self.result_count.set(50)
+        self.result_count.set(self.result_limit)
         self.result_count.grid(row=1, column=1, sticky=tk.W, padx=5)
 
         # Include hidden files
@@ -379,6 +706,27 @@ class PreferencesWindow:
             variable=self.include_hidden
         ).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=10)
 
+        # Filters applied to every scan (empty fields match everything)
+        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=3, column=0, columnspan=3, sticky=tk.EW, pady=5)
+        settings = self.filter_settings or {}
+        fields = [
+            ("Extensions (e.g. .jpg .heic):", "extensions", " ".join(settings.get("extensions", ()))),
+            ("Name Patterns (e.g. IMG_*):", "globs", " ".join(settings.get("globs", ()))),
+            ("Name Regex:", "regex", settings.get("regex") or ""),
+            ("Minimum Size (e.g. 10M):", "min_size", settings.get("min_size") or ""),
+            ("Maximum Size (e.g. 2G):", "max_size", settings.get("max_size") or ""),
+            ("Modified After (YYYY-MM-DD):", "modified_after",
+             datetime.fromtimestamp(settings["modified_after"]).strftime("%Y-%m-%d")
+             if settings.get("modified_after") is not None else ""),
+        ]
+        self.filter_entries = {}
+        for row, (label, key, value) in enumerate(fields, start=4):
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=3)
+            entry = ttk.Entry(frame, width=30)
+            entry.insert(0, str(value))
+            entry.grid(row=row, column=1, sticky=tk.W, padx=5)
+            self.filter_entries[key] = entry
+
     def _create_license_tab(self, parent):
         """Create license tab."""
         frame = ttk.LabelFrame(parent, text="License Information", padding=15)
@@ -431,9 +779,38 @@ class PreferencesWindow:
         import webbrowser
         webbrowser.open("https://gumroad.com/l/file-automation-suite")
 
+    def _read_filter_settings(self) -> Optional[Dict]:
+        """Parse the filter fields into FileFilter arguments (ValueError if invalid)."""
+        values = {key: entry.get().strip() for key, entry in self.filter_entries.items()}
+        settings = {
+            "extensions": values["extensions"].replace(",", " ").split(),
+            "globs": values["globs"].split(),
+            "regex": values["regex"] or None,
+            "min_size": parse_size(values["min_size"]) if values["min_size"] else None,
+            "max_size": parse_size(values["max_size"]) if values["max_size"] else None,
+            "modified_after": parse_time(values["modified_after"]) if values["modified_after"] else None,
+        }
+        if not any(settings.values()):
+            return None
+        FileFilter(**settings)  # Validate before saving
+        return settings
+
     def _save_preferences(self):
         """Save preferences."""
-        # TODO: Implement actual preference saving
+        try:
+            result_limit = int(self.result_count.get())
+            if result_limit < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Number", "Number of results must be a positive whole number")
+            return
+        try:
+            self.filter_settings = self._read_filter_settings()
+        except ValueError as e:
+            messagebox.showerror("Invalid Filter", str(e))
+            return
+        self.result_limit = result_limit
+        # TODO: Persist preferences across launches
         messagebox.showinfo("Saved", "Preferences saved successfully!")
         self.window.destroy()
 
@@ -459,7 +836,7 @@ class SystemDashboardWindow:
         """Create dashboard window."""
         self.window = tk.Toplevel()
         self.window.title("File Automation Suite - System Health")
-        self.window.geometry("700x500")
+        self.window.geometry("700x740")
 
         # Set custom app icon
         try:
@@ -518,15 +895,140 @@ class SystemDashboardWindow:
         self.status_labels['mem'] = ttk.Label(mem_frame, text="")
         self.status_labels['mem'].pack(anchor=tk.W)
 
+        # File size distribution of the last scanned folder
+        sizes_frame = ttk.LabelFrame(self.window, text="File Sizes", padding=10)
+        sizes_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.status_labels['sizes'] = ttk.Label(sizes_frame, text="Analyzing...")
+        self.status_labels['sizes'].pack(anchor=tk.W)
+        self.sizes_canvas = tk.Canvas(sizes_frame, height=90, highlightthickness=0)
+        self.sizes_canvas.pack(fill=tk.X, pady=5)
+
+        # Growth history of the last scanned folder and disk-full forecast
+        growth_frame = ttk.LabelFrame(self.window, text="Growth", padding=10)
+        growth_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.status_labels['growth'] = ttk.Label(growth_frame, text="Analyzing...", justify=tk.LEFT)
+        self.status_labels['growth'].pack(anchor=tk.W)
+
         # Button frame
         button_frame = ttk.Frame(self.window)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        ttk.Button(button_frame, text="🔄 Refresh", command=self._update_display).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="🔄 Refresh", command=self._refresh).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
 
         # Initial update
+        self._refresh()
+
+    def _refresh(self):
+        """Update system stats now and the size distribution in the background."""
         self._update_display()
+        # One request for both queries: a refresh supersedes only the previous refresh
+        token = self.parent_app.dashboard_organizer.new_token()
+        self._update_distribution(token)
+        self._update_growth(token)
+
+    def _update_distribution(self, token: CancellationToken):
+        """Compute the size distribution of the last scanned folder off the Tk thread."""
+        scan_path = self.parent_app.last_scan_path or str(Path.home() / "Downloads")
+        self.status_labels['sizes'].config(text=f"Analyzing {Path(scan_path).name}...")
+
+        # Answered from the scan index, so a folder scanned before is cheap
+        future = self.parent_app.scan_loop.submit(
+            self.parent_app.dashboard_organizer.get_size_distribution(scan_path, token=token)
+        )
+
+        def done(future):
+            try:
+                distribution = future.result()
+            except ScanCancelled:
+                return
+            except Exception as e:
+                distribution = e
+            if self.window is not None and self.window.winfo_exists():
+                self.window.after(0, self._show_distribution, scan_path, distribution)
+
+        future.add_done_callback(done)
+
+    def _update_growth(self, token: CancellationToken):
+        """Add a growth sample for the last scanned folder and forecast the disk."""
+        scan_path = self.parent_app.last_scan_path or str(Path.home() / "Downloads")
+        store = self.parent_app.growth_store
+
+        async def sample():
+            # Totals come from the scan index: no traversal for a watched folder
+            await self.parent_app.dashboard_organizer.record_growth(
+                scan_path, token=token, store=store
+            )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, store.forecast, scan_path)
+
+        def done(future):
+            try:
+                forecast = future.result()
+            except ScanCancelled:
+                return
+            except Exception as e:
+                forecast = e
+            if self.window is not None and self.window.winfo_exists():
+                self.window.after(0, self._show_growth, scan_path, forecast)
+
+        self.parent_app.scan_loop.submit(sample()).add_done_callback(done)
+
+    def _show_growth(self, scan_path: str, forecast):
+        """Show the fill rate, the expected full date and the fastest growing folders."""
+        label = self.status_labels['growth']
+        if isinstance(forecast, Exception):
+            label.config(text=f"Could not record growth of {scan_path}: {forecast}")
+            return
+        if forecast.samples < 2:
+            label.config(text="Collecting history; the forecast appears after the next scan.")
+            return
+
+        fmt = self.parent_app.file_organizer.format_size
+        rate = forecast.rate
+        lines = [f"{forecast.volume}: {'+' if rate >= 0 else '-'}{fmt(int(abs(rate)))}/day"]
+        if forecast.days_left is None:
+            lines[0] += " • not filling up"
+        else:
+            full = datetime.fromtimestamp(forecast.full_at).strftime('%Y-%m-%d')
+            lines[0] += f" • full in {forecast.days_left:,.0f} days (around {full})"
+        for trend in forecast.folders[:3]:
+            lines.append(f"   +{fmt(int(trend.rate))}/day  {trend.path}")
+        label.config(text="\n".join(lines))
+
+    def _show_distribution(self, scan_path: str, distribution):
+        """Show percentiles and draw the log2 histogram."""
+        canvas = self.sizes_canvas
+        canvas.delete("all")
+        if isinstance(distribution, Exception):
+            self.status_labels['sizes'].config(text=f"Could not analyze {scan_path}: {distribution}")
+            return
+        if not distribution['file_count']:
+            self.status_labels['sizes'].config(text=f"No files in {scan_path}")
+            return
+
+        fmt = self.parent_app.file_organizer.format_size
+        self.status_labels['sizes'].config(text=(
+            f"{Path(scan_path).name}: median {fmt(distribution['p50'])} • "
+            f"p90 {fmt(distribution['p90'])} • p99 {fmt(distribution['p99'])} • "
+            f"largest 1% of files hold {distribution['top1_share']:.0%}"
+        ))
+
+        # One bar per power of two, by the space the bucket takes
+        buckets = distribution['buckets']
+        width = max(canvas.winfo_width(), 600)
+        bar_width = width / len(buckets)
+        largest = max(total for _, _, _, total in buckets) or 1
+        for i, (low, _, count, total) in enumerate(buckets):
+            height = 70 * total / largest
+            x = i * bar_width
+            canvas.create_rectangle(x + 1, 75 - height, x + bar_width - 1, 75,
+                                    fill="#4a90d9", outline="")
+            if i % max(1, len(buckets) // 8) == 0:
+                canvas.create_text(x + 1, 85, text=fmt(low).replace('.00', ''), anchor=tk.W,
+                                   font=('Helvetica', 8))
 
     def _update_display(self):
         """Update dashboard with current stats."""
@@ -574,9 +1076,27 @@ class FileAutomationApp(rumps.App):
 
         # Initialize components
         self.system_monitor = SystemMonitor(disk_threshold=20, cpu_threshold=75)
-        self.file_organizer = FileOrganizer()
+        # A menu bar app has no terminal to print progress to
+        self.file_organizer = FileOrganizer(quiet=True)
+        # Repeat scans of the same folder only re-list directories that changed
+        self.scan_index = ScanIndex()
+        # Scans run on a background event loop so they can be cancelled
+        self.scan_loop = BackgroundLoop()
+        # Directory mtimes miss files that grow in place (logs, VM disks,
+        # downloads), so the index is re-listed in full once an hour; the
+        # first scan after a longer break always gets a full refresh
+        index_options = dict(index=self.scan_index, index_max_age=30, index_full_every=3600)
+        self.async_organizer = AsyncFileOrganizer(quiet=True, **index_options)
+        # Dashboard queries are requests of their own, so they never supersede a menu scan
+        self.dashboard_organizer = AsyncFileOrganizer(quiet=True, **index_options)
+        # Folder sizes over time, for the dashboard's disk-full forecast
+        self.growth_store = GrowthStore()
+        # Scanned folders stay current from file-system events afterwards
+        self.index_watchers: Dict[str, IndexWatcher] = {}
         self.license_key: Optional[str] = None
         self.is_licensed = False
+        # Folder of the most recent scan, analyzed by the dashboard
+        self.last_scan_path: Optional[str] = None
 
         # Initialize windows (created on demand)
         self.file_results_window = FileResultsWindow(self)
@@ -633,6 +1153,7 @@ class FileAutomationApp(rumps.App):
                 rumps.MenuItem("✅ Licensed", callback=None),
                 rumps.separator,
                 rumps.MenuItem("🔍 Scan Large Files...", callback=self.scan_large_files_window),
+                rumps.MenuItem("⏹ Cancel Scan", callback=self.cancel_scan),
                 rumps.MenuItem("📊 System Dashboard...", callback=self.show_dashboard_window),
                 rumps.MenuItem("⏰ Time Machine Status", callback=self.time_machine_status),
                 rumps.separator,
@@ -700,6 +1221,7 @@ class FileAutomationApp(rumps.App):
         response = window.run()
         if response.clicked:
             scan_path = response.text.strip() or str(Path.home() / "Downloads")
+            self.last_scan_path = scan_path
 
             # Show progress
             rumps.notification(
@@ -708,21 +1230,84 @@ class FileAutomationApp(rumps.App):
                 message="This may take a moment"
             )
 
-            # Scan in background and show window
-            def scan_and_show():
+            # Scan in background and show window; a newer scan supersedes this one
+            async def scan():
+                token = self.async_organizer.new_token()
+                # Refreshes the index (cancellable) and queries it
+                file_filter = self.preferences_window.file_filter()
+                result_limit = self.preferences_window.result_limit
+                # Only the top files, with the mtimes and inodes the index holds; no second stat
+                records = await self.async_organizer.find_largest_records(
+                    scan_path, top_n=result_limit, token=token, file_filter=file_filter
+                )
+                # The refresh above is what reads the disk
+                errors = self.async_organizer.last_errors
+                # From here on the index follows file-system events
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._watch_folder, scan_path)
+                stats = await self.async_organizer.get_directory_stats(scan_path, token=token)
+                # Ranked from the same index: no further traversal
+                directories = await self.async_organizer.find_largest_directories(
+                    scan_path, top_n=result_limit, token=token, file_filter=file_filter
+                )
+                categories = await self.async_organizer.get_category_breakdown(
+                    scan_path, token=token, file_filter=file_filter
+                )
+                # Compared with the previous scan of this folder, which it then replaces
+                snapshot = self._snapshot_name(scan_path)
+                changes = None
+                if os.path.exists(snapshot_path(snapshot)):
+                    changes = await self.async_organizer.compare_snapshot(
+                        snapshot, scan_path, token=token, top_n=result_limit, save_to=snapshot
+                    )
+                else:
+                    await self.async_organizer.save_snapshot(scan_path, snapshot, token=token)
+                # One more sample of the folder's growth history, from the index
+                await self.async_organizer.record_growth(scan_path, token=token, store=self.growth_store)
+                return records, stats, directories, categories, errors, changes
+
+            def show(future):
                 try:
-                    largest = self.file_organizer.find_largest_files(scan_path, top_n=100)
+                    largest, stats, directories, categories, errors, changes = future.result()
 
                     # Show results in window
-                    self.file_results_window.show(scan_path, largest)
+                    self.file_results_window.show(
+                        scan_path, largest, stats, directories, categories, errors, changes
+                    )
 
+                except ScanCancelled:
+                    pass  # Cancelled by the user or replaced by a newer scan
                 except Exception as e:
                     rumps.alert(
                         title="Scan Error",
                         message=f"Error scanning files: {str(e)}"
                     )
 
-            threading.Thread(target=scan_and_show, daemon=True).start()
+            self.scan_loop.submit(scan()).add_done_callback(show)
+
+    @rumps.clicked("⏹ Cancel Scan")
+    def cancel_scan(self, _):
+        """Stop the running scan."""
+        self.async_organizer.cancel()
+
+    def _snapshot_name(self, scan_path: str) -> str:
+        """Name of the snapshot holding the previous scan of a folder."""
+        digest = hashlib.sha1(os.path.abspath(scan_path).encode('utf-8', 'surrogateescape')).hexdigest()
+        return f"menubar-{digest[:16]}"
+
+    def _watch_folder(self, scan_path: str):
+        """Keep the scan index for a folder current with file-system events."""
+        scan_path = os.path.abspath(scan_path)
+        if scan_path in self.index_watchers:
+            return
+
+        watcher = IndexWatcher(self.scan_index, scan_path)
+        try:
+            watcher.start()
+        except (ImportError, OSError):
+            # No event source on this system; fall back to mtime refreshes
+            return
+        self.index_watchers[scan_path] = watcher
 
     @rumps.clicked("📊 System Dashboard...")
     def show_dashboard_window(self, _):
@@ -28,6 +28,7 @@ for src_dir in SRC_DIRS:
 
 from system_monitor import SystemMonitor
 from file_organizer import FileOrganizer
+from async_scan import AsyncFileOrganizer, BackgroundLoop, ScanCancelled
 
 
 class FileAutomationApp(rumps.App):
@@ -43,6 +44,9 @@ class FileAutomationApp(rumps.App):
         # Initialize components
         self.system_monitor = SystemMonitor(disk_threshold=20, cpu_threshold=75)
         self.file_organizer = FileOrganizer()
+        # Scans run on a background event loop so they can be cancelled
+        self.scan_loop = BackgroundLoop()
+        self.async_organizer = AsyncFileOrganizer()
         self.license_key: Optional[str] = None
         self.is_licensed = False
 
@@ -92,6 +96,7 @@ class FileAutomationApp(rumps.App):
                 rumps.MenuItem("✅ Licensed", callback=None),
                 rumps.separator,
                 rumps.MenuItem("🔍 Find Large Files...", callback=self.find_large_files),
+                rumps.MenuItem("⏹ Cancel Scan", callback=self.cancel_scan),
                 rumps.MenuItem("📊 System Health Check", callback=self.health_check),
                 rumps.MenuItem("⏰ Time Machine Status", callback=self.time_machine_status),
                 rumps.separator,
@@ -204,29 +209,44 @@ class FileAutomationApp(rumps.App):
                 message="This may take a moment"
             )
 
-            # Scan in background
-            def scan_and_notify():
+            # Scan in background; a newer scan supersedes this one
+            def notify(future):
                 try:
-                    largest = self.file_organizer.find_largest_files(scan_path, top_n=10)
+                    report = future.result()
+                    largest = report['largest_files']
+                    stats = report['stats']
 
                     # Format results
                     results = "\n".join([
                         f"{self.file_organizer.format_size(size)} - {Path(path).name}"
                         for size, path in largest
                     ])
+                    if largest:
+                        results += (
+                            f"\n\n{stats['file_count']:,} files scanned, "
+                            f"{self.file_organizer.format_size(stats['total_size'])} total"
+                        )
 
                     # Show results
                     rumps.alert(
                         title=f"Top 10 Largest Files in {Path(scan_path).name}",
                         message=results or "No files found"
                     )
+                except ScanCancelled:
+                    pass  # Cancelled by the user or replaced by a newer scan
                 except Exception as e:
                     rumps.alert(
                         title="Scan Error",
                         message=f"Error scanning files: {str(e)}"
                     )
 
-            threading.Thread(target=scan_and_notify, daemon=True).start()
+            scan = self.async_organizer.analyze_directory(scan_path, top_n=10)
+            self.scan_loop.submit(scan).add_done_callback(notify)
+
+    @rumps.clicked("⏹ Cancel Scan")
+    def cancel_scan(self, _):
+        """Stop the running scan."""
+        self.async_organizer.cancel()
 
     @rumps.clicked("📊 System Health Check")
     def health_check(self, _):
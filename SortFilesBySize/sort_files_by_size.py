@@ -1,35 +1,30 @@
 import os
-import time
-import heapq
+import sys
+
+# Use the shared scandir scanner from the repo's src/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from scanner import Scanner
+from aggregators import TopNCollector
 
 # Search my computer for the largest files and sort by size
 def find_largest_files(start_path, top_n=10):
-    file_sizes = []
     scan_count = 0
+    next_report = 100
     last_dir = start_path
     top_n = max(1, min(top_n, 100)) # Ensure top_n is between 1 and 100
-    # Walk the directory tree
-    for dirpath, dirnames, filenames in os.walk(start_path):
+    scanner = Scanner(include_hidden=True)
+    largest = TopNCollector(top_n) # Only the current top_n stay in memory
+    # Walk the directory tree (one stat per file, no separate getsize call)
+    for dirpath, files in scanner.scan(start_path):
         last_dir = dirpath
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            # Get the file size
-            try:
-                file_size = os.path.getsize(filepath)
-                file_sizes.append((file_size, filepath))
-                scan_count += 1
-                # Print progress every 100 files
-                if scan_count % 100 == 0:
-                    print(f" Scanned {scan_count} files... Last directory: {last_dir}", end="\r")
-            except (OSError, FileNotFoundError):
-                continue
+        largest.add_batch(dirpath, files)
+        scan_count = scanner.file_count
+        # Print progress every 100 files
+        if scan_count >= next_report:
+            next_report = scan_count + 100
+            print(f" Scanned {scan_count} files... Last directory: {last_dir}", end="\r")
 
-    print(f"Scanned {scan_count} files in {dirpath}")
-    largest_files = heapq.nlargest(top_n, file_sizes, key=lambda x: x[0]) # Get the top_n largest files
+    print(f"Scanned {scan_count} files in {start_path}")
+    largest_files = largest.results() # Get the top_n largest files
     print(largest_files)
     return largest_files
-    
-         
-
-
-       
\ No newline at end of file
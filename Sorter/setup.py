@@ -1,5 +1,11 @@
+import os
+import sys
+
 from setuptools import setup
 
+# sorter.py imports its extension map from src/categories.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
 APP = ['sorter.py']
 DATA_FILES = []
 OPTIONS = {
@@ -1,46 +1,20 @@
 import os
+import sys
 import shutil
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
-# Mapping of file extensions to project types
-PROJECT_TYPES = {
-    '.py': 'python',
-    '.js': 'javascript',
-    '.ts': 'typescript',
-    '.tsx': 'typescript',
-    '.jsx': 'javascript',
-    '.java': 'java',
-    '.cpp': 'cpp',
-    '.c': 'c',
-    '.cs': 'csharp',
-    '.php': 'php',
-    '.rb': 'ruby',
-    '.go': 'go',
-    '.rs': 'rust',
-    '.html': 'web',
-    '.htm': 'web',
-    '.css': 'web',
-    '.scss': 'web',
-    '.sass': 'web',
-    '.less': 'web',
-    '.json': 'config',
-    '.xml': 'config',
-    '.yaml': 'config',
-    '.yml': 'config',
-    '.md': 'docs',
-    '.txt': 'docs',
-    '.sh': 'scripts',
-    '.bat': 'scripts',
-    '.ps1': 'scripts',
-    # Add more as needed
-}
+# Mapping of file extensions to project types, shared with the category report
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from categories import PROJECT_TYPES
 
-def sort_files(directory):
+def sort_files(directory, notify=True):
     """
     Sorts files in the given directory into subfolders based on project type inferred from file extension.
     Files with unknown extensions go into 'other' folder.
     Files without extension go into 'no_extension' folder.
+    With notify=False no message boxes are shown, errors are raised, and the
+    number of moved files is returned (for scripts and benchmarks).
     """
     try:
         files_moved = 0
@@ -62,8 +36,12 @@ def sort_files(directory):
                 # Move file
                 shutil.move(filepath, os.path.join(folder_path, filename))
                 files_moved += 1
-        messagebox.showinfo("Success", f"File sorting complete! Moved {files_moved} files.")
+        if notify:
+            messagebox.showinfo("Success", f"File sorting complete! Moved {files_moved} files.")
+        return files_moved
     except OSError as e:
+        if not notify:
+            raise
         messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
 def select_directory():
@@ -71,15 +49,20 @@ def select_directory():
     if directory:
         sort_files(directory)
 
-# GUI
-root = tk.Tk()
-root.title("File Sorter")
-root.geometry("300x100")
+def main():
+    # GUI
+    root = tk.Tk()
+    root.title("File Sorter")
+    root.geometry("300x100")
 
-label = tk.Label(root, text="Click to select a directory and sort its files:")
-label.pack(pady=10)
+    label = tk.Label(root, text="Click to select a directory and sort its files:")
+    label.pack(pady=10)
 
-btn = tk.Button(root, text="Select Directory and Sort", command=select_directory)
-btn.pack()
+    btn = tk.Button(root, text="Select Directory and Sort", command=select_directory)
+    btn.pack()
 
-root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+# Importing the module (e.g. from the benchmarks) must not open a window
+if __name__ == "__main__":
+    main()
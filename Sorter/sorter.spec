@@ -3,7 +3,7 @@
 
 a = Analysis(
     ['sorter.py'],
-    pathex=[],
+    pathex=['../src'],
     binaries=[],
     datas=[],
     hiddenimports=[],
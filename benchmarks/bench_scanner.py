@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Scanner Benchmark - os.walk + getsize vs. scandir engine
+=========================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Compare the original FileOrganizer traversal (os.walk followed by one
+os.path.getsize per file) against the scandir-based Scanner.
+
+Usage:
+    python benchmarks/bench_scanner.py                 # synthetic tree
+    python benchmarks/bench_scanner.py ~/Documents 3   # real tree, 3 runs
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scanner import Scanner
+
+
+def legacy_walk(start_path: str):
+    """Original FileOrganizer traversal: os.walk plus a getsize per file."""
+    file_sizes = []
+    for dirpath, dirnames, filenames in os.walk(start_path):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        for filename in filenames:
+            if filename.startswith('.'):
+                continue
+            filepath = os.path.join(dirpath, filename)
+            try:
+                file_sizes.append((os.path.getsize(filepath), filepath))
+            except OSError:
+                continue
+    return file_sizes
+
+
+def scandir_walk(start_path: str):
+    """Scanner traversal producing the same (size, path) list."""
+    file_sizes = []
+    for dirpath, files in Scanner().scan(start_path):
+        for name, st in files:
+            file_sizes.append((st.st_size, os.path.join(dirpath, name)))
+    return file_sizes
+
+
+def build_tree(root: str, dirs: int = 200, files_per_dir: int = 100) -> None:
+    """Create a small synthetic tree of empty-ish files."""
+    for d in range(dirs):
+        dirpath = os.path.join(root, f"dir_{d // 20}", f"sub_{d}")
+        os.makedirs(dirpath, exist_ok=True)
+        for f in range(files_per_dir):
+            with open(os.path.join(dirpath, f"file_{f}.bin"), 'wb') as fh:
+                fh.write(b'0' * (f % 7))
+
+
+def best_of(func, path: str, runs: int):
+    """Return (best_seconds, result) over several runs."""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(path)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """Run the benchmark and print a comparison."""
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    temp_root = None
+
+    if len(sys.argv) > 1:
+        path = os.path.expanduser(sys.argv[1])
+    else:
+        temp_root = tempfile.mkdtemp(prefix="scanner_bench_")
+        build_tree(temp_root)
+        path = temp_root
+
+    try:
+        legacy_time, legacy = best_of(legacy_walk, path, runs)
+        scandir_time, current = best_of(scandir_walk, path, runs)
+
+        assert sorted(legacy) == sorted(current), "implementations disagree"
+
+        count = len(current)
+        print(f"Files scanned: {count:,} (best of {runs})")
+        print(f"  os.walk + getsize: {legacy_time:.3f}s ({count / legacy_time:,.0f} files/s)")
+        print(f"  scandir Scanner:   {scandir_time:.3f}s ({count / scandir_time:,.0f} files/s)")
+        print(f"  Speedup: {legacy_time / scandir_time:.2f}x")
+    finally:
+        if temp_root:
+            shutil.rmtree(temp_root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite - Scan Throughput, Filesystem Calls and Peak Memory
+====================================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Time find_largest_files, get_directory_stats and the Sorter's sort_files on
+a reproducible synthetic tree (or a real one) and report the results as
+JSON, so runs can be compared between commits and machines.
+
+Every benchmark is timed over several clean runs. One further instrumented
+run counts the filesystem calls made through the os module (scandir, stat,
+lstat, DirEntry.stat, rename, ...), each at least one system call, and
+measures peak Python memory with tracemalloc; instrumentation never
+affects the timings.
+
+Usage:
+    python benchmarks/bench_suite.py                          # small synthetic tree
+    python benchmarks/bench_suite.py --preset large --runs 5 --output bench.json
+    python benchmarks/bench_suite.py --path ~/Documents       # real tree
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Sorter')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.file_organizer import FileOrganizer
+from sorter import sort_files
+from synthetic_tree import PRESETS, TreeSpec, generate_tree, remove_tree
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# os functions whose calls are counted; each issues at least one syscall
+_COUNTED = ("scandir", "listdir", "stat", "lstat", "rename", "replace", "mkdir", "unlink", "open")
+
+
+class _CountingEntry:
+    """DirEntry proxy counting the stat calls that reach the disk."""
+
+    __slots__ = ("_entry", "_counts")
+
+    def __init__(self, entry, counts: Dict[str, int]):
+        self._entry = entry
+        self._counts = counts
+
+    def stat(self, *, follow_symlinks: bool = True):
+        self._counts["DirEntry.stat"] = self._counts.get("DirEntry.stat", 0) + 1
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def __getattr__(self, name: str):
+        return getattr(self._entry, name)
+
+    def __fspath__(self) -> str:
+        return self._entry.path
+
+
+class _CountingScandir:
+    """Iterator returned by the patched os.scandir."""
+
+    def __init__(self, iterator, counts: Dict[str, int]):
+        self._iterator = iterator
+        self._counts = counts
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return _CountingEntry(next(self._iterator), self._counts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._iterator.close()
+
+    def close(self):
+        self._iterator.close()
+
+
+class FsCallCounter:
+    """
+    Count filesystem calls made through the os module while active.
+
+    Example:
+        >>> with FsCallCounter() as counter:
+        ...     os.listdir(".")
+        >>> counter.counts
+        {'listdir': 1}
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self._originals: Dict[str, Callable] = {}
+
+    def __enter__(self) -> "FsCallCounter":
+        counts = self.counts
+        for name in _COUNTED:
+            original = getattr(os, name)
+            self._originals[name] = original
+            if name == "scandir":
+                def wrapper(*args, _original=original, **kwargs):
+                    counts["scandir"] = counts.get("scandir", 0) + 1
+                    return _CountingScandir(_original(*args, **kwargs), counts)
+            else:
+                def wrapper(*args, _original=original, _name=name, **kwargs):
+                    counts[_name] = counts.get(_name, 0) + 1
+                    return _original(*args, **kwargs)
+            setattr(os, name, wrapper)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def measure(
+    name: str,
+    run: Callable[[Any], int],
+    runs: int,
+    setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Time a benchmark, then count its filesystem calls and peak memory.
+
+    Args:
+        name: Benchmark name in the report
+        run: Function taking the setup result and returning the number of
+             files it processed
+        runs: Number of timed runs
+        setup: Optional untimed preparation before every run
+
+    Returns:
+        JSON-ready dictionary of the measurements
+    """
+    seconds = []
+    files = 0
+    for _ in range(runs):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        files = run(argument)
+        seconds.append(time.perf_counter() - start)
+
+    argument = setup() if setup else None
+    tracemalloc.start()
+    try:
+        with FsCallCounter() as counter:
+            run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(seconds)
+    return {
+        "name": name,
+        "runs": runs,
+        "files": files,
+        "seconds": {"best": best, "median": statistics.median(seconds), "all": seconds},
+        "files_per_second": files / best if best > 0 else None,
+        "syscalls": {"total": counter.total, "by_call": dict(sorted(counter.counts.items()))},
+        "peak_memory_bytes": peak,
+    }
+
+
+def _max_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_suite(path: str, runs: int, workers: int, sort_count: int, work_dir: str) -> List[Dict[str, Any]]:
+    """
+    Run every benchmark against one tree.
+
+    Args:
+        path: Tree to scan
+        runs: Timed runs per benchmark
+        workers: Worker threads for the parallel variants
+        sort_count: Files in the flat directory handed to sort_files
+        work_dir: Scratch directory for sort_files
+
+    Returns:
+        One result dictionary per benchmark
+    """
+    organizer = FileOrganizer(quiet=True)
+
+    def largest(workers: int) -> Callable[[Any], int]:
+        def run(_):
+            organizer.find_largest_files(path, top_n=100, workers=workers)
+            return organizer.scan_count
+        return run
+
+    def stats(workers: int) -> Callable[[Any], int]:
+        def run(_):
+            return organizer.get_directory_stats(path, workers=workers)["file_count"]
+        return run
+
+    # sort_files moves the files of one flat directory into type folders
+    extensions = TreeSpec().extensions
+
+    def flat_directory() -> str:
+        target = os.path.join(work_dir, "sort")
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        os.mkdir(target)
+        for i in range(sort_count):
+            open(os.path.join(target, f"file{i:06d}{extensions[i % len(extensions)]}"), "wb").close()
+        return target
+
+    results = [
+        measure("find_largest_files", largest(1), runs),
+        measure("get_directory_stats", stats(1), runs),
+        measure("sort_files", lambda target: sort_files(target, notify=False), runs, setup=flat_directory),
+    ]
+    if workers > 1:
+        results.insert(1, measure(f"find_largest_files[workers={workers}]", largest(workers), runs))
+        results.insert(3, measure(f"get_directory_stats[workers={workers}]", stats(workers), runs))
+    return results
+
+
+def main():
+    """Run the suite and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark scanning and sorting, with a JSON report.")
+    parser.add_argument("--path", help="Scan this tree instead of a synthetic one")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small",
+                        help="Synthetic tree size (default: small)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic tree")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per benchmark (default: 3)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Threads for the parallel variants; 1 skips them (default: 4)")
+    parser.add_argument("--sort-files", type=int, default=2000, metavar="N",
+                        help="Files sort_files sorts per run (default: 2000)")
+    parser.add_argument("--output", metavar="FILE", help="Write the JSON report to FILE instead of stdout")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_suite_")
+    try:
+        if args.path:
+            path = os.path.abspath(os.path.expanduser(args.path))
+            tree: Dict[str, Any] = {"path": path}
+        else:
+            spec = PRESETS[args.preset]._replace(seed=args.seed)
+            start = time.perf_counter()
+            manifest = generate_tree(os.path.join(work_dir, "tree"), spec)
+            path = manifest.root
+            tree = {
+                "preset": args.preset,
+                "spec": spec._asdict(),
+                "manifest": dict(manifest._asdict(), unreadable_dirs=len(manifest.unreadable_dirs)),
+                "build_seconds": time.perf_counter() - start,
+            }
+
+        benchmarks = run_suite(path, args.runs, args.workers, args.sort_files, work_dir)
+    finally:
+        remove_tree(work_dir)
+
+    report = {
+        "suite": "file-automation-suite",
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "tree": tree,
+        "benchmarks": benchmarks,
+        "max_rss_bytes": _max_rss(),
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        for result in benchmarks:
+            print(f"{result['name']:<36} {result['files']:>10,} files "
+                  f"{result['seconds']['best']:8.3f}s {result['files_per_second'] or 0:>12,.0f}/s "
+                  f"{result['syscalls']['total']:>10,} calls {result['peak_memory_bytes'] / 1024 ** 2:8.1f} MB")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
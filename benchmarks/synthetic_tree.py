@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Synthetic Tree - Reproducible File Trees for Benchmarks
+========================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Build directory trees of a chosen shape so scan throughput can be measured
+and compared between machines and commits. The same spec and seed always
+produce the same names, sizes and links.
+
+Features:
+    - Depth and fan-out of the directory tree
+    - Files per directory: fixed, uniform or exponential
+    - File sizes: fixed, uniform, lognormal or Pareto (heavy tail), capped
+    - Hard links, symlinks and dangling symlinks
+    - Unreadable directories (mode 000; still readable when run as root)
+    - Sparse files by default, so large trees build in seconds
+
+Dependencies:
+    - Standard library only
+
+Usage:
+    python benchmarks/synthetic_tree.py /tmp/tree --preset medium --seed 7
+"""
+
+import os
+import math
+import random
+import shutil
+import argparse
+from typing import Dict, List, NamedTuple, Tuple
+
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "pareto")
+COUNT_DISTRIBUTIONS = ("fixed", "uniform", "exponential")
+
+
+class TreeSpec(NamedTuple):
+    """Shape of a synthetic tree."""
+
+    # Directory levels below the root, and subdirectories per directory
+    depth: int = 3
+    fan_out: int = 4
+    # Mean number of files in each directory, root included
+    files_per_dir: int = 25
+    file_count_distribution: str = "uniform"
+    size_distribution: str = "lognormal"
+    mean_size: int = 64 * 1024
+    max_size: int = 256 * 1024 ** 2
+    # Share of files that get an extra hard link / symlink elsewhere
+    hardlink_ratio: float = 0.0
+    symlink_ratio: float = 0.0
+    broken_symlinks: int = 0
+    unreadable_dirs: int = 0
+    extensions: Tuple[str, ...] = (".txt", ".jpg", ".mp4", ".py", ".zip", ".pdf", ".json", ".log", "")
+    # Sizes via truncate(); False writes the bytes
+    sparse: bool = True
+    seed: int = 0
+
+
+class TreeManifest(NamedTuple):
+    """What generate_tree() created."""
+
+    root: str
+    directories: int
+    # Regular files, not counting the extra hard links
+    files: int
+    total_size: int
+    hardlinks: int
+    symlinks: int
+    broken_symlinks: int
+    unreadable_dirs: List[str]
+
+
+PRESETS: Dict[str, TreeSpec] = {
+    # About 130, 2,100, 31,000 and 470,000 files
+    "tiny": TreeSpec(depth=2, fan_out=3, files_per_dir=10),
+    "small": TreeSpec(depth=3, fan_out=4, files_per_dir=25),
+    "medium": TreeSpec(depth=4, fan_out=5, files_per_dir=40, hardlink_ratio=0.01,
+                       symlink_ratio=0.01, broken_symlinks=5, unreadable_dirs=2),
+    "large": TreeSpec(depth=5, fan_out=6, files_per_dir=50, hardlink_ratio=0.01,
+                      symlink_ratio=0.01, broken_symlinks=20, unreadable_dirs=5),
+}
+
+
+def _file_count(rng: random.Random, spec: TreeSpec) -> int:
+    mean = spec.files_per_dir
+    if spec.file_count_distribution == "fixed":
+        return mean
+    if spec.file_count_distribution == "uniform":
+        return rng.randint(0, 2 * mean)
+    return int(rng.expovariate(1 / mean)) if mean > 0 else 0
+
+
+def _file_size(rng: random.Random, spec: TreeSpec) -> int:
+    mean = spec.mean_size
+    if spec.size_distribution == "fixed":
+        size = mean
+    elif spec.size_distribution == "uniform":
+        size = rng.randint(0, 2 * mean)
+    elif spec.size_distribution == "lognormal":
+        sigma = 1.5
+        size = int(rng.lognormvariate(math.log(max(mean, 1)) - sigma ** 2 / 2, sigma))
+    else:
+        alpha = 1.5
+        size = int(mean * (alpha - 1) / alpha * rng.paretovariate(alpha))
+    return min(size, spec.max_size)
+
+
+def generate_tree(root: str, spec: TreeSpec = TreeSpec()) -> TreeManifest:
+    """
+    Create a tree below root.
+
+    Args:
+        root: Directory to fill; created if needed, should be empty
+        spec: Shape of the tree
+
+    Returns:
+        TreeManifest with the counts of what was created
+
+    Raises:
+        ValueError: If a distribution name is unknown
+    """
+    if spec.size_distribution not in SIZE_DISTRIBUTIONS:
+        raise ValueError(f"size_distribution must be one of {', '.join(SIZE_DISTRIBUTIONS)}")
+    if spec.file_count_distribution not in COUNT_DISTRIBUTIONS:
+        raise ValueError(f"file_count_distribution must be one of {', '.join(COUNT_DISTRIBUTIONS)}")
+
+    rng = random.Random(spec.seed)
+    root = os.path.abspath(root)
+    os.makedirs(root, exist_ok=True)
+
+    # Breadth-first, so the names do not depend on anything but the spec
+    directories = [root]
+    level = [root]
+    for depth in range(spec.depth):
+        next_level = []
+        for parent in level:
+            for i in range(spec.fan_out):
+                path = os.path.join(parent, f"d{depth}_{i}")
+                os.mkdir(path)
+                next_level.append(path)
+        directories.extend(next_level)
+        level = next_level
+
+    files: List[str] = []
+    total_size = 0
+    chunk = b"\0" * (1024 * 1024)
+    for dirpath in directories:
+        for i in range(_file_count(rng, spec)):
+            path = os.path.join(dirpath, f"f{i:05d}{rng.choice(spec.extensions)}")
+            size = _file_size(rng, spec)
+            with open(path, "wb") as f:
+                if spec.sparse:
+                    f.truncate(size)
+                else:
+                    for offset in range(0, size, len(chunk)):
+                        f.write(chunk[:size - offset])
+            files.append(path)
+            total_size += size
+
+    hardlinks = symlinks = broken = 0
+    if files:
+        for i in range(int(len(files) * spec.hardlink_ratio)):
+            os.link(rng.choice(files), os.path.join(rng.choice(directories), f"hardlink{i:05d}"))
+            hardlinks += 1
+        for i in range(int(len(files) * spec.symlink_ratio)):
+            os.symlink(rng.choice(files), os.path.join(rng.choice(directories), f"symlink{i:05d}"))
+            symlinks += 1
+    for i in range(spec.broken_symlinks):
+        os.symlink(os.path.join(root, f"missing{i:05d}"),
+                   os.path.join(rng.choice(directories), f"broken{i:05d}"))
+        broken += 1
+
+    # Chosen among the subdirectories; their contents stay in the counts
+    unreadable = rng.sample(directories[1:], min(spec.unreadable_dirs, len(directories) - 1))
+    for path in unreadable:
+        os.chmod(path, 0)
+
+    return TreeManifest(
+        root=root,
+        directories=len(directories),
+        files=len(files),
+        total_size=total_size,
+        hardlinks=hardlinks,
+        symlinks=symlinks,
+        broken_symlinks=broken,
+        unreadable_dirs=unreadable
+    )
+
+
+def remove_tree(root: str) -> None:
+    """Delete a generated tree, unreadable directories included."""
+    # Top-down: each directory's mode is restored before os.walk enters it
+    for dirpath, dirnames, _ in os.walk(root):
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                os.chmod(path, 0o755)
+    shutil.rmtree(root)
+
+
+def main():
+    """Generate a tree from the command line."""
+    parser = argparse.ArgumentParser(description="Create a reproducible synthetic file tree.")
+    parser.add_argument("root", help="Directory to create the tree in")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    manifest = generate_tree(args.root, PRESETS[args.preset]._replace(seed=args.seed))
+    print(f"{manifest.files:,} files ({manifest.total_size:,} bytes) in "
+          f"{manifest.directories:,} directories below {manifest.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,5 +14,41 @@ __license__ = "MIT"
 
 from .system_monitor import SystemMonitor
 from .file_organizer import FileOrganizer
+from .scanner import Scanner
+from .aggregators import (
+    Aggregator, ExtensionCollector, SizeDistribution, SizeHistogram, TopNCollector,
+    TotalsCollector
+)
+from .pipeline import ScanPipeline
+from .scan_index import ScanIndex
+from .watcher import IndexWatcher
+from .duplicates import DuplicateFinder, DuplicateGroup, SizeGroupCollector
+from .hash_cache import HashCache
+from .records import FileRecord, FileRecords
+from .filters import FileFilter
+from .exclusions import Exclusions
+from .categories import CATEGORIES, CategoryCollector
+from .aging import AgeCollector
+from .external_sort import SortedFiles
+from .progress import ProgressChannel, ProgressEvent
+from .error_ledger import ErrorLedger
+from .snapshots import Snapshot, SnapshotWriter, diff_snapshots
+from .growth import FolderTotals, GrowthStore
+from .export import ExportWriter, FileExporter, export_rows
+from .profiling import ScanProfiler
+from .disk_usage import DirectoryTree, DirectoryTreeCollector, LargestDirectoriesCollector
+from .async_scan import AsyncFileOrganizer, CancellationToken, ScanCancelled
 
-__all__ = ['SystemMonitor', 'FileOrganizer']
+__all__ = [
+    'SystemMonitor', 'FileOrganizer', 'Scanner', 'ScanPipeline', 'ScanIndex',
+    'IndexWatcher', 'AsyncFileOrganizer', 'CancellationToken', 'ScanCancelled',
+    'DuplicateFinder', 'DuplicateGroup', 'SizeGroupCollector', 'HashCache',
+    'DirectoryTree', 'DirectoryTreeCollector', 'LargestDirectoriesCollector',
+    'FileRecord', 'FileRecords', 'FileFilter', 'Exclusions',
+    'Aggregator', 'TopNCollector', 'TotalsCollector', 'ExtensionCollector', 'SizeHistogram',
+    'SizeDistribution', 'CategoryCollector', 'CATEGORIES', 'AgeCollector',
+    'SortedFiles', 'ProgressChannel', 'ProgressEvent', 'ErrorLedger',
+    'Snapshot', 'SnapshotWriter', 'diff_snapshots',
+    'FolderTotals', 'GrowthStore', 'ExportWriter', 'FileExporter', 'export_rows',
+    'ScanProfiler',
+]
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Aging - Find Cold Data by Modification and Access Age
+======================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Answer "which files over 500 MB has nobody touched in a year?" from the
+stat results the scanner already has: no file is stat-ed twice. Files are
+bucketed by age, counted in a size x age matrix, and the largest files of
+every age bucket are kept in bounded heaps.
+
+Features:
+    - Age from mtime, atime or whichever is more recent ("touched")
+    - Configurable age bucket and size class edges
+    - Count and bytes per size class and age bucket
+    - Bounded top-N heap per age bucket; paths are only built for files
+      that enter a heap
+    - Mergeable and picklable; the reference time is fixed when the
+      collector is created, so parallel workers agree on every age
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> organizer = FileOrganizer()
+    >>> for size, path in organizer.find_stale_files("/Users/daniel", older_than_days=365,
+    ...                                              min_size=500 * 1024 ** 2):
+    ...     print(organizer.format_size(size), path)
+"""
+
+import os
+import time
+import heapq
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from .aggregators import Aggregator
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+
+
+DAY = 86400
+
+# Upper bounds of the age buckets in days; the last bucket is open-ended
+AGE_EDGES = (30, 90, 180, 365, 730, 1825)
+
+# Upper bounds of the size classes in bytes; the last class is open-ended
+SIZE_EDGES = (1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2, 1024 ** 3)
+
+CLOCKS = ("mtime", "atime", "touched")
+
+
+def _label(low: float, high: Optional[float]) -> str:
+    """Describe a half-open range of days, e.g. '90-180d' or '>5y'."""
+    def short(days: float) -> str:
+        if days >= 365 and days % 365 == 0:
+            return f"{days // 365:g}y"
+        return f"{days:g}d"
+
+    if high is None:
+        return f">{short(low)}"
+    if not low:
+        return f"<{short(high)}"
+    return f"{short(low)}-{short(high)}"
+
+
+class AgeCollector(Aggregator):
+    """
+    Bucket files by age and size, keeping the largest files of each age.
+
+    Args:
+        top_n: Number of largest files kept per age bucket (0 keeps none)
+        clock: 'mtime' (last modified), 'atime' (last read; unreliable on
+               volumes mounted noatime) or 'touched' (the later of both)
+        age_edges: Ascending upper bounds of the age buckets, in days
+        size_edges: Ascending upper bounds of the size classes, in bytes
+        min_size: Only files of at least this size enter the heaps; the
+                  counts and the matrix still cover every file
+        now: Reference time in seconds since the epoch (default: now)
+
+    Raises:
+        ValueError: If clock is unknown, top_n is negative or the edges are
+                    not strictly ascending
+
+    Example:
+        >>> collector = AgeCollector(top_n=5, clock="touched", age_edges=(365,))
+        >>> # ... feed it through ScanPipeline or analyze_directory(aggregators=...)
+        >>> stale = collector.result()['buckets'][-1]
+        >>> stale['label'], stale['total_size'], stale['largest']
+    """
+
+    name = "ages"
+
+    def __init__(
+        self,
+        top_n: int = 10,
+        clock: str = "mtime",
+        age_edges: Sequence[float] = AGE_EDGES,
+        size_edges: Sequence[int] = SIZE_EDGES,
+        min_size: int = 0,
+        now: Optional[float] = None
+    ):
+        """Initialize empty buckets."""
+        if clock not in CLOCKS:
+            raise ValueError(f"clock must be one of {', '.join(CLOCKS)}")
+        if top_n < 0:
+            raise ValueError("top_n must not be negative")
+        for edges in (age_edges, size_edges):
+            if any(low >= high for low, high in zip(edges, edges[1:])):
+                raise ValueError("bucket edges must be strictly ascending")
+
+        self.top_n = top_n
+        self.clock = clock
+        self.age_edges = tuple(age_edges)
+        self.size_edges = tuple(size_edges)
+        self.min_size = min_size
+        self.now = time.time() if now is None else now
+
+        # Compared against raw ages in seconds, so no division per file
+        self._age_bounds = [days * DAY for days in self.age_edges]
+        ages = len(self.age_edges) + 1
+        sizes = len(self.size_edges) + 1
+        self.counts = [[0] * ages for _ in range(sizes)]
+        self.sizes = [[0] * ages for _ in range(sizes)]
+        self._heaps: List[List[Tuple[int, str]]] = [[] for _ in range(ages)]
+
+    def _timestamp(self, st: os.stat_result) -> float:
+        if self.clock == "mtime":
+            return st.st_mtime
+        if self.clock == "atime":
+            return st.st_atime
+        return max(st.st_mtime, st.st_atime)
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        """
+        Add one directory's worth of scanner output.
+
+        Args:
+            dirpath: Directory the files belong to
+            files: List of (name, stat_result) pairs from the scanner
+
+        Returns:
+            True if any heap changed
+        """
+        timestamp = self._timestamp
+        return self._add((st.st_size, dirpath, name, timestamp(st)) for name, st in files)
+
+    def add_files(self, files: Iterable[Tuple[int, str, float]]) -> bool:
+        """
+        Add (size, path, timestamp) triples, e.g. read from a ScanIndex.
+
+        Args:
+            files: Iterable of (size in bytes, full path, seconds since the
+                   epoch on this collector's clock)
+
+        Returns:
+            True if any heap changed
+        """
+        return self._add((size, path, None, stamp) for size, path, stamp in files)
+
+    def _add(self, files: Iterable[Tuple[int, str, Optional[str], float]]) -> bool:
+        """Bucket (size, dirpath or path, name or None, timestamp) entries."""
+        now = self.now
+        age_bounds = self._age_bounds
+        size_edges = self.size_edges
+        counts = self.counts
+        sizes = self.sizes
+        heaps = self._heaps
+        top_n = self.top_n
+        min_size = self.min_size
+        join = os.path.join
+        changed = False
+
+        for size, location, name, stamp in files:
+            age = bisect_right(age_bounds, now - stamp)
+            row = bisect_right(size_edges, size)
+            counts[row][age] += 1
+            sizes[row][age] += size
+
+            if size < min_size or not top_n:
+                continue
+            heap = heaps[age]
+            # As in TopNCollector, the path is built only for heap entries
+            if len(heap) < top_n:
+                heapq.heappush(heap, (size, join(location, name) if name is not None else location))
+                changed = True
+            elif size >= heap[0][0]:
+                item = (size, join(location, name) if name is not None else location)
+                if item > heap[0]:
+                    heapq.heapreplace(heap, item)
+                    changed = True
+
+        return changed
+
+    def merge(self, other: "AgeCollector") -> None:
+        """
+        Fold another collector's buckets into this one.
+
+        Args:
+            other: Collector created by spawn()
+        """
+        for mine, theirs in ((self.counts, other.counts), (self.sizes, other.sizes)):
+            for row, other_row in zip(mine, theirs):
+                for age, value in enumerate(other_row):
+                    row[age] += value
+
+        for heap, other_heap in zip(self._heaps, other._heaps):
+            for item in other_heap:
+                if len(heap) < self.top_n:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+    def spawn(self) -> "AgeCollector":
+        return AgeCollector(self.top_n, self.clock, self.age_edges, self.size_edges,
+                            self.min_size, self.now)
+
+    def age_labels(self) -> List[str]:
+        """Return a label per age bucket, youngest first."""
+        bounds = (0,) + self.age_edges
+        return [_label(low, high) for low, high in zip(bounds, self.age_edges + (None,))]
+
+    def size_labels(self) -> List[Tuple[int, Optional[int]]]:
+        """Return (low, high) byte bounds per size class; high is None for the last."""
+        bounds = (0,) + self.size_edges
+        return list(zip(bounds, self.size_edges + (None,)))
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Return the buckets, the matrix and the largest files per bucket.
+
+        Returns:
+            Dictionary with 'clock', 'now', 'buckets' (one dict per age
+            bucket, youngest first, with 'label', 'min_days', 'max_days',
+            'file_count', 'total_size' and 'largest' as (size, path) pairs,
+            largest first), 'size_classes' as (low, high) byte bounds and
+            'matrix' with a row per size class of (file_count, total_size)
+            per age bucket
+        """
+        bounds = (0,) + self.age_edges
+        buckets = []
+        for age, label in enumerate(self.age_labels()):
+            buckets.append({
+                "label": label,
+                "min_days": bounds[age],
+                "max_days": self.age_edges[age] if age < len(self.age_edges) else None,
+                "file_count": sum(row[age] for row in self.counts),
+                "total_size": sum(row[age] for row in self.sizes),
+                "largest": sorted(self._heaps[age], reverse=True),
+            })
+
+        return {
+            "clock": self.clock,
+            "now": self.now,
+            "buckets": buckets,
+            "size_classes": self.size_labels(),
+            "matrix": [
+                list(zip(count_row, size_row))
+                for count_row, size_row in zip(self.counts, self.sizes)
+            ],
+        }
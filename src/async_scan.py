@@ -0,0 +1,652 @@
+#!/usr/bin/env python3
+"""
+Async Scan - asyncio Scanning API with Cancellation
+====================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Run FileOrganizer scans from asyncio code. Scans execute in a worker thread
+and check a cancellation token before every directory, so a scan of a huge
+root stops as soon as it is cancelled, its deadline passes, or a newer scan
+supersedes it. Progress is delivered as events on the event loop.
+
+Features:
+    - Cooperative cancellation tokens with optional deadlines
+    - Newer scans supersede older ones (no wasted I/O on stale requests)
+    - Throttled progress events (files, directories, bytes, files/sec)
+      delivered on the event loop (sync or async handlers)
+    - Error ledger of the latest scan for the UI
+    - Cancelling the awaiting task also stops the worker thread
+    - BackgroundLoop for GUI toolkits that own the main thread
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> import asyncio
+    >>> from async_scan import AsyncFileOrganizer
+    >>> async def main():
+    ...     organizer = AsyncFileOrganizer()
+    ...     report = await organizer.analyze_directory("/Users/daniel", top_n=5, timeout=30)
+    ...     print(report['stats']['file_count'])
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from .disk_usage import RankedDirectory
+    from .error_ledger import ErrorLedger
+    from .file_organizer import FileOrganizer, TopN
+    from .progress import ProgressEvent
+    from .records import FileRecords
+    from .scanner import Roots
+    from .snapshots import Snapshot
+except ImportError:  # Running as a script or with src/ on sys.path
+    from disk_usage import RankedDirectory
+    from error_ledger import ErrorLedger
+    from file_organizer import FileOrganizer, TopN
+    from progress import ProgressEvent
+    from records import FileRecords
+    from scanner import Roots
+    from snapshots import Snapshot
+
+
+class ScanCancelled(Exception):
+    """Raised when a scan is stopped through its cancellation token."""
+
+
+class DeadlineExceeded(ScanCancelled):
+    """Raised when a scan runs past its deadline."""
+
+
+class CancellationToken:
+    """Thread-safe flag that asks a running scan to stop."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Create a token.
+
+        Args:
+            timeout: Optional number of seconds after which the token counts
+                     as cancelled (the scan's deadline)
+        """
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() was called or the deadline has passed."""
+        if self._event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """
+        Ask the scan to stop at the next directory.
+
+        Args:
+            reason: Message carried by the resulting ScanCancelled
+        """
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def remaining(self) -> Optional[float]:
+        """
+        Return the seconds left until the deadline.
+
+        Returns:
+            Seconds (never negative), or None without a deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if the scan should stop; called by the scanner.
+
+        Raises:
+            ScanCancelled: If cancel() was called
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self._event.is_set():
+            raise ScanCancelled(self.reason)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise DeadlineExceeded("scan deadline exceeded")
+
+
+# Handler for progress events: a plain function or a coroutine function
+ProgressHandler = Callable[[ProgressEvent], Optional[Awaitable[None]]]
+
+
+class AsyncFileOrganizer:
+    """asyncio front end for FileOrganizer scans."""
+
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        **organizer_options: Any
+    ):
+        """
+        Initialize the async organizer.
+
+        Args:
+            executor: Executor the blocking scans run in (default: the
+                      event loop's default thread pool)
+            **organizer_options: Passed to every FileOrganizer created for a
+                                 scan (e.g. index=, index_max_age=)
+        """
+        self.executor = executor
+        self.organizer_options = organizer_options
+        # Errors of the most recently finished scan
+        self.last_errors: Optional[ErrorLedger] = None
+        self._current: Optional[CancellationToken] = None
+        self._lock = threading.Lock()
+
+    def new_token(self, timeout: Optional[float] = None) -> CancellationToken:
+        """
+        Start a new request, superseding the previous one.
+
+        The token of the previous request is cancelled, so its scan stops at
+        the next directory. Pass the returned token to several calls to run
+        them as one request.
+
+        Args:
+            timeout: Optional deadline in seconds for the new request
+
+        Returns:
+            Token for the new request
+        """
+        token = CancellationToken(timeout)
+        with self._lock:
+            previous, self._current = self._current, token
+        if previous is not None:
+            previous.cancel("superseded by a newer scan")
+        return token
+
+    def cancel(self) -> None:
+        """Cancel the current request, if any."""
+        with self._lock:
+            token = self._current
+        if token is not None:
+            token.cancel()
+
+    async def find_largest_files(
+        self,
+        start_path: Roots,
+        top_n: TopN = 10,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> List[Tuple[int, str]]:
+        """
+        Find the largest files without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1), or "all"
+            token: Token of the request this scan belongs to; by default a
+                   new request is started, superseding the previous one
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.find_largest_files() arguments
+
+        Returns:
+            List of (file_size, file_path) tuples, sorted by size descending
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "find_largest_files", (start_path, top_n), options, token, timeout, on_progress
+        )
+
+    async def find_largest_directories(
+        self,
+        start_path: Roots,
+        top_n: int = 10,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, List[RankedDirectory]]:
+        """
+        Rank directories by recursive size and file count without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of directories on each leaderboard (at least 1)
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.find_largest_directories() arguments
+
+        Returns:
+            Dictionary with keys 'by_size' and 'by_count'
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "find_largest_directories", (start_path, top_n), options, token, timeout, on_progress
+        )
+
+    async def find_largest_records(
+        self,
+        start_path: Roots,
+        top_n: int = 10,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> FileRecords:
+        """
+        Find the largest files with their mtimes and inodes without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1)
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.find_largest_records() arguments
+
+        Returns:
+            FileRecords, sorted by size descending
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "find_largest_records", (start_path, top_n), options, token, timeout, on_progress
+        )
+
+    async def collect_records(
+        self,
+        start_path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> FileRecords:
+        """
+        Collect every file into a FileRecords store without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.collect_records() arguments
+
+        Returns:
+            FileRecords with every file
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "collect_records", (start_path,), options, token, timeout, on_progress
+        )
+
+    async def get_directory_stats(
+        self,
+        path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> dict:
+        """
+        Get directory statistics without blocking the event loop.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.get_directory_stats() arguments
+
+        Returns:
+            Dictionary with statistics
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run("get_directory_stats", (path,), options, token, timeout, on_progress)
+
+    async def get_size_distribution(
+        self,
+        path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Get size percentiles and the log2 histogram without blocking the event loop.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.get_size_distribution() arguments
+
+        Returns:
+            Dictionary with 'p50', 'p90', 'p99', 'top1_share', 'buckets' and totals
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "get_size_distribution", (path,), options, token, timeout, on_progress
+        )
+
+    async def get_category_breakdown(
+        self,
+        path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Get the space used per category and extension without blocking the event loop.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.get_category_breakdown() arguments
+
+        Returns:
+            Dictionary with 'categories' and 'extensions' totals
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "get_category_breakdown", (path,), options, token, timeout, on_progress
+        )
+
+    async def get_age_report(
+        self,
+        path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Bucket files by age and size without blocking the event loop.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.get_age_report() arguments
+
+        Returns:
+            Dictionary with 'buckets', 'size_classes' and 'matrix'
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run("get_age_report", (path,), options, token, timeout, on_progress)
+
+    async def save_snapshot(
+        self,
+        start_path: Roots,
+        name: str,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Snapshot:
+        """
+        Scan and save a snapshot without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            name: Snapshot name or file path
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.take_snapshot() arguments
+
+        Returns:
+            The saved Snapshot
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "save_snapshot", (start_path, name), options, token, timeout, on_progress
+        )
+
+    async def compare_snapshot(
+        self,
+        old: Union[str, Snapshot],
+        start_path: Optional[Roots] = None,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Report what changed since a snapshot without blocking the event loop.
+
+        Args:
+            old: Snapshot or snapshot name to compare against
+            start_path: Roots to scan (default: the snapshot's roots)
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.compare_snapshot() arguments
+                       (top_n, save_to, ...)
+
+        Returns:
+            Dictionary of added, removed, grown and shrunk files and folders
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "compare_snapshot", (old, start_path), options, token, timeout, on_progress
+        )
+
+    async def export_files(
+        self,
+        start_path: Roots,
+        destination: str,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> int:
+        """
+        Stream every file to an NDJSON or CSV file without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            destination: File path (.csv, .ndjson or .jsonl, optionally .gz)
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.export_files() arguments
+
+        Returns:
+            Number of files exported
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run(
+            "export_files", (start_path, destination), options, token, timeout, on_progress
+        )
+
+    async def record_growth(
+        self,
+        start_path: Roots,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, int]:
+        """
+        Record folder sizes for growth tracking without blocking the event loop.
+
+        Args:
+            start_path: Root directory to measure, or a list of roots
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.record_growth() arguments
+                       (depth, store, ...)
+
+        Returns:
+            The recorded sizes, folder path -> bytes
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+        """
+        return await self._run("record_growth", (start_path,), options, token, timeout, on_progress)
+
+    async def analyze_directory(
+        self,
+        start_path: Roots,
+        top_n: TopN = 10,
+        token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressHandler] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Run FileOrganizer.analyze_directory() without blocking the event loop.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1), or "all"
+            token: Token of the request this scan belongs to (default: new request)
+            timeout: Deadline in seconds when no token is given
+            on_progress: Optional handler for ProgressEvents, called on the loop
+            **options: Further FileOrganizer.analyze_directory() arguments
+
+        Returns:
+            Dictionary with keys 'largest_files', 'stats', 'extensions', 'histogram'
+            and 'distribution'
+
+        Raises:
+            ScanCancelled: If the request was cancelled or superseded
+            DeadlineExceeded: If the deadline passed first
+
+        Example:
+            >>> organizer = AsyncFileOrganizer()
+            >>> task = asyncio.create_task(organizer.analyze_directory("/"))
+            >>> organizer.cancel()   # the scan thread stops at the next directory
+        """
+        return await self._run(
+            "analyze_directory", (start_path, top_n), options, token, timeout, on_progress
+        )
+
+    async def _run(
+        self,
+        method: str,
+        args: tuple,
+        options: Dict[str, Any],
+        token: Optional[CancellationToken],
+        timeout: Optional[float],
+        on_progress: Optional[ProgressHandler]
+    ) -> Any:
+        """Run one FileOrganizer method in the executor under a token."""
+        if token is None:
+            token = self.new_token(timeout)
+        token.raise_if_cancelled()
+
+        loop = asyncio.get_running_loop()
+
+        def deliver(event: ProgressEvent) -> None:
+            result = on_progress(event)
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(result)
+
+        def report(event: ProgressEvent) -> None:
+            # Runs in the scan thread (throttled); hop to the loop for the handler
+            token.raise_if_cancelled()
+            if on_progress is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(deliver, event)
+
+        organizer = FileOrganizer(
+            progress_listener=report,
+            check_cancelled=token.raise_if_cancelled,
+            **self.organizer_options
+        )
+        call = partial(getattr(organizer, method), *args, **options)
+
+        try:
+            result = await loop.run_in_executor(self.executor, call)
+        except asyncio.CancelledError:
+            # The awaiting task was cancelled; stop the thread as well
+            token.cancel("task cancelled")
+            raise
+        self.last_errors = organizer.error_ledger
+        return result
+
+
+class BackgroundLoop:
+    """
+    Event loop running in a daemon thread.
+
+    GUI toolkits such as rumps and Tkinter own the main thread; this gives
+    them a place to run AsyncFileOrganizer coroutines.
+    """
+
+    def __init__(self):
+        """Start the loop thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future that resolves with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Disk Usage - du-style Directory Size Tree
+=========================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Aggregate file sizes into every directory of a scan, bottom-up, from the
+same traversal as the other aggregates. Both the apparent size (st_size)
+and the allocated size (st_blocks * 512, what du reports) are tracked, and
+hard-linked files are counted once.
+
+Features:
+    - Recursive size, allocated size and file count for every directory
+    - Top-N directories by recursive size and by file count in O(depth + N)
+      memory (LargestDirectoriesCollector), from a scan or the scan index
+    - Hard links counted once per inode, deterministically attributed to
+      the first path in sort order (identical in serial and parallel scans)
+    - Sparse files and file-system compression show up as allocated < apparent
+    - Tree queries (children, largest directories at a depth) need no
+      further traversal
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> tree = FileOrganizer().get_directory_tree("/Users/daniel")
+    >>> for path, usage in tree.largest("/Users/daniel", top_n=5):
+    ...     print(usage.allocated_size, path)
+"""
+
+import os
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .aggregators import Aggregator
+    from .scanner import Roots, _as_roots
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+    from scanner import Roots, _as_roots
+
+# Bytes per st_blocks unit (POSIX)
+BLOCK_SIZE = 512
+
+
+class DirectoryUsage(NamedTuple):
+    """Recursive totals of one directory."""
+
+    apparent_size: int
+    allocated_size: int
+    file_count: int
+
+
+class RankedDirectory(NamedTuple):
+    """A directory with the recursive totals it was ranked by."""
+
+    path: str
+    size: int
+    file_count: int
+
+
+def _is_within(path: str, parent: str) -> bool:
+    """Return True if path is parent or lies below it (both absolute)."""
+    if path == parent:
+        return True
+    return path.startswith(parent if parent.endswith(os.sep) else parent + os.sep)
+
+
+class DirectoryTree:
+    """Per-directory recursive totals produced by DirectoryTreeCollector."""
+
+    def __init__(
+        self,
+        roots: List[str],
+        usage: Dict[str, DirectoryUsage],
+        children: Dict[str, List[str]]
+    ):
+        """
+        Initialize the tree.
+
+        Args:
+            roots: Scanned roots (absolute paths)
+            usage: Directory -> recursive totals
+            children: Directory -> subdirectories that hold files
+        """
+        self.roots = roots
+        self._usage = usage
+        self._children = children
+
+    def __len__(self) -> int:
+        return len(self._usage)
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self._usage
+
+    def usage(self, path: str) -> DirectoryUsage:
+        """
+        Return the recursive totals of a directory.
+
+        Directories without any files below them are not part of the tree
+        and report zeros.
+
+        Args:
+            path: Directory inside a scanned root
+
+        Returns:
+            DirectoryUsage for path
+        """
+        return self._usage.get(os.path.abspath(path), DirectoryUsage(0, 0, 0))
+
+    def children(self, path: str, key: str = "allocated_size") -> List[Tuple[str, DirectoryUsage]]:
+        """
+        Return the subdirectories of path, largest first.
+
+        Args:
+            path: Directory inside a scanned root
+            key: DirectoryUsage field to sort by
+
+        Returns:
+            List of (path, DirectoryUsage)
+        """
+        path = os.path.abspath(path)
+        return sorted(
+            ((child, self._usage[child]) for child in self._children.get(path, ())),
+            key=lambda item: (-getattr(item[1], key), item[0])
+        )
+
+    def largest(
+        self,
+        under: Optional[str] = None,
+        top_n: int = 10,
+        depth: int = 1,
+        key: str = "allocated_size"
+    ) -> List[Tuple[str, DirectoryUsage]]:
+        """
+        Return the largest directories a given number of levels below a path.
+
+        A fixed depth keeps parents from crowding out their own children,
+        like `du -d DEPTH | sort -rh`.
+
+        Args:
+            under: Directory to look below (default: every root)
+            top_n: Number of directories to return
+            depth: Levels below `under` (1 = immediate subdirectories)
+            key: DirectoryUsage field to rank by
+
+        Returns:
+            List of (path, DirectoryUsage), largest first
+        """
+        level = [os.path.abspath(under)] if under is not None else list(self.roots)
+        for _ in range(depth):
+            level = [child for parent in level for child in self._children.get(parent, ())]
+
+        ranked = sorted(
+            ((path, self._usage[path]) for path in level),
+            key=lambda item: (-getattr(item[1], key), item[0])
+        )
+        return ranked[:top_n]
+
+
+class DirectoryTreeCollector(Aggregator):
+    """Build a DirectoryTree from scanner output."""
+
+    name = "directory_tree"
+
+    def __init__(self, roots: Roots):
+        """
+        Initialize the collector.
+
+        Args:
+            roots: The roots being scanned; totals are rolled up to them
+        """
+        self.roots = [os.path.abspath(root) for root in _as_roots(roots)]
+        # Directory -> [apparent, allocated, files] of files directly inside it
+        self.own: Dict[str, List[int]] = {}
+        # (device, inode) -> (path, apparent, allocated) for files with several links
+        self.links: Dict[Tuple[int, int], Tuple[str, int, int]] = {}
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        apparent = allocated = count = 0
+        links = self.links
+        for name, st in files:
+            size = st.st_size
+            blocks = getattr(st, 'st_blocks', None)
+            used = blocks * BLOCK_SIZE if blocks is not None else size
+            if st.st_nlink > 1:
+                key = (st.st_dev, st.st_ino)
+                path = os.path.join(dirpath, name)
+                seen = links.get(key)
+                if seen is None or path < seen[0]:
+                    links[key] = (path, size, used)
+                continue
+            apparent += size
+            allocated += used
+            count += 1
+
+        totals = self.own.setdefault(os.path.abspath(dirpath), [0, 0, 0])
+        totals[0] += apparent
+        totals[1] += allocated
+        totals[2] += count
+        return bool(files)
+
+    def merge(self, other: "DirectoryTreeCollector") -> None:
+        for dirpath, (apparent, allocated, count) in other.own.items():
+            totals = self.own.setdefault(dirpath, [0, 0, 0])
+            totals[0] += apparent
+            totals[1] += allocated
+            totals[2] += count
+        for key, entry in other.links.items():
+            seen = self.links.get(key)
+            if seen is None or entry[0] < seen[0]:
+                self.links[key] = entry
+
+    def spawn(self) -> "DirectoryTreeCollector":
+        return DirectoryTreeCollector(self.roots)
+
+    def result(self) -> DirectoryTree:
+        """
+        Roll the per-directory totals up into recursive totals.
+
+        Returns:
+            DirectoryTree covering every directory with files below it
+        """
+        totals = {dirpath: list(values) for dirpath, values in self.own.items()}
+        for path, apparent, allocated in self.links.values():
+            values = totals.setdefault(os.path.dirname(path), [0, 0, 0])
+            values[0] += apparent
+            values[1] += allocated
+            values[2] += 1
+
+        # Add directories that only contain subdirectories, up to the roots
+        roots = set(self.roots)
+        children: Dict[str, List[str]] = {}
+        for dirpath in list(totals):
+            while dirpath not in roots:
+                parent = os.path.dirname(dirpath)
+                if parent == dirpath:
+                    break
+                children.setdefault(parent, []).append(dirpath)
+                if parent in totals:
+                    break
+                totals[parent] = [0, 0, 0]
+                dirpath = parent
+
+        # Deepest directories first, so children are complete before parents
+        for dirpath in sorted(totals, key=lambda path: path.count(os.sep), reverse=True):
+            if dirpath in roots:
+                continue
+            parent = os.path.dirname(dirpath)
+            if parent != dirpath and parent in totals:
+                values, parent_values = totals[dirpath], totals[parent]
+                parent_values[0] += values[0]
+                parent_values[1] += values[1]
+                parent_values[2] += values[2]
+
+        usage = {dirpath: DirectoryUsage(*values) for dirpath, values in totals.items()}
+        for subdirs in children.values():
+            subdirs.sort()
+        return DirectoryTree(self.roots, usage, children)
+
+
+class LargestDirectoriesCollector(Aggregator):
+    """
+    Rank directories by recursive size and by recursive file count.
+
+    A directory's totals are only known once everything below it has been
+    seen. Scanner.scan() yields directories depth-first, so this collector
+    keeps just the directories from the root down to the current one: when
+    the scan leaves a directory, its totals are final, are added to its
+    parent and compete for the two leaderboards. Memory is O(depth + top_n)
+    however many directories the tree holds.
+
+    Parallel workers see directories in no particular order, so spawned
+    copies keep partial totals per directory instead (O(directories)) and
+    merge() adds them up.
+    """
+
+    name = "largest_directories"
+
+    def __init__(self, roots: Roots, top_n: int = 10):
+        """
+        Initialize the collector.
+
+        Args:
+            roots: The roots being scanned; they are not ranked themselves
+            top_n: Number of directories to keep on each leaderboard
+
+        Raises:
+            ValueError: If top_n is less than 1
+        """
+        if top_n < 1:
+            raise ValueError("top_n must be at least 1")
+
+        self.roots = [os.path.abspath(root) for root in _as_roots(roots)]
+        self.top_n = top_n
+        # Min-heaps of (size, path, files) and (files, path, size)
+        self._by_size: List[Tuple[int, str, int]] = []
+        self._by_count: List[Tuple[int, str, int]] = []
+        # Open directories from a root down to the last one seen: [path, size, files]
+        self._chain: List[list] = []
+        # Per-directory partial totals; None while input arrives depth-first
+        self._partial: Optional[Dict[str, List[int]]] = None
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        if not files:
+            return False
+        size = 0
+        for _, st in files:
+            size += st.st_size
+        self.add_totals(dirpath, size, len(files))
+        return True
+
+    def add_totals(self, dirpath: str, size: int, file_count: int) -> None:
+        """
+        Add the totals of the files directly inside one directory.
+
+        Directories must arrive depth-first (every directory before anything
+        below it, and a subtree finished before its next sibling), as
+        Scanner.scan() and ScanIndex.directory_totals() produce them.
+
+        Args:
+            dirpath: Directory the files belong to
+            size: Combined size of its files
+            file_count: Number of its files
+        """
+        dirpath = os.path.abspath(dirpath)
+        chain = self._chain
+        while chain and not _is_within(dirpath, chain[-1][0]):
+            self._close()
+
+        if not chain:
+            root = max((r for r in self.roots if _is_within(dirpath, r)), key=len, default=None)
+            if root is None:
+                return
+            chain.append([root, 0, 0])
+
+        # Open every directory between the deepest open one and dirpath
+        path = chain[-1][0]
+        if dirpath != path:
+            for part in dirpath[len(path):].strip(os.sep).split(os.sep):
+                path = os.path.join(path, part)
+                chain.append([path, 0, 0])
+
+        node = chain[-1]
+        node[1] += size
+        node[2] += file_count
+
+    def merge(self, other: "LargestDirectoriesCollector") -> None:
+        while other._chain:
+            other._close()
+        for size, path, count in other._by_size:
+            self._offer(self._by_size, (size, path, count))
+        for count, path, size in other._by_count:
+            self._offer(self._by_count, (count, path, size))
+        if other._partial:
+            if self._partial is None:
+                self._partial = {}
+            for path, (size, count) in other._partial.items():
+                totals = self._partial.setdefault(path, [0, 0])
+                totals[0] += size
+                totals[1] += count
+
+    def spawn(self) -> "LargestDirectoriesCollector":
+        worker = LargestDirectoriesCollector(self.roots, self.top_n)
+        worker._partial = {}
+        return worker
+
+    def result(self) -> Dict[str, List[RankedDirectory]]:
+        """
+        Return both leaderboards.
+
+        Returns:
+            Dictionary with keys 'by_size' and 'by_count', each a list of
+            RankedDirectory, largest first (ties broken by path)
+        """
+        while self._chain:
+            self._close()
+
+        by_size, by_count = list(self._by_size), list(self._by_count)
+        for path, (size, count) in (self._partial or {}).items():
+            self._offer(by_size, (size, path, count))
+            self._offer(by_count, (count, path, size))
+
+        return {
+            "by_size": [RankedDirectory(path, size, count)
+                        for size, path, count in sorted(by_size, reverse=True)],
+            "by_count": [RankedDirectory(path, size, count)
+                         for count, path, size in sorted(by_count, reverse=True)],
+        }
+
+    def _close(self) -> None:
+        """Finish the deepest open directory and pass its totals to its parent."""
+        path, size, count = self._chain.pop()
+        if not self._chain:
+            return  # a root
+
+        parent = self._chain[-1]
+        parent[1] += size
+        parent[2] += count
+
+        if not count:
+            return  # nothing (matching) below it
+        if self._partial is not None:
+            totals = self._partial.setdefault(path, [0, 0])
+            totals[0] += size
+            totals[1] += count
+        else:
+            self._offer(self._by_size, (size, path, count))
+            self._offer(self._by_count, (count, path, size))
+
+    def _offer(self, heap: List[Tuple[int, str, int]], item: Tuple[int, str, int]) -> None:
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
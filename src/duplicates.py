@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Duplicates - Staged Duplicate File Detection
+============================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Find files with identical content while reading as few bytes as possible.
+Candidates are narrowed down in stages, and each stage only looks at files
+that survived the previous one:
+
+    1. group files by size (from the scan, no reads)
+    2. drop sizes that occur once
+    3. hash the first and last few KB; drop unique samples
+    4. hash the remaining files completely, in parallel (mmap for big files)
+
+Features:
+    - Size grouping as a pipeline aggregator, so it shares a traversal
+      with the other aggregates
+    - Hard links to the same inode are not reported as duplicates
+    - Parallel hashing on a thread pool
+    - Reclaimable space per group and in total
+    - Counters for every stage, including the number of bytes read
+    - Optional persistent HashCache: unchanged files are never re-read
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> report = FileOrganizer().find_duplicates("/Users/daniel/Pictures")
+    >>> for group in report['groups'][:5]:
+    ...     print(group.reclaimable, group.paths)
+"""
+
+import os
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    from .aggregators import Aggregator
+    from .hashing import DEFAULT_ALGORITHM, hash_file, hash_sample, sample_covers_file
+    from .hash_cache import HashCache, sample_kind
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+    from hashing import DEFAULT_ALGORITHM, hash_file, hash_sample, sample_covers_file
+    from hash_cache import HashCache, sample_kind
+
+
+class DuplicateGroup(NamedTuple):
+    """Files that share one content."""
+
+    size: int
+    digest: str
+    paths: List[str]
+
+    @property
+    def reclaimable(self) -> int:
+        """Bytes freed by keeping a single copy."""
+        return self.size * (len(self.paths) - 1)
+
+
+class SizeGroupCollector(Aggregator):
+    """Group files by size; the first stage of duplicate detection."""
+
+    name = "size_groups"
+
+    def __init__(self, min_size: int = 1):
+        """
+        Initialize the collector.
+
+        Args:
+            min_size: Ignore files smaller than this many bytes (default
+                      skips empty files, which are trivially identical)
+        """
+        self.min_size = min_size
+        # size -> [(path, device, inode), ...]
+        self.groups: Dict[int, List[Tuple[str, int, int]]] = {}
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        groups = self.groups
+        min_size = self.min_size
+        join = os.path.join
+        for name, st in files:
+            size = st.st_size
+            if size >= min_size:
+                entry = (join(dirpath, name), st.st_dev, st.st_ino)
+                group = groups.get(size)
+                if group is None:
+                    groups[size] = [entry]
+                else:
+                    group.append(entry)
+        return bool(files)
+
+    def merge(self, other: "SizeGroupCollector") -> None:
+        for size, entries in other.groups.items():
+            self.groups.setdefault(size, []).extend(entries)
+
+    def spawn(self) -> "SizeGroupCollector":
+        return SizeGroupCollector(self.min_size)
+
+    def result(self) -> Dict[int, List[str]]:
+        """
+        Return the sizes shared by more than one file.
+
+        Hard links are collapsed to one path per inode first, since they
+        do not use extra space.
+
+        Returns:
+            Dictionary mapping size to the sorted paths of that size
+        """
+        candidates = {}
+        for size, entries in self.groups.items():
+            if len(entries) < 2:
+                continue
+            by_inode: Dict[Tuple[int, int], str] = {}
+            for path, device, inode in entries:
+                key = (device, inode)
+                if key not in by_inode or path < by_inode[key]:
+                    by_inode[key] = path
+            if len(by_inode) > 1:
+                candidates[size] = sorted(by_inode.values())
+        return candidates
+
+
+class DuplicateFinder:
+    """Confirm duplicate candidates with sample and full content hashes."""
+
+    def __init__(
+        self,
+        sample_size: int = 4096,
+        workers: int = 4,
+        on_error: Optional[Callable[[str, OSError], None]] = None,
+        cache: Optional[HashCache] = None
+    ):
+        """
+        Initialize the finder.
+
+        Args:
+            sample_size: Bytes hashed from each end of a file in the sample stage
+            workers: Number of hashing threads
+            cache: Optional digest cache; files whose (device, inode, size,
+                   mtime) are cached are not read
+            on_error: Optional function called for every unreadable file
+                      Signature: on_error(path: str, error: OSError)
+
+        Raises:
+            ValueError: If workers or sample_size is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if sample_size < 1:
+            raise ValueError("sample_size must be at least 1")
+
+        self.sample_size = sample_size
+        self.workers = workers
+        self.on_error = on_error
+        self.cache = cache
+        self.candidate_count = 0
+        self.cache_hits = 0
+        self.sample_hashed = 0
+        self.fully_hashed = 0
+        self.bytes_read = 0
+
+    def find(self, candidates: Mapping[int, Sequence[str]]) -> Dict[str, object]:
+        """
+        Find duplicates among files grouped by size.
+
+        Args:
+            candidates: Size -> paths, e.g. SizeGroupCollector.result()
+
+        Returns:
+            Dictionary with keys:
+                'groups': List of DuplicateGroup, most reclaimable first
+                'duplicate_files': Files that could be removed
+                'reclaimable_bytes': Space freed by keeping one copy of each
+                'candidates', 'sample_hashed', 'fully_hashed', 'bytes_read',
+                'cache_hits': Work done by each stage
+
+        Example:
+            >>> finder = DuplicateFinder(workers=8)
+            >>> report = finder.find({1024: ["/a/x.bin", "/b/x.bin", "/c/y.bin"]})
+        """
+        self.candidate_count = sum(len(paths) for paths in candidates.values() if len(paths) > 1)
+        sample_size = self.sample_size
+
+        groups: List[DuplicateGroup] = []
+        pending: List[Tuple[int, str]] = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # Stage 3: sample hashes
+            jobs = [
+                (size, path)
+                for size, paths in candidates.items() if len(paths) > 1
+                for path in paths
+            ]
+            for size, digest, paths in self._group(pool, jobs, full=False):
+                if sample_covers_file(size, sample_size):
+                    # The sample was the whole file: already confirmed
+                    groups.append(DuplicateGroup(size, digest, paths))
+                else:
+                    pending.extend((size, path) for path in paths)
+
+            # Stage 4: full hashes of what is left
+            groups.extend(
+                DuplicateGroup(size, digest, paths)
+                for size, digest, paths in self._group(pool, pending, full=True)
+            )
+
+        groups.sort(key=lambda group: (-group.reclaimable, group.paths[0]))
+        return {
+            "groups": groups,
+            "duplicate_files": sum(len(group.paths) - 1 for group in groups),
+            "reclaimable_bytes": sum(group.reclaimable for group in groups),
+            "candidates": self.candidate_count,
+            "sample_hashed": self.sample_hashed,
+            "fully_hashed": self.fully_hashed,
+            "bytes_read": self.bytes_read,
+            "cache_hits": self.cache_hits,
+        }
+
+    def _group(
+        self,
+        pool: ThreadPoolExecutor,
+        jobs: Sequence[Tuple[int, str]],
+        full: bool
+    ) -> List[Tuple[int, str, List[str]]]:
+        """Hash (size, path) jobs on the pool and keep digests shared by several files."""
+        by_digest: Dict[Tuple[int, str], List[str]] = {}
+        hash_job = self._full_job if full else self._sample_job
+
+        # Results are consumed here, so counters and on_error stay on one thread
+        for (size, path), outcome in zip(jobs, pool.map(hash_job, jobs)):
+            if isinstance(outcome, OSError):
+                self._record_error(path, outcome)
+                continue
+            digest, cached = outcome
+            if full:
+                self.fully_hashed += 1
+            else:
+                self.sample_hashed += 1
+            if cached:
+                self.cache_hits += 1
+            else:
+                self.bytes_read += size if full else min(size, 2 * self.sample_size)
+            by_digest.setdefault((size, digest), []).append(path)
+
+        return [
+            (size, digest, sorted(paths))
+            for (size, digest), paths in by_digest.items()
+            if len(paths) > 1
+        ]
+
+    def _sample_job(self, job: Tuple[int, str]) -> Union[Tuple[str, bool], OSError]:
+        size, path = job
+        compute = partial(hash_sample, path, size, self.sample_size)
+        return self._hash(path, sample_kind(self.sample_size), compute)
+
+    def _full_job(self, job: Tuple[int, str]) -> Union[Tuple[str, bool], OSError]:
+        path = job[1]
+        return self._hash(path, DEFAULT_ALGORITHM, partial(hash_file, path))
+
+    def _hash(
+        self,
+        path: str,
+        kind: str,
+        compute: Callable[[], str]
+    ) -> Union[Tuple[str, bool], OSError]:
+        """Return (digest, came from cache), or the error that prevented hashing."""
+        try:
+            if self.cache is not None:
+                return self.cache.digest(path, kind, compute)
+            return compute(), False
+        except OSError as e:
+            return e
+
+    def _record_error(self, path: str, error: OSError) -> None:
+        if self.on_error is not None:
+            self.on_error(path, error)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Error Ledger - Bounded Record of Inaccessible Files
+====================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Keep track of the files and directories a scan could not read without
+letting the record grow with the number of failures. Scanning / as a normal
+user produces hundreds of thousands of PermissionErrors; the ledger counts
+them by errno and by top-level directory and keeps only a few example paths
+per errno. Messages are formatted when someone reads the summary, not in
+the scan loop.
+
+Features:
+    - Counts per errno and per top-level directory below the scan roots
+    - A bounded number of example paths per errno
+    - Exceptions stored as-is; strings are built only by summary()/lines()
+    - Callable like the scanner's on_error handler
+    - Thread-safe, mergeable and picklable (process-pool shards)
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> organizer = FileOrganizer()
+    >>> organizer.find_largest_files("/")
+    >>> for line in organizer.error_ledger.lines():
+    ...     print(line)
+"""
+
+import os
+import errno
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class ErrorLedger:
+    """
+    Count scan errors by errno and top-level directory, with a few examples.
+
+    Args:
+        roots: Scan roots; failures are attributed to the first directory
+               below the root they occurred in
+        max_examples: Example paths kept per errno
+
+    Example:
+        >>> ledger = ErrorLedger(["/data"])
+        >>> ledger("/data/private/a", PermissionError(errno.EACCES, "Permission denied"))
+        >>> ledger.by_directory
+        {'/data/private': 1}
+    """
+
+    def __init__(self, roots: Sequence[str] = (), max_examples: int = 5):
+        """Initialize an empty ledger."""
+        self.max_examples = max_examples
+        self._lock = threading.Lock()
+        self.reset(roots)
+
+    def reset(self, roots: Sequence[str] = ()) -> None:
+        """
+        Forget every recorded error and attribute new ones to these roots.
+
+        Args:
+            roots: Scan roots of the next scan
+        """
+        # As given to the scanner, which builds paths from them; longest
+        # first, so nested roots win over their parents
+        stripped = (root.rstrip(os.sep) or os.sep for root in roots)
+        self.roots = sorted(stripped, key=len, reverse=True)
+        self.count = 0
+        self.by_errno: Dict[Optional[int], int] = {}
+        self.by_directory: Dict[str, int] = {}
+        self._examples: Dict[Optional[int], List[Tuple[str, BaseException]]] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __call__(self, path: str, error: BaseException) -> None:
+        """Record a failure; signature of the scanner's on_error handler."""
+        self.record(path, error)
+
+    def record(self, path: str, error: BaseException) -> None:
+        """
+        Record one inaccessible file or directory.
+
+        Args:
+            path: Path that could not be read
+            error: The exception raised for it
+        """
+        code = getattr(error, "errno", None)
+        directory = self._top_level(path)
+        with self._lock:
+            self.count += 1
+            self.by_errno[code] = self.by_errno.get(code, 0) + 1
+            self.by_directory[directory] = self.by_directory.get(directory, 0) + 1
+            examples = self._examples.setdefault(code, [])
+            if len(examples) < self.max_examples:
+                examples.append((path, error))
+
+    def _top_level(self, path: str) -> str:
+        """Return the entry directly below the root holding path."""
+        sep = os.sep
+        for root in self.roots:
+            if not path.startswith(root):
+                continue
+            start = len(root) if root.endswith(sep) else len(root) + 1
+            if start > len(path):
+                return root
+            if start == len(root) + 1 and path[len(root)] != sep:
+                continue
+            end = path.find(sep, start)
+            return path if end < 0 else path[:end]
+        return os.path.dirname(path)
+
+    def merge(self, other: "ErrorLedger") -> None:
+        """
+        Add another ledger's counts and examples to this one.
+
+        Args:
+            other: Ledger created by spawn(), e.g. in a worker process
+        """
+        with self._lock:
+            self.count += other.count
+            for code, count in other.by_errno.items():
+                self.by_errno[code] = self.by_errno.get(code, 0) + count
+            for directory, count in other.by_directory.items():
+                self.by_directory[directory] = self.by_directory.get(directory, 0) + count
+            for code, examples in other._examples.items():
+                mine = self._examples.setdefault(code, [])
+                mine.extend(examples[:self.max_examples - len(mine)])
+
+    def spawn(self) -> "ErrorLedger":
+        """Create an empty ledger with the same roots and limits."""
+        return ErrorLedger(self.roots, self.max_examples)
+
+    def examples(self) -> List[Tuple[str, str]]:
+        """
+        Return the kept example failures with their messages.
+
+        Returns:
+            List of (path, message), grouped by errno
+        """
+        with self._lock:
+            return [(path, str(error)) for examples in self._examples.values()
+                    for path, error in examples]
+
+    def summary(self, top_directories: int = 5) -> Dict[str, Any]:
+        """
+        Describe the recorded failures.
+
+        Args:
+            top_directories: Number of directories to list
+
+        Returns:
+            Dictionary with 'total', 'by_errno' as (name, description, count),
+            most frequent first, 'by_directory' as (directory, count) and
+            'examples' as (path, message)
+        """
+        with self._lock:
+            by_errno = sorted(self.by_errno.items(), key=lambda item: -item[1])
+            by_directory = sorted(self.by_directory.items(), key=lambda item: (-item[1], item[0]))
+            total = self.count
+
+        return {
+            "total": total,
+            "by_errno": [
+                (errno.errorcode.get(code, "unknown") if code is not None else "other",
+                 os.strerror(code) if code is not None else "Other error",
+                 count)
+                for code, count in by_errno
+            ],
+            "by_directory": by_directory[:top_directories],
+            "examples": self.examples(),
+        }
+
+    def lines(self, top_directories: int = 3) -> List[str]:
+        """
+        Format the summary as short human-readable lines.
+
+        Args:
+            top_directories: Number of directories to list
+
+        Returns:
+            Lines without trailing newlines; empty when nothing failed
+        """
+        if not self.count:
+            return []
+
+        summary = self.summary(top_directories)
+        lines = [f"{summary['total']:,} entries could not be read:"]
+        for name, description, count in summary["by_errno"]:
+            lines.append(f"  {count:>10,} × {description} ({name})")
+        if summary["by_directory"]:
+            lines.append("  Most affected:")
+            for directory, count in summary["by_directory"]:
+                lines.append(f"  {count:>10,} in {directory}")
+        return lines
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        # Tracebacks keep frames alive and do not pickle; the error is enough
+        state["_examples"] = {
+            code: [(path, error.with_traceback(None)) for path, error in examples]
+            for code, examples in self._examples.items()
+        }
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Exclusions - gitignore-style Rules that Prune Whole Subtrees
+============================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Skip node_modules, __pycache__, build caches, VM images and anything else
+not worth walking. Rules use .gitignore syntax and come from three places:
+
+    - global rules, matched against the absolute path of every entry
+      (a user-wide file such as ~/.file_automation_suite/ignore, or
+      patterns passed in code)
+    - per-root rules, relative to one scan root
+    - per-directory rule files (.scanignore by default), relative to the
+      directory holding them and read as the scan reaches it
+
+An excluded directory is pruned before it is listed, so nothing below it
+costs a syscall. Deeper rules override shallower ones and later lines
+override earlier ones; '!pattern' re-includes, as in git.
+
+Features:
+    - Full .gitignore pattern syntax: *, ?, [...], **, trailing '/' for
+      directories only, leading or inner '/' to anchor, '!' to negate
+    - Rule sets without negations compile into a single regex
+    - Per-directory rule files are picked up from the listing the scanner
+      makes anyway, so they cost no extra syscall
+    - Picklable, for process-pool scans
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from exclusions import COMMON_PATTERNS, Exclusions
+    >>> rules = Exclusions(patterns=COMMON_PATTERNS)
+    >>> rules.is_excluded("/Users/daniel/src/app/node_modules", is_dir=True)
+    True
+    >>> FileOrganizer(exclusions=rules).find_largest_files("/Users/daniel")
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# User-wide rules, loaded by the command line tool when present
+DEFAULT_RULES_PATH = Path.home() / ".file_automation_suite" / "ignore"
+
+# Name of per-directory rule files
+RULE_FILE = ".scanignore"
+
+# Trees that are rarely what a disk-usage scan is looking for
+COMMON_PATTERNS = (
+    # Dependencies, caches and build output
+    "node_modules/",
+    "bower_components/",
+    "__pycache__/",
+    ".venv/",
+    "venv/",
+    ".tox/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".gradle/",
+    ".cache/",
+    "DerivedData/",
+    "Pods/",
+    "target/",
+    # Version control internals
+    ".git/",
+    ".hg/",
+    ".svn/",
+    # Virtual machine images and bundles
+    "*.vmdk",
+    "*.vdi",
+    "*.qcow2",
+    "*.vmwarevm/",
+    "*.pvm/",
+    "*.utm/",
+)
+
+
+def _translate(pattern: str) -> str:
+    """Translate the body of a gitignore pattern into a regular expression."""
+    i, n = 0, len(pattern)
+    out: List[str] = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                starts_segment = i == 0 or pattern[i - 1] == "/"
+                if starts_segment and pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")      # zero or more directories
+                    i += 3
+                    continue
+                if starts_segment and i + 2 == n:
+                    out.append(".*")            # everything inside
+                    i += 2
+                    continue
+            out.append("[^/]*")
+            i += 1
+            while i < n and pattern[i] == "*" and not pattern.startswith("**/", i):
+                i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            # A ']' right after '[' (or '[!') is part of the class
+            start = i + 2 if pattern[i + 1:i + 2] in ("!", "^") else i + 1
+            end = pattern.find("]", start + 1)
+            if end < 0:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class Rule:
+    """One compiled gitignore pattern."""
+
+    __slots__ = ("pattern", "negated", "dir_only", "anchored", "literal", "suffix", "regex")
+
+    def __init__(self, pattern: str, negated: bool, dir_only: bool, anchored: bool, body: str):
+        """
+        Compile a parsed pattern.
+
+        Args:
+            pattern: Line as written, for repr()
+            negated: '!' pattern that re-includes
+            dir_only: Pattern ending in '/', matching directories only
+            anchored: Matched against the path below the base directory;
+                      otherwise against the entry name alone
+            body: Pattern without '!', leading and trailing slashes
+        """
+        self.pattern = pattern
+        self.negated = negated
+        self.dir_only = dir_only
+        self.anchored = anchored
+        # Plain names ('node_modules') and suffixes ('*.vmdk') need no regex
+        plain = not anchored and not any(c in body.lstrip("*") for c in "*?[\\")
+        self.literal = body if plain and not body.startswith("*") else None
+        suffix = plain and body.startswith("*") and not body.startswith("**")
+        self.suffix = body[1:] if suffix else None
+        self.regex = re.compile(_translate(body) + r"\Z")
+
+    def __repr__(self) -> str:
+        return f"Rule({self.pattern!r})"
+
+    def matches(self, prefix: str, name: str) -> bool:
+        """Check the entry name in the directory at prefix (relative to the base)."""
+        return self.regex.match(prefix + name if self.anchored else name) is not None
+
+    @classmethod
+    def parse(cls, line: str) -> Optional["Rule"]:
+        """
+        Compile one line of a rule file.
+
+        Args:
+            line: Line in .gitignore syntax
+
+        Returns:
+            Rule, or None for blank lines and comments
+        """
+        line = line.rstrip("\r\n")
+        # Trailing spaces are dropped unless escaped
+        stripped = line.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(line):
+            stripped += " "
+        line = stripped
+        if not line or line.startswith("#"):
+            return None
+
+        pattern = line
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        # A slash anywhere but the end anchors the pattern to its base
+        anchored = "/" in line
+        return cls(pattern, negated, dir_only, anchored, line.lstrip("/"))
+
+
+class RuleSet:
+    """Ordered rules that share a base directory."""
+
+    def __init__(self, lines: Iterable[str], source: str = "<patterns>"):
+        """
+        Compile rules.
+
+        Args:
+            lines: Patterns or lines of a rule file
+            source: Where the rules came from, for repr()
+        """
+        self.source = source
+        self.rules = [rule for rule in map(Rule.parse, lines) if rule is not None]
+        # Without negations the last-match-wins scan reduces to "any match":
+        # plain names become sets, the other patterns one alternation regex
+        # each for names and for relative paths, split by directory-only
+        self._simple = not any(rule.negated for rule in self.rules)
+        if self._simple:
+            self._names = [frozenset(rule.literal for rule in self.rules
+                                     if rule.literal is not None and rule.dir_only == dirs)
+                           for dirs in (False, True)]
+            self._suffixes = [tuple(rule.suffix for rule in self.rules
+                                    if rule.suffix is not None and rule.dir_only == dirs)
+                              for dirs in (False, True)]
+            self._name_res = [self._combine(rule for rule in self.rules
+                                            if rule.literal is None and rule.suffix is None
+                                            and not rule.anchored and rule.dir_only == dirs)
+                              for dirs in (False, True)]
+            self._path_res = [self._combine(rule for rule in self.rules
+                                            if rule.anchored and rule.dir_only == dirs)
+                              for dirs in (False, True)]
+
+    def __repr__(self) -> str:
+        return f"RuleSet({self.source!r}, {len(self.rules)} rules)"
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @staticmethod
+    def _combine(rules: Iterable[Rule]) -> Optional["re.Pattern"]:
+        patterns = [rule.regex.pattern for rule in rules]
+        return re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+
+    def verdict(self, prefix: str, name: str, is_dir: bool) -> Optional[bool]:
+        """
+        Apply the rules to a directory entry.
+
+        Args:
+            prefix: Path of its directory relative to the base directory,
+                    '/'-separated with a trailing '/' ('' for the base itself)
+            name: Entry name
+            is_dir: Whether the entry is a directory
+
+        Returns:
+            True if excluded, False if re-included, None if no rule matches
+        """
+        if self._simple:
+            for kind in ((False, True) if is_dir else (False,)):
+                if name in self._names[kind] or name.endswith(self._suffixes[kind]):
+                    return True
+                name_re = self._name_res[kind]
+                if name_re is not None and name_re.match(name):
+                    return True
+                path_re = self._path_res[kind]
+                if path_re is not None and path_re.match(prefix + name):
+                    return True
+            return None
+        for rule in reversed(self.rules):
+            if (is_dir or not rule.dir_only) and rule.matches(prefix, name):
+                return not rule.negated
+        return None
+
+    @classmethod
+    def from_file(cls, path: str) -> "RuleSet":
+        """
+        Read a rule file.
+
+        Args:
+            path: File in .gitignore syntax
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return cls(f.read().splitlines(), source=path)
+
+
+Matcher = Callable[[str, bool], bool]
+
+
+def _excluded(sets: List[Tuple[str, RuleSet]], name: str, is_dir: bool) -> bool:
+    """Decide on one directory entry; sets are ordered deepest first."""
+    for prefix, rules in sets:
+        verdict = rules.verdict(prefix, name, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+class Exclusions:
+    """Global, per-root and per-directory exclusion rules for a scanner."""
+
+    def __init__(
+        self,
+        patterns: Sequence[str] = (),
+        root_patterns: Optional[Dict[str, Sequence[str]]] = None,
+        global_files: Sequence[str] = (),
+        rule_file: Optional[str] = RULE_FILE
+    ):
+        """
+        Compile exclusion rules.
+
+        Args:
+            patterns: Global patterns, matched against absolute paths
+                      ('node_modules/' anywhere, '/Volumes/Backup' exactly)
+            root_patterns: Patterns per scan root, relative to that root
+            global_files: Rule files holding further global patterns
+            rule_file: Name of per-directory rule files, or None to ignore them
+
+        Raises:
+            OSError: If a global rule file cannot be read
+        """
+        self.rule_file = rule_file
+        lines = list(patterns)
+        for path in global_files:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                lines += f.read().splitlines()
+        self.global_rules = RuleSet(lines, "<global>")
+        self._root_rules: Dict[str, RuleSet] = {
+            os.path.abspath(root): RuleSet(lines, root)
+            for root, lines in (root_patterns or {}).items()
+        }
+        # Directories holding a rule file, by absolute path
+        self._file_rules: Dict[str, RuleSet] = {}
+
+    def __repr__(self) -> str:
+        return (f"Exclusions({len(self.global_rules)} global rules, "
+                f"{len(self._root_rules)} roots, {len(self._file_rules)} rule files)")
+
+    @property
+    def signature(self) -> str:
+        """Stable description of the configured rules, e.g. to invalidate caches."""
+        roots = sorted((root, [rule.pattern for rule in rules.rules])
+                       for root, rules in self._root_rules.items())
+        return repr(([rule.pattern for rule in self.global_rules.rules], roots, self.rule_file))
+
+    def enter(self, dirpath: str, names: Optional[Iterable[str]] = None) -> Optional[Matcher]:
+        """
+        Prepare the rules for the entries of one directory.
+
+        The scanner calls this with the names it listed, so a rule file is
+        only opened when it exists. Pass names=None to look on disk instead.
+        Parent directories must have been entered first.
+
+        Args:
+            dirpath: Directory about to be filtered
+            names: Names of its entries, if already listed
+
+        Returns:
+            matcher(name, is_dir) -> True if the entry is excluded, or
+            None if no rule can apply in this directory
+        """
+        absdir = os.path.abspath(dirpath)
+        if self.rule_file is not None:
+            if names is None or self.rule_file in names:
+                try:
+                    rule_path = os.path.join(absdir, self.rule_file)
+                    self._file_rules[absdir] = RuleSet.from_file(rule_path)
+                except OSError:
+                    self._file_rules.pop(absdir, None)
+            elif self._file_rules:
+                # Re-listed after its rule file was deleted
+                self._file_rules.pop(absdir, None)
+
+        sets = self._applicable(absdir)
+        if not sets:
+            return None
+        if len(sets) == 1:
+            # Usually just the global rules: skip the loop over rule sets
+            prefix, verdict = sets[0][0], sets[0][1].verdict
+            return lambda name, is_dir: verdict(prefix, name, is_dir) is True
+        return lambda name, is_dir: _excluded(sets, name, is_dir)
+
+    def is_excluded(self, path: str, is_dir: bool = False) -> bool:
+        """
+        Check a single path against the rules loaded so far.
+
+        Args:
+            path: File or directory
+            is_dir: Whether path is a directory
+
+        Returns:
+            True if the path is excluded
+        """
+        dirpath, name = os.path.split(os.path.abspath(path))
+        sets = self._applicable(dirpath)
+        return bool(sets) and _excluded(sets, name, is_dir)
+
+    def _applicable(self, absdir: str) -> List[Tuple[str, RuleSet]]:
+        """Collect (relative prefix, rules) for absdir, deepest first."""
+        sets: List[Tuple[str, RuleSet]] = []
+        if self._root_rules or self._file_rules:
+            base = absdir
+            while True:
+                for table in (self._file_rules, self._root_rules):
+                    rules = table.get(base)
+                    if rules:
+                        sets.append((self._prefix(absdir, base), rules))
+                parent = os.path.dirname(base)
+                if parent == base:
+                    break
+                base = parent
+        if self.global_rules.rules:
+            # Global rules see the absolute path without its anchor
+            sets.append((self._prefix(absdir, None), self.global_rules))
+        return sets
+
+    @staticmethod
+    def _prefix(absdir: str, base: Optional[str]) -> str:
+        """Relative path of absdir below base ('/'-separated, with trailing '/')."""
+        if base is None:
+            relative = os.path.splitdrive(absdir)[1].lstrip(os.sep)
+        else:
+            relative = absdir[len(base):].lstrip(os.sep)
+        if not relative:
+            return ""
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+        return relative + "/"
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Export - Streaming NDJSON and CSV Output of Scan Results
+=========================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Write every scanned file, or any aggregate, to NDJSON or CSV while the scan
+runs. Rows are formatted as they arrive and written in large batches, so an
+export of tens of millions of files uses constant memory and runs at disk
+speed. Files ending in .gz are compressed on the fly.
+
+Features:
+    - NDJSON (one JSON object per line) and CSV, optionally gzip-compressed;
+      the format follows the file name (.ndjson/.jsonl/.csv, plus .gz)
+    - Batched writes; nothing is kept once written
+    - File names are written byte for byte (surrogateescape), like the
+      scan index and snapshots store them
+    - Pipeline aggregator: threads and processes stream to their own part
+      files, which are appended to the export when the scan finishes;
+      already collected FileRecords are exported with add_records()
+    - export_rows() for any aggregate: NamedTuples name their own columns
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> organizer = FileOrganizer()
+    >>> organizer.export_files("/Users/daniel", "all-files.ndjson.gz")
+    >>> ranking = organizer.find_largest_directories("/Users/daniel", top_n=100)
+    >>> export_rows("folders.csv", ranking['by_size'])
+"""
+
+import os
+import csv
+import gzip
+import json
+import shutil
+import tempfile
+import weakref
+from itertools import chain
+from typing import Any, BinaryIO, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .aggregators import Aggregator
+    from .external_sort import _remove_files
+    from .records import FileRecord
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+    from external_sort import _remove_files
+    from records import FileRecord
+
+FORMATS = ("ndjson", "csv")
+
+# Columns of a file export; mtime in seconds since the epoch
+FILE_FIELDS = ("path", "size", "mtime")
+
+# Rows formatted before they are written out in one call
+_BATCH_ROWS = 4096
+
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+def detect_format(path: Union[str, "os.PathLike[str]"]) -> Tuple[str, bool]:
+    """
+    Tell the export format from a file name.
+
+    Args:
+        path: File name ending in .csv, .ndjson, .jsonl or .json,
+              optionally followed by .gz
+
+    Returns:
+        (format, compress), e.g. ("ndjson", True) for "files.ndjson.gz"
+
+    Raises:
+        ValueError: If the extension is not recognized
+    """
+    name = os.fspath(path).lower()
+    compress = name.endswith(".gz")
+    if compress:
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return "csv", compress
+    if name.endswith((".ndjson", ".jsonl", ".json")):
+        return "ndjson", compress
+    raise ValueError(f"cannot tell the export format of {os.fspath(path)!r}; "
+                     "use .csv, .ndjson or .jsonl, optionally with .gz")
+
+
+class ExportWriter:
+    """
+    Write rows of values as NDJSON or CSV in large batches.
+
+    Args:
+        destination: File path, or a binary file object (which is flushed
+                     but not closed)
+        fields: Column names
+        format: "ndjson" or "csv" (default: from the file name)
+        compress: Gzip the output (default: when the file name ends in .gz)
+        header: Write a CSV header line
+
+    Raises:
+        ValueError: If the format is unknown or cannot be told from the
+                    destination
+        OSError: If the file cannot be created
+
+    Example:
+        >>> with ExportWriter("sizes.csv", ["path", "size"]) as writer:
+        ...     writer.write_rows([("/tmp/a", 10), ("/tmp/b", 20)])
+        2
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        fields: Sequence[str],
+        format: Optional[str] = None,
+        compress: Optional[bool] = None,
+        header: bool = True
+    ):
+        """Open the destination and write the CSV header."""
+        if isinstance(destination, (str, os.PathLike)):
+            detected, gzipped = detect_format(destination) if format is None else (format, False)
+            format = detected
+            compress = gzipped if compress is None else compress
+        elif format is None:
+            raise ValueError("format is required when writing to a file object")
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+        self.format = format
+        self.compress = bool(compress)
+        self.fields = list(fields)
+        self.rows_written = 0
+        self._pending: List[str] = []
+
+        if isinstance(destination, (str, os.PathLike)):
+            self._file = open(destination, "wb", buffering=1024 * 1024)
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+        # Level 6 keeps compression well ahead of the disk
+        self._stream = self._file
+        if self.compress:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=6)
+
+        if format == "csv":
+            # The csv module writes each formatted row into the batch
+            self._csv = csv.writer(_Batch(self._pending))
+            if header:
+                self._csv.writerow(self.fields)
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False, check_circular=False).encode
+            self._encode = encode
+            # '{"path":', ',"size":', ... are encoded once, not for every row
+            self._keys = [
+                ("," if i else "{") + encode(field) + ":" for i, field in enumerate(self.fields)
+            ]
+
+    def write_row(self, row: Sequence[Any]) -> None:
+        """
+        Add one row; values in the order of fields.
+
+        Args:
+            row: Sequence of str, int, float, bool or None values
+        """
+        if self.format == "csv":
+            self._csv.writerow(row)
+        else:
+            encode = self._encode
+            pairs = [key + encode(value) for key, value in zip(self._keys, row)]
+            self._pending.append("".join(pairs) + "}\n")
+        self.rows_written += 1
+        if len(self._pending) >= _BATCH_ROWS:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Add many rows.
+
+        Returns:
+            Number of rows written by this call
+        """
+        before = self.rows_written
+        for row in rows:
+            self.write_row(row)
+        return self.rows_written - before
+
+    def write_raw(self, path: str) -> None:
+        """
+        Append a file of rows already formatted by a writer like this one.
+
+        Args:
+            path: Uncompressed part file without a header
+        """
+        self.flush()
+        with open(path, "rb") as part:
+            shutil.copyfileobj(part, self._stream, 1024 * 1024)
+
+    def flush(self) -> None:
+        """Write the formatted rows."""
+        if self._pending:
+            self._stream.write("".join(self._pending).encode("utf-8", "surrogateescape"))
+            self._pending.clear()
+
+    def close(self) -> None:
+        """Write what is left and close the output."""
+        if self._stream is None:
+            return
+        self.flush()
+        if self.compress:
+            self._stream.close()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._stream = None
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _Batch:
+    """File-like object the csv module writes formatted rows into."""
+
+    def __init__(self, pending: List[str]):
+        self.write = pending.append
+
+
+def export_rows(
+    destination: Destination,
+    rows: Iterable[Sequence[Any]],
+    fields: Optional[Sequence[str]] = None,
+    format: Optional[str] = None,
+    compress: Optional[bool] = None
+) -> int:
+    """
+    Write any sequence of rows, e.g. an aggregate's result, as NDJSON or CSV.
+
+    Args:
+        destination: File path or binary file object
+        rows: Tuples of values; may be a stream (SortedFiles, a generator)
+        fields: Column names (default: the fields of NamedTuple rows such
+                as RankedDirectory, FileRecord or Trend)
+        format: "ndjson" or "csv" (default: from the file name)
+        compress: Gzip the output (default: when the file name ends in .gz)
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If fields are not given and the rows do not name them
+
+    Example:
+        >>> organizer = FileOrganizer()
+        >>> with organizer.iter_sorted_files("/Users/daniel") as listing:
+        ...     export_rows("by-size.csv.gz", listing, fields=["size", "path"])
+    """
+    rows = iter(rows)
+    if fields is None:
+        first = next(rows, None)
+        fields = getattr(first, "_fields", None)
+        if fields is None and first is not None:
+            raise ValueError("fields are required for rows that are not NamedTuples")
+        rows = chain([first], rows) if first is not None else rows
+
+    with ExportWriter(destination, fields or (), format, compress) as writer:
+        return writer.write_rows(rows)
+
+
+class FileExporter(Aggregator):
+    """
+    Stream one row per scanned file (path, size, mtime) to an export file.
+
+    The export is complete once the scan has finished and the exporter is
+    closed. Parallel workers write uncompressed part files that are merged
+    into the export in turn.
+
+    Args:
+        destination: File path or binary file object
+        format: "ndjson" or "csv" (default: from the file name)
+        compress: Gzip the output (default: when the file name ends in .gz)
+        spill_dir: Directory for the part files of parallel scans
+                   (default: the system temp dir)
+
+    Example:
+        >>> with FileExporter("all-files.csv.gz") as exporter:
+        ...     ScanPipeline([exporter], workers=4).run("/Users/daniel")
+    """
+
+    name = "export"
+
+    def __init__(
+        self,
+        destination: Destination,
+        format: Optional[str] = None,
+        compress: Optional[bool] = None,
+        spill_dir: Optional[str] = None
+    ):
+        """Open the export; the CSV header is written right away."""
+        self.writer: Optional[ExportWriter] = ExportWriter(
+            destination, FILE_FIELDS, format, compress
+        )
+        self.format = self.writer.format
+        self.spill_dir = spill_dir
+        self.file_count = 0
+        self._parts: List[str] = []
+        self._finalizer = weakref.finalize(self, _remove_files, self._parts)
+
+    def _start_part(self) -> ExportWriter:
+        """Open a part file for a worker's rows."""
+        fd, path = tempfile.mkstemp(prefix="export-", suffix=".part", dir=self.spill_dir)
+        os.close(fd)
+        self._parts.append(path)
+        self.writer = ExportWriter(path, FILE_FIELDS, self.format, compress=False, header=False)
+        return self.writer
+
+    def offer(self, path: str, size: int, mtime: float) -> None:
+        """
+        Add a single file.
+
+        Args:
+            path: Full file path
+            size: File size in bytes
+            mtime: Modification time in seconds since the epoch
+        """
+        writer = self.writer if self.writer is not None else self._start_part()
+        writer.write_row((path, size, mtime))
+        self.file_count += 1
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        if not files:
+            return False
+        writer = self.writer if self.writer is not None else self._start_part()
+        join = os.path.join
+        write_row = writer.write_row
+        for name, st in files:
+            write_row((join(dirpath, name), st.st_size, st.st_mtime))
+        self.file_count += len(files)
+        return True
+
+    def add_records(self, records: Iterable[FileRecord]) -> int:
+        """
+        Add files that were already collected, e.g. find_largest_records().
+
+        Args:
+            records: FileRecords, or any iterable of FileRecord tuples
+
+        Returns:
+            Number of files added
+        """
+        writer = self.writer if self.writer is not None else self._start_part()
+        write_row = writer.write_row
+        count = 0
+        for size, path, mtime_ns, _inode in records:
+            write_row((path, size, mtime_ns / 1e9))
+            count += 1
+        self.file_count += count
+        return count
+
+    def merge(self, other: "FileExporter") -> None:
+        """
+        Append another exporter's part files to this export.
+
+        Args:
+            other: Exporter created by spawn(); its part files are deleted
+        """
+        if other.writer is not None:
+            other.writer.close()
+            other.writer = None
+        writer = self.writer if self.writer is not None else self._start_part()
+        for path in other._parts:
+            writer.write_raw(path)
+        _remove_files(other._parts)
+        self.file_count += other.file_count
+        other.file_count = 0
+
+    def spawn(self) -> "FileExporter":
+        # The part file is created when the worker writes its first row, so
+        # templates sent to worker processes hold no open file
+        exporter = FileExporter.__new__(FileExporter)
+        exporter.writer = None
+        exporter.format = self.format
+        exporter.spill_dir = self.spill_dir
+        exporter.file_count = 0
+        exporter._parts = []
+        exporter._finalizer = weakref.finalize(exporter, _remove_files, exporter._parts)
+        return exporter
+
+    def result(self) -> int:
+        """Number of files exported."""
+        return self.file_count
+
+    def close(self) -> None:
+        """Finish the export (or a worker's part file)."""
+        if self.writer is not None:
+            self.writer.close()
+
+    def __enter__(self) -> "FileExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # A worker's exporter travels back with its finished part files
+        if self.writer is not None:
+            self.writer.close()
+        state = dict(self.__dict__)
+        del state["_finalizer"]
+        state["writer"] = None
+        state["_parts"] = list(self._parts)
+        self._parts.clear()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._finalizer = weakref.finalize(self, _remove_files, self._parts)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+External Sort - Size-Ordered File Listings of Any Length
+=========================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Produce the largest N files, or every file, ordered by size when the answer
+does not fit in memory. Entries are buffered up to a memory budget; a full
+buffer is sorted and written to a temporary run file, and the runs are
+merged lazily while the result is read, so exporters can stream a sorted
+listing of millions of files without ever holding it in RAM.
+
+Features:
+    - Arbitrary limit, or no limit at all
+    - Memory budget in bytes; sorted runs spill to temporary files
+    - Lazy k-way merge of the runs (heapq.merge) while iterating
+    - With a limit, each run is truncated to the limit and files smaller
+      than a full run's smallest entry are rejected without building a path
+    - Same ordering as TopNCollector: size descending, ties by path
+    - Pipeline aggregator: mergeable across threads and picklable for
+      process pools (run files are handed over, not copied)
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> organizer = FileOrganizer()
+    >>> with open("all-files.tsv", "w") as out:
+    ...     for size, path in organizer.iter_sorted_files("/Users/daniel"):
+    ...         out.write(f"{size}\\t{path}\\n")
+"""
+
+import os
+import heapq
+import struct
+import tempfile
+import weakref
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .aggregators import Aggregator
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+
+
+# Run file record: size, length of the UTF-8 path, then the path
+_HEADER = struct.Struct("<QI")
+
+# Rough cost of one buffered (size, path) tuple on top of the path itself
+_ENTRY_OVERHEAD = 120
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+def _remove_files(paths: List[str]) -> None:
+    """Delete run files that are still owned; used as a finalizer."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    paths.clear()
+
+
+def _read_run(path: str) -> Iterator[Tuple[int, str]]:
+    """Stream the entries of one run file in the order they were written."""
+    header_size = _HEADER.size
+    unpack = _HEADER.unpack
+    with open(path, "rb", buffering=1024 * 1024) as f:
+        while True:
+            header = f.read(header_size)
+            if not header:
+                return
+            size, length = unpack(header)
+            yield size, f.read(length).decode("utf-8", "surrogateescape")
+
+
+class SortedFiles(Aggregator):
+    """
+    Collect (size, path) pairs and read them back largest first.
+
+    The object is its own result: iterate it (as often as needed) to
+    stream the ordered entries, and close it, or use it as a context
+    manager, to delete the run files early. Run files left behind are
+    deleted when the object is garbage collected or the interpreter exits.
+
+    Args:
+        limit: Number of entries to keep, or None for all of them
+        memory_budget: Approximate bytes buffered before a run is spilled;
+                       every parallel worker has its own budget
+        spill_dir: Directory for run files (default: the system temp dir)
+
+    Raises:
+        ValueError: If limit is less than 1 or the budget is not positive
+
+    Example:
+        >>> with SortedFiles(memory_budget=16 * 1024 ** 2) as listing:
+        ...     for size, path in [(10, "a"), (30, "b"), (20, "c")]:
+        ...         listing.offer(size, path)
+        ...     list(listing)
+        [(30, 'b'), (20, 'c'), (10, 'a')]
+    """
+
+    name = "largest_files"
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        spill_dir: Optional[str] = None
+    ):
+        """Initialize an empty listing."""
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        if memory_budget <= 0:
+            raise ValueError("memory_budget must be positive")
+
+        self.limit = limit
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.file_count = 0
+        self._buffer: List[Tuple[int, str]] = []
+        self._buffered_bytes = 0
+        # Smallest size that can still make the limit, -1 while unknown
+        self._threshold = -1
+        self._runs: List[str] = []
+        self._finalizer = weakref.finalize(self, _remove_files, self._runs)
+
+    def __len__(self) -> int:
+        """Number of entries iteration will yield."""
+        if self.limit is None:
+            return self.file_count
+        return min(self.limit, self.file_count)
+
+    @property
+    def run_count(self) -> int:
+        """Number of runs spilled to disk so far."""
+        return len(self._runs)
+
+    def offer(self, size: int, path: str) -> None:
+        """
+        Add a single file.
+
+        Args:
+            size: File size in bytes
+            path: Full file path
+        """
+        self.file_count += 1
+        if size < self._threshold:
+            return
+        self._buffer.append((size, path))
+        self._buffered_bytes += _ENTRY_OVERHEAD + len(path)
+        if self._buffered_bytes > self.memory_budget:
+            self._spill()
+
+    def add_pairs(self, pairs: Iterable[Tuple[int, str]]) -> None:
+        """
+        Add (size, path) pairs, e.g. read from a ScanIndex.
+
+        Args:
+            pairs: Iterable of (size in bytes, full path)
+        """
+        for size, path in pairs:
+            self.offer(size, path)
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        """
+        Add one directory's worth of scanner output.
+
+        Files below the threshold of a full run are counted without
+        building their path.
+
+        Returns:
+            True if any file was buffered
+        """
+        buffer = self._buffer
+        join = os.path.join
+        budget = self.memory_budget
+        changed = False
+
+        self.file_count += len(files)
+        for name, st in files:
+            size = st.st_size
+            if size < self._threshold:
+                continue
+            path = join(dirpath, name)
+            buffer.append((size, path))
+            self._buffered_bytes += _ENTRY_OVERHEAD + len(path)
+            changed = True
+            if self._buffered_bytes > budget:
+                self._spill()
+                buffer = self._buffer
+
+        return changed
+
+    def _spill(self) -> None:
+        """Sort the buffer and write it to a new run file."""
+        buffer = self._buffer
+        buffer.sort(reverse=True)
+        if self.limit is not None:
+            del buffer[self.limit:]
+            if len(buffer) == self.limit:
+                # Nothing smaller than this run's last entry can make the cut
+                self._threshold = max(self._threshold, buffer[-1][0])
+
+        fd, path = tempfile.mkstemp(prefix="sorted-files-", suffix=".run", dir=self.spill_dir)
+        self._runs.append(path)
+        pack = _HEADER.pack
+        with os.fdopen(fd, "wb", buffering=1024 * 1024) as f:
+            for size, file_path in buffer:
+                encoded = file_path.encode("utf-8", "surrogateescape")
+                f.write(pack(size, len(encoded)))
+                f.write(encoded)
+
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        """Stream the entries, largest first, merging the runs lazily."""
+        self._buffer.sort(reverse=True)
+        merged = heapq.merge(self._buffer, *(_read_run(path) for path in self._runs), reverse=True)
+        if self.limit is not None:
+            merged = islice(merged, self.limit)
+        return iter(merged)
+
+    def merge(self, other: "SortedFiles") -> None:
+        """
+        Take over another listing's entries and run files.
+
+        Args:
+            other: Listing created by spawn(); it is left empty
+        """
+        self.file_count += other.file_count
+        self._threshold = max(self._threshold, other._threshold)
+        self._runs.extend(other._runs)
+        # The runs now belong to this listing; the other must not delete them
+        other._runs.clear()
+        self._buffer.extend(other._buffer)
+        self._buffered_bytes += other._buffered_bytes
+        other._buffer = []
+        other._buffered_bytes = 0
+        if self._buffered_bytes > self.memory_budget:
+            self._spill()
+
+    def spawn(self) -> "SortedFiles":
+        return SortedFiles(self.limit, self.memory_budget, self.spill_dir)
+
+    def result(self) -> "SortedFiles":
+        return self
+
+    def close(self) -> None:
+        """Delete the run files and drop the buffered entries."""
+        self._finalizer()
+        self._buffer = []
+        self._buffered_bytes = 0
+        self.file_count = 0
+
+    def __enter__(self) -> "SortedFiles":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Pickling hands the run files over: a process-pool worker's copy is
+        # garbage collected before the parent reads the runs
+        state = dict(self.__dict__)
+        del state["_finalizer"]
+        state["_runs"] = list(self._runs)
+        self._runs.clear()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._finalizer = weakref.finalize(self, _remove_files, self._runs)
@@ -10,10 +10,33 @@ Scan directories and organize files by size with real-time progress tracking.
 Cross-platform compatible (macOS, Linux, Windows).
 
 Features:
-    - Find largest files efficiently using heap queue
-    - Real-time progress reporting
-    - Configurable result limits
-    - Error handling for inaccessible files
+    - Find largest files with a bounded heap (memory independent of tree size)
+    - Live leaderboard generator for progressive UIs
+    - scandir-based traversal with one stat per file
+    - Optional multi-threaded scanning (work-stealing traversal)
+    - Optional process-pool scanning sharded by subdirectory
+    - Several roots scanned as one tree
+    - Single-pass analysis: largest files, totals, extensions and size
+      histogram from one traversal
+    - Space per category (video, archives, ...) and per extension
+    - Cold-data report: files bucketed by mtime/atime age, a size x age
+      matrix and the largest files of every age
+    - Optional persistent scan index: repeat queries only re-list
+      directories that changed since the last scan
+    - du-style directory size tree (apparent and allocated size, hard
+      links counted once)
+    - Duplicate detection (size -> sample hash -> full hash) with
+      reclaimable space and a persistent digest cache
+    - Throttled, structured progress events (files, directories, bytes,
+      files/sec), decoupled from stdout; quiet mode for embedding
+    - Any number of results, or all files: sorted runs spill to temporary
+      files and are merged while the listing is streamed
+    - Saved scan snapshots and a streaming diff: added, removed, grown and
+      shrunk files and the directories that grew the most
+    - Bounded error ledger: inaccessible files counted per errno and
+      top-level directory, with a few example paths
+    - Opt-in scan profiling: time per phase, call counts, per-directory
+      latency histogram and the slowest directories
 
 Dependencies:
     - Standard library only
@@ -27,46 +50,182 @@ Example:
 """
 
 import os
+import time
 import heapq
-from typing import List, Tuple, Optional
-from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Optional, Union
+
+try:
+    from .scanner import Roots, Scanner
+    from .aggregators import (
+        Aggregator, ExtensionCollector, SizeDistribution, TopNCollector, TotalsCollector
+    )
+    from .pipeline import ScanPipeline
+    from .scan_index import ScanIndex
+    from .duplicates import DuplicateFinder, SizeGroupCollector
+    from .hash_cache import HashCache
+    from .disk_usage import (
+        DirectoryTree, DirectoryTreeCollector, LargestDirectoriesCollector, RankedDirectory
+    )
+    from .records import FileRecords
+    from .filters import FileFilter, as_filter, parse_size, parse_time
+    from .exclusions import COMMON_PATTERNS, DEFAULT_RULES_PATH, RULE_FILE, Exclusions
+    from .categories import CategoryCollector
+    from .aging import AGE_EDGES, AgeCollector
+    from .external_sort import DEFAULT_MEMORY_BUDGET, SortedFiles
+    from .progress import DEFAULT_INTERVAL, ProgressEvent, ProgressListener, ProgressReporter
+    from .error_ledger import ErrorLedger
+    from .snapshots import Snapshot, SnapshotWriter, diff_snapshots
+    from .growth import DiskForecast, FolderTotals, GrowthStore
+    from .export import Destination, FileExporter, detect_format
+    from .profiling import PROGRESS, ScanProfiler
+except ImportError:  # Running as a script or with src/ on sys.path
+    from scanner import Roots, Scanner
+    from aggregators import (
+        Aggregator, ExtensionCollector, SizeDistribution, TopNCollector, TotalsCollector
+    )
+    from pipeline import ScanPipeline
+    from scan_index import ScanIndex
+    from duplicates import DuplicateFinder, SizeGroupCollector
+    from hash_cache import HashCache
+    from disk_usage import (
+        DirectoryTree, DirectoryTreeCollector, LargestDirectoriesCollector, RankedDirectory
+    )
+    from records import FileRecords
+    from filters import FileFilter, as_filter, parse_size, parse_time
+    from exclusions import COMMON_PATTERNS, DEFAULT_RULES_PATH, RULE_FILE, Exclusions
+    from categories import CategoryCollector
+    from aging import AGE_EDGES, AgeCollector
+    from external_sort import DEFAULT_MEMORY_BUDGET, SortedFiles
+    from progress import DEFAULT_INTERVAL, ProgressEvent, ProgressListener, ProgressReporter
+    from error_ledger import ErrorLedger
+    from snapshots import Snapshot, SnapshotWriter, diff_snapshots
+    from growth import DiskForecast, FolderTotals, GrowthStore
+    from export import Destination, FileExporter, detect_format
+    from profiling import PROGRESS, ScanProfiler
+
+
+# A number of results, or "all"
+TopN = Union[int, str]
+
+# Longer top-N results are sorted through spilled runs instead of a heap
+_HEAP_LIMIT = 100_000
 
 
 class FileOrganizer:
     """Organize and analyze files by size and other criteria."""
 
-    def __init__(self, progress_callback: Optional[callable] = None):
+    def __init__(
+        self,
+        progress_callback: Optional[callable] = None,
+        index: Optional[ScanIndex] = None,
+        index_max_age: float = 0.0,
+        index_full_every: Optional[float] = None,
+        check_cancelled: Optional[Callable[[], None]] = None,
+        hash_cache: Optional[HashCache] = None,
+        exclusions: Optional[Exclusions] = None,
+        progress_listener: Optional[ProgressListener] = None,
+        progress_interval: float = DEFAULT_INTERVAL,
+        quiet: bool = False,
+        profiler: Optional[ScanProfiler] = None
+    ):
         """
         Initialize the file organizer.
 
         Args:
             progress_callback: Optional function to call with progress updates
                                Signature: callback(current_count: int, current_path: str)
+            index: Optional ScanIndex. When given, find_largest_files() and
+                   get_directory_stats() refresh the index incrementally and
+                   answer from it instead of walking the whole tree. Hidden
+                   files follow the index's include_hidden setting.
+            index_max_age: Seconds for which an index refresh is reused
+                           without touching the disk (default: always refresh)
+            index_full_every: Seconds after which a refresh re-lists every
+                              directory instead of only those whose mtime
+                              changed, catching files that grew in place
+                              (logs, VM disks, downloads); default: never
+            check_cancelled: Optional function called before each directory is
+                             listed; raising from it aborts the scan (see
+                             async_scan.CancellationToken)
+            hash_cache: Optional persistent digest cache used by
+                        find_duplicates(); unchanged files are not re-read
+            exclusions: Optional gitignore-style rules; matching files are
+                        skipped and matching directories are not walked.
+                        An index applies its own exclusions.
+            progress_listener: Optional function receiving a ProgressEvent
+                               (files, directories, bytes, files/sec) at most
+                               once per progress_interval, plus a final event;
+                               pass a ProgressChannel for slow consumers
+            progress_interval: Minimum seconds between progress updates,
+                               for the callback, the listener and the
+                               progress line alike (default: 0.1)
+            quiet: Print nothing while scanning; the print_* methods still print
+            profiler: Optional ScanProfiler; reset at the start of every
+                      scan, it then describes the latest one. Index
+                      refreshes are not profiled.
         """
         self.progress_callback = progress_callback
+        self.progress_listener = progress_listener
+        self.progress_interval = progress_interval
+        self.quiet = quiet
+        self.profiler = profiler
+        self.index = index
+        self.index_max_age = index_max_age
+        self.index_full_every = index_full_every
+        self.check_cancelled = check_cancelled
+        self.hash_cache = hash_cache
+        self.exclusions = exclusions
         self.scan_count = 0
-        self.error_count = 0
-        self.errors = []
+        self.dir_count = 0
+        self.pruned_count = 0
+        # Errors of the latest scan; bounded however many files fail
+        self.error_ledger = ErrorLedger()
+
+    @property
+    def error_count(self) -> int:
+        """Number of entries the latest scan could not read."""
+        return len(self.error_ledger)
+
+    @property
+    def errors(self) -> List[Tuple[str, str]]:
+        """Example (path, message) pairs of the latest scan's errors."""
+        return self.error_ledger.examples()
 
     def find_largest_files(
         self,
-        start_path: str,
-        top_n: int = 10,
-        file_extension: Optional[str] = None
+        start_path: Roots,
+        top_n: TopN = 10,
+        file_extension: Optional[str] = None,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
     ) -> List[Tuple[int, str]]:
         """
         Find the largest files in a directory tree.
 
+        Only the current top N are held in memory, so memory use does not
+        grow with the number of files scanned. Above 100,000 results, and
+        for "all", the files are sorted through iter_sorted_files(), which
+        spills to disk. For listings too long to hold as a list, stream
+        them from iter_sorted_files() instead.
+
         Args:
-            start_path: Root directory to start scanning
-            top_n: Number of largest files to return (1-100)
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1), or "all"
             file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            workers: Number of scanner threads; more than 1 helps on NVMe and
+                     network mounts where stat latency dominates
+            use_processes: Use a pool of `workers` processes instead of
+                           threads, sharding the tree by subdirectory. Scales
+                           with cores because aggregation escapes the GIL.
 
         Returns:
             List of (file_size, file_path) tuples, sorted by size descending
 
         Raises:
-            ValueError: If top_n is not between 1 and 100
+            ValueError: If top_n is not a positive number or "all", or workers < 1
             FileNotFoundError: If start_path doesn't exist
 
         Example:
@@ -75,72 +234,817 @@ class FileOrganizer:
             >>> for size, path in largest:
             ...     print(f"{size / (1024**2):.2f} MB - {path}")
         """
-        # Validate inputs
-        if not 1 <= top_n <= 100:
-            raise ValueError("top_n must be between 1 and 100")
+        limit = self._validate_scan(start_path, top_n, workers, allow_all=True)
+        if limit is None or limit > _HEAP_LIMIT:
+            with self.iter_sorted_files(
+                start_path,
+                top_n,
+                file_filter=as_filter(file_extension, file_filter),
+                workers=workers,
+                use_processes=use_processes
+            ) as listing:
+                return list(listing)
+
+        file_filter = as_filter(file_extension, file_filter)
+        collector = TopNCollector(top_n)
+
+        if self.index is not None:
+            self._log(f"\n🔍 Querying index: {start_path}")
+            for root in self._refresh_index(start_path):
+                for size, path in self.index.largest_files(root, top_n, file_filter=file_filter):
+                    collector.offer(size, path)
+            self._log(f"   Largest files found: {len(collector)}\n")
+            return collector.results()
+
+        for _ in self._run_pipeline(
+            start_path,
+            [collector],
+            file_filter=file_filter,
+            workers=workers,
+            use_processes=use_processes,
+            task=f"Finding top {top_n} largest files"
+        ):
+            pass
+
+        self._log(f"   Largest files found: {len(collector)}\n")
+        return collector.results()
+
+    def iter_largest_files(
+        self,
+        start_path: Roots,
+        top_n: int = 10,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Stream the leaderboard of largest files while the scan runs.
+
+        A new snapshot is yielded after each directory that changed the
+        leaderboard, which makes this suitable for driving live UIs. The
+        last snapshot equals the result of find_largest_files().
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to track (at least 1)
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+
+        Returns:
+            Iterator of (file_size, file_path) lists, sorted by size descending
+
+        Raises:
+            ValueError: If top_n is less than 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> for leaderboard in organizer.iter_largest_files("/Users/daniel", top_n=5):
+            ...     print(leaderboard[0])
+        """
+        self._validate_scan(start_path, top_n)
+        file_filter = as_filter(file_extension, file_filter)
+        collector = TopNCollector(top_n)
+
+        def snapshots():
+            for changed in self._run_pipeline(
+                start_path,
+                [collector],
+                file_filter=file_filter,
+                task=f"Finding top {top_n} largest files"
+            ):
+                if changed:
+                    yield collector.results()
+            self._log(f"   Largest files found: {len(collector)}\n")
+
+        return snapshots()
+
+    def iter_sorted_files(
+        self,
+        start_path: Roots,
+        top_n: TopN = "all",
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        spill_dir: Optional[str] = None
+    ) -> SortedFiles:
+        """
+        Scan a tree into a size-ordered listing that streams from disk.
+
+        Entries beyond memory_budget are sorted into temporary run files,
+        which are merged while the listing is iterated, so exporters can
+        write millions of files in order without holding them in memory.
+        With an index, the listing is read from SQLite's sorted output
+        instead of scanning.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to keep (at least 1), or "all"
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Include dot-files and dot-directories (ignored
+                            with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1);
+                     every worker buffers up to memory_budget
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+            memory_budget: Approximate bytes buffered before a run is spilled
+            spill_dir: Directory for run files (default: the system temp dir)
+
+        Returns:
+            SortedFiles: iterate it for (file_size, file_path) tuples, largest
+            first; close it (or use it in a with block) to delete the run files
+
+        Raises:
+            ValueError: If top_n is not a positive number or "all", or workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> with organizer.iter_sorted_files("/Users/daniel") as listing:
+            ...     for size, path in listing:
+            ...         print(size, path)
+        """
+        limit = self._validate_scan(start_path, top_n, workers, allow_all=True)
+        file_filter = as_filter(file_extension, file_filter)
+        listing = SortedFiles(limit, memory_budget, spill_dir)
+
+        if self.index is not None:
+            # Each root comes out of SQLite sorted; merging them keeps the order.
+            # Spooling into the listing releases the index lock before iteration
+            roots = self._refresh_index(start_path)
+            listing.add_pairs(heapq.merge(
+                *(self.index.iter_largest_files(root, limit, file_filter=file_filter)
+                  for root in roots),
+                reverse=True
+            ))
+            return listing
+
+        for _ in self._run_pipeline(
+            start_path,
+            [listing],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return listing
+
+    def find_largest_directories(
+        self,
+        start_path: Roots,
+        top_n: int = 10,
+        file_extension: Optional[str] = None,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
+    ) -> Dict[str, List[RankedDirectory]]:
+        """
+        Find the directories holding the most data and the most files.
+
+        Directories are ranked by the recursive totals of everything below
+        them, so a folder of many small files (node_modules, caches, mail
+        stores) shows up even when none of its files would. The scan roots
+        themselves are not ranked.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of directories on each leaderboard (at least 1)
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+
+        Returns:
+            Dictionary with keys 'by_size' and 'by_count', each a list of
+            RankedDirectory(path, size, file_count), largest first
+
+        Raises:
+            ValueError: If top_n is less than 1 or workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> ranking = organizer.find_largest_directories("/Users/daniel", top_n=5)
+            >>> for folder in ranking['by_count']:
+            ...     print(folder.file_count, folder.path)
+        """
+        self._validate_scan(start_path, top_n, workers)
+        file_filter = as_filter(file_extension, file_filter)
+
+        if self.index is not None:
+            self._log(f"\n🔍 Querying index: {start_path}")
+            roots = self._refresh_index(start_path)
+            collector = LargestDirectoriesCollector(roots, top_n)
+            for root in roots:
+                totals = self.index.directory_totals(root, file_filter=file_filter)
+                for dirpath, size, count in totals:
+                    collector.add_totals(dirpath, size, count)
+            return collector.result()
+
+        collector = LargestDirectoriesCollector(start_path, top_n)
+        for _ in self._run_pipeline(
+            start_path,
+            [collector],
+            file_filter=file_filter,
+            workers=workers,
+            use_processes=use_processes,
+            task=f"Finding top {top_n} largest directories"
+        ):
+            pass
+
+        return collector.result()
+
+    def collect_records(
+        self,
+        start_path: Roots,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
+    ) -> FileRecords:
+        """
+        Collect every file of a tree into a compact columnar store.
+
+        Use this instead of lists of tuples when all files are needed (to
+        sort, export or compare them): a record takes about 28 bytes plus
+        its basename, and directory paths are stored once.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            include_hidden: Include dot-files and dot-directories (ignored
+                            with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+
+        Returns:
+            FileRecords with size, mtime, inode and path of every file
+
+        Raises:
+            ValueError: If workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> records = organizer.collect_records("/Users/daniel/Movies")
+            >>> for index in records.order_by_size()[:5]:
+            ...     print(records.sizes[index], records.path(index))
+        """
+        self._validate_roots(start_path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+
+        if self.index is not None:
+            records = FileRecords()
+            for root in self._refresh_index(start_path):
+                records.merge(self.index.records(root, file_filter=file_filter))
+            return records
+
+        records = FileRecords()
+        for _ in self._run_pipeline(
+            start_path,
+            [records],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return records
+
+    def find_largest_records(
+        self,
+        start_path: Roots,
+        top_n: int = 10,
+        file_extension: Optional[str] = None,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
+    ) -> FileRecords:
+        """
+        Find the largest files together with their mtimes and inodes.
+
+        The same files as find_largest_files(), as FileRecords. With an index
+        they come straight from it; without one only the top N are stat'ed
+        again, so memory stays O(top_n) either way.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1)
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+
+        Returns:
+            FileRecords, sorted by size descending
+
+        Raises:
+            ValueError: If top_n is not a positive number, or workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer(index=ScanIndex())
+            >>> largest = organizer.find_largest_records("/Users/daniel/Movies", top_n=5)
+            >>> for record in largest:
+            ...     print(record.size, record.mtime_ns, record.path)
+        """
+        self._validate_scan(start_path, top_n, workers)
+        file_filter = as_filter(file_extension, file_filter)
+
+        if self.index is None:
+            largest = self.find_largest_files(
+                start_path, top_n, file_filter=file_filter,
+                workers=workers, use_processes=use_processes
+            )
+            return FileRecords.from_pairs(largest, stat=True)
 
-        if not os.path.exists(start_path):
-            raise FileNotFoundError(f"Path does not exist: {start_path}")
+        roots = self._refresh_index(start_path)
+        if len(roots) == 1:
+            return self.index.largest_records(roots[0], top_n, file_filter=file_filter)
+        # Each root's own top N, then the overall top N of those
+        records = FileRecords()
+        for root in roots:
+            records.merge(self.index.largest_records(root, top_n, file_filter=file_filter))
+        return FileRecords.from_records(records.largest(top_n))
 
+    def take_snapshot(
+        self,
+        start_path: Roots,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        spill_dir: Optional[str] = None
+    ) -> SnapshotWriter:
+        """
+        Record size and modification time of every file, in snapshot order.
+
+        Nothing is written until the result is saved; it can also be
+        compared with diff_snapshots() directly. Entries beyond
+        memory_budget are spilled to sorted temporary runs.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Include dot-files and dot-directories (ignored
+                            with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+            memory_budget: Approximate bytes held in memory per worker
+            spill_dir: Directory for the temporary runs
+
+        Returns:
+            SnapshotWriter; close it (or use it in a with block) when done
+
+        Raises:
+            ValueError: If workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> with organizer.take_snapshot("/builds") as snapshot:
+            ...     snapshot.save("builds-monday")
+        """
+        self._validate_roots(start_path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+        # Absolute paths, so snapshots taken from different places compare
+        snapshot = SnapshotWriter(start_path, memory_budget, spill_dir)
+
+        if self.index is not None:
+            for root in self._refresh_index(snapshot.roots):
+                for record in self.index.records(root, file_filter=file_filter):
+                    snapshot.offer(record.path, record.size, record.mtime_ns)
+            return snapshot
+
+        for _ in self._run_pipeline(
+            snapshot.roots,
+            [snapshot],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return snapshot
+
+    def save_snapshot(self, start_path: Roots, name: str, **options: Any) -> Snapshot:
+        """
+        Scan start_path and save the result as a snapshot.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            name: Snapshot name (stored in ~/.file_automation_suite/snapshots)
+                  or file path
+            **options: Passed to take_snapshot()
+
+        Returns:
+            The saved Snapshot
+
+        Example:
+            >>> FileOrganizer().save_snapshot("/builds", "builds-monday")
+        """
+        with self.take_snapshot(start_path, **options) as snapshot:
+            return snapshot.save(name)
+
+    def compare_snapshot(
+        self,
+        old: Union[str, Snapshot],
+        start_path: Optional[Roots] = None,
+        top_n: int = 10,
+        save_to: Optional[str] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Scan again and report what changed since a saved snapshot.
+
+        Args:
+            old: Snapshot or snapshot name to compare against
+            start_path: Roots to scan (default: the snapshot's roots)
+            top_n: Number of entries on each leaderboard
+            save_to: Optional name under which to save the new scan, e.g. to
+                     compare against it next time
+            **options: Passed to take_snapshot()
+
+        Returns:
+            Result of diff_snapshots(): added, removed, grown and shrunk
+            files, directories ranked by growth and shrinkage, counts
+
+        Raises:
+            FileNotFoundError: If the snapshot or start_path doesn't exist
+            ValueError: If top_n is less than 1
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> diff = organizer.compare_snapshot("builds-monday", save_to="builds-latest")
+            >>> organizer.print_snapshot_diff(diff)
+        """
+        if not isinstance(old, Snapshot):
+            old = Snapshot(old)
+        if start_path is None:
+            start_path = old.roots
+        self._validate_scan(start_path, top_n)
+
+        with self.take_snapshot(start_path, **options) as snapshot:
+            diff = diff_snapshots(old, snapshot, top_n)
+            if save_to is not None:
+                snapshot.save(save_to)
+        return diff
+
+    def export_files(
+        self,
+        start_path: Roots,
+        destination: Destination,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None,
+        format: Optional[str] = None,
+        compress: Optional[bool] = None
+    ) -> int:
+        """
+        Write path, size and mtime of every file to an NDJSON or CSV file.
+
+        Rows are streamed to the file as the scan (or the index) produces
+        them, so memory use does not depend on the number of files.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            destination: File path (.csv, .ndjson or .jsonl, optionally
+                         .gz) or binary file object
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Include dot-files and dot-directories (ignored
+                            with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+            format: "ndjson" or "csv" (default: from the file name)
+            compress: Gzip the output (default: when the file name ends in .gz)
+
+        Returns:
+            Number of files exported
+
+        Raises:
+            ValueError: If workers < 1 or the format is unknown
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> organizer.export_files("/Users/daniel", "all-files.csv.gz", workers=4)
+            1843202
+        """
+        self._validate_roots(start_path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+
+        with FileExporter(destination, format, compress) as exporter:
+            if self.index is not None:
+                for root in self._refresh_index(start_path):
+                    rows = self.index.iter_files(root, file_filter=file_filter)
+                    for dirpath, name, size, mtime_ns in rows:
+                        exporter.offer(os.path.join(dirpath, name), size, mtime_ns / 1e9)
+                return exporter.result()
+
+            for _ in self._run_pipeline(
+                start_path,
+                [exporter],
+                file_filter=file_filter,
+                include_hidden=include_hidden,
+                workers=workers,
+                use_processes=use_processes
+            ):
+                pass
+
+            return exporter.result()
+
+    def record_growth(
+        self,
+        start_path: Roots,
+        depth: int = 1,
+        store: Optional[GrowthStore] = None,
+        include_hidden: bool = True,
+        workers: int = 1,
+        use_processes: bool = False
+    ) -> Dict[str, int]:
+        """
+        Add a size sample for each root and the folders below it to a growth store.
+
+        With an index the totals come from the (refreshed) index, so a
+        sample after an incremental refresh costs no traversal at all.
+
+        Args:
+            start_path: Root directory to measure, or a list of roots
+            depth: Folder levels below each root that get their own series
+            store: GrowthStore to write to (default: ~/.file_automation_suite/growth.db)
+            include_hidden: Count dot-files and dot-directories (default: True,
+                            so the totals match the used space on disk)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+
+        Returns:
+            The recorded sizes, absolute folder path -> bytes
+
+        Raises:
+            ValueError: If workers < 1 or depth is negative
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> with GrowthStore() as store:
+            ...     FileOrganizer().record_growth("/Users/daniel", depth=2, store=store)
+            ...     print(store.forecast("/Users/daniel").days_left)
+        """
+        self._validate_roots(start_path, workers)
+        totals = FolderTotals(start_path, depth)
+
+        if self.index is not None:
+            for root in self._refresh_index(totals.roots):
+                for dirpath, size, _count in self.index.directory_totals(root):
+                    totals.add_totals(dirpath, size)
+        else:
+            for _ in self._run_pipeline(
+                totals.roots,
+                [totals],
+                include_hidden=include_hidden,
+                workers=workers,
+                use_processes=use_processes
+            ):
+                pass
+
+        sizes = totals.result()
+        if store is not None:
+            store.record(sizes)
+        else:
+            with GrowthStore() as default_store:
+                default_store.record(sizes)
+        return sizes
+
+    def _validate_scan(
+        self,
+        start_path: Roots,
+        top_n: TopN,
+        workers: int = 1,
+        allow_all: bool = False
+    ) -> Optional[int]:
+        """
+        Check scan arguments before any work is done.
+
+        Returns:
+            top_n as a number, or None for "all"
+        """
+        if allow_all and top_n == "all":
+            limit = None
+        elif isinstance(top_n, int) and not isinstance(top_n, bool) and top_n >= 1:
+            limit = top_n
+        else:
+            raise ValueError("top_n must be a positive number" + (' or "all"' if allow_all else ""))
+
+        self._validate_roots(start_path, workers)
+        return limit
+
+    def _validate_roots(self, start_path: Roots, workers: int) -> None:
+        """Check that every root exists and the worker count is sensible."""
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        roots = [start_path] if isinstance(start_path, str) else start_path
+        for root in roots:
+            if not os.path.exists(root):
+                raise FileNotFoundError(f"Path does not exist: {root}")
+
+    def _run_pipeline(
+        self,
+        start_path: Roots,
+        aggregators: Sequence[Aggregator],
+        file_filter: Optional[FileFilter] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        task: Optional[str] = None,
+        follow_symlinks: bool = True
+    ) -> Iterator[bool]:
+        """
+        Run one traversal of start_path through every aggregator.
+
+        Counters (scan_count, dir_count, pruned_count, error_ledger) are
+        reset at the start and describe this scan when the generator is
+        exhausted.
+        Output is printed only when a task description is given and the
+        organizer is not quiet.
+
+        Yields:
+            Whether each unit of progress changed any aggregate
+        """
         # Reset counters
         self.scan_count = 0
-        self.error_count = 0
-        self.errors = []
+        self.dir_count = 0
+        self.pruned_count = 0
+        self.error_ledger.reset([start_path] if isinstance(start_path, str) else start_path)
+        verbose = task is not None and not self.quiet
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.reset()
+            profiler.start()
+
+        if verbose:
+            roots = start_path if isinstance(start_path, str) else ", ".join(start_path)
+            print(f"\n🔍 Scanning: {roots}")
+            print(f"   Filter: {file_filter.describe() if file_filter else 'All files'}")
+            print(f"   {task}...\n")
 
-        file_sizes = []
-        start_path_obj = Path(start_path)
+        # Name checks run before the stat call so filtered-out files cost
+        # nothing; size and time bounds run on the stat result
+        scanner = Scanner(
+            include_hidden=include_hidden,
+            file_filter=file_filter.name_predicate() if file_filter else None,
+            stat_filter=file_filter.stat_predicate() if file_filter else None,
+            on_error=self.error_ledger,
+            check_cancelled=self.check_cancelled,
+            follow_symlinks=follow_symlinks,
+            exclusions=self.exclusions,
+            profiler=profiler
+        )
+        pipeline = ScanPipeline(aggregators, scanner, workers, use_processes)
+        reporter = self._progress_reporter(verbose)
 
-        print(f"\n🔍 Scanning: {start_path}")
-        print(f"   Filter: {file_extension if file_extension else 'All files'}")
-        print(f"   Finding top {top_n} largest files...\n")
+        def report(_count: int, dirpath: str) -> None:
+            # One clock read per directory; counters are summed only when due
+            if reporter.due():
+                if profiler is None:
+                    reporter.update(*scanner.counts(), dirpath)
+                else:
+                    started = time.perf_counter_ns()
+                    reporter.update(*scanner.counts(), dirpath)
+                    profiler.add(PROGRESS, time.perf_counter_ns() - started)
 
-        # Walk the directory tree
-        for dirpath, dirnames, filenames in os.walk(start_path):
-            # Filter hidden directories for performance
-            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        last_dir = ""
+        for dirpath, changed in pipeline.iter_run(start_path, on_progress=report):
+            self.scan_count = scanner.file_count
+            if dirpath:
+                last_dir = dirpath
+                report(self.scan_count, dirpath)
 
-            for filename in filenames:
-                # Skip hidden files
-                if filename.startswith('.'):
-                    continue
+            yield changed
 
-                # Apply extension filter if specified
-                if file_extension and not filename.endswith(file_extension):
-                    continue
+        self.scan_count = scanner.file_count
+        self.dir_count = scanner.dir_count
+        self.pruned_count = scanner.pruned_count
+        reporter.finish(scanner.file_count, scanner.dir_count, scanner.byte_count, last_dir)
+        if profiler is not None:
+            profiler.stop()
 
-                filepath = os.path.join(dirpath, filename)
+        if verbose:
+            # Clear progress line
+            print(f"\r{' ' * 80}\r", end="")
+
+            # Print summary
+            print("✅ Scan complete!")
+            print(f"   Files scanned: {self.scan_count:,}")
+            print(f"   Errors: {self.error_count:,}")
+            if self.exclusions is not None:
+                print(f"   Pruned: {self.pruned_count:,} excluded entries (subtrees not walked)")
+
+    def _refresh_index(self, start_path: Roots) -> List[str]:
+        """
+        Bring the index up to date for every root.
 
-                try:
-                    file_size = os.path.getsize(filepath)
-                    file_sizes.append((file_size, filepath))
-                    self.scan_count += 1
+        Roots refreshed less than index_max_age seconds ago, or watched by
+        an IndexWatcher, are not touched. Roots not fully re-listed for
+        index_full_every seconds get a full refresh.
+        scan_count and dir_count describe the indexed trees afterwards;
+        pruned_count counts the entries the refreshes excluded.
 
-                    # Report progress every 100 files
-                    if self.scan_count % 100 == 0:
-                        progress_msg = f"📂 Scanned {self.scan_count:,} files... {dirpath}"
-                        print(f"\r{progress_msg[:80]}", end="", flush=True)
+        Returns:
+            The roots as absolute paths
+        """
+        self.scan_count = 0
+        self.dir_count = 0
+        self.pruned_count = 0
 
-                        if self.progress_callback:
-                            self.progress_callback(self.scan_count, dirpath)
+        roots = [start_path] if isinstance(start_path, str) else start_path
+        roots = [os.path.abspath(root) for root in roots]
+        self.error_ledger.reset(roots)
+        reporter = self._progress_reporter(verbose=False)
+        total_size = 0
+        for root in roots:
+            # Trees kept current by an IndexWatcher never need a refresh
+            now = time.time()
+            refreshed_at = self.index.last_refreshed(root)
+            full = False
+            if self.index_full_every is not None:
+                full_at = self.index.last_refreshed(root, full=True)
+                full = full_at is None or now - full_at >= self.index_full_every
+            stale = full or refreshed_at is None or now - refreshed_at >= self.index_max_age
+            if stale and not self.index.is_live(root):
+                summary = self.index.refresh(
+                    root, full=full, on_error=self._record_error,
+                    check_cancelled=self.check_cancelled
+                )
+                self.pruned_count += summary.get("pruned", 0)
 
-                except (OSError, FileNotFoundError, PermissionError) as e:
-                    self.error_count += 1
-                    self.errors.append((filepath, str(e)))
-                    continue
+            stats = self.index.directory_stats(root)
+            self.scan_count += stats["file_count"]
+            self.dir_count += stats["directory_count"]
+            total_size += stats["total_size"]
+            reporter.update(self.scan_count, self.dir_count, total_size, root)
 
-        # Clear progress line
-        print(f"\r{' ' * 80}\r", end="")
+        reporter.finish(self.scan_count, self.dir_count, total_size, roots[-1] if roots else "")
+        return roots
 
-        # Get the top N largest files
-        largest_files = heapq.nlargest(top_n, file_sizes, key=lambda x: x[0])
+    def _progress_reporter(self, verbose: bool) -> ProgressReporter:
+        """Build the throttled reporter feeding every progress consumer."""
+        listeners: List[ProgressListener] = []
+        if verbose:
+            listeners.append(self._print_progress)
+        if self.progress_callback:
+            callback = self.progress_callback
+            listeners.append(lambda event: callback(event.files_scanned, event.current_path))
+        if self.progress_listener:
+            listeners.append(self.progress_listener)
+        return ProgressReporter(listeners, self.progress_interval)
 
-        # Print summary
-        print(f"✅ Scan complete!")
-        print(f"   Files scanned: {self.scan_count:,}")
-        print(f"   Errors: {self.error_count:,}")
-        print(f"   Largest files found: {len(largest_files)}\n")
+    def _print_progress(self, event: ProgressEvent) -> None:
+        """Overwrite the progress line with the latest event."""
+        if event.final:
+            return
+        progress_msg = (
+            f"📂 Scanned {event.files_scanned:,} files, {self.format_size(event.bytes_seen)} "
+            f"({event.files_per_second:,.0f}/s)... {event.current_path}"
+        )
+        print(f"\r{progress_msg[:80]}", end="", flush=True)
 
-        return largest_files
+    def _log(self, message: str) -> None:
+        """Print a scan status message unless the organizer is quiet."""
+        if not self.quiet:
+            print(message)
+
+    def _build_stats(self, totals: TotalsCollector) -> dict:
+        """Turn a totals aggregate and the scan counters into a stats dict."""
+        return {
+            "total_size": totals.total_size,
+            "file_count": totals.file_count,
+            "directory_count": self.dir_count,
+            "average_file_size": (
+                totals.total_size / totals.file_count if totals.file_count > 0 else 0
+            )
+        }
+
+    def _record_error(self, path: str, error: OSError) -> None:
+        """Record an inaccessible file or directory in the error ledger."""
+        self.error_ledger.record(path, error)
 
     def format_size(self, size_bytes: int) -> str:
         """
@@ -163,12 +1067,12 @@ class FileOrganizer:
             size_bytes /= 1024.0
         return f"{size_bytes:.2f} PB"
 
-    def print_results(self, results: List[Tuple[int, str]]) -> None:
+    def print_results(self, results: Sequence[Tuple[int, str]]) -> None:
         """
         Print formatted results.
 
         Args:
-            results: List of (size, path) tuples
+            results: List of (size, path) tuples, or a SortedFiles listing
 
         Example:
             >>> organizer = FileOrganizer()
@@ -177,10 +1081,9 @@ class FileOrganizer:
         """
         if not results:
             print("No files found.")
-            return
-
-        print("📊 Largest Files:")
-        print("=" * 80)
+        else:
+            print("📊 Largest Files:")
+            print("=" * 80)
 
         for idx, (size, path) in enumerate(results, 1):
             formatted_size = self.format_size(size)
@@ -191,15 +1094,28 @@ class FileOrganizer:
 
             print(f"{idx:2d}. {formatted_size:>12} - {display_path}")
 
-        if self.errors:
-            print(f"\n⚠️  {self.error_count} files could not be accessed")
+        # Unreadable files may be why nothing was found
+        error_lines = self.error_ledger.lines()
+        if error_lines:
+            print(f"\n⚠️  {error_lines[0]}")
+            for line in error_lines[1:]:
+                print(line)
 
-    def get_directory_stats(self, path: str) -> dict:
+    def get_directory_stats(
+        self,
+        path: Roots,
+        workers: int = 1,
+        use_processes: bool = False,
+        include_hidden: bool = True
+    ) -> dict:
         """
         Get statistics about a directory.
 
         Args:
-            path: Directory path to analyze
+            path: Directory path to analyze, or a list of directories
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            include_hidden: Count dot-files and dot-directories (default: True)
 
         Returns:
             Dictionary with statistics
@@ -209,60 +1125,1025 @@ class FileOrganizer:
             >>> stats = organizer.get_directory_stats("/Users/daniel/Documents")
             >>> print(f"Total size: {organizer.format_size(stats['total_size'])}")
         """
-        total_size = 0
-        file_count = 0
-        dir_count = 0
-
-        for dirpath, dirnames, filenames in os.walk(path):
-            dir_count += len(dirnames)
-            for filename in filenames:
-                file_count += 1
-                try:
-                    filepath = os.path.join(dirpath, filename)
-                    total_size += os.path.getsize(filepath)
-                except (OSError, FileNotFoundError):
-                    continue
+        if self.index is not None:
+            stats = {"total_size": 0, "file_count": 0, "directory_count": 0}
+            for root in self._refresh_index(path):
+                root_stats = self.index.directory_stats(root)
+                for key in stats:
+                    stats[key] += root_stats[key]
+            stats["average_file_size"] = (
+                stats["total_size"] / stats["file_count"] if stats["file_count"] > 0 else 0
+            )
+            return stats
 
-        return {
-            "total_size": total_size,
-            "file_count": file_count,
-            "directory_count": dir_count,
-            "average_file_size": total_size / file_count if file_count > 0 else 0
-        }
+        totals = TotalsCollector()
+
+        for _ in self._run_pipeline(
+            path,
+            [totals],
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return self._build_stats(totals)
+
+    def get_size_distribution(
+        self,
+        path: Roots,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = True,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
+    ) -> Dict[str, Any]:
+        """
+        Describe how file sizes are distributed, beyond the average.
+
+        With an index the sizes are read from it instead of walking the tree.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Count dot-files and dot-directories (default: True;
+                            ignored with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+
+        Returns:
+            Dictionary with 'file_count', 'total_size', 'p50', 'p90', 'p99'
+            (sizes in bytes), 'top1_size' and 'top1_share' (space held by the
+            largest 1% of files) and 'buckets' (log2 histogram)
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> dist = organizer.get_size_distribution("/Users/daniel/Documents")
+            >>> print(f"Median file: {organizer.format_size(dist['p50'])}")
+            >>> print(f"Largest 1% hold {dist['top1_share']:.0%} of the space")
+        """
+        self._validate_roots(path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+        distribution = SizeDistribution()
+
+        if self.index is not None:
+            for root in self._refresh_index(path):
+                distribution.add_sizes(self.index.file_sizes(root, file_filter=file_filter))
+            return distribution.result()
+
+        for _ in self._run_pipeline(
+            path,
+            [distribution],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return distribution.result()
+
+    def get_category_breakdown(
+        self,
+        path: Roots,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = True,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None,
+        categories: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the space used per file category and per extension.
+
+        With an index the names and sizes are read from it instead of
+        walking the tree.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Count dot-files and dot-directories (default: True;
+                            ignored with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+            categories: Extra or overriding extension -> category mappings
+
+        Returns:
+            Dictionary with 'categories' as (category, file_count, total_size)
+            and 'extensions' as (extension, category, file_count, total_size),
+            largest first
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> breakdown = organizer.get_category_breakdown("/Users/daniel")
+            >>> for category, count, size in breakdown['categories'][:5]:
+            ...     print(f"{category:<12} {organizer.format_size(size)}")
+        """
+        self._validate_roots(path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+        collector = CategoryCollector(categories)
+
+        if self.index is not None:
+            for root in self._refresh_index(path):
+                collector.add_files(self.index.file_names(root, file_filter=file_filter))
+            return collector.result()
+
+        for _ in self._run_pipeline(
+            path,
+            [collector],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return collector.result()
+
+    def get_age_report(
+        self,
+        path: Roots,
+        top_n: int = 10,
+        clock: str = "mtime",
+        age_edges: Sequence[float] = AGE_EDGES,
+        min_size: int = 0,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = True,
+        workers: int = 1,
+        use_processes: bool = False,
+        file_filter: Optional[FileFilter] = None
+    ) -> Dict[str, Any]:
+        """
+        Bucket files by age and size to find cold data worth archiving.
+
+        Ages come from the stat result the scanner already holds, so this
+        costs no extra system calls. With an index and the 'mtime' clock the
+        report is built from the index; the index does not store access
+        times, so the other clocks always walk the tree.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            top_n: Number of largest files kept per age bucket (0-100)
+            clock: 'mtime', 'atime' or 'touched' (the later of both)
+            age_edges: Ascending upper bounds of the age buckets, in days
+            min_size: Only list files of at least this many bytes; the
+                      bucket totals and the matrix still count every file
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            include_hidden: Count dot-files and dot-directories (default: True;
+                            ignored with an index, which has its own setting)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            file_filter: Optional FileFilter instead of file_extension
+
+        Returns:
+            Dictionary with 'buckets' (per age bucket: 'label', 'file_count',
+            'total_size', 'largest'), 'size_classes' and 'matrix' (see
+            AgeCollector.result())
+
+        Raises:
+            ValueError: If top_n is negative, the clock is unknown or
+                        workers < 1
+            FileNotFoundError: If path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> report = organizer.get_age_report("/Users/daniel", clock="touched")
+            >>> for bucket in report['buckets']:
+            ...     print(bucket['label'], organizer.format_size(bucket['total_size']))
+        """
+        collector = AgeCollector(top_n, clock, age_edges, min_size=min_size)
+        self._validate_roots(path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+
+        if self.index is not None and clock == "mtime":
+            for root in self._refresh_index(path):
+                collector.add_files(
+                    (record.size, record.path, record.mtime_ns / 1e9)
+                    for record in self.index.records(root, file_filter=file_filter)
+                )
+            return collector.result()
+
+        for _ in self._run_pipeline(
+            path,
+            [collector],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes
+        ):
+            pass
+
+        return collector.result()
+
+    def find_stale_files(
+        self,
+        start_path: Roots,
+        older_than_days: float = 365,
+        min_size: int = 0,
+        top_n: int = 10,
+        clock: str = "mtime",
+        **options: Any
+    ) -> List[Tuple[int, str]]:
+        """
+        Find the largest files not modified (or accessed) for a while.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            older_than_days: Minimum age in days
+            min_size: Minimum size in bytes
+            top_n: Number of files to return (at least 1)
+            clock: 'mtime', 'atime' or 'touched' (the later of both)
+            **options: Further get_age_report() arguments (file_filter,
+                       workers, include_hidden, ...)
+
+        Returns:
+            List of (file_size, file_path) tuples, sorted by size descending
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> cold = organizer.find_stale_files("/Users/daniel", older_than_days=365,
+            ...                                   min_size=500 * 1024 ** 2, clock="touched")
+        """
+        if top_n < 1:
+            raise ValueError("top_n must be a positive number")
+        # One age edge: the last bucket holds exactly the stale files
+        report = self.get_age_report(start_path, top_n=top_n, clock=clock,
+                                     age_edges=(older_than_days,), min_size=min_size,
+                                     **options)
+        return report["buckets"][-1]["largest"]
+
+    def get_directory_tree(
+        self,
+        path: Roots,
+        include_hidden: bool = True,
+        workers: int = 1,
+        use_processes: bool = False,
+        follow_symlinks: bool = False
+    ) -> DirectoryTree:
+        """
+        Get recursive disk usage for every directory, like du.
+
+        Unlike get_directory_stats(), hard-linked files are counted once,
+        symlinks count as links rather than as their targets, and the
+        allocated size (st_blocks * 512) is reported next to the apparent
+        size.
+
+        Args:
+            path: Directory path to analyze, or a list of directories
+            include_hidden: Count dot-files and dot-directories (default: True)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            follow_symlinks: Count the targets of symlinked files instead
+
+        Returns:
+            DirectoryTree with usage(), children() and largest() queries
+
+        Raises:
+            ValueError: If workers < 1
+            FileNotFoundError: If path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> tree = organizer.get_directory_tree("/Users/daniel")
+            >>> for folder, usage in tree.largest(top_n=5):
+            ...     print(organizer.format_size(usage.allocated_size), folder)
+        """
+        self._validate_roots(path, workers)
+        collector = DirectoryTreeCollector(path)
+
+        for _ in self._run_pipeline(
+            path,
+            [collector],
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes,
+            follow_symlinks=follow_symlinks
+        ):
+            pass
+
+        return collector.result()
+
+    def print_distribution(self, distribution: Dict[str, Any], width: int = 40) -> None:
+        """
+        Print percentiles, the top-1% share and a log2 size histogram.
+
+        Args:
+            distribution: Result of get_size_distribution() or
+                          analyze_directory()['distribution']
+            width: Length of the longest histogram bar
+        """
+        if not distribution["file_count"]:
+            print("No files found.")
+            return
+
+        print("📈 File Size Distribution:")
+        print("=" * 80)
+        print(f"   Median (p50): {self.format_size(distribution['p50'])}   "
+              f"p90: {self.format_size(distribution['p90'])}   "
+              f"p99: {self.format_size(distribution['p99'])}")
+        total = self.format_size(distribution['total_size'])
+        print(f"   Largest 1% of files: {self.format_size(distribution['top1_size'])} "
+              f"({distribution['top1_share']:.1%} of {total})")
+        print()
+
+        buckets = distribution["buckets"]
+        most = max(count for _, _, count, _ in buckets)
+        for low, high, count, total in buckets:
+            label = f"{self.format_size(low)} - {self.format_size(high)}" if low else "empty"
+            bar = "█" * max(1, round(width * count / most))
+            print(f"   {label:>23} {count:>10,} {bar}")
+
+    def print_categories(self, breakdown: Dict[str, Any], top_n: int = 10) -> None:
+        """
+        Print the space used per category with its largest extensions.
+
+        Args:
+            breakdown: Result of get_category_breakdown() or
+                       analyze_directory()['categories']
+            top_n: Number of categories to list
+        """
+        if not breakdown["categories"]:
+            print("No files found.")
+            return
+
+        by_category: Dict[str, List[str]] = {}
+        for ext, category, _, _ in breakdown["extensions"]:
+            by_category.setdefault(category, []).append(ext)
+
+        total = sum(size for _, _, size in breakdown["categories"]) or 1
+        print("🗂️  Space by Category:")
+        print("=" * 80)
+        for category, count, size in breakdown["categories"][:top_n]:
+            examples = ", ".join(by_category[category][:3]) if category != "no_extension" else ""
+            print(f"   {category:<14} {self.format_size(size):>12} {size / total:>6.1%} "
+                  f"{count:>10,} files  {examples}")
+
+    def print_age_report(self, report: Dict[str, Any], top_n: int = 3) -> None:
+        """
+        Print space per age bucket, the size x age matrix and the largest old files.
+
+        Args:
+            report: Result of get_age_report() or AgeCollector
+            top_n: Number of files listed per age bucket
+        """
+        buckets = report["buckets"]
+        if not any(bucket["file_count"] for bucket in buckets):
+            print("No files found.")
+            return
+
+        clock = {"mtime": "modified", "atime": "accessed", "touched": "touched"}[report["clock"]]
+        print(f"🕰️  Space by Age (last {clock}):")
+        print("=" * 80)
+        for bucket in buckets:
+            print(f"   {bucket['label']:>10} {self.format_size(bucket['total_size']):>12} "
+                  f"{bucket['file_count']:>10,} files")
+
+        print()
+        print(f"   {'size / age':>23}" + "".join(f"{bucket['label']:>11}" for bucket in buckets))
+        for (low, high), row in zip(report["size_classes"], report["matrix"]):
+            if high is None:
+                label = f">= {self.format_size(low)}"
+            else:
+                label = f"{self.format_size(low)} - {self.format_size(high)}"
+            cells = (self.format_size(size) if count else "-" for count, size in row)
+            print(f"   {label:>23}" + "".join(f"{cell:>11}" for cell in cells))
+
+        for bucket in reversed(buckets):
+            if not bucket["largest"] or not bucket["min_days"]:
+                continue
+            print(f"\n   Largest files {bucket['label']}:")
+            for size, path in bucket["largest"][:top_n]:
+                display_path = path if len(path) <= 60 else "..." + path[-57:]
+                print(f"   {self.format_size(size):>12} - {display_path}")
+
+    def print_directory_tree(self, tree: DirectoryTree, top_n: int = 10, depth: int = 1) -> None:
+        """
+        Print the largest directories of a tree, du-style.
+
+        Args:
+            tree: Result of get_directory_tree() or DirectoryTreeCollector
+            top_n: Number of directories to list
+            depth: Levels below the roots to rank
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> organizer.print_directory_tree(organizer.get_directory_tree("/path"))
+        """
+        largest = tree.largest(top_n=top_n, depth=depth)
+        if not largest:
+            print("No directories found.")
+            return
+
+        print("📦 Largest Directories (allocated / apparent size):")
+        print("=" * 80)
+
+        for idx, (path, usage) in enumerate(largest, 1):
+            display_path = path if len(path) <= 46 else "..." + path[-43:]
+            print(f"{idx:2d}. {self.format_size(usage.allocated_size):>11} / "
+                  f"{self.format_size(usage.apparent_size):>11} - {display_path} "
+                  f"({usage.file_count:,} files)")
+
+    def print_largest_directories(self, ranking: Dict[str, List[RankedDirectory]]) -> None:
+        """
+        Print both directory leaderboards.
+
+        Args:
+            ranking: Result of find_largest_directories() or LargestDirectoriesCollector
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> organizer.print_largest_directories(organizer.find_largest_directories("/path"))
+        """
+        if not ranking['by_size']:
+            print("No directories found.")
+            return
+
+        for title, entries in [("📦 Largest Directories by Size:", ranking['by_size']),
+                               ("🗃️  Largest Directories by File Count:", ranking['by_count'])]:
+            print(title)
+            print("=" * 80)
+            for idx, entry in enumerate(entries, 1):
+                display_path = entry.path if len(entry.path) <= 50 else "..." + entry.path[-47:]
+                print(f"{idx:2d}. {self.format_size(entry.size):>12} "
+                      f"{entry.file_count:>10,} files - {display_path}")
+            print()
+
+    def print_snapshot_diff(self, diff: Dict[str, Any]) -> None:
+        """
+        Print what changed between two snapshots.
+
+        Args:
+            diff: Result of compare_snapshot() or diff_snapshots()
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> organizer.print_snapshot_diff(organizer.compare_snapshot("builds-monday"))
+        """
+        def shorten(path: str) -> str:
+            return path if len(path) <= 50 else "..." + path[-47:]
+
+        old, new, counts = diff['old'], diff['new'], diff['counts']
+        since = time.strftime("%Y-%m-%d %H:%M", time.localtime(old['created']))
+        net = diff['net_change']
+        print(f"📈 Changes since {since}:")
+        print("=" * 80)
+        print(f"   Total: {self.format_size(old['total_size'])} -> "
+              f"{self.format_size(new['total_size'])} "
+              f"({'+' if net >= 0 else '-'}{self.format_size(abs(net))})")
+        print(f"   Files: {counts['added']:,} added ({self.format_size(diff['added_size'])}), "
+              f"{counts['removed']:,} removed ({self.format_size(diff['removed_size'])}), "
+              f"{counts['grown']:,} grew, {counts['shrunk']:,} shrank, "
+              f"{counts['modified']:,} modified in place")
+
+        sections = [
+            ("Folders that grew:",
+             [(entry.size, entry.path) for entry in diff['directories_grown']], "+"),
+            ("Files that grew:", [(change.delta, change.path) for change in diff['grown']], "+"),
+            ("New files:", diff['added'], "+"),
+            ("Folders that shrank:",
+             [(entry.size, entry.path) for entry in diff['directories_shrunk']], "-"),
+            ("Removed files:", diff['removed'], "-"),
+        ]
+        for title, entries, sign in sections:
+            if not entries:
+                continue
+            print(f"\n   {title}")
+            for size, path in entries:
+                print(f"   {sign + self.format_size(size):>13} - {shorten(path)}")
+
+    def print_growth_forecast(self, forecast: DiskForecast) -> None:
+        """
+        Print how fast a volume fills up and which folders grow fastest.
+
+        Args:
+            forecast: Result of GrowthStore.forecast()
+
+        Example:
+            >>> with GrowthStore() as store:
+            ...     FileOrganizer().print_growth_forecast(store.forecast("/"))
+        """
+        print(f"📉 Disk Forecast for {forecast.volume}:")
+        print("=" * 80)
+        print(f"   Used: {self.format_size(forecast.used)} "
+              f"of {self.format_size(forecast.capacity)}")
+        if forecast.samples < 2:
+            print("   Not enough history yet; record growth again later to get a forecast.")
+            return
+
+        rate = forecast.rate
+        print(f"   Growth: {'+' if rate >= 0 else '-'}{self.format_size(int(abs(rate)))}/day "
+              f"({forecast.samples} samples)")
+        if forecast.days_left is None:
+            print("   Not filling up at the current rate.")
+        else:
+            full = time.strftime("%Y-%m-%d", time.localtime(forecast.full_at))
+            print(f"   Full in {forecast.days_left:,.0f} days (around {full})")
+
+        if forecast.folders:
+            print("\n   Fastest growing folders:")
+            for trend in forecast.folders:
+                display_path = trend.path if len(trend.path) <= 50 else "..." + trend.path[-47:]
+                print(f"   {'+' + self.format_size(int(trend.rate)):>12}/day "
+                      f"{self.format_size(trend.size):>11} - {display_path}")
+
+    def analyze_directory(
+        self,
+        start_path: Roots,
+        top_n: TopN = 10,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        aggregators: Sequence[Aggregator] = (),
+        follow_symlinks: bool = True,
+        file_filter: Optional[FileFilter] = None
+    ) -> Dict[str, Any]:
+        """
+        Collect the largest files, statistics and breakdowns in one pass.
+
+        Replaces calling find_largest_files() and get_directory_stats()
+        back to back, which walks the tree twice. Both the leaderboard and
+        the statistics use the same hidden-file and extension settings.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            top_n: Number of largest files to return (at least 1), or "all",
+                   in which case 'largest_files' is a SortedFiles listing
+                   to iterate and close rather than a list
+            file_extension: Optional filter by extension (e.g., '.pdf', '.mp4')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            include_hidden: Include dot-files and dot-directories
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            aggregators: Extra aggregators to feed from the same traversal;
+                         their results are added under their names
+            follow_symlinks: Report the targets of symlinked files (default)
+                             rather than the links themselves
+
+        Returns:
+            Dictionary with keys 'largest_files', 'stats', 'extensions',
+            'histogram' (log2 buckets), 'distribution' (see
+            get_size_distribution()) and one per extra aggregator
+
+        Raises:
+            ValueError: If top_n is not a positive number or "all", or workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> report = organizer.analyze_directory("/Users/daniel/Documents", top_n=5)
+            >>> organizer.print_results(report['largest_files'])
+            >>> print(organizer.format_size(report['stats']['total_size']))
+        """
+        limit = self._validate_scan(start_path, top_n, workers, allow_all=True)
+        file_filter = as_filter(file_extension, file_filter)
+
+        largest = TopNCollector(limit) if limit is not None else SortedFiles()
+        totals = TotalsCollector()
+        distribution = SizeDistribution()
+        pipeline_aggregators = [largest, totals, ExtensionCollector(), distribution]
+        pipeline_aggregators.extend(aggregators)
+
+        for _ in self._run_pipeline(
+            start_path,
+            pipeline_aggregators,
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes,
+            task=f"Finding top {top_n} largest files" if limit else "Sorting all files by size",
+            follow_symlinks=follow_symlinks
+        ):
+            pass
+
+        self._log(f"   Largest files found: {len(largest)}\n")
+
+        report = {aggregator.name: aggregator.result() for aggregator in pipeline_aggregators}
+        del report[totals.name]
+        report["stats"] = self._build_stats(totals)
+        report["histogram"] = report["distribution"]["buckets"]
+        return report
+
+    def find_duplicates(
+        self,
+        start_path: Roots,
+        min_size: int = 1,
+        file_extension: Optional[str] = None,
+        include_hidden: bool = False,
+        workers: int = 1,
+        use_processes: bool = False,
+        hash_workers: int = 4,
+        file_filter: Optional[FileFilter] = None
+    ) -> Dict[str, Any]:
+        """
+        Find files with identical content.
+
+        Files are grouped by size during the scan; only sizes shared by
+        several files are sampled (first and last 4 KB), and only matching
+        samples are hashed completely, so most bytes are never read.
+
+        Args:
+            start_path: Root directory to start scanning, or a list of roots
+            min_size: Ignore files smaller than this many bytes (default: 1)
+            file_extension: Optional filter by extension (e.g., '.jpg')
+            file_filter: Optional FileFilter (several extensions, globs, regex,
+                         size and mtime bounds) instead of file_extension
+            include_hidden: Include dot-files and dot-directories
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Scan with a process pool instead of threads
+            hash_workers: Number of hashing threads (default: 4)
+
+        Returns:
+            Dictionary with 'groups' (DuplicateGroup list, most reclaimable
+            first), 'duplicate_files', 'reclaimable_bytes' and per-stage counters
+
+        Raises:
+            ValueError: If workers or hash_workers < 1
+            FileNotFoundError: If start_path doesn't exist
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> report = organizer.find_duplicates("/Users/daniel/Pictures")
+            >>> organizer.print_duplicates(report)
+        """
+        self._validate_roots(start_path, workers)
+        file_filter = as_filter(file_extension, file_filter)
+        finder = DuplicateFinder(
+            workers=hash_workers, on_error=self._record_error, cache=self.hash_cache
+        )
+        sizes = SizeGroupCollector(min_size)
+
+        for _ in self._run_pipeline(
+            start_path,
+            [sizes],
+            file_filter=file_filter,
+            include_hidden=include_hidden,
+            workers=workers,
+            use_processes=use_processes,
+            task="Grouping files by size"
+        ):
+            pass
+
+        return finder.find(sizes.result())
+
+    def print_duplicates(self, report: Dict[str, Any], limit: int = 10) -> None:
+        """
+        Print a duplicate report.
+
+        Args:
+            report: Result of find_duplicates() or DuplicateFinder.find()
+            limit: Number of groups to list
+
+        Example:
+            >>> organizer = FileOrganizer()
+            >>> organizer.print_duplicates(organizer.find_duplicates("/path"))
+        """
+        groups = report['groups']
+        if not groups:
+            print("No duplicate files found.")
+            return
+
+        print(f"🧬 Duplicate Files ({report['duplicate_files']:,} redundant copies, "
+              f"{self.format_size(report['reclaimable_bytes'])} reclaimable):")
+        print("=" * 80)
+
+        for idx, group in enumerate(groups[:limit], 1):
+            print(f"{idx:2d}. {self.format_size(group.reclaimable):>12} reclaimable - "
+                  f"{len(group.paths)} x {self.format_size(group.size)}")
+            for path in group.paths:
+                display_path = path if len(path) <= 70 else "..." + path[-67:]
+                print(f"      {display_path}")
+
+        if len(groups) > limit:
+            print(f"   ... and {len(groups) - limit:,} more groups")
+        print(f"   Hashed {report['sample_hashed']:,} samples and "
+              f"{report['fully_hashed']:,} whole files "
+              f"({self.format_size(report['bytes_read'])} read, "
+              f"{report['cache_hits']:,} cached)")
 
 
 def main():
     """Command-line interface for file organization."""
     import sys
+    import argparse
+
+    def top_n_type(value: str) -> TopN:
+        if value == "all":
+            return value
+        try:
+            return int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected a number or 'all', got {value!r}")
+
+    parser = argparse.ArgumentParser(description="Find the largest files in a directory tree.")
+    parser.add_argument(
+        "path", nargs="?", default=os.path.expanduser("~/Documents"),
+        help="Directory to scan (default: ~/Documents)"
+    )
+    parser.add_argument(
+        "top_n", nargs="?", type=top_n_type, default=10,
+        help="Number of largest files to show, or 'all' for every file by size (default: 10)"
+    )
+    parser.add_argument(
+        "extension", nargs="?", default=None,
+        help="Only consider files with this extension (e.g., .pdf)"
+    )
+    parser.add_argument(
+        "-r", "--root", action="append", default=[], metavar="PATH",
+        help="Additional directory to scan together with PATH (repeatable)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Number of scanner threads or processes (default: 1)"
+    )
+    parser.add_argument(
+        "-p", "--processes", action="store_true",
+        help="Scan with a process pool sharded by subdirectory instead of threads"
+    )
+    parser.add_argument(
+        "--hidden", action="store_true",
+        help="Include hidden files and directories"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="No progress line or scan messages; print only the results"
+    )
+    parser.add_argument(
+        "--du", type=int, metavar="DEPTH", default=None,
+        help="Also list the largest directories DEPTH levels below the root"
+    )
+    parser.add_argument(
+        "--dirs", action="store_true",
+        help="Also rank directories by recursive size and file count"
+    )
+    parser.add_argument(
+        "-c", "--categories", action="store_true",
+        help="Also break the space down by category (video, archives, ...) and extension"
+    )
+    parser.add_argument(
+        "--age", action="store_true",
+        help="Also bucket the space by age, with a size x age matrix and the largest old files"
+    )
+    parser.add_argument(
+        "--older-than", type=float, metavar="DAYS",
+        help="Split --age into files younger and older than DAYS (implies --age)"
+    )
+    parser.add_argument(
+        "--clock", choices=["mtime", "atime", "touched"], default="mtime",
+        help="Age by last modification, last access or the later of both (default: mtime)"
+    )
+    parser.add_argument(
+        "-d", "--duplicates", action="store_true",
+        help="Also report duplicate files and the space they waste"
+    )
+    parser.add_argument(
+        "--save-snapshot", metavar="NAME",
+        help="Save this scan as snapshot NAME "
+             "(in ~/.file_automation_suite/snapshots, or a .snap path)"
+    )
+    parser.add_argument(
+        "--diff", metavar="NAME",
+        help="Also report what was added, removed, grew or shrank since snapshot NAME"
+    )
+    parser.add_argument(
+        "--export", metavar="FILE",
+        help="Also write path, size and mtime of every scanned file to FILE "
+             "(.csv, .ndjson or .jsonl; add .gz to compress)"
+    )
+    parser.add_argument(
+        "--track-growth", type=int, metavar="DEPTH", nargs="?", const=1, default=None,
+        help="Record folder sizes DEPTH levels deep (default: 1) for growth tracking "
+             "and print the disk-full forecast"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Also print where the scan spent its time: phases, call counts "
+             "and the slowest directories"
+    )
+    filters = parser.add_argument_group(
+        "filters (combined with AND; repeated --ext/--glob with OR)"
+    )
+    filters.add_argument(
+        "--ext", action="append", default=[], metavar="EXT",
+        help="Only files with this extension, any case (repeatable)"
+    )
+    filters.add_argument(
+        "--glob", action="append", default=[], metavar="PATTERN",
+        help="Only file names matching this shell pattern, e.g. 'IMG_*' (repeatable)"
+    )
+    filters.add_argument(
+        "--regex", metavar="REGEX",
+        help="Only file names containing a match for this regular expression"
+    )
+    filters.add_argument(
+        "--min-size", type=parse_size, metavar="SIZE",
+        help="Only files of at least SIZE, e.g. 500K or 1.5G"
+    )
+    filters.add_argument(
+        "--max-size", type=parse_size, metavar="SIZE",
+        help="Only files of at most SIZE"
+    )
+    filters.add_argument(
+        "--modified-after", type=parse_time, metavar="DATE",
+        help="Only files modified on or after DATE (YYYY-MM-DD[THH:MM])"
+    )
+    filters.add_argument(
+        "--modified-before", type=parse_time, metavar="DATE",
+        help="Only files modified before DATE"
+    )
+    filters.add_argument(
+        "--case-sensitive", action="store_true",
+        help="Match --ext, --glob and --regex case-sensitively"
+    )
+    excludes = parser.add_argument_group(
+        "exclusions (.gitignore syntax; excluded directories are not walked)"
+    )
+    excludes.add_argument(
+        "-x", "--exclude", action="append", default=[], metavar="PATTERN",
+        help="Skip entries matching PATTERN, e.g. 'node_modules/' or '*.vmdk' (repeatable)"
+    )
+    excludes.add_argument(
+        "--exclude-from", action="append", default=[], metavar="FILE",
+        help=f"Read global patterns from FILE (repeatable; {DEFAULT_RULES_PATH} "
+             "is always read if present)"
+    )
+    excludes.add_argument(
+        "--skip-common", action="store_true",
+        help="Skip dependency folders, caches, VCS internals and VM images"
+    )
+    excludes.add_argument(
+        "--no-ignore-files", action="store_true",
+        help="Ignore per-directory .scanignore files"
+    )
+    args = parser.parse_args()
+
+    patterns = (list(COMMON_PATTERNS) if args.skip_common else []) + args.exclude
+    global_files = [str(DEFAULT_RULES_PATH)] if DEFAULT_RULES_PATH.is_file() else []
+    global_files += args.exclude_from
+    try:
+        exclusions = Exclusions(
+            patterns=patterns,
+            global_files=global_files,
+            rule_file=None if args.no_ignore_files else RULE_FILE
+        )
+    except OSError as e:
+        parser.error(f"cannot read exclusion rules: {e}")
+
+    file_filter = None
+    if (args.ext or args.glob or args.regex or args.case_sensitive
+            or any(bound is not None for bound in (args.min_size, args.max_size,
+                                                   args.modified_after, args.modified_before))):
+        try:
+            file_filter = FileFilter(
+                extensions=args.ext + ([args.extension] if args.extension else []),
+                globs=args.glob,
+                regex=args.regex,
+                min_size=args.min_size,
+                max_size=args.max_size,
+                modified_after=args.modified_after,
+                modified_before=args.modified_before,
+                case_sensitive=args.case_sensitive
+            )
+        except ValueError as e:
+            parser.error(str(e))
 
     print("=" * 80)
     print("File Organizer - Find Largest Files")
     print("=" * 80)
 
-    # Get path from arguments or use home directory
-    if len(sys.argv) > 1:
-        search_path = sys.argv[1]
-    else:
-        search_path = os.path.expanduser("~/Documents")
+    search_path = [args.path] + args.root if args.root else args.path
+    top_n = args.top_n
+    # Length of the other rankings when every file is listed
+    rank_n = 10 if top_n == "all" else top_n
 
-    # Get top_n from arguments
-    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    profiler = ScanProfiler() if args.profile else None
+    organizer = FileOrganizer(exclusions=exclusions, quiet=args.quiet, profiler=profiler)
 
-    organizer = FileOrganizer()
+    if args.export:
+        try:
+            detect_format(args.export)
+        except ValueError as e:
+            parser.error(str(e))
 
     try:
-        results = organizer.find_largest_files(search_path, top_n=top_n)
-        organizer.print_results(results)
+        old_snapshot = Snapshot(args.diff) if args.diff else None
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read snapshot: {e}")
+
+    try:
+        # One traversal feeds the leaderboard, the statistics and the breakdowns
+        extra = [SizeGroupCollector()] if args.duplicates else []
+        tree = None
+        if args.du is not None:
+            # Its own pass: du counts symlinks as links, the other reports follow them.
+            # Run first so a --profile report describes the main scan
+            tree = organizer.get_directory_tree(
+                search_path,
+                include_hidden=args.hidden,
+                workers=args.workers,
+                use_processes=args.processes
+            )
+        if args.dirs:
+            extra.append(LargestDirectoriesCollector(search_path, rank_n))
+        if args.categories:
+            extra.append(CategoryCollector())
+        if args.age or args.older_than is not None:
+            edges = AGE_EDGES if args.older_than is None else (args.older_than,)
+            extra.append(AgeCollector(rank_n, args.clock, edges))
+        snapshot = None
+        if args.save_snapshot or old_snapshot is not None:
+            snapshot = SnapshotWriter(search_path)
+            extra.append(snapshot)
+        if args.track_growth is not None:
+            extra.append(FolderTotals(search_path, args.track_growth))
+        exporter = None
+        if args.export:
+            # Written during the traversal, not from the results
+            exporter = FileExporter(args.export)
+            extra.append(exporter)
+        report = organizer.analyze_directory(
+            search_path,
+            top_n=top_n,
+            # The positional extension is folded into file_filter when one is built
+            file_extension=None if file_filter else args.extension,
+            file_filter=file_filter,
+            include_hidden=args.hidden,
+            workers=args.workers,
+            use_processes=args.processes,
+            aggregators=extra
+        )
+        organizer.print_results(report['largest_files'])
+        if isinstance(report['largest_files'], SortedFiles):
+            report['largest_files'].close()
+        if exporter is not None:
+            exporter.close()
+            print(f"\n💾 Exported {report['export']:,} files to {args.export}")
 
         # Show directory stats
         print("\n" + "=" * 80)
-        stats = organizer.get_directory_stats(search_path)
+        stats = report['stats']
         print(f"\n📁 Directory Statistics:")
         print(f"   Total size: {organizer.format_size(stats['total_size'])}")
         print(f"   Files: {stats['file_count']:,}")
         print(f"   Directories: {stats['directory_count']:,}")
         print(f"   Average file size: {organizer.format_size(stats['average_file_size'])}")
 
+        if report['extensions']:
+            print("\n🗂️  Top Extensions:")
+            for ext, count, size in report['extensions'][:5]:
+                print(f"   {ext or '(none)':<12} {organizer.format_size(size):>12} "
+                      f"in {count:,} files")
+
+        print("\n" + "=" * 80)
+        organizer.print_distribution(report['distribution'])
+
+        if args.categories:
+            print("\n" + "=" * 80)
+            organizer.print_categories(report['categories'], rank_n)
+
+        if args.age or args.older_than is not None:
+            print("\n" + "=" * 80)
+            organizer.print_age_report(report['ages'], rank_n if args.older_than is not None else 3)
+
+        if args.du is not None:
+            print("\n" + "=" * 80)
+            organizer.print_directory_tree(tree, rank_n, depth=args.du)
+
+        if args.dirs:
+            print("\n" + "=" * 80)
+            organizer.print_largest_directories(report['largest_directories'])
+
+        if args.duplicates:
+            print("\n" + "=" * 80)
+            # Digests of unchanged files are reused from earlier runs
+            with HashCache() as cache:
+                finder = DuplicateFinder(on_error=organizer._record_error, cache=cache)
+                organizer.print_duplicates(finder.find(report['size_groups']))
+
+        if snapshot is not None:
+            with snapshot:
+                if old_snapshot is not None:
+                    print("\n" + "=" * 80)
+                    organizer.print_snapshot_diff(diff_snapshots(old_snapshot, snapshot, rank_n))
+                if args.save_snapshot:
+                    saved = snapshot.save(args.save_snapshot)
+                    print(f"\n💾 Snapshot saved: {saved.path}")
+
+        if args.track_growth is not None:
+            print("\n" + "=" * 80)
+            with GrowthStore() as store:
+                store.record(report['folder_totals'])
+                organizer.print_growth_forecast(store.forecast(os.path.abspath(args.path)))
+
+        if profiler is not None:
+            print("\n" + "=" * 80)
+            print()
+            for line in profiler.lines():
+                print(line)
+
     except KeyboardInterrupt:
         print("\n\n⚠️  Scan interrupted by user")
         sys.exit(1)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Filters - Compiled File Filters with Predicate Pushdown
+=======================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Describe which files a scan should consider: extensions, glob patterns, a
+regular expression, and size or modification-time bounds. A filter is
+compiled once into two predicates:
+
+    - a name predicate, which the scanner runs on the directory entry
+      before calling stat, so rejected files cost no syscall at all
+    - a stat predicate, run on the stat result of files that passed
+
+Each kind of condition narrows the selection (extension AND glob AND
+regex AND bounds); several extensions or globs widen it (any may match).
+
+Features:
+    - Multiple extensions, case-insensitive by default ('.jpg' matches IMG.JPG)
+    - Shell globs ('IMG_*', '*.tar.gz') combined into one compiled regex
+    - Regular expressions searched in the file name
+    - Minimum/maximum size and modified-after/before bounds
+    - Picklable, so the same filter runs in process-pool workers
+    - Size/mtime bounds pushed down into ScanIndex SQL queries
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from filters import FileFilter, parse_size
+    >>> photos = FileFilter(extensions=[".jpg", ".heic"], min_size=parse_size("2M"))
+    >>> photos.match_name("IMG_0001.JPG")
+    True
+    >>> organizer.find_largest_files("/Users/daniel", file_filter=photos)
+"""
+
+import os
+import re
+import fnmatch
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a human-readable size such as '500', '10K', '1.5G' or '2 MB'.
+
+    Units are binary (K = 1024 bytes), matching FileOrganizer.format_size().
+
+    Args:
+        text: Size with an optional K, M, G or T suffix (B/iB optional)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the text is not a size
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", text.upper())
+    if not match:
+        raise ValueError(f"not a size: {text!r}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit])
+
+
+def parse_time(text: str) -> float:
+    """
+    Parse an ISO date or date-time ('2024-01-31', '2024-01-31T12:00') in local time.
+
+    Args:
+        text: ISO 8601 date or date-time
+
+    Returns:
+        Seconds since the epoch
+
+    Raises:
+        ValueError: If the text is not an ISO date
+    """
+    return datetime.fromisoformat(text.strip()).timestamp()
+
+
+class FileFilter:
+    """Compiled selection of files by name, size and modification time."""
+
+    def __init__(
+        self,
+        extensions: Sequence[str] = (),
+        globs: Sequence[str] = (),
+        regex: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        modified_after: Optional[float] = None,
+        modified_before: Optional[float] = None,
+        case_sensitive: bool = False
+    ):
+        """
+        Compile a filter.
+
+        Args:
+            extensions: Extensions to accept ('.pdf' or 'pdf'; '.tar.gz' works)
+            globs: Shell patterns matched against the whole file name
+            regex: Regular expression searched for in the file name
+            min_size: Smallest size accepted, in bytes (inclusive)
+            max_size: Largest size accepted, in bytes (inclusive)
+            modified_after: Only files modified at or after this epoch time
+            modified_before: Only files modified before this epoch time
+            case_sensitive: Match extensions, globs and regex case-sensitively
+
+        Raises:
+            ValueError: If a bound is negative or inverted, or the regex is invalid
+        """
+        if min_size is not None and min_size < 0 or max_size is not None and max_size < 0:
+            raise ValueError("size bounds must not be negative")
+        if min_size is not None and max_size is not None and min_size > max_size:
+            raise ValueError("min_size must not exceed max_size")
+        if (modified_after is not None and modified_before is not None
+                and modified_after >= modified_before):
+            raise ValueError("modified_after must be earlier than modified_before")
+
+        self.extensions = [ext if ext.startswith('.') else '.' + ext for ext in extensions if ext]
+        self.globs = list(globs)
+        self.regex = regex
+        self.min_size = min_size
+        self.max_size = max_size
+        self.modified_after = modified_after
+        self.modified_before = modified_before
+        self.case_sensitive = case_sensitive
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._suffixes: Tuple[str, ...] = tuple(
+            ext if case_sensitive else ext.lower() for ext in self.extensions
+        )
+        self._glob_re = (
+            re.compile("|".join(fnmatch.translate(glob) for glob in self.globs), flags)
+            if self.globs else None
+        )
+        try:
+            self._regex_re = re.compile(regex, flags) if regex else None
+        except re.error as e:
+            raise ValueError(f"invalid regular expression {regex!r}: {e}") from None
+
+        # Bounds as integers in the units stat reports
+        self._min_size = min_size if min_size is not None else -1
+        self._max_size = max_size
+        self._after_ns = int(modified_after * 1e9) if modified_after is not None else None
+        self._before_ns = int(modified_before * 1e9) if modified_before is not None else None
+
+    def __repr__(self) -> str:
+        return f"FileFilter({self.describe()})"
+
+    @property
+    def filters_names(self) -> bool:
+        """True if the filter has conditions on the file name."""
+        return bool(self._suffixes or self._glob_re or self._regex_re)
+
+    @property
+    def filters_stat(self) -> bool:
+        """True if the filter has conditions on size or modification time."""
+        return (self.min_size is not None or self.max_size is not None
+                or self._after_ns is not None or self._before_ns is not None)
+
+    def match_name(self, name: str) -> bool:
+        """
+        Check the name conditions (no file-system access).
+
+        Args:
+            name: File name without directory
+
+        Returns:
+            True if the name passes every name condition
+        """
+        if self._suffixes:
+            key = name if self.case_sensitive else name.lower()
+            if not key.endswith(self._suffixes):
+                return False
+        if self._glob_re is not None and self._glob_re.match(name) is None:
+            return False
+        if self._regex_re is not None and self._regex_re.search(name) is None:
+            return False
+        return True
+
+    def match_stat(self, st: os.stat_result) -> bool:
+        """
+        Check the size and modification-time conditions.
+
+        Args:
+            st: stat result of the file
+
+        Returns:
+            True if the file passes every size and time condition
+        """
+        size = st.st_size
+        if size < self._min_size or self._max_size is not None and size > self._max_size:
+            return False
+        if self._after_ns is not None and st.st_mtime_ns < self._after_ns:
+            return False
+        if self._before_ns is not None and st.st_mtime_ns >= self._before_ns:
+            return False
+        return True
+
+    def matches(self, name: str, st: os.stat_result) -> bool:
+        """Check every condition of the filter."""
+        return self.match_name(name) and self.match_stat(st)
+
+    def name_predicate(self) -> Optional[Callable[[str], bool]]:
+        """Return the pre-stat predicate for Scanner(file_filter=...), or None."""
+        return self.match_name if self.filters_names else None
+
+    def stat_predicate(self) -> Optional[Callable[[os.stat_result], bool]]:
+        """Return the post-stat predicate for Scanner(stat_filter=...), or None."""
+        return self.match_stat if self.filters_stat else None
+
+    def sql_bounds(self, size_column: str, mtime_column: str) -> Tuple[str, List[int]]:
+        """
+        Translate the size and time bounds into an SQL condition.
+
+        Args:
+            size_column: Column holding the size in bytes
+            mtime_column: Column holding the modification time in nanoseconds
+
+        Returns:
+            Tuple of (condition starting with ' AND', or '', parameters)
+        """
+        clauses, params = [], []
+        if self.min_size is not None:
+            clauses.append(f"{size_column} >= ?")
+            params.append(self.min_size)
+        if self.max_size is not None:
+            clauses.append(f"{size_column} <= ?")
+            params.append(self.max_size)
+        if self._after_ns is not None:
+            clauses.append(f"{mtime_column} >= ?")
+            params.append(self._after_ns)
+        if self._before_ns is not None:
+            clauses.append(f"{mtime_column} < ?")
+            params.append(self._before_ns)
+        return "".join(" AND " + clause for clause in clauses), params
+
+    def sql_names(self, name_column: str) -> Optional[Tuple[str, List[object]]]:
+        """
+        Translate the name conditions into SQL, if they are extensions only.
+
+        Globs, regular expressions and non-ASCII extensions (SQLite's
+        lower() only folds ASCII) are left to match_name().
+
+        Args:
+            name_column: Column holding the file name
+
+        Returns:
+            Tuple of (condition starting with ' AND', or '', parameters), or
+            None if match_name() has to check the names
+        """
+        if self._glob_re is not None or self._regex_re is not None:
+            return None
+        if not self._suffixes:
+            return "", []
+        if not all(suffix.isascii() for suffix in self._suffixes):
+            return None
+
+        column = name_column if self.case_sensitive else f"lower({name_column})"
+        clause = " OR ".join(f"substr({column}, -?) = ?" for _ in self._suffixes)
+        params: List[object] = []
+        for suffix in self._suffixes:
+            params += [len(suffix), suffix]
+        return f" AND ({clause})", params
+
+    def describe(self) -> str:
+        """Return a short human-readable summary, e.g. for progress output."""
+        parts = []
+        if self.extensions:
+            parts.append(", ".join(self.extensions))
+        if self.globs:
+            parts.append("names " + " or ".join(self.globs))
+        if self.regex:
+            parts.append(f"matching /{self.regex}/")
+        if self.min_size is not None:
+            parts.append(f">= {self.min_size:,} bytes")
+        if self.max_size is not None:
+            parts.append(f"<= {self.max_size:,} bytes")
+        if self.modified_after is not None:
+            since = datetime.fromtimestamp(self.modified_after)
+            parts.append(f"modified since {since:%Y-%m-%d %H:%M}")
+        if self.modified_before is not None:
+            before = datetime.fromtimestamp(self.modified_before)
+            parts.append(f"modified before {before:%Y-%m-%d %H:%M}")
+        return "; ".join(parts) if parts else "All files"
+
+
+def as_filter(
+    file_extension: Optional[str],
+    file_filter: Optional[FileFilter]
+) -> Optional[FileFilter]:
+    """
+    Merge the single-extension argument of older APIs into a FileFilter.
+
+    file_extension keeps its original meaning: one case-sensitive suffix.
+
+    Args:
+        file_extension: Optional extension such as '.pdf'
+        file_filter: Optional FileFilter
+
+    Returns:
+        The filter to apply, or None for all files
+
+    Raises:
+        ValueError: If both are given
+    """
+    if file_extension and file_filter is not None:
+        raise ValueError("pass either file_extension or file_filter, not both")
+    if file_extension:
+        return FileFilter(extensions=[file_extension], case_sensitive=True)
+    return file_filter
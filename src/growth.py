@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Growth - Folder Size Time Series and Disk-Full Forecasts
+=========================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Record the size of folders and the used space of their volume every time a
+tree is scanned, and turn the history into growth rates: how fast is the
+disk filling up, when will it be full, and which folders are responsible.
+Samples come from the scan that is running anyway or from the scan index
+(an incremental refresh), so tracking costs no extra traversal.
+
+Every series is a ring buffer of fixed capacity in SQLite: a sample
+overwrites the oldest slot once the buffer is full, so the store stays the
+same size however long it runs.
+
+Features:
+    - Folder totals down to a chosen depth, from one traversal or the index
+    - Used and total space of every volume the folders live on
+    - Fixed-size ring buffer per series (no pruning jobs)
+    - Least-squares growth rates over a time window
+    - Disk-full forecast with the fastest growing folders on the volume
+
+Dependencies:
+    - Standard library only (sqlite3)
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> from growth import GrowthStore
+    >>> store = GrowthStore()
+    >>> FileOrganizer().record_growth("/Users/daniel", store=store)  # e.g. daily
+    >>> forecast = store.forecast("/")
+    >>> print(forecast.days_left, forecast.folders[:3])
+"""
+
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    from .aggregators import Aggregator
+    from .scanner import Roots, _as_roots
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+    from scanner import Roots, _as_roots
+
+DEFAULT_GROWTH_PATH = Path.home() / ".file_automation_suite" / "growth.db"
+
+DAY = 86400.0
+
+# Series kinds: a folder's recursive size, or the used space of a volume
+FOLDER = "folder"
+VOLUME = "volume"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    volume TEXT NOT NULL,
+    capacity INTEGER NOT NULL DEFAULT 0,
+    next_slot INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (path, kind)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    series_id INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    time REAL NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (series_id, slot)
+) WITHOUT ROWID;
+"""
+
+
+def mount_point(path: str) -> str:
+    """
+    Return the mount point of the volume holding path.
+
+    Args:
+        path: Any existing path
+
+    Returns:
+        The nearest ancestor (or path itself) that is a mount point
+    """
+    path = os.path.realpath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def fit_rate(samples: Sequence[Tuple[float, int]]) -> float:
+    """
+    Fit a straight line through (time, value) samples.
+
+    Args:
+        samples: (unix time, value) pairs in any order
+
+    Returns:
+        Slope in value units per day; 0.0 with fewer than two distinct times
+    """
+    n = len(samples)
+    if n < 2:
+        return 0.0
+    mean_t = sum(t for t, _ in samples) / n
+    mean_v = sum(v for _, v in samples) / n
+    variance = sum((t - mean_t) ** 2 for t, _ in samples)
+    if variance == 0:
+        return 0.0
+    covariance = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    return covariance / variance * DAY
+
+
+class FolderTotals(Aggregator):
+    """
+    Recursive size of every root and of the folders down to depth below it.
+
+    Args:
+        roots: The roots being scanned (made absolute)
+        depth: Folder levels below each root that get their own total
+
+    Raises:
+        ValueError: If depth is negative
+    """
+
+    name = "folder_totals"
+
+    def __init__(self, roots: Roots, depth: int = 1):
+        """Initialize zero totals."""
+        if depth < 0:
+            raise ValueError("depth must not be negative")
+        self.roots = [os.path.abspath(root) for root in _as_roots(roots)]
+        # Nested roots win over their parents
+        self._by_length = sorted(self.roots, key=len, reverse=True)
+        self.depth = depth
+        self.totals: Dict[str, int] = {root: 0 for root in self.roots}
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        if not files:
+            return False
+        self.add_totals(dirpath, sum(st.st_size for _, st in files))
+        return True
+
+    def add_totals(self, dirpath: str, size: int) -> None:
+        """
+        Add the size of the files directly inside one directory.
+
+        Args:
+            dirpath: Directory the files belong to
+            size: Their combined size
+        """
+        dirpath = os.path.abspath(dirpath)
+        sep = os.sep
+        for root in self._by_length:
+            if dirpath == root:
+                self.totals[root] += size
+                return
+            prefix = root if root.endswith(sep) else root + sep
+            if dirpath.startswith(prefix):
+                break
+        else:
+            return
+
+        self.totals[root] += size
+        path = root
+        for part in dirpath[len(prefix):].split(sep, self.depth)[:self.depth]:
+            path = os.path.join(path, part)
+            self.totals[path] = self.totals.get(path, 0) + size
+
+    def merge(self, other: "FolderTotals") -> None:
+        for path, size in other.totals.items():
+            self.totals[path] = self.totals.get(path, 0) + size
+
+    def spawn(self) -> "FolderTotals":
+        return FolderTotals(self.roots, self.depth)
+
+    def result(self) -> Dict[str, int]:
+        return dict(self.totals)
+
+
+class Trend(NamedTuple):
+    """Latest size and fitted growth of one folder or volume."""
+
+    path: str
+    size: int
+    # Bytes per day, negative when shrinking
+    rate: float
+    samples: int
+
+
+class DiskForecast(NamedTuple):
+    """When a volume fills up at its current growth rate."""
+
+    volume: str
+    capacity: int
+    used: int
+    # Bytes per day
+    rate: float
+    # None when the volume is not growing
+    days_left: Optional[float]
+    full_at: Optional[float]
+    samples: int
+    # Fastest growing folders on the volume
+    folders: List[Trend]
+
+
+class GrowthStore:
+    """Ring-buffered time series of folder sizes and volume usage."""
+
+    def __init__(self, db_path: Optional[str] = None, capacity: int = 512):
+        """
+        Open (and create if needed) a growth database.
+
+        Args:
+            db_path: SQLite file to use (default: ~/.file_automation_suite/growth.db);
+                     ":memory:" gives a throwaway store
+            capacity: Samples kept per series; the oldest is overwritten
+                      (a sample takes roughly 30 bytes on disk)
+
+        Raises:
+            ValueError: If capacity is less than 2
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+
+        if db_path is None:
+            DEFAULT_GROWTH_PATH.parent.mkdir(exist_ok=True)
+            db_path = str(DEFAULT_GROWTH_PATH)
+
+        self.db_path = db_path
+        self.capacity = capacity
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self) -> "GrowthStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self.conn.close()
+
+    def record(self, sizes: Dict[str, int], when: Optional[float] = None) -> None:
+        """
+        Add one sample per folder, and one for each volume they are on.
+
+        Args:
+            sizes: Folder path -> recursive size in bytes, e.g. from
+                   FolderTotals or FileOrganizer.record_growth()
+            when: Sample time (default: now)
+        """
+        when = time.time() if when is None else when
+        volumes = {path: mount_point(path) for path in sizes}
+
+        with self._lock:
+            for path, size in sizes.items():
+                self._append(path, FOLDER, volumes[path], when, size)
+            for volume in set(volumes.values()):
+                try:
+                    usage = shutil.disk_usage(volume)
+                except OSError:
+                    continue
+                self._append(volume, VOLUME, volume, when, usage.used, usage.total)
+            self.conn.commit()
+
+    def record_volume(
+        self,
+        volume: str,
+        used: int,
+        capacity: int,
+        when: Optional[float] = None
+    ) -> None:
+        """
+        Add a usage sample for a volume measured elsewhere.
+
+        record() samples the volumes of its folders itself; this is for
+        usage reported by other tools (e.g. a remote df).
+
+        Args:
+            volume: Mount point
+            used: Used bytes
+            capacity: Size of the volume in bytes
+            when: Sample time (default: now)
+        """
+        with self._lock:
+            when = time.time() if when is None else when
+            self._append(volume, VOLUME, volume, when, used, capacity)
+            self.conn.commit()
+
+    def _append(
+        self,
+        path: str,
+        kind: str,
+        volume: str,
+        when: float,
+        value: int,
+        capacity: int = 0
+    ) -> None:
+        """Write a sample into the next slot of a series' ring buffer."""
+        conn = self.conn
+        row = conn.execute("SELECT id, next_slot FROM series WHERE path = ? AND kind = ?",
+                           (path, kind)).fetchone()
+        if row is None:
+            series_id = conn.execute(
+                "INSERT INTO series (path, kind, volume, capacity) VALUES (?, ?, ?, ?)",
+                (path, kind, volume, capacity)
+            ).lastrowid
+            slot = 0
+        else:
+            series_id, slot = row
+
+        conn.execute(
+            "INSERT OR REPLACE INTO samples (series_id, slot, time, value) VALUES (?, ?, ?, ?)",
+            (series_id, slot % self.capacity, when, value)
+        )
+        conn.execute(
+            "UPDATE series SET next_slot = ?, volume = ?, capacity = MAX(capacity, ?) WHERE id = ?",
+            (slot + 1, volume, capacity, series_id)
+        )
+
+    def series(
+        self,
+        path: str,
+        kind: str = FOLDER,
+        since: Optional[float] = None
+    ) -> List[Tuple[float, int]]:
+        """
+        Return the samples of one folder or volume.
+
+        Args:
+            path: Folder path, or a volume's mount point with kind VOLUME
+            kind: FOLDER or VOLUME
+            since: Only samples taken at or after this time
+
+        Returns:
+            (time, bytes) pairs, oldest first
+        """
+        with self._lock:
+            return self.conn.execute(
+                """
+                SELECT s.time, s.value FROM samples s JOIN series r ON r.id = s.series_id
+                WHERE r.path = ? AND r.kind = ? AND s.time >= ?
+                ORDER BY s.time
+                """,
+                (path, kind, since if since is not None else float("-inf"))
+            ).fetchall()
+
+    def trend(
+        self,
+        path: str,
+        kind: str = FOLDER,
+        window_days: Optional[float] = 30
+    ) -> Optional[Trend]:
+        """
+        Fit the growth of one folder or volume.
+
+        Args:
+            path: Folder path or mount point
+            kind: FOLDER or VOLUME
+            window_days: Only fit samples this recent (None: all kept samples)
+
+        Returns:
+            Trend, or None without samples
+        """
+        since = time.time() - window_days * DAY if window_days is not None else None
+        samples = self.series(path, kind, since)
+        if not samples:
+            return None
+        return Trend(path, samples[-1][1], fit_rate(samples), len(samples))
+
+    def forecast(
+        self,
+        path: str = "/",
+        window_days: Optional[float] = 30,
+        top_n: int = 5
+    ) -> DiskForecast:
+        """
+        Predict when the volume holding path fills up.
+
+        Current usage is read from the disk when it is mounted; the growth
+        rate comes from the recorded samples.
+
+        Args:
+            path: Any path on the volume
+            window_days: Only fit samples this recent (None: all kept samples)
+            top_n: Number of growing folders to list
+
+        Returns:
+            DiskForecast; days_left is None while the volume is not growing
+        """
+        volume = mount_point(path)
+        trend = self.trend(volume, VOLUME, window_days)
+        with self._lock:
+            row = self.conn.execute("SELECT capacity FROM series WHERE path = ? AND kind = ?",
+                                    (volume, VOLUME)).fetchone()
+            folder_paths = [folder for (folder,) in self.conn.execute(
+                "SELECT path FROM series WHERE volume = ? AND kind = ?", (volume, FOLDER)
+            )]
+
+        try:
+            usage = shutil.disk_usage(volume)
+            capacity, used = usage.total, usage.used
+        except OSError:
+            capacity = row[0] if row else 0
+            used = trend.size if trend else 0
+
+        rate = trend.rate if trend else 0.0
+        days_left = full_at = None
+        if rate > 0:
+            days_left = max(0, capacity - used) / rate
+            full_at = time.time() + days_left * DAY
+
+        folders = [t for t in (self.trend(folder, FOLDER, window_days) for folder in folder_paths)
+                   if t is not None and t.rate > 0]
+        folders.sort(key=lambda t: (-t.rate, t.path))
+
+        return DiskForecast(
+            volume=volume,
+            capacity=capacity,
+            used=used,
+            rate=rate,
+            days_left=days_left,
+            full_at=full_at,
+            samples=trend.samples if trend else 0,
+            folders=folders[:top_n]
+        )
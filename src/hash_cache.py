@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Hash Cache - Persistent Content Digest Cache
+============================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Remember content digests across runs, keyed by (st_dev, st_ino, st_size,
+st_mtime_ns). A file whose key is unchanged is not read again, so repeat
+runs of duplicate detection (or anything else that hashes) over an
+unchanged tree do no content reads at all.
+
+Features:
+    - SQLite-backed, shared by every component that hashes files
+    - Separate entries per digest kind (full content, sample size, algorithm)
+    - Least-recently-used eviction above a maximum number of entries
+    - Writes are batched; safe to use from hashing thread pools
+    - A file that changes while it is hashed is not cached
+
+Dependencies:
+    - Standard library only (sqlite3)
+
+Example:
+    >>> from hash_cache import HashCache
+    >>> cache = HashCache()
+    >>> cache.file_digest("/Users/daniel/movie.mp4")   # reads the file
+    >>> cache.file_digest("/Users/daniel/movie.mp4")   # answered from the cache
+    >>> cache.close()
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    from .hashing import DEFAULT_ALGORITHM, hash_file, hash_sample
+except ImportError:  # Running as a script or with src/ on sys.path
+    from hashing import DEFAULT_ALGORITHM, hash_file, hash_sample
+
+DEFAULT_CACHE_PATH = Path.home() / ".file_automation_suite" / "hash_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (device, inode, size, mtime_ns, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_hashes_last_used ON hashes(last_used);
+"""
+
+# (device, inode, size, mtime_ns, kind)
+CacheKey = Tuple[int, int, int, int, str]
+
+
+def sample_kind(sample_size: int, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Cache kind under which hash_sample() digests are stored."""
+    return f"{algorithm}:sample{sample_size}"
+
+
+class HashCache:
+    """Persistent cache of file content digests."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = 1_000_000,
+        flush_every: int = 1000
+    ):
+        """
+        Open (and create if needed) a cache database.
+
+        Args:
+            db_path: SQLite file to use (default: ~/.file_automation_suite/hash_cache.db);
+                     ":memory:" gives a throwaway cache
+            max_entries: Least recently used entries beyond this are evicted
+                         (an entry takes roughly 150 bytes on disk)
+            flush_every: Pending writes that trigger a flush
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        if db_path is None:
+            DEFAULT_CACHE_PATH.parent.mkdir(exist_ok=True)
+            db_path = str(DEFAULT_CACHE_PATH)
+
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.hits = 0
+        self.misses = 0
+
+        # One connection shared by hashing threads, serialized by a lock
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+        # Upper bound on the row count, so eviction needs no COUNT per flush
+        self._count = self.conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+        self._new: Dict[CacheKey, str] = {}
+        self._touched: Dict[CacheKey, float] = {}
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            return self.conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+
+    def file_digest(self, path: str, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        """
+        Return the full-content digest of a file, reading it only on a miss.
+
+        Args:
+            path: File to hash
+            algorithm: Any hashlib algorithm name
+
+        Returns:
+            Hex digest, equal to hashing.hash_file()
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return self.digest(path, algorithm, lambda: hash_file(path, algorithm))[0]
+
+    def sample_digest(
+        self,
+        path: str,
+        sample_size: int = 4096,
+        algorithm: str = DEFAULT_ALGORITHM
+    ) -> str:
+        """
+        Return the sample digest of a file, reading it only on a miss.
+
+        Args:
+            path: File to hash
+            sample_size: Bytes read from each end
+            algorithm: Any hashlib algorithm name
+
+        Returns:
+            Hex digest, equal to hashing.hash_sample()
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return self.digest(
+            path,
+            sample_kind(sample_size, algorithm),
+            lambda: hash_sample(path, os.stat(path).st_size, sample_size, algorithm)
+        )[0]
+
+    def digest(self, path: str, kind: str, compute: Callable[[], str]) -> Tuple[str, bool]:
+        """
+        Look up a digest, computing and storing it on a miss.
+
+        Args:
+            path: File the digest belongs to
+            kind: Name of the digest type (algorithm plus any parameters)
+            compute: Function that reads the file and returns the digest
+
+        Returns:
+            Tuple of (digest, True if it came from the cache)
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+        """
+        st = os.stat(path)
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, kind)
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        digest = compute()
+
+        # Only cache what still describes the file after hashing
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            self.put(key, digest)
+        return digest, False
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """
+        Look up a digest by key.
+
+        Args:
+            key: (device, inode, size, mtime_ns, kind)
+
+        Returns:
+            Cached digest, or None on a miss
+        """
+        with self._lock:
+            digest = self._new.get(key)
+            if digest is None:
+                row = self.conn.execute(
+                    "SELECT digest FROM hashes WHERE device = ? AND inode = ? AND size = ?"
+                    " AND mtime_ns = ? AND kind = ?",
+                    key
+                ).fetchone()
+                digest = row[0] if row else None
+
+            if digest is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._touched[key] = time.time()
+            self._maybe_flush()
+            return digest
+
+    def put(self, key: CacheKey, digest: str) -> None:
+        """
+        Store a digest.
+
+        Args:
+            key: (device, inode, size, mtime_ns, kind)
+            digest: Digest of the file content
+        """
+        with self._lock:
+            self._new[key] = digest
+            self._maybe_flush()
+
+    def flush(self) -> None:
+        """Write pending entries and access times, then evict if over the limit."""
+        with self._lock:
+            if not (self._new or self._touched):
+                return
+
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [key + (digest, now) for key, digest in self._new.items()]
+                )
+                self.conn.executemany(
+                    "UPDATE hashes SET last_used = ? WHERE device = ? AND inode = ?"
+                    " AND size = ? AND mtime_ns = ? AND kind = ?",
+                    [(used,) + key for key, used in self._touched.items()]
+                )
+                self._count += len(self._new)
+                self._new.clear()
+                self._touched.clear()
+
+                if self._count > self.max_entries:
+                    self._count = self.conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+                    excess = self._count - self.max_entries
+                    if excess > 0:
+                        self.conn.execute(
+                            "DELETE FROM hashes WHERE rowid IN"
+                            " (SELECT rowid FROM hashes ORDER BY last_used LIMIT ?)",
+                            (excess,)
+                        )
+                        self._count = self.max_entries
+
+    def clear(self) -> None:
+        """Remove every cached digest."""
+        with self._lock:
+            self._new.clear()
+            self._touched.clear()
+            with self.conn:
+                self.conn.execute("DELETE FROM hashes")
+            self._count = 0
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        with self._lock:
+            self.flush()
+            self.conn.close()
+
+    def _maybe_flush(self) -> None:
+        if len(self._new) + len(self._touched) >= self.flush_every:
+            self.flush()
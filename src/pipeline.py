@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Scan Pipeline - One Traversal, Many Aggregates
+===============================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Drive a single directory traversal into any number of aggregators, so that
+the largest files, totals, per-extension breakdown and size histogram all
+come out of one walk instead of one walk each.
+
+Features:
+    - Pluggable aggregators (see aggregators.Aggregator)
+    - Serial, threaded or process-pool execution with identical results
+    - Incremental iteration for progress reporting and live updates
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from pipeline import ScanPipeline
+    >>> from aggregators import TopNCollector, TotalsCollector
+    >>> largest, totals = TopNCollector(10), TotalsCollector()
+    >>> ScanPipeline([largest, totals]).run("/Users/daniel/Documents")
+    >>> print(totals.total_size, largest.results()[0])
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+try:
+    from .scanner import Roots, Scanner
+    from .aggregators import Aggregator, AggregatorSet
+    from .profiling import AGGREGATE
+except ImportError:  # Running as a script or with src/ on sys.path
+    from scanner import Roots, Scanner
+    from aggregators import Aggregator, AggregatorSet
+    from profiling import AGGREGATE
+
+
+class ScanPipeline:
+    """Feed one traversal into several aggregators at once."""
+
+    def __init__(
+        self,
+        aggregators: Sequence[Aggregator],
+        scanner: Optional[Scanner] = None,
+        workers: int = 1,
+        use_processes: bool = False
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            aggregators: Aggregators to feed; results are merged back into
+                         these same objects, whatever the execution mode
+            scanner: Configured Scanner (default: Scanner() with defaults)
+            workers: Number of scanner threads or processes (default: 1)
+            use_processes: Use a process pool instead of threads
+
+        Raises:
+            ValueError: If no aggregators are given, names collide or
+                        workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.aggregators = AggregatorSet(aggregators)
+        self.scanner = scanner if scanner is not None else Scanner()
+        self.workers = workers
+        self.use_processes = use_processes
+
+    def run(
+        self,
+        roots: Roots,
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Scan roots and return every aggregator's result.
+
+        Args:
+            roots: Directory to scan, or a sequence of directories
+            on_progress: Optional progress function for threaded/process scans
+                         Signature: on_progress(file_count: int, current_dir: str)
+
+        Returns:
+            Dictionary mapping each aggregator's name to its result()
+        """
+        for _ in self.iter_run(roots, on_progress):
+            pass
+        return self.aggregators.result()
+
+    def iter_run(
+        self,
+        roots: Roots,
+        on_progress: Optional[Callable[[int, str], None]] = None
+    ) -> Iterator[Tuple[str, bool]]:
+        """
+        Scan roots, yielding after each unit of progress.
+
+        Serial scans yield once per directory with files. Threaded and
+        process scans merge the per-worker aggregates when the traversal
+        finishes and yield once; use on_progress to follow them.
+
+        Args:
+            roots: Directory to scan, or a sequence of directories
+            on_progress: Optional progress function for threaded/process scans
+
+        Yields:
+            (dirpath, changed) where changed tells whether any aggregator
+            reported a change for that directory
+        """
+        scanner = self.scanner
+
+        if self.workers > 1 or self.use_processes:
+            # Empty template so workers never receive already-collected data
+            template = self.aggregators.spawn()
+            if self.use_processes:
+                partials = scanner.scan_processes(roots, self.workers, template.spawn, on_progress)
+            else:
+                partials = scanner.scan_parallel(roots, self.workers, template.spawn, on_progress)
+
+            started = time.perf_counter_ns()
+            for partial in partials:
+                self.aggregators.merge(partial)
+            if scanner.profiler is not None:
+                scanner.profiler.add(AGGREGATE, time.perf_counter_ns() - started)
+            yield "", True
+        else:
+            add_batch = self.aggregators.add_batch
+            profiler = scanner.profiler
+            if profiler is None:
+                for dirpath, files in scanner.scan(roots):
+                    yield dirpath, add_batch(dirpath, files)
+                return
+            clock = time.perf_counter_ns
+            for dirpath, files in scanner.scan(roots):
+                started = clock()
+                changed = add_batch(dirpath, files)
+                profiler.add(AGGREGATE, clock() - started)
+                yield dirpath, changed
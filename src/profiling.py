@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Profiling - Opt-in Per-Phase Instrumentation of Scans
+======================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Find out where a slow scan spends its time: listing directories, stat
+calls, filtering, aggregation or progress output. A ScanProfiler handed to
+FileOrganizer (or to a Scanner) collects per-phase timers, call counters,
+a histogram of per-directory latency and the slowest directories. The
+scanner picks its timed loop once per directory, only when a profiler is
+set, so an unprofiled scan never reads the clock.
+
+Features:
+    - Wall time per phase; what is left is reported as "other"
+    - Directory listings, stat calls and errors counted
+    - Log2 histogram of the time spent listing each directory
+    - The N slowest directories
+    - Mergeable and picklable: every thread or process worker fills its
+      own profiler, merged when the scan finishes
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> from profiling import ScanProfiler
+    >>> profiler = ScanProfiler()
+    >>> FileOrganizer(profiler=profiler).find_largest_files("/Users/daniel")
+    >>> for line in profiler.lines():
+    ...     print(line)
+"""
+
+import heapq
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Phases timed by the scanner, the pipeline and FileOrganizer; "list" is
+# the time per directory spent neither filtering nor in stat calls
+LIST = "list"
+FILTER = "filter"
+STAT = "stat"
+AGGREGATE = "aggregate"
+PROGRESS = "progress"
+PHASES = (LIST, FILTER, STAT, AGGREGATE, PROGRESS)
+
+# Bucket 0 is below 1 µs, bucket k covers [2**(k-1), 2**k) µs; the last
+# bucket (about 18 minutes and up) takes everything longer
+_BUCKETS = 32
+
+
+class ScanProfiler:
+    """
+    Per-phase timers, call counters and directory latencies of a scan.
+
+    Times are measured with time.perf_counter_ns and summed over every
+    worker, so with several workers the phases can add up to more than
+    the wall time.
+
+    Args:
+        slowest: Number of slowest directories to keep
+
+    Example:
+        >>> profiler = ScanProfiler(slowest=5)
+        >>> Scanner(profiler=profiler)  # or FileOrganizer(profiler=profiler)
+    """
+
+    def __init__(self, slowest: int = 10):
+        """Initialize an empty profile."""
+        self.slowest_n = slowest
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything measured so far."""
+        self.phase_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.calls: Dict[str, int] = {"scandir": 0, "stat": 0, "errors": 0}
+        self.directories = 0
+        self.histogram: List[int] = [0] * _BUCKETS
+        # Min-heap of (nanoseconds, path)
+        self._slowest: List[Tuple[int, str]] = []
+        self.wall_ns = 0
+        self._started: Optional[int] = None
+
+    def start(self) -> None:
+        """Start the wall clock of a scan."""
+        self._started = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        """Stop the wall clock; the elapsed time is added to wall_ns."""
+        if self._started is not None:
+            self.wall_ns += time.perf_counter_ns() - self._started
+            self._started = None
+
+    def add(self, phase: str, nanoseconds: int) -> None:
+        """Add time spent in a phase."""
+        self.phase_ns[phase] += nanoseconds
+
+    def record_directory(self, path: str, nanoseconds: int) -> None:
+        """
+        Record how long one directory took to list, filter and stat.
+
+        Args:
+            path: Directory path
+            nanoseconds: Time spent on it
+        """
+        self.directories += 1
+        self.histogram[min((nanoseconds // 1000).bit_length(), _BUCKETS - 1)] += 1
+        self.record_slow(nanoseconds, path)
+
+    def add_directory(
+        self,
+        path: str,
+        nanoseconds: int,
+        filter_ns: int,
+        stat_ns: int,
+        stat_calls: int,
+        errors: int
+    ) -> None:
+        """
+        Record one listed directory and how its time was spent.
+
+        Args:
+            path: Directory path
+            nanoseconds: Time spent on it in total
+            filter_ns: Part spent in exclusion rules and filters
+            stat_ns: Part spent in stat calls
+            stat_calls: Number of stat calls
+            errors: Number of entries (or the directory) that failed
+        """
+        phase_ns = self.phase_ns
+        phase_ns[LIST] += nanoseconds - filter_ns - stat_ns
+        phase_ns[FILTER] += filter_ns
+        phase_ns[STAT] += stat_ns
+        calls = self.calls
+        calls["scandir"] += 1
+        calls["stat"] += stat_calls
+        calls["errors"] += errors
+        self.record_directory(path, nanoseconds)
+
+    def merge(self, other: "ScanProfiler") -> None:
+        """
+        Add another profile (e.g. a worker's) to this one.
+
+        The wall time is not added; workers run at the same time.
+        """
+        for phase, nanoseconds in other.phase_ns.items():
+            self.phase_ns[phase] = self.phase_ns.get(phase, 0) + nanoseconds
+        for name, count in other.calls.items():
+            self.calls[name] = self.calls.get(name, 0) + count
+        self.directories += other.directories
+        self.histogram = [mine + theirs for mine, theirs in zip(self.histogram, other.histogram)]
+        for nanoseconds, path in other._slowest:
+            self.record_slow(nanoseconds, path)
+
+    def record_slow(self, nanoseconds: int, path: str) -> None:
+        """Offer a directory to the slowest list without counting it."""
+        slowest = self._slowest
+        if len(slowest) < self.slowest_n:
+            heapq.heappush(slowest, (nanoseconds, path))
+        elif slowest and nanoseconds > slowest[0][0]:
+            heapq.heapreplace(slowest, (nanoseconds, path))
+
+    def spawn(self) -> "ScanProfiler":
+        """Create an empty profiler with the same settings."""
+        return ScanProfiler(self.slowest_n)
+
+    def slowest(self) -> List[Tuple[float, str]]:
+        """
+        Return the slowest directories.
+
+        Returns:
+            List of (seconds, path), slowest first
+        """
+        return [
+            (nanoseconds / 1e9, path) for nanoseconds, path in sorted(self._slowest, reverse=True)
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Describe the profile.
+
+        Returns:
+            Dictionary with 'wall_seconds', 'phases' as {phase: seconds}
+            including 'other' (wall time not covered by a phase, never
+            negative), 'calls', 'directories', 'latency' as
+            (low_seconds, high_seconds, directories) for non-empty buckets
+            and 'slowest' as (seconds, path)
+        """
+        phases = {phase: nanoseconds / 1e9 for phase, nanoseconds in self.phase_ns.items()}
+        wall = self.wall_ns / 1e9
+        phases["other"] = max(0.0, wall - sum(phases.values()))
+        latency = [
+            (0.0 if bucket == 0 else 2 ** (bucket - 1) / 1e6, 2 ** bucket / 1e6, count)
+            for bucket, count in enumerate(self.histogram) if count
+        ]
+        return {
+            "wall_seconds": wall,
+            "phases": phases,
+            "calls": dict(self.calls),
+            "directories": self.directories,
+            "latency": latency,
+            "slowest": self.slowest(),
+        }
+
+    def lines(self, width: int = 40) -> List[str]:
+        """
+        Format the profile as short human-readable lines.
+
+        Args:
+            width: Width of the longest histogram bar
+
+        Returns:
+            Lines without trailing newlines
+        """
+        report = self.report()
+        wall = report["wall_seconds"]
+        lines = [f"Scan profile: {wall:.3f}s wall, {report['directories']:,} directories"]
+
+        lines.append("  Phases (summed over workers):")
+        for phase, seconds in report["phases"].items():
+            share = f" {seconds / wall:6.1%}" if wall > 0 else ""
+            lines.append(f"    {phase:<10} {seconds:10.3f}s{share}")
+
+        calls = report["calls"]
+        lines.append(f"  Calls: {calls['scandir']:,} directory listings, {calls['stat']:,} stat, "
+                     f"{calls['errors']:,} errors")
+
+        if report["latency"]:
+            lines.append("  Time per directory:")
+            largest = max(count for _, _, count in report["latency"])
+            for low, high, count in report["latency"]:
+                bar = "█" * max(1, round(width * count / largest))
+                lines.append(f"    {_duration(low):>8} - {_duration(high):<8} {count:>8,} {bar}")
+
+        if report["slowest"]:
+            lines.append("  Slowest directories:")
+            for seconds, path in report["slowest"]:
+                display_path = path if len(path) <= 60 else "..." + path[-57:]
+                lines.append(f"    {_duration(seconds):>8}  {display_path}")
+        return lines
+
+
+def _duration(seconds: float) -> str:
+    """Format a duration with a unit that keeps it short."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Progress - Throttled, Structured Scan Progress Events
+======================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Report scan progress without slowing the scan down. Instead of printing and
+calling back every N files, the scan offers an update after each directory
+and the reporter lets through at most one event per interval (10 Hz by
+default), so a fast SSD scan produces ten terminal updates a second, not
+thousands. Listeners that may be slow (GUIs, network sinks) are decoupled
+through a ProgressChannel: a bounded queue the scan never waits on.
+
+Features:
+    - Time-based throttling; the check is one monotonic clock read
+    - Structured events: files, directories and bytes seen, files/sec,
+      current directory, elapsed time
+    - A final event is always delivered when the scan ends
+    - Non-blocking channel: when consumers fall behind, the oldest
+      undelivered events are dropped rather than stalling the scan
+    - Optional dispatcher thread that runs a callback off the scan thread
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> from progress import ProgressChannel
+    >>> channel = ProgressChannel(callback=lambda event: print(event.files_per_second))
+    >>> organizer = FileOrganizer(progress_listener=channel, quiet=True)
+    >>> organizer.find_largest_files("/Users/daniel", top_n=10)
+    >>> channel.close()
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+
+class ProgressEvent(NamedTuple):
+    """Progress of a running scan."""
+
+    files_scanned: int
+    current_path: str
+    elapsed: float
+    bytes_seen: int = 0
+    dirs_scanned: int = 0
+    files_per_second: float = 0.0
+    # True for the last event of a scan
+    final: bool = False
+
+
+# Anything that accepts events: a function, a ProgressChannel, ...
+ProgressListener = Callable[[ProgressEvent], Any]
+
+DEFAULT_INTERVAL = 0.1
+
+
+class ProgressReporter:
+    """
+    Turn frequent progress updates into at most one event per interval.
+
+    Args:
+        listeners: Called in the scanning thread with each event that is
+                   let through; use a ProgressChannel for slow consumers
+        interval: Minimum seconds between events (default: 0.1, i.e. 10 Hz)
+
+    Example:
+        >>> reporter = ProgressReporter([print], interval=0.5)
+        >>> reporter.due()
+        True
+        >>> event = reporter.update(120, 3, 4096, "/tmp")
+        >>> reporter.due()
+        False
+    """
+
+    def __init__(
+        self,
+        listeners: Sequence[ProgressListener] = (),
+        interval: float = DEFAULT_INTERVAL
+    ):
+        """Initialize the reporter; the clock starts now."""
+        self.listeners = list(listeners)
+        self.interval = interval
+        self.started = time.monotonic()
+        self._next = 0.0
+
+    def due(self) -> bool:
+        """Whether an update offered now would be delivered."""
+        return time.monotonic() >= self._next
+
+    def update(self, files: int, dirs: int, nbytes: int, path: str) -> Optional[ProgressEvent]:
+        """
+        Offer the current counters; delivered only if the interval has passed.
+
+        Callers that need work to compute the counters should check due() first.
+
+        Returns:
+            The delivered event, or None if it was throttled
+        """
+        now = time.monotonic()
+        if now < self._next:
+            return None
+        self._next = now + self.interval
+        return self._emit(files, dirs, nbytes, path, now, final=False)
+
+    def finish(self, files: int, dirs: int, nbytes: int, path: str = "") -> ProgressEvent:
+        """Deliver the final event regardless of the interval."""
+        return self._emit(files, dirs, nbytes, path, time.monotonic(), final=True)
+
+    def _emit(
+        self,
+        files: int,
+        dirs: int,
+        nbytes: int,
+        path: str,
+        now: float,
+        final: bool
+    ) -> ProgressEvent:
+        elapsed = now - self.started
+        event = ProgressEvent(
+            files_scanned=files,
+            current_path=path,
+            elapsed=elapsed,
+            bytes_seen=nbytes,
+            dirs_scanned=dirs,
+            files_per_second=files / elapsed if elapsed > 0 else 0.0,
+            final=final
+        )
+        for listener in self.listeners:
+            listener(event)
+        return event
+
+
+class ProgressChannel:
+    """
+    Bounded, non-blocking queue of progress events.
+
+    Calling the channel with an event never blocks: when the queue is full
+    the oldest event is discarded. Consumers either poll it (get(), drain(),
+    e.g. from a GUI timer) or pass a callback, which then runs in a daemon
+    dispatcher thread.
+
+    Args:
+        maxsize: Number of undelivered events kept
+        callback: Optional function run off the scan thread for each event
+
+    Example:
+        >>> channel = ProgressChannel()
+        >>> organizer = FileOrganizer(progress_listener=channel, quiet=True)
+        >>> # ... in a Tk after() loop:
+        >>> for event in channel.drain():
+        ...     label.config(text=f"{event.files_scanned:,} files")
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, maxsize: int = 64, callback: Optional[ProgressListener] = None):
+        """Create the queue and, with a callback, start the dispatcher thread."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._queue: "queue.Queue" = queue.Queue(maxsize)
+        self.dropped = 0
+        self._dispatcher: Optional[threading.Thread] = None
+        if callback is not None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, args=(callback,), daemon=True
+            )
+            self._dispatcher.start()
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """Enqueue an event, discarding the oldest one if the queue is full."""
+        self._put(event)
+
+    def _put(self, item: Any) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait; None waits until an event arrives
+
+        Returns:
+            The event, or None on timeout or after close()
+        """
+        try:
+            item = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return None if item is self._CLOSED else item
+
+    def drain(self) -> List[ProgressEvent]:
+        """Return every queued event without waiting."""
+        events = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return events
+            if item is not self._CLOSED:
+                events.append(item)
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop the dispatcher thread after it delivered the queued events."""
+        if self._dispatcher is not None:
+            self._put(self._CLOSED)
+            self._dispatcher.join(timeout)
+            self._dispatcher = None
+
+    def _dispatch(self, callback: ProgressListener) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._CLOSED:
+                return
+            try:
+                callback(item)
+            except Exception:
+                pass  # A failing consumer must not silence the ones after it
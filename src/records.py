@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Records - Compact Columnar File Record Store
+============================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Hold scan results for millions of files without a Python object per file.
+Sizes, modification times, inodes and parent-directory ids live in typed
+arrays; each directory path is stored once and every basename is a slice of
+one shared UTF-8 buffer. A record costs roughly 28 bytes plus its name,
+against 150+ bytes for a (size, path) tuple with its own path string.
+
+Features:
+    - array-backed columns (size, mtime_ns, inode, directory id)
+    - Interned directory strings, basenames in one byte buffer
+    - Zero-copy NumPy views of the columns when NumPy is installed
+    - Pipeline aggregator: collected from the same traversal as the others,
+      mergeable across parallel workers and picklable for process pools
+    - Exact top-N and full size ordering without materializing paths
+
+Dependencies:
+    - Standard library only
+    - numpy (optional, for to_numpy() and faster ordering)
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> records = FileOrganizer().collect_records("/Users/daniel/Downloads")
+    >>> len(records), records.nbytes
+    >>> for record in records.largest(5):
+    ...     print(record.size, record.path)
+"""
+
+import os
+import heapq
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from .aggregators import Aggregator
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator
+
+try:
+    import numpy as np
+except ImportError:  # Optional; columns stay plain arrays
+    np = None
+
+
+class FileRecord(NamedTuple):
+    """One file, materialized from a FileRecords store."""
+
+    size: int
+    path: str
+    mtime_ns: int
+    inode: int
+
+
+class FileRecords(Aggregator):
+    """Columnar store of file records; also a pipeline aggregator."""
+
+    name = "records"
+
+    def __init__(self):
+        """Create an empty store."""
+        self.sizes = array('q')
+        self.mtimes = array('q')
+        self.inodes = array('Q')
+        self.dir_ids = array('I')
+        # Interned directory paths; dir_ids index into this list
+        self.directories: List[str] = []
+        self._dir_index: Dict[str, int] = {}
+        # Basenames, UTF-8 (surrogate-escaped like os.fsencode), back to back
+        self._names = bytearray()
+        self._name_ends = array('Q')
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def __getitem__(self, index: int) -> FileRecord:
+        if index < 0:
+            index += len(self.sizes)
+        return FileRecord(
+            self.sizes[index], self.path(index), self.mtimes[index], self.inodes[index]
+        )
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        for index in range(len(self.sizes)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns, buffers and directory strings."""
+        columns = (self.sizes, self.mtimes, self.inodes, self.dir_ids, self._name_ends)
+        return (
+            sum(column.itemsize * len(column) for column in columns)
+            + len(self._names)
+            + sum(len(directory) for directory in self.directories)
+        )
+
+    def intern_directory(self, dirpath: str) -> int:
+        """
+        Return the id of a directory, adding it on first use.
+
+        Args:
+            dirpath: Directory path, stored as given
+
+        Returns:
+            Index into self.directories
+        """
+        dir_id = self._dir_index.get(dirpath)
+        if dir_id is None:
+            dir_id = len(self.directories)
+            self.directories.append(dirpath)
+            self._dir_index[dirpath] = dir_id
+        return dir_id
+
+    def append(self, dirpath: str, name: str, size: int, mtime_ns: int = 0, inode: int = 0) -> None:
+        """
+        Add a single file.
+
+        Args:
+            dirpath: Directory holding the file
+            name: Basename of the file
+            size: Size in bytes
+            mtime_ns: Modification time in nanoseconds since the epoch
+            inode: Inode number
+        """
+        self.dir_ids.append(self.intern_directory(dirpath))
+        self.sizes.append(size)
+        self.mtimes.append(mtime_ns)
+        self.inodes.append(inode)
+        self._names += os.fsencode(name)
+        self._name_ends.append(len(self._names))
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        if not files:
+            return False
+
+        dir_id = self.intern_directory(dirpath)
+        names = self._names
+        name_ends = self._name_ends
+        fsencode = os.fsencode
+        for name, st in files:
+            self.sizes.append(st.st_size)
+            self.mtimes.append(st.st_mtime_ns)
+            self.inodes.append(st.st_ino)
+            names += fsencode(name)
+            name_ends.append(len(names))
+        self.dir_ids.extend([dir_id] * len(files))
+        return True
+
+    def merge(self, other: "FileRecords") -> None:
+        remap = [self.intern_directory(directory) for directory in other.directories]
+        self.dir_ids.extend(remap[dir_id] for dir_id in other.dir_ids)
+        self.sizes.extend(other.sizes)
+        self.mtimes.extend(other.mtimes)
+        self.inodes.extend(other.inodes)
+        base = len(self._names)
+        self._names += other._names
+        self._name_ends.extend(end + base for end in other._name_ends)
+
+    def spawn(self) -> "FileRecords":
+        return FileRecords()
+
+    def result(self) -> "FileRecords":
+        return self
+
+    def basename(self, index: int) -> str:
+        """Return the basename of a record."""
+        start = self._name_ends[index - 1] if index else 0
+        return os.fsdecode(bytes(self._names[start:self._name_ends[index]]))
+
+    def directory(self, index: int) -> str:
+        """Return the directory of a record."""
+        return self.directories[self.dir_ids[index]]
+
+    def path(self, index: int) -> str:
+        """Return the full path of a record."""
+        return os.path.join(self.directory(index), self.basename(index))
+
+    def pairs(self, indices: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (size, path) tuples, the format of find_largest_files().
+
+        Args:
+            indices: Records to yield (default: all, in insertion order)
+        """
+        for index in range(len(self.sizes)) if indices is None else indices:
+            yield self.sizes[index], self.path(index)
+
+    def order_by_size(self) -> array:
+        """
+        Return record indices ordered by size, largest first.
+
+        Ties keep insertion order. Uses NumPy's argsort when available.
+
+        Returns:
+            array('Q') of indices
+        """
+        if np is not None and len(self.sizes):
+            order = np.argsort(-self.to_numpy()["sizes"], kind="stable")
+            indices = array('Q')
+            indices.frombytes(order.astype(np.uint64).tobytes())
+            return indices
+        sizes = self.sizes
+        return array('Q', sorted(range(len(sizes)), key=lambda index: -sizes[index]))
+
+    def largest(self, top_n: int) -> List[FileRecord]:
+        """
+        Return the largest records, ordered like TopNCollector.
+
+        Only records that tie with or beat the N-th largest size have their
+        path built.
+
+        Args:
+            top_n: Number of records to return
+
+        Returns:
+            List of FileRecord, size descending with ties broken by path descending
+        """
+        sizes = self.sizes
+        if top_n < 1 or not sizes:
+            return []
+        threshold = heapq.nlargest(top_n, sizes)[-1]
+        candidates = [index for index in range(len(sizes)) if sizes[index] >= threshold]
+        candidates.sort(key=lambda index: (sizes[index], self.path(index)), reverse=True)
+        return [self[index] for index in candidates[:top_n]]
+
+    def to_numpy(self) -> Dict[str, "np.ndarray"]:
+        """
+        Return zero-copy NumPy views of the numeric columns.
+
+        The views share memory with the store, so they must not be kept
+        across further appends.
+
+        Returns:
+            Dictionary with 'sizes', 'mtimes', 'inodes' and 'dir_ids'
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy is required: pip install numpy")
+        return {
+            "sizes": np.frombuffer(self.sizes, dtype=np.int64),
+            "mtimes": np.frombuffer(self.mtimes, dtype=np.int64),
+            "inodes": np.frombuffer(self.inodes, dtype=np.uint64),
+            "dir_ids": np.frombuffer(self.dir_ids, dtype=np.uint32),
+        }
+
+    @classmethod
+    def from_records(cls, records: Iterable[FileRecord]) -> "FileRecords":
+        """
+        Build a store from FileRecord tuples, e.g. another store's largest().
+
+        Args:
+            records: FileRecord tuples; nothing is stat'ed
+
+        Returns:
+            New FileRecords in the order given
+        """
+        store = cls()
+        for size, path, mtime_ns, inode in records:
+            dirpath, name = os.path.split(path)
+            store.append(dirpath, name, size, mtime_ns, inode)
+        return store
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[int, str]], stat: bool = False) -> "FileRecords":
+        """
+        Build a store from (size, path) tuples.
+
+        Args:
+            pairs: (size, path) tuples, e.g. from find_largest_files()
+            stat: Fill in mtime and inode by stat'ing each path (files that
+                  cannot be stat'ed keep zeros)
+
+        Returns:
+            New FileRecords in the order given
+        """
+        records = cls()
+        for size, path in pairs:
+            mtime_ns = inode = 0
+            if stat:
+                try:
+                    st = os.stat(path)
+                    mtime_ns, inode = st.st_mtime_ns, st.st_ino
+                except OSError:
+                    pass
+            dirpath, name = os.path.split(path)
+            records.append(dirpath, name, size, mtime_ns, inode)
+        return records
@@ -0,0 +1,909 @@
+#!/usr/bin/env python3
+"""
+Scan Index - Persistent SQLite Index with Incremental Rescans
+==============================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Record every scanned file (size, mtime, inode) and every directory (mtime and
+per-directory totals) in an SQLite database. Later refreshes stat each known
+directory once and only re-list those whose mtime changed, so top-N and
+statistics queries are answered from the index instead of a full walk.
+
+Features:
+    - Incremental refresh: unchanged directories are not re-listed
+    - Removed directories are pruned from the index with their subtrees
+    - Indexed top-N query (ORDER BY size via an index on files.size)
+    - Per-directory totals, so statistics cost O(directories), not O(files)
+    - Depth-first per-directory totals for ranking directories
+    - Targeted updates from change watchers (apply_changes)
+    - Optional exclusion rules; excluded subtrees are never indexed
+
+Limitations:
+    A file rewritten in place does not change its directory's mtime, so its
+    new size is only picked up by refresh(full=True) or when its directory
+    changes for another reason.
+
+Dependencies:
+    - Standard library only (sqlite3)
+
+Example:
+    >>> from scan_index import ScanIndex
+    >>> index = ScanIndex()
+    >>> index.refresh("/Users/daniel/Downloads")     # first run: full scan
+    >>> index.refresh("/Users/daniel/Downloads")     # later: only changed dirs
+    >>> index.largest_files("/Users/daniel/Downloads", top_n=5)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .exclusions import Exclusions
+    from .filters import FileFilter, as_filter
+    from .records import FileRecords
+    from .scanner import Scanner
+except ImportError:  # Running as a script or with src/ on sys.path
+    from exclusions import Exclusions
+    from filters import FileFilter, as_filter
+    from records import FileRecords
+    from scanner import Scanner
+
+DEFAULT_INDEX_PATH = Path.home() / ".file_automation_suite" / "scan_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS directories (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    parent_id INTEGER,
+    mtime_ns INTEGER NOT NULL,
+    file_count INTEGER NOT NULL DEFAULT 0,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    subdir_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_directories_parent ON directories(parent_id);
+CREATE TABLE IF NOT EXISTS files (
+    dir_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    device INTEGER NOT NULL,
+    PRIMARY KEY (dir_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_files_size ON files(size);
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS full_refreshes (
+    path TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+# Directory ids of a subtree, given the id of its top directory
+_SUBTREE = """
+WITH RECURSIVE subtree(id) AS (
+    SELECT ?
+    UNION ALL
+    SELECT d.id FROM directories d JOIN subtree s ON d.parent_id = s.id
+)
+"""
+
+
+def _filter_sql(
+    file_filter: Optional[FileFilter]
+) -> Tuple[str, list, Optional[Callable[[str], bool]]]:
+    """Split a filter into SQL conditions on files f and a name check SQL cannot do."""
+    if file_filter is None:
+        return "", [], None
+    where, params = file_filter.sql_bounds("f.size", "f.mtime_ns")
+    names = file_filter.sql_names("f.name")
+    if names is None:
+        return where, params, file_filter.match_name
+    return where + names[0], params + names[1], None
+
+
+class ScanIndex:
+    """Persistent, incrementally refreshed index of file sizes."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        include_hidden: bool = False,
+        exclusions: Optional[Exclusions] = None
+    ):
+        """
+        Open (and create if needed) an index database.
+
+        Args:
+            db_path: SQLite file to use (default: ~/.file_automation_suite/scan_index.db);
+                     ":memory:" gives a throwaway index
+            include_hidden: Index dot-files and dot-directories. An existing
+                            index built with the other setting is cleared.
+            exclusions: Optional rules for entries not to index. An existing
+                        index built with other global or per-root rules is
+                        cleared; per-directory rule files are re-read as
+                        directories are visited.
+        """
+        if db_path is None:
+            DEFAULT_INDEX_PATH.parent.mkdir(exist_ok=True)
+            db_path = str(DEFAULT_INDEX_PATH)
+
+        self.db_path = db_path
+        self.include_hidden = include_hidden
+        self.exclusions = exclusions
+        # One connection shared by GUI worker threads, serialized by a lock
+        self._lock = threading.RLock()
+        # Roots kept current by a change watcher (see watcher.IndexWatcher)
+        self._live_roots = set()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        stored = self._get_meta("include_hidden")
+        if stored is not None and stored != str(int(include_hidden)):
+            self.clear()
+        self._set_meta("include_hidden", str(int(include_hidden)))
+        rules = exclusions.signature if exclusions is not None else ""
+        stored = self._get_meta("exclusions")
+        if stored is not None and stored != rules:
+            self.clear()
+        self._set_meta("exclusions", rules)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def clear(self) -> None:
+        """Remove every indexed directory and file."""
+        with self._lock:
+            with self.conn:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM directories")
+                self.conn.execute("DELETE FROM roots")
+                self.conn.execute("DELETE FROM full_refreshes")
+
+    def refresh(
+        self,
+        root: str,
+        full: bool = False,
+        on_error: Optional[Callable[[str, OSError], None]] = None,
+        check_cancelled: Optional[Callable[[], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Bring the index for root up to date.
+
+        Every known directory is stat'ed once. Directories whose mtime is
+        unchanged keep their indexed files and are descended through their
+        indexed subdirectories; new or changed directories are re-listed.
+
+        Args:
+            root: Directory to index
+            full: Re-list every directory, also catching files rewritten in place
+            on_error: Optional function called for every inaccessible entry
+                      Signature: on_error(path: str, error: OSError)
+            check_cancelled: Optional function called before each directory;
+                             raising from it rolls the refresh back
+
+        Returns:
+            Dictionary with 'scanned', 'unchanged' and 'removed' directory
+            counts; with exclusion rules also 'pruned', the entries skipped
+
+        Raises:
+            FileNotFoundError: If root doesn't exist
+
+        Example:
+            >>> summary = index.refresh("/Users/daniel/Downloads")
+            >>> print(f"{summary['unchanged']} directories reused")
+        """
+        with self._lock:
+            root = os.path.abspath(root)
+            if not os.path.isdir(root):
+                raise FileNotFoundError(f"Path does not exist: {root}")
+
+            scanner = Scanner(
+                include_hidden=self.include_hidden,
+                on_error=on_error,
+                check_cancelled=check_cancelled,
+                exclusions=self.exclusions
+            )
+            summary = {"scanned": 0, "unchanged": 0, "removed": 0}
+            parent_id = self._directory_id(os.path.dirname(root))
+
+            with self.conn:
+                self._sync([(root, parent_id)], scanner, summary, full=full)
+                if self.exclusions is not None:
+                    summary["pruned"] = scanner.pruned_count
+                now = time.time()
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO roots (path, refreshed_at) VALUES (?, ?)", (root, now)
+                )
+                if full:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO full_refreshes (path, refreshed_at) VALUES (?, ?)",
+                        (root, now)
+                    )
+
+            return summary
+
+    def apply_changes(
+        self,
+        dirpaths: Iterable[str],
+        on_error: Optional[Callable[[str, OSError], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Re-list directories known to have changed, without walking the tree.
+
+        Used by change watchers: each directory is listed again regardless of
+        its mtime (so in-place rewrites are caught), new subdirectories are
+        indexed with their whole subtree, and vanished ones are pruned.
+        Indexed subdirectories that were not reported are left alone.
+        Directories outside the index (and not directly inside an indexed
+        directory) are ignored.
+
+        Args:
+            dirpaths: Directories whose contents changed
+            on_error: Optional function called for every inaccessible entry
+                      Signature: on_error(path: str, error: OSError)
+
+        Returns:
+            Dictionary with 'scanned', 'unchanged' and 'removed' directory
+            counts; with exclusion rules also 'pruned', the entries skipped
+        """
+        with self._lock:
+            scanner = Scanner(
+                include_hidden=self.include_hidden, on_error=on_error, exclusions=self.exclusions
+            )
+            summary = {"scanned": 0, "unchanged": 0, "removed": 0}
+            conn = self.conn
+
+            with conn:
+                # Parents first, so a new directory's subtree is indexed once
+                for dirpath in sorted({os.path.abspath(p) for p in dirpaths}):
+                    row = conn.execute(
+                        "SELECT id, parent_id FROM directories WHERE path = ?", (dirpath,)
+                    ).fetchone()
+                    if not os.path.isdir(dirpath):
+                        # Deleted or moved away; not an access error
+                        if row is not None:
+                            summary["removed"] += self._delete_subtree(row[0])
+                        continue
+
+                    if row is not None:
+                        parent_id = row[1]
+                    else:
+                        parent_id = self._directory_id(os.path.dirname(dirpath))
+                        if parent_id is None:
+                            continue
+                        exclusions = self.exclusions
+                        if exclusions is not None and exclusions.is_excluded(dirpath, True):
+                            continue
+                    self._sync([(dirpath, parent_id)], scanner, summary, True, False)
+
+            if self.exclusions is not None:
+                summary["pruned"] = scanner.pruned_count
+            return summary
+
+    def set_live(self, root: str, live: bool = True) -> None:
+        """
+        Mark root as kept current by a change watcher.
+
+        Args:
+            root: Indexed directory
+            live: False once the watcher stops
+        """
+        with self._lock:
+            root = os.path.abspath(root)
+            if live:
+                self._live_roots.add(root)
+            else:
+                self._live_roots.discard(root)
+
+    def is_live(self, path: str) -> bool:
+        """
+        Check whether path lies in a tree kept current by a change watcher.
+
+        Args:
+            path: Directory to check
+
+        Returns:
+            True if queries for path need no refresh
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            return any(
+                path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+                for root in self._live_roots
+            )
+
+    def _sync(
+        self,
+        stack: List[Tuple[str, Optional[int]]],
+        scanner: Scanner,
+        summary: Dict[str, int],
+        full: bool = False,
+        descend_known: bool = True
+    ) -> None:
+        """
+        Update the directories on stack and (some of) their descendants.
+
+        Args:
+            stack: (dirpath, parent_id) pairs to process
+            scanner: Scanner used to list changed directories
+            summary: Counters updated in place
+            full: Re-list directories even if their mtime is unchanged
+            descend_known: Also visit subdirectories that are already
+                           indexed; new subdirectories are always visited
+        """
+        conn = self.conn
+        while stack:
+            if scanner.check_cancelled is not None:
+                scanner.check_cancelled()
+            dirpath, parent_id = stack.pop()
+            row = conn.execute(
+                "SELECT id, mtime_ns, parent_id FROM directories WHERE path = ?", (dirpath,)
+            ).fetchone()
+
+            try:
+                mtime_ns = os.stat(dirpath).st_mtime_ns
+            except OSError as e:
+                if row:
+                    summary["removed"] += self._delete_subtree(row[0])
+                if scanner.on_error is not None:
+                    scanner.on_error(dirpath, e)
+                continue
+
+            if row and row[1] == mtime_ns and not full:
+                summary["unchanged"] += 1
+                if scanner.exclusions is not None and scanner.exclusions.rule_file is not None:
+                    # Not listed, so look for its rule file explicitly;
+                    # its subdirectories' rules build on it
+                    scanner.exclusions.enter(dirpath)
+                if row[2] != parent_id:
+                    # A former root is now reached from an enclosing root
+                    conn.execute(
+                        "UPDATE directories SET parent_id = ? WHERE id = ?",
+                        (parent_id, row[0])
+                    )
+                children = conn.execute(
+                    "SELECT path FROM directories WHERE parent_id = ?", (row[0],)
+                ).fetchall()
+                stack.extend((path, row[0]) for (path,) in children)
+                continue
+
+            summary["scanned"] += 1
+            dirs_before = scanner.dir_count
+            files, subdirs = scanner.scan_directory(dirpath)
+            dir_id = self._store_directory(
+                row[0] if row else None,
+                dirpath,
+                parent_id,
+                mtime_ns,
+                files,
+                scanner.dir_count - dirs_before
+            )
+
+            # Drop indexed subdirectories that no longer exist (or are now
+            # excluded, e.g. replaced by a symlink)
+            keep = set(subdirs)
+            known = set()
+            for child_id, child_path in conn.execute(
+                "SELECT id, path FROM directories WHERE parent_id = ?", (dir_id,)
+            ).fetchall():
+                if child_path not in keep:
+                    summary["removed"] += self._delete_subtree(child_id)
+                else:
+                    known.add(child_path)
+
+            if not descend_known:
+                subdirs = [path for path in subdirs if path not in known]
+            stack.extend((path, dir_id) for path in reversed(subdirs))
+
+    def last_refreshed(self, root: str, full: bool = False) -> Optional[float]:
+        """
+        Return when root was last refreshed.
+
+        Args:
+            root: Directory passed to refresh()
+            full: Return the last refresh with full=True instead
+
+        Returns:
+            UNIX timestamp, or None if root was never refreshed (that way)
+        """
+        table = "full_refreshes" if full else "roots"
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT refreshed_at FROM {table} WHERE path = ?", (os.path.abspath(root),)
+            ).fetchone()
+            return row[0] if row else None
+
+    def largest_files(
+        self,
+        root: str,
+        top_n: Optional[int] = 10,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Return the largest indexed files under root.
+
+        Ordering matches FileOrganizer.find_largest_files: size descending,
+        ties broken by path descending.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            top_n: Number of files to return, or None for all of them
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter; its bounds and extensions become
+                         SQL, globs and regexes are checked on the rows read
+
+        Returns:
+            List of (file_size, file_path) tuples, sorted by size descending
+        """
+        return list(self.iter_largest_files(root, top_n, file_extension, file_filter))
+
+    def iter_largest_files(
+        self,
+        root: str,
+        top_n: Optional[int] = None,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Stream the indexed files under root, largest first.
+
+        SQLite sorts large results in its own temporary files, so a listing
+        of every file never has to fit in memory. The index is locked until
+        the iterator is exhausted or closed.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            top_n: Number of files to yield, or None for all of them
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Yields:
+            (file_size, file_path) tuples, sorted by size descending
+        """
+        for size, path, *_ in self._largest_rows(root, top_n, file_extension, file_filter):
+            yield size, path
+
+    def largest_records(
+        self,
+        root: str,
+        top_n: Optional[int] = 10,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> FileRecords:
+        """
+        Return the largest indexed files under root with their mtimes and inodes.
+
+        Same files and order as largest_files(), in the columnar form that
+        collect_records() returns for whole trees.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            top_n: Number of files to return, or None for all of them
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Returns:
+            FileRecords, sorted by size descending
+        """
+        records = FileRecords()
+        append = records.append
+        rows = self._largest_rows(root, top_n, file_extension, file_filter)
+        for size, _path, dirpath, name, mtime_ns, inode in rows:
+            append(dirpath, name, size, mtime_ns, inode)
+        return records
+
+    def _largest_rows(
+        self,
+        root: str,
+        top_n: Optional[int],
+        file_extension: Optional[str],
+        file_filter: Optional[FileFilter]
+    ) -> Iterator[Tuple[int, str, str, str, int, int]]:
+        """Yield (size, path, dirpath, name, mtime_ns, inode) rows, largest first."""
+        where, filter_params, name_check = _filter_sql(as_filter(file_extension, file_filter))
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return
+
+            # Walking the size index from the top is fastest when the subtree
+            # holds a good share of the indexed files; for small subtrees it is
+            # cheaper to collect their files and sort them
+            subtree_files, all_files = self.conn.execute(
+                _SUBTREE
+                + """
+                SELECT (SELECT COALESCE(SUM(file_count), 0) FROM directories WHERE id IN subtree),
+                       (SELECT COALESCE(SUM(file_count), 0) FROM directories)
+                """,
+                (root_id,)
+            ).fetchone()
+            hint = "INDEXED BY idx_files_size" if subtree_files * 10 >= all_files else ""
+
+            sep = os.sep
+            params: list = [root_id, sep, sep] + filter_params
+            # Without a name check in Python, SQL can stop after top_n rows
+            limit = ""
+            if name_check is None and top_n is not None:
+                limit = "LIMIT ?"
+                params.append(top_n)
+
+            rows = self.conn.execute(
+                _SUBTREE
+                + f"""
+                SELECT f.size,
+                       CASE WHEN substr(d.path, -1) = ? THEN d.path || f.name
+                            ELSE d.path || ? || f.name END AS full_path,
+                       d.path, f.name, f.mtime_ns, f.inode
+                FROM files f {hint} JOIN directories d ON d.id = f.dir_id
+                WHERE f.dir_id IN subtree {where}
+                ORDER BY f.size DESC, full_path DESC
+                {limit}
+                """,
+                params
+            )
+
+            found = 0
+            for row in rows:
+                if name_check is None or name_check(row[3]):
+                    yield row
+                    found += 1
+                    if found == top_n:
+                        return
+
+    def directory_stats(self, root: str) -> Dict[str, float]:
+        """
+        Return statistics for an indexed directory tree.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+
+        Returns:
+            Dictionary with the same keys as FileOrganizer.get_directory_stats
+        """
+        with self._lock:
+            root_id = self._directory_id(root)
+            total_size = file_count = dir_count = 0
+
+            if root_id is not None:
+                total_size, file_count, dir_count = self.conn.execute(
+                    _SUBTREE
+                    + """
+                    SELECT COALESCE(SUM(total_size), 0), COALESCE(SUM(file_count), 0),
+                           COALESCE(SUM(subdir_count), 0)
+                    FROM directories WHERE id IN subtree
+                    """,
+                    (root_id,)
+                ).fetchone()
+
+            return {
+                "total_size": total_size,
+                "file_count": file_count,
+                "directory_count": dir_count,
+                "average_file_size": total_size / file_count if file_count > 0 else 0
+            }
+
+    def records(
+        self,
+        root: str,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> FileRecords:
+        """
+        Return every indexed file under root as a columnar record store.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Returns:
+            FileRecords, grouped by directory
+        """
+        where, filter_params, name_check = _filter_sql(as_filter(file_extension, file_filter))
+        records = FileRecords()
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return records
+
+            rows = self.conn.execute(
+                _SUBTREE
+                + f"""
+                SELECT d.path, f.name, f.size, f.mtime_ns, f.inode
+                FROM files f JOIN directories d ON d.id = f.dir_id
+                WHERE f.dir_id IN subtree {where}
+                ORDER BY f.dir_id
+                """,
+                [root_id] + filter_params
+            )
+            append = records.append
+            for dirpath, name, size, mtime_ns, inode in rows:
+                if name_check is None or name_check(name):
+                    append(dirpath, name, size, mtime_ns, inode)
+        return records
+
+    def file_sizes(
+        self,
+        root: str,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[int]:
+        """
+        Stream the sizes of the indexed files under root.
+
+        The index is locked until the iterator is exhausted or closed.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Yields:
+            File sizes in bytes, in no particular order
+        """
+        where, filter_params, name_check = _filter_sql(as_filter(file_extension, file_filter))
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return
+
+            if name_check is None:
+                rows = self.conn.execute(
+                    _SUBTREE + f"SELECT f.size FROM files f WHERE f.dir_id IN subtree {where}",
+                    [root_id] + filter_params
+                )
+                for (size,) in rows:
+                    yield size
+            else:
+                rows = self.conn.execute(
+                    _SUBTREE
+                    + f"SELECT f.name, f.size FROM files f WHERE f.dir_id IN subtree {where}",
+                    [root_id] + filter_params
+                )
+                for name, size in rows:
+                    if name_check(name):
+                        yield size
+
+    def file_names(
+        self,
+        root: str,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Stream the names and sizes of the indexed files under root.
+
+        The index is locked until the iterator is exhausted or closed.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Yields:
+            (basename, size in bytes) pairs, in no particular order
+        """
+        where, filter_params, name_check = _filter_sql(as_filter(file_extension, file_filter))
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return
+
+            rows = self.conn.execute(
+                _SUBTREE + f"SELECT f.name, f.size FROM files f WHERE f.dir_id IN subtree {where}",
+                [root_id] + filter_params
+            )
+            for name, size in rows:
+                if name_check is None or name_check(name):
+                    yield name, size
+
+    def iter_files(
+        self,
+        root: str,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[Tuple[str, str, int, int]]:
+        """
+        Stream every indexed file under root without materializing them.
+
+        The index is locked until the iterator is exhausted or closed.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Yields:
+            (directory_path, basename, size in bytes, mtime_ns) tuples,
+            grouped by directory
+        """
+        where, filter_params, name_check = _filter_sql(as_filter(file_extension, file_filter))
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return
+
+            rows = self.conn.execute(
+                _SUBTREE
+                + f"""
+                SELECT d.path, f.name, f.size, f.mtime_ns
+                FROM files f JOIN directories d ON d.id = f.dir_id
+                WHERE f.dir_id IN subtree {where}
+                ORDER BY f.dir_id
+                """,
+                [root_id] + filter_params
+            )
+            for row in rows:
+                if name_check is None or name_check(row[1]):
+                    yield row
+
+    def directory_totals(
+        self,
+        root: str,
+        file_extension: Optional[str] = None,
+        file_filter: Optional[FileFilter] = None
+    ) -> Iterator[Tuple[str, int, int]]:
+        """
+        Stream the totals of the files directly inside each indexed directory.
+
+        Directories come depth-first (every directory before its
+        descendants, subtrees one after another), the order
+        LargestDirectoriesCollector.add_totals() expects. The index is
+        locked until the iterator is exhausted or closed.
+
+        Args:
+            root: Indexed directory (or any directory inside one)
+            file_extension: Optional case-sensitive extension filter (e.g., '.pdf')
+            file_filter: Optional FileFilter (see largest_files())
+
+        Yields:
+            (directory_path, total_size, file_count) tuples
+        """
+        file_filter = as_filter(file_extension, file_filter)
+        where, filter_params, name_check = _filter_sql(file_filter)
+
+        with self._lock:
+            root_id = self._directory_id(root)
+            if root_id is None:
+                return
+
+            # Sorting on the path with separators mapped below every other
+            # character puts each subtree directly after its directory
+            order = "ORDER BY replace(d.path, ?, char(1))"
+            params = [root_id] + filter_params + [os.sep]
+
+            if file_filter is None:
+                yield from self.conn.execute(
+                    _SUBTREE
+                    + f"""
+                    SELECT d.path, d.total_size, d.file_count FROM directories d
+                    WHERE d.id IN subtree {order}
+                    """,
+                    (root_id, os.sep)
+                )
+            elif name_check is None:
+                yield from self.conn.execute(
+                    _SUBTREE
+                    + f"""
+                    SELECT d.path, COALESCE(SUM(f.size), 0), COUNT(f.name)
+                    FROM directories d LEFT JOIN files f ON f.dir_id = d.id {where}
+                    WHERE d.id IN subtree
+                    GROUP BY d.id {order}
+                    """,
+                    params
+                )
+            else:
+                # Names are checked here; rows of one directory are adjacent
+                rows = self.conn.execute(
+                    _SUBTREE
+                    + f"""
+                    SELECT d.path, f.name, f.size
+                    FROM directories d LEFT JOIN files f ON f.dir_id = d.id {where}
+                    WHERE d.id IN subtree {order}
+                    """,
+                    params
+                )
+                current, size, count = None, 0, 0
+                for dirpath, name, file_size in rows:
+                    if dirpath != current:
+                        if current is not None:
+                            yield current, size, count
+                        current, size, count = dirpath, 0, 0
+                    if name is not None and name_check(name):
+                        size += file_size
+                        count += 1
+                if current is not None:
+                    yield current, size, count
+
+    def _directory_id(self, path: str) -> Optional[int]:
+        """Look up the id of an indexed directory."""
+        row = self.conn.execute(
+            "SELECT id FROM directories WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store_directory(
+        self,
+        dir_id: Optional[int],
+        dirpath: str,
+        parent_id: Optional[int],
+        mtime_ns: int,
+        files,
+        subdir_count: int
+    ) -> int:
+        """Replace a directory's row and file rows with a fresh listing."""
+        conn = self.conn
+        rows = [
+            (name, st.st_size, st.st_mtime_ns, st.st_ino, st.st_dev)
+            for name, st in files
+        ]
+        total_size = sum(row[1] for row in rows)
+
+        if dir_id is None:
+            dir_id = conn.execute(
+                "INSERT INTO directories (path, parent_id, mtime_ns, file_count, total_size,"
+                " subdir_count) VALUES (?, ?, ?, ?, ?, ?)",
+                (dirpath, parent_id, mtime_ns, len(rows), total_size, subdir_count)
+            ).lastrowid
+        else:
+            conn.execute(
+                "UPDATE directories SET parent_id = ?, mtime_ns = ?, file_count = ?,"
+                " total_size = ?, subdir_count = ? WHERE id = ?",
+                (parent_id, mtime_ns, len(rows), total_size, subdir_count, dir_id)
+            )
+            conn.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+
+        insert = "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)"
+        try:
+            conn.executemany(insert, [(dir_id,) + row for row in rows])
+        except UnicodeEncodeError:
+            # Undecodable file names cannot be stored as TEXT; skip just those
+            conn.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+            for row in rows:
+                try:
+                    conn.execute(insert, (dir_id,) + row)
+                except UnicodeEncodeError:
+                    continue
+
+        return dir_id
+
+    def _delete_subtree(self, dir_id: int) -> int:
+        """Delete a directory, its descendants and their files."""
+        conn = self.conn
+        ids = [row[0] for row in conn.execute(_SUBTREE + "SELECT id FROM subtree", (dir_id,))]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM files WHERE dir_id IN ({marks})", chunk)
+            conn.execute(f"DELETE FROM directories WHERE id IN ({marks})", chunk)
+        return len(ids)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Scanner - scandir-based Directory Traversal Engine
+===================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Walk directory trees with os.scandir, reusing the file type information cached
+on each DirEntry so that every file costs at most one stat call.
+
+Features:
+    - Iterative traversal (no recursion limit on deep trees)
+    - Directory/symlink checks answered from the cached d_type
+    - One stat per file, shared by every consumer of the scan
+    - Name filters applied before the stat call
+    - gitignore-style exclusion rules that prune whole subtrees
+    - Errors recorded without aborting the walk
+    - Live file, directory and byte counters, also while threads scan
+    - Cooperative cancellation checked before every directory
+    - Optional multi-threaded traversal with work-stealing deques
+    - Optional process-pool traversal sharded by subdirectory, for
+      GIL-free aggregation on many-core machines
+    - Opt-in per-phase profiling (see profiling.ScanProfiler) in a timed
+      twin of the directory loop; unprofiled scans never read the clock
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from scanner import Scanner
+    >>> scanner = Scanner()
+    >>> for dirpath, files in scanner.scan("/Users/daniel/Documents"):
+    ...     for name, st in files:
+    ...         print(st.st_size, os.path.join(dirpath, name))
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .exclusions import Exclusions
+    from .profiling import AGGREGATE, ScanProfiler
+except ImportError:  # Running as a script or with src/ on sys.path
+    from exclusions import Exclusions
+    from profiling import AGGREGATE, ScanProfiler
+
+# A directory listing as produced by the scanner: (name, stat_result) pairs
+FileBatch = List[Tuple[str, os.stat_result]]
+
+# One directory or several directories to scan together
+Roots = Union[str, Sequence[str]]
+
+
+def _as_roots(roots: Roots) -> List[str]:
+    """Normalize a single root or a sequence of roots to a list."""
+    if isinstance(roots, (str, os.PathLike)):
+        return [os.fspath(roots)]
+    return [os.fspath(root) for root in roots]
+
+
+class Scanner:
+    """Traverse a directory tree with os.scandir and one stat per file."""
+
+    def __init__(
+        self,
+        include_hidden: bool = False,
+        file_filter: Optional[Callable[[str], bool]] = None,
+        on_error: Optional[Callable[[str, OSError], None]] = None,
+        check_cancelled: Optional[Callable[[], None]] = None,
+        follow_symlinks: bool = True,
+        stat_filter: Optional[Callable[[os.stat_result], bool]] = None,
+        exclusions: Optional[Exclusions] = None,
+        profiler: Optional[ScanProfiler] = None
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            include_hidden: Descend into dot-directories and report dot-files
+            file_filter: Optional predicate on the file name, evaluated before
+                         the file is stat'ed. Files it rejects cost no syscall.
+            on_error: Optional function called for every inaccessible entry
+                      Signature: on_error(path: str, error: OSError)
+            check_cancelled: Optional function called before each directory
+                             is listed; raising from it aborts the scan. Not
+                             sent to worker processes, so process scans stop
+                             at shard boundaries.
+            follow_symlinks: Report the target of symlinked files (default,
+                             like os.path.getsize). When False the link
+                             itself is reported, like du.
+            stat_filter: Optional predicate on the stat result (size, mtime)
+                         of files that passed file_filter
+            exclusions: Optional gitignore-style rules; excluded directories
+                        are neither counted nor descended into
+            profiler: Optional ScanProfiler timing the listing, filter and
+                      stat phases of every directory
+        """
+        self.include_hidden = include_hidden
+        self.file_filter = file_filter
+        self.on_error = on_error
+        self.check_cancelled = check_cancelled
+        self.follow_symlinks = follow_symlinks
+        self.stat_filter = stat_filter
+        self.exclusions = exclusions
+        self.profiler = profiler
+        self.file_count = 0
+        self.dir_count = 0
+        self.byte_count = 0
+        self.error_count = 0
+        # Entries skipped by the exclusion rules (a pruned subtree counts once)
+        self.pruned_count = 0
+        # Worker scanners of a running scan_parallel(), read by counts()
+        self._workers: List["Scanner"] = []
+
+    def spawn(self) -> "Scanner":
+        """
+        Create a scanner with the same settings and zeroed counters.
+
+        Returns:
+            New Scanner sharing this scanner's filters and error handler
+        """
+        return Scanner(
+            include_hidden=self.include_hidden,
+            file_filter=self.file_filter,
+            on_error=self.on_error,
+            check_cancelled=self.check_cancelled,
+            follow_symlinks=self.follow_symlinks,
+            stat_filter=self.stat_filter,
+            exclusions=self.exclusions,
+            profiler=self.profiler.spawn() if self.profiler is not None else None
+        )
+
+    def absorb(self, other: "Scanner") -> None:
+        """
+        Add another scanner's counters to this one.
+
+        Args:
+            other: Scanner whose file, directory, byte, error and pruned
+                   counts (and profile) are added
+        """
+        self.file_count += other.file_count
+        self.dir_count += other.dir_count
+        self.byte_count += other.byte_count
+        self.error_count += other.error_count
+        self.pruned_count += other.pruned_count
+        if self.profiler is not None and other.profiler is not None:
+            self.profiler.merge(other.profiler)
+
+    def counts(self) -> Tuple[int, int, int]:
+        """
+        Return the files, directories and bytes seen so far.
+
+        Includes the workers of a threaded scan that is still running, so
+        it can be called from a progress callback.
+
+        Returns:
+            Tuple of (file_count, dir_count, byte_count)
+        """
+        files, dirs, nbytes = self.file_count, self.dir_count, self.byte_count
+        for worker in self._workers:
+            files += worker.file_count
+            dirs += worker.dir_count
+            nbytes += worker.byte_count
+        return files, dirs, nbytes
+
+    def scan(self, root: Roots) -> Iterator[Tuple[str, FileBatch]]:
+        """
+        Walk a directory tree, yielding one batch of files per directory.
+
+        Symlinked directories are counted but not descended into, and
+        symlinked files report the size of their target, matching os.walk
+        combined with os.path.getsize (unless follow_symlinks is False).
+
+        Args:
+            root: Directory to scan, or a sequence of directories
+
+        Yields:
+            (dirpath, files) tuples where files is a list of (name, stat_result)
+
+        Example:
+            >>> scanner = Scanner(include_hidden=True)
+            >>> total = sum(st.st_size for _, files in scanner.scan("/tmp")
+            ...             for _, st in files)
+        """
+        stack = _as_roots(root)[::-1]
+        while stack:
+            dirpath = stack.pop()
+            files, subdirs = self.scan_directory(dirpath)
+            if files:
+                yield dirpath, files
+            # Reverse so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+    def scan_parallel(
+        self,
+        root: Roots,
+        workers: int,
+        make_sink: Callable[[], Any],
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        poll_interval: float = 0.1
+    ) -> List[Any]:
+        """
+        Walk a directory tree with a pool of threads.
+
+        Every worker owns a deque of pending directories. It pops new work
+        from the tail of its own deque (depth-first, cache friendly) and,
+        when that runs dry, steals from the head of another worker's deque,
+        where the largest unexplored subtrees sit. os.scandir and stat
+        release the GIL, so on high-latency storage the workers keep many
+        directory reads in flight at once.
+
+        Each worker feeds its own sink, so no locking is needed on the hot
+        path; the caller merges the returned sinks. Counters of all workers
+        are added to this scanner when the scan finishes.
+
+        Args:
+            root: Directory to scan, or a sequence of directories
+            workers: Number of worker threads (at least 1)
+            make_sink: Factory for per-worker sinks; a sink must provide
+                       add_batch(dirpath, files)
+            on_progress: Optional function called from the calling thread
+                         Signature: on_progress(file_count: int, current_dir: str)
+            poll_interval: Seconds between progress callbacks
+
+        Returns:
+            List of per-worker sinks, one per worker
+
+        Raises:
+            ValueError: If workers is less than 1
+
+        Example:
+            >>> scanner = Scanner()
+            >>> sinks = scanner.scan_parallel("/data", 8, lambda: TopNCollector(10))
+            >>> for sink in sinks[1:]:
+            ...     sinks[0].merge(sink)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        scanners = [self.spawn() for _ in range(workers)]
+        self._workers = scanners
+        sinks = [make_sink() for _ in range(workers)]
+        roots = _as_roots(root)
+        queues: List[deque] = [deque() for _ in range(workers)]
+        for i, path in enumerate(roots):
+            queues[i % workers].append(path)
+
+        cond = threading.Condition()
+        state = {"pending": len(roots), "failure": None, "current": roots[0] if roots else ""}
+
+        def next_directory(index: int) -> Optional[str]:
+            try:
+                return queues[index].pop()
+            except IndexError:
+                pass
+            for offset in range(1, workers):
+                try:
+                    return queues[(index + offset) % workers].popleft()
+                except IndexError:
+                    continue
+            return None
+
+        def work(index: int) -> None:
+            scanner = scanners[index]
+            sink = sinks[index]
+            own = queues[index]
+            profiler = scanner.profiler
+            clock = time.perf_counter_ns
+            try:
+                while state["failure"] is None:
+                    dirpath = next_directory(index)
+                    if dirpath is None:
+                        with cond:
+                            if state["pending"] == 0:
+                                return
+                            cond.wait(0.01)
+                        continue
+
+                    files, subdirs = scanner.scan_directory(dirpath)
+                    if files:
+                        if profiler is None:
+                            sink.add_batch(dirpath, files)
+                        else:
+                            started = clock()
+                            sink.add_batch(dirpath, files)
+                            profiler.add(AGGREGATE, clock() - started)
+                    state["current"] = dirpath
+
+                    # Publish children and retire this directory atomically so
+                    # the pending count can never reach zero early
+                    with cond:
+                        state["pending"] += len(subdirs) - 1
+                        own.extend(reversed(subdirs))
+                        if subdirs or state["pending"] == 0:
+                            cond.notify_all()
+            except BaseException as e:
+                with cond:
+                    state["failure"] = e
+                    cond.notify_all()
+
+        threads = [
+            threading.Thread(target=work, args=(i,), daemon=True)
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(poll_interval)
+                    if on_progress:
+                        on_progress(self.counts()[0], state["current"])
+        finally:
+            # Stop the workers if the caller was interrupted
+            with cond:
+                if state["failure"] is None and state["pending"]:
+                    state["failure"] = KeyboardInterrupt()
+                cond.notify_all()
+
+        self._workers = []
+        for scanner in scanners:
+            self.absorb(scanner)
+
+        if state["failure"] is not None:
+            raise state["failure"]
+
+        return sinks
+
+    def scan_processes(
+        self,
+        roots: Roots,
+        processes: int,
+        make_sink: Callable[[], Any],
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        min_shards_per_process: int = 4,
+        max_split_depth: int = 3
+    ) -> List[Any]:
+        """
+        Walk one or more directory trees with a pool of processes.
+
+        The top of each tree is listed in the calling process and split into
+        shards (subdirectories), descending further while there are fewer
+        than processes * min_shards_per_process shards so that one huge
+        subdirectory cannot serialize the scan. Each shard is scanned in a
+        worker process that returns only its sink, its counters and its
+        errors; nothing per-file crosses the process boundary. If on_error
+        is mergeable (an ErrorLedger), each worker fills its own spawned
+        ledger, so the errors crossing back are bounded too.
+
+        make_sink and the scanner's filters are sent to the workers, so
+        they must be picklable (classes, functools.partial, module-level
+        functions; not lambdas).
+
+        Args:
+            roots: Directory to scan, or a sequence of directories
+            processes: Number of worker processes (at least 1)
+            make_sink: Picklable factory for sinks providing add_batch(dirpath, files)
+            on_progress: Optional function called as each shard completes
+                         Signature: on_progress(file_count: int, shard: str)
+            min_shards_per_process: Split target used for load balancing
+            max_split_depth: Deepest level the tree is split at
+
+        Returns:
+            List of sinks: one for the files listed by the parent, then one per shard
+
+        Raises:
+            ValueError: If processes is less than 1
+
+        Example:
+            >>> from functools import partial
+            >>> scanner = Scanner()
+            >>> sinks = scanner.scan_processes(["/srv/a", "/srv/b"], 32,
+            ...                                partial(TopNCollector, 10))
+        """
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+
+        local = make_sink()
+        sinks = [local]
+        frontier = _as_roots(roots)
+        target = processes * min_shards_per_process
+        shards: List[str] = []
+        depth = 0
+
+        # List the top levels here until there is enough work to spread out
+        while frontier:
+            shards = []
+            for dirpath in frontier:
+                files, subdirs = self.scan_directory(dirpath)
+                if files:
+                    local.add_batch(dirpath, files)
+                shards.extend(subdirs)
+            depth += 1
+            if len(shards) >= target or depth >= max_split_depth:
+                break
+            frontier = shards
+
+        if not shards:
+            return sinks
+
+        config = {
+            "include_hidden": self.include_hidden,
+            "file_filter": self.file_filter,
+            "follow_symlinks": self.follow_symlinks,
+            "stat_filter": self.stat_filter,
+            # Carries the rule files read while listing the top levels
+            "exclusions": self.exclusions,
+            # Every shard fills its own copy, returned with its counters
+            "profiler": self.profiler.spawn() if self.profiler is not None else None
+        }
+
+        ledger = self.on_error if hasattr(self.on_error, "merge") else None
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = {
+                pool.submit(_scan_shard, shard, config, make_sink,
+                            ledger.spawn() if ledger is not None else None): shard
+                for shard in shards
+            }
+            try:
+                for future in as_completed(futures):
+                    sink, counters, errors, profile = future.result()
+                    sinks.append(sink)
+                    if profile is not None:
+                        self.profiler.merge(profile)
+                    file_count, dir_count, byte_count, pruned_count = counters
+                    self.file_count += file_count
+                    self.dir_count += dir_count
+                    self.byte_count += byte_count
+                    self.pruned_count += pruned_count
+                    if ledger is not None:
+                        self.error_count += len(errors)
+                        ledger.merge(errors)
+                    else:
+                        for path, error in errors:
+                            self._record_error(path, error)
+                    if on_progress:
+                        on_progress(self.file_count, futures[future])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return sinks
+
+    def scan_directory(self, dirpath: str) -> Tuple[FileBatch, List[str]]:
+        """
+        List a single directory without recursing.
+
+        Args:
+            dirpath: Directory to list
+
+        Returns:
+            Tuple of (files, subdirectories to descend into)
+
+        Raises:
+            Exception: Anything raised by check_cancelled
+        """
+        if self.check_cancelled is not None:
+            self.check_cancelled()
+        if self.profiler is not None:
+            return self._scan_directory_profiled(dirpath)
+
+        files: FileBatch = []
+        subdirs: List[str] = []
+        include_hidden = self.include_hidden
+        file_filter = self.file_filter
+        follow_symlinks = self.follow_symlinks
+        stat_filter = self.stat_filter
+        excluded = None
+
+        try:
+            with os.scandir(dirpath) as entries:
+                if self.exclusions is not None:
+                    # The listing shows whether this directory has a rule file
+                    entries = list(entries)
+                    excluded = self.exclusions.enter(dirpath, [entry.name for entry in entries])
+
+                for entry in entries:
+                    name = entry.name
+                    if not include_hidden and name.startswith('.'):
+                        continue
+
+                    try:
+                        # d_type answers this without a syscall (except symlinks)
+                        if entry.is_dir():
+                            if excluded is not None and excluded(name, True):
+                                self.pruned_count += 1
+                                continue
+                            self.dir_count += 1
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+
+                        if excluded is not None and excluded(name, False):
+                            self.pruned_count += 1
+                            continue
+                        if file_filter is not None and not file_filter(name):
+                            continue
+
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        if stat_filter is not None and not stat_filter(st):
+                            continue
+                        files.append((name, st))
+                    except OSError as e:
+                        self._record_error(entry.path, e)
+        except OSError as e:
+            self._record_error(dirpath, e)
+
+        self.file_count += len(files)
+        self.byte_count += sum(st.st_size for _, st in files)
+        return files, subdirs
+
+    def _scan_directory_profiled(self, dirpath: str) -> Tuple[FileBatch, List[str]]:
+        """
+        scan_directory() with its phases timed into the profiler.
+
+        A twin of the loop in scan_directory(), chosen once per directory,
+        so scans without a profiler never read the clock.
+        """
+        files: FileBatch = []
+        subdirs: List[str] = []
+        include_hidden = self.include_hidden
+        file_filter = self.file_filter
+        follow_symlinks = self.follow_symlinks
+        stat_filter = self.stat_filter
+        excluded = None
+
+        profiler = self.profiler
+        clock = time.perf_counter_ns
+        filter_ns = stat_ns = stat_calls = 0
+        errors = self.error_count
+        started = clock()
+
+        try:
+            with os.scandir(dirpath) as entries:
+                if self.exclusions is not None:
+                    # The listing shows whether this directory has a rule file
+                    entries = list(entries)
+                    before = clock()
+                    excluded = self.exclusions.enter(dirpath, [entry.name for entry in entries])
+                    filter_ns += clock() - before
+
+                for entry in entries:
+                    name = entry.name
+                    if not include_hidden and name.startswith('.'):
+                        continue
+
+                    try:
+                        # d_type answers this without a syscall (except symlinks)
+                        if entry.is_dir():
+                            if excluded is not None and excluded(name, True):
+                                self.pruned_count += 1
+                                continue
+                            self.dir_count += 1
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+
+                        before = clock()
+                        if excluded is not None and excluded(name, False):
+                            self.pruned_count += 1
+                            filter_ns += clock() - before
+                            continue
+                        if file_filter is not None and not file_filter(name):
+                            filter_ns += clock() - before
+                            continue
+
+                        stat_started = clock()
+                        stat_calls += 1
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        stat_ended = clock()
+                        filter_ns += stat_started - before
+                        stat_ns += stat_ended - stat_started
+                        if stat_filter is not None and not stat_filter(st):
+                            filter_ns += clock() - stat_ended
+                            continue
+                        files.append((name, st))
+                    except OSError as e:
+                        self._record_error(entry.path, e)
+        except OSError as e:
+            self._record_error(dirpath, e)
+
+        profiler.add_directory(dirpath, clock() - started, filter_ns, stat_ns,
+                               stat_calls, self.error_count - errors)
+
+        self.file_count += len(files)
+        self.byte_count += sum(st.st_size for _, st in files)
+        return files, subdirs
+
+    def _record_error(self, path: str, error: OSError) -> None:
+        """Count an inaccessible entry and forward it to the error handler."""
+        self.error_count += 1
+        if self.on_error is not None:
+            self.on_error(path, error)
+
+
+def _scan_shard(shard: str, config: dict, make_sink: Callable[[], Any], ledger: Any = None):
+    """
+    Scan one shard in a worker process.
+
+    Args:
+        ledger: Optional empty ErrorLedger to record errors in
+
+    Returns:
+        Tuple of (sink, (file_count, dir_count, byte_count, pruned_count),
+        errors, profiler), errors being the ledger or a [(path, error), ...]
+        list and profiler the shard's ScanProfiler or None
+    """
+    errors = ledger if ledger is not None else []
+    on_error = ledger if ledger is not None else lambda path, e: errors.append((path, e))
+    scanner = Scanner(on_error=on_error, **config)
+    sink = make_sink()
+    profiler = scanner.profiler
+
+    for dirpath, files in scanner.scan(shard):
+        if profiler is None:
+            sink.add_batch(dirpath, files)
+        else:
+            started = time.perf_counter_ns()
+            sink.add_batch(dirpath, files)
+            profiler.add(AGGREGATE, time.perf_counter_ns() - started)
+
+    counters = (scanner.file_count, scanner.dir_count, scanner.byte_count, scanner.pruned_count)
+    return sink, counters, errors, profiler
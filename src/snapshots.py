@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Snapshots - Saved Scans and What Changed Since
+===============================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Save the file listing of a scan and later compare it with another one to
+answer "what grew since last week". A snapshot is written in path order,
+with sorted runs spilled to temporary files when it does not fit in memory,
+and two snapshots are compared in one sort-merge pass: neither side is ever
+loaded, and per-directory deltas are rolled up in O(depth) memory.
+
+Paths are ordered component by component (the separator sorts before every
+other character), so every directory's subtree is contiguous. That is what
+lets the comparison rank directories without a table of all of them.
+
+Features:
+    - Compact binary snapshot files: size, mtime and path per file
+    - Memory-bounded writer; also a pipeline aggregator, so a snapshot is
+      taken in the same traversal as the other reports
+    - Streaming diff: added, removed, grown and shrunk files
+    - Directories ranked by recursive growth and shrinkage
+    - Named snapshots in ~/.file_automation_suite/snapshots
+
+Dependencies:
+    - Standard library only
+
+Example:
+    >>> from file_organizer import FileOrganizer
+    >>> organizer = FileOrganizer()
+    >>> organizer.save_snapshot("/builds", "builds-monday")
+    >>> # ... a week later
+    >>> diff = organizer.compare_snapshot("builds-monday")
+    >>> for folder in diff['directories_grown']:
+    ...     print(folder.size, folder.path)
+"""
+
+import os
+import json
+import heapq
+import struct
+import tempfile
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    from .aggregators import Aggregator, TopNCollector
+    from .disk_usage import LargestDirectoriesCollector
+    from .external_sort import _ENTRY_OVERHEAD, DEFAULT_MEMORY_BUDGET, _remove_files
+    from .scanner import Roots, _as_roots
+except ImportError:  # Running as a script or with src/ on sys.path
+    from aggregators import Aggregator, TopNCollector
+    from disk_usage import LargestDirectoriesCollector
+    from external_sort import _ENTRY_OVERHEAD, DEFAULT_MEMORY_BUDGET, _remove_files
+    from scanner import Roots, _as_roots
+
+
+SNAPSHOT_DIR = Path.home() / ".file_automation_suite" / "snapshots"
+SNAPSHOT_SUFFIX = ".snap"
+
+_MAGIC = b"FOSNAP1\n"
+_HEADER_LENGTH = struct.Struct("<I")
+# Record: size, mtime in nanoseconds, length of the UTF-8 path, then the path
+_RECORD = struct.Struct("<QqI")
+
+# (path, size, mtime_ns)
+Entry = Tuple[str, int, int]
+
+
+def _order_key(path: str) -> str:
+    """Sort key that keeps every directory's subtree contiguous."""
+    return path.replace(os.sep, "\0")
+
+
+def _entry_key(entry: Entry) -> str:
+    return _order_key(entry[0])
+
+
+def _write_entries(f, entries: Iterable[Entry]) -> None:
+    pack = _RECORD.pack
+    for path, size, mtime_ns in entries:
+        encoded = path.encode("utf-8", "surrogateescape")
+        f.write(pack(size, mtime_ns, len(encoded)))
+        f.write(encoded)
+
+
+def _read_entries(path: str, offset: int = 0) -> Iterator[Entry]:
+    """Stream the records of a run or snapshot file from offset on."""
+    record_size = _RECORD.size
+    unpack = _RECORD.unpack
+    with open(path, "rb", buffering=1024 * 1024) as f:
+        f.seek(offset)
+        while True:
+            record = f.read(record_size)
+            if not record:
+                return
+            size, mtime_ns, length = unpack(record)
+            yield f.read(length).decode("utf-8", "surrogateescape"), size, mtime_ns
+
+
+def snapshot_path(name: Union[str, os.PathLike]) -> str:
+    """
+    Resolve a snapshot name to a file.
+
+    Plain names ("monday") live in SNAPSHOT_DIR; anything with a directory
+    part or the .snap suffix is used as a path.
+
+    Args:
+        name: Snapshot name or path
+
+    Returns:
+        Path of the snapshot file
+    """
+    name = os.fspath(name)
+    if os.sep in name or (os.altsep and os.altsep in name) or name.endswith(SNAPSHOT_SUFFIX):
+        return name
+    return str(SNAPSHOT_DIR / (name + SNAPSHOT_SUFFIX))
+
+
+class Snapshot:
+    """
+    A saved snapshot, read lazily.
+
+    Iterating yields (path, size, mtime_ns) in snapshot order, straight from
+    the file; iterate as often as needed.
+
+    Args:
+        path: Snapshot name or file (see snapshot_path())
+
+    Raises:
+        FileNotFoundError: If the snapshot does not exist
+        ValueError: If the file is not a snapshot
+
+    Example:
+        >>> snapshot = Snapshot("builds-monday")
+        >>> snapshot.file_count, snapshot.total_size, snapshot.roots
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Read the snapshot header."""
+        self.path = snapshot_path(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"Not a snapshot file: {self.path}")
+            (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+            header = json.loads(f.read(length).decode("utf-8"))
+            self._offset = f.tell()
+
+        self.roots: List[str] = header["roots"]
+        self.created: float = header["created"]
+        self.file_count: int = header["file_count"]
+        self.total_size: int = header["total_size"]
+
+    def __len__(self) -> int:
+        return self.file_count
+
+    def __iter__(self) -> Iterator[Entry]:
+        return _read_entries(self.path, self._offset)
+
+
+class SnapshotWriter(Aggregator):
+    """
+    Collect a scan's files in snapshot order, spilling sorted runs to disk.
+
+    Like SortedFiles, the writer is its own result: iterate it to stream
+    the entries in snapshot order, save() it to keep it, and close it (or
+    use it as a context manager) to delete the run files early.
+
+    Args:
+        roots: The roots being scanned (made absolute)
+        memory_budget: Approximate bytes buffered before a run is spilled;
+                       every parallel worker has its own budget
+        spill_dir: Directory for run files (default: the system temp dir)
+
+    Raises:
+        ValueError: If the budget is not positive
+
+    Example:
+        >>> with organizer.take_snapshot("/builds") as snapshot:
+        ...     snapshot.save("builds-monday")
+    """
+
+    name = "snapshot"
+
+    def __init__(
+        self,
+        roots: Roots,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        spill_dir: Optional[str] = None
+    ):
+        """Initialize an empty snapshot; its time is now."""
+        if memory_budget <= 0:
+            raise ValueError("memory_budget must be positive")
+
+        self.roots = [os.path.abspath(root) for root in _as_roots(roots)]
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.created = time.time()
+        self.file_count = 0
+        self.total_size = 0
+        self._buffer: List[Entry] = []
+        self._buffered_bytes = 0
+        self._runs: List[str] = []
+        self._finalizer = weakref.finalize(self, _remove_files, self._runs)
+
+    def __len__(self) -> int:
+        return self.file_count
+
+    @property
+    def run_count(self) -> int:
+        """Number of runs spilled to disk so far."""
+        return len(self._runs)
+
+    def offer(self, path: str, size: int, mtime_ns: int) -> None:
+        """
+        Add a single file, e.g. read from a ScanIndex.
+
+        Args:
+            path: Full file path
+            size: File size in bytes
+            mtime_ns: Modification time in nanoseconds
+        """
+        self.file_count += 1
+        self.total_size += size
+        self._buffer.append((path, size, mtime_ns))
+        self._buffered_bytes += _ENTRY_OVERHEAD + len(path)
+        if self._buffered_bytes > self.memory_budget:
+            self._spill()
+
+    def add_batch(self, dirpath: str, files) -> bool:
+        # Relative roots would make snapshots depend on the working directory
+        dirpath = os.path.abspath(dirpath)
+        buffer = self._buffer
+        join = os.path.join
+        added = 0
+
+        for name, st in files:
+            path = join(dirpath, name)
+            buffer.append((path, st.st_size, st.st_mtime_ns))
+            self.total_size += st.st_size
+            added += _ENTRY_OVERHEAD + len(path)
+
+        self.file_count += len(files)
+        self._buffered_bytes += added
+        if self._buffered_bytes > self.memory_budget:
+            self._spill()
+        return bool(files)
+
+    def _spill(self) -> None:
+        """Sort the buffer and write it to a new run file."""
+        self._buffer.sort(key=_entry_key)
+        fd, path = tempfile.mkstemp(prefix="snapshot-", suffix=".run", dir=self.spill_dir)
+        self._runs.append(path)
+        with os.fdopen(fd, "wb", buffering=1024 * 1024) as f:
+            _write_entries(f, self._buffer)
+
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def __iter__(self) -> Iterator[Entry]:
+        """Stream the entries in snapshot order, merging the runs lazily."""
+        self._buffer.sort(key=_entry_key)
+        runs = (_read_entries(path) for path in self._runs)
+        return heapq.merge(self._buffer, *runs, key=_entry_key)
+
+    def save(self, path: Union[str, os.PathLike]) -> Snapshot:
+        """
+        Write the snapshot to a file, replacing any older one atomically.
+
+        Args:
+            path: Snapshot name or file (see snapshot_path())
+
+        Returns:
+            The saved Snapshot
+        """
+        path = snapshot_path(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        header = json.dumps({
+            "roots": self.roots,
+            "created": self.created,
+            "file_count": self.file_count,
+            "total_size": self.total_size,
+        }).encode("utf-8")
+
+        fd, temp_path = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb", buffering=1024 * 1024) as f:
+                f.write(_MAGIC)
+                f.write(_HEADER_LENGTH.pack(len(header)))
+                f.write(header)
+                _write_entries(f, self)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        return Snapshot(path)
+
+    def merge(self, other: "SnapshotWriter") -> None:
+        """
+        Take over another writer's entries and run files.
+
+        Args:
+            other: Writer created by spawn(); it is left empty
+        """
+        self.file_count += other.file_count
+        self.total_size += other.total_size
+        self._runs.extend(other._runs)
+        # The runs now belong to this writer; the other must not delete them
+        other._runs.clear()
+        self._buffer.extend(other._buffer)
+        self._buffered_bytes += other._buffered_bytes
+        other._buffer = []
+        other._buffered_bytes = 0
+        if self._buffered_bytes > self.memory_budget:
+            self._spill()
+
+    def spawn(self) -> "SnapshotWriter":
+        worker = SnapshotWriter(self.roots, self.memory_budget, self.spill_dir)
+        worker.created = self.created
+        return worker
+
+    def result(self) -> "SnapshotWriter":
+        return self
+
+    def close(self) -> None:
+        """Delete the run files and drop the buffered entries."""
+        self._finalizer()
+        self._buffer = []
+        self._buffered_bytes = 0
+        self.file_count = 0
+        self.total_size = 0
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Hands the run files over, like SortedFiles
+        state = dict(self.__dict__)
+        del state["_finalizer"]
+        state["_runs"] = list(self._runs)
+        self._runs.clear()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._finalizer = weakref.finalize(self, _remove_files, self._runs)
+
+
+class SizeChange(NamedTuple):
+    """A file present in both snapshots with a different size."""
+
+    path: str
+    old_size: int
+    new_size: int
+
+    @property
+    def delta(self) -> int:
+        return self.new_size - self.old_size
+
+
+def _describe(snapshot: Any) -> Dict[str, Any]:
+    return {
+        "roots": list(snapshot.roots),
+        "created": snapshot.created,
+        "file_count": snapshot.file_count,
+        "total_size": snapshot.total_size,
+    }
+
+
+def diff_snapshots(
+    old: Union[Snapshot, SnapshotWriter],
+    new: Union[Snapshot, SnapshotWriter],
+    top_n: int = 10
+) -> Dict[str, Any]:
+    """
+    Compare two snapshots in one sort-merge pass.
+
+    Both inputs are streamed in snapshot order; memory holds the top_n
+    leaderboards and the directories from a root down to the current one.
+
+    Args:
+        old: Earlier snapshot
+        new: Later snapshot, saved or just taken
+        top_n: Number of entries on each leaderboard
+
+    Returns:
+        Dictionary with 'old' and 'new' (roots, created, file_count,
+        total_size); 'added' and 'removed' as (size, path) lists, largest
+        first; 'grown' and 'shrunk' as SizeChange lists, largest change
+        first; 'directories_grown' and 'directories_shrunk' as
+        RankedDirectory lists of (path, bytes gained or lost below it,
+        changed files); 'counts' per kind of change; 'added_size', 'removed_size'
+        and 'net_change' in bytes
+
+    Raises:
+        ValueError: If top_n is less than 1
+
+    Example:
+        >>> diff = diff_snapshots(Snapshot("monday"), Snapshot("friday"))
+        >>> diff['net_change'], diff['directories_grown'][:3]
+    """
+    if top_n < 1:
+        raise ValueError("top_n must be at least 1")
+
+    added, removed = TopNCollector(top_n), TopNCollector(top_n)
+    grown: List[Tuple[int, str, int, int]] = []
+    shrunk: List[Tuple[int, str, int, int]] = []
+    counts = {"added": 0, "removed": 0, "grown": 0, "shrunk": 0, "modified": 0, "unchanged": 0}
+    added_size = removed_size = 0
+
+    # Directory deltas arrive depth-first, which the collector needs to
+    # rank directories in O(depth) memory; one collector per direction
+    roots = sorted(set(old.roots) | set(new.roots))
+    growth = LargestDirectoriesCollector(roots, top_n)
+    shrinkage = LargestDirectoriesCollector(roots, top_n)
+    current_dir: Optional[str] = None
+    dir_delta = dir_changes = 0
+
+    def offer_change(heap, item) -> None:
+        if len(heap) < top_n:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def record(path: str, delta: int) -> None:
+        nonlocal current_dir, dir_delta, dir_changes
+        dirpath = os.path.dirname(path)
+        if dirpath != current_dir:
+            if dir_changes:
+                growth.add_totals(current_dir, dir_delta, dir_changes)
+                shrinkage.add_totals(current_dir, -dir_delta, dir_changes)
+            current_dir, dir_delta, dir_changes = dirpath, 0, 0
+        dir_delta += delta
+        dir_changes += 1
+
+    old_entries, new_entries = iter(old), iter(new)
+    a = next(old_entries, None)
+    b = next(new_entries, None)
+    a_key = _order_key(a[0]) if a is not None else None
+    b_key = _order_key(b[0]) if b is not None else None
+
+    while a is not None or b is not None:
+        if b is None or (a is not None and a_key < b_key):
+            path, size, _ = a
+            counts["removed"] += 1
+            removed_size += size
+            removed.offer(size, path)
+            record(path, -size)
+            a = next(old_entries, None)
+            a_key = _order_key(a[0]) if a is not None else None
+            continue
+
+        if a is None or b_key < a_key:
+            path, size, _ = b
+            counts["added"] += 1
+            added_size += size
+            added.offer(size, path)
+            record(path, size)
+            b = next(new_entries, None)
+            b_key = _order_key(b[0]) if b is not None else None
+            continue
+
+        path, old_size, old_mtime = a
+        _, new_size, new_mtime = b
+        if new_size > old_size:
+            counts["grown"] += 1
+            offer_change(grown, (new_size - old_size, path, old_size, new_size))
+            record(path, new_size - old_size)
+        elif new_size < old_size:
+            counts["shrunk"] += 1
+            offer_change(shrunk, (old_size - new_size, path, old_size, new_size))
+            record(path, new_size - old_size)
+        elif new_mtime != old_mtime:
+            counts["modified"] += 1
+        else:
+            counts["unchanged"] += 1
+
+        a = next(old_entries, None)
+        a_key = _order_key(a[0]) if a is not None else None
+        b = next(new_entries, None)
+        b_key = _order_key(b[0]) if b is not None else None
+
+    if dir_changes:
+        growth.add_totals(current_dir, dir_delta, dir_changes)
+        shrinkage.add_totals(current_dir, -dir_delta, dir_changes)
+
+    return {
+        "old": _describe(old),
+        "new": _describe(new),
+        "added": added.results(),
+        "removed": removed.results(),
+        "grown": [SizeChange(path, old_size, new_size)
+                  for _, path, old_size, new_size in sorted(grown, reverse=True)],
+        "shrunk": [SizeChange(path, old_size, new_size)
+                   for _, path, old_size, new_size in sorted(shrunk, reverse=True)],
+        "directories_grown": [entry for entry in growth.result()["by_size"] if entry.size > 0],
+        "directories_shrunk": [entry for entry in shrinkage.result()["by_size"] if entry.size > 0],
+        "counts": counts,
+        "added_size": added_size,
+        "removed_size": removed_size,
+        "net_change": new.total_size - old.total_size,
+    }
@@ -7,6 +7,7 @@ MIT License
 Copyright (c) 2025 Daniel
 
 Monitor system resources (CPU, disk usage) and alert on threshold violations.
+Predicts when a disk fills up from the growth history recorded by scans.
 Cross-platform compatible (macOS, Linux, Windows).
 
 Dependencies:
@@ -21,7 +22,12 @@ Example:
 
 import shutil
 import psutil
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+try:
+    from .growth import DEFAULT_GROWTH_PATH, DiskForecast, GrowthStore
+except ImportError:  # Running as a script or with src/ on sys.path
+    from growth import DEFAULT_GROWTH_PATH, DiskForecast, GrowthStore
 
 
 class SystemMonitor:
@@ -124,6 +130,39 @@ class SystemMonitor:
         cpu_healthy, _ = self.check_cpu_usage()
         return disk_healthy and cpu_healthy
 
+    def forecast_disk_full(
+        self,
+        path: str = "/",
+        store: Optional[GrowthStore] = None,
+        window_days: Optional[float] = 30,
+        top_n: int = 5
+    ) -> DiskForecast:
+        """
+        Predict when the disk holding path fills up.
+
+        Uses the samples written by FileOrganizer.record_growth(); the
+        more often growth is recorded, the better the estimate.
+
+        Args:
+            path: Any path on the disk (default: "/")
+            store: GrowthStore to read (default: ~/.file_automation_suite/growth.db)
+            window_days: Fit only samples this recent (None: all kept samples)
+            top_n: Number of fastest growing folders to include
+
+        Returns:
+            DiskForecast; days_left is None while the disk is not filling up
+
+        Example:
+            >>> monitor = SystemMonitor()
+            >>> forecast = monitor.forecast_disk_full()
+            >>> if forecast.days_left is not None and forecast.days_left < 30:
+            ...     print(f"Disk full in {forecast.days_left:.0f} days")
+        """
+        if store is not None:
+            return store.forecast(path, window_days, top_n)
+        with GrowthStore() as default_store:
+            return default_store.forecast(path, window_days, top_n)
+
 
 def main():
     """Command-line interface for system monitoring."""
@@ -137,6 +176,14 @@ def main():
     print(f"\n📊 Disk Usage:")
     print(f"   Free Space: {status['disk_free_percent']:.1f}%")
     print(f"   Status: {'✅ OK' if status['disk_healthy'] else '❌ LOW SPACE'}")
+    # Only once scans have recorded some history
+    if DEFAULT_GROWTH_PATH.exists():
+        forecast = monitor.forecast_disk_full()
+        if forecast.days_left is not None:
+            print(f"   Full in: {forecast.days_left:,.0f} days "
+                  f"at {forecast.rate / 1024 ** 3:.2f} GB/day")
+        elif forecast.samples >= 2:
+            print("   Full in: not filling up")
 
     print(f"\n💻 CPU Usage:")
     print(f"   Current: {status['cpu_percent']:.1f}%")
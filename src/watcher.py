@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Watcher - Live Scan Index Maintenance from File-System Events
+==============================================================
+
+MIT License
+Copyright (c) 2025 Daniel
+
+Subscribe to file-system change events and keep a ScanIndex current without
+rescanning. Events are debounced and coalesced into sets of changed
+directories, which are re-listed in one batch, so after the watcher has
+started, top-N and statistics queries are answered straight from the index.
+
+Features:
+    - Platform abstraction (WatchBackend) for event sources
+    - Linux: inotify through ctypes, no third-party packages
+    - macOS and others: FSEvents/kqueue/ReadDirectoryChangesW through the
+      optional watchdog package
+    - Debouncing (quiet period) with a cap on the delay of any batch
+    - Creates, deletes, modifications and moves coalesced per directory
+    - Event queue overflows fall back to an incremental refresh
+
+Dependencies:
+    - Standard library only on Linux
+    - watchdog (optional, other platforms)
+
+Example:
+    >>> from scan_index import ScanIndex
+    >>> from watcher import IndexWatcher
+    >>> index = ScanIndex()
+    >>> with IndexWatcher(index, "/Users/daniel/Downloads"):
+    ...     index.largest_files("/Users/daniel/Downloads", top_n=5)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+try:
+    from .scanner import Roots, _as_roots
+    from .scan_index import ScanIndex
+except ImportError:  # Running as a script or with src/ on sys.path
+    from scanner import Roots, _as_roots
+    from scan_index import ScanIndex
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional; only needed off Linux
+    FileSystemEventHandler = object
+    Observer = None
+
+# Event kinds reported by backends
+CREATED = "created"
+DELETED = "deleted"
+MODIFIED = "modified"
+MOVED_FROM = "moved_from"
+MOVED_TO = "moved_to"
+# Events were lost; everything under the roots must be re-checked
+OVERFLOW = "overflow"
+
+
+class FileEvent(NamedTuple):
+    """One change reported by a backend."""
+
+    kind: str
+    path: str
+    is_dir: bool
+
+
+class WatchBackend:
+    """
+    Source of file-system events for one or more directory trees.
+
+    Backends report changes below (and of) each watched root; the watcher
+    service does the filtering, debouncing and coalescing. To support a new
+    platform, implement watch(), read_events() and close().
+    """
+
+    def __init__(self, include_hidden: bool = False):
+        """
+        Initialize the backend.
+
+        Args:
+            include_hidden: Also report changes in dot-directories. Backends
+                            may use this to avoid watching them at all.
+        """
+        self.include_hidden = include_hidden
+
+    def watch(self, root: str) -> None:
+        """
+        Start reporting changes anywhere under root.
+
+        Args:
+            root: Directory tree to watch
+        """
+        raise NotImplementedError
+
+    def read_events(self, timeout: float) -> List[FileEvent]:
+        """
+        Return the events received so far, waiting up to timeout for one.
+
+        Args:
+            timeout: Seconds to wait when no events are pending
+
+        Returns:
+            List of events (empty on timeout)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Stop watching and release operating-system resources."""
+        raise NotImplementedError
+
+
+class InotifyBackend(WatchBackend):
+    """Linux inotify backend; one watch descriptor per directory."""
+
+    IN_MODIFY = 0x00000002
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_DONT_FOLLOW = 0x02000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW
+    )
+
+    _HEADER = struct.Struct("iIII")
+
+    def __init__(
+        self,
+        include_hidden: bool = False,
+        on_error: Optional[Callable[[str, OSError], None]] = None
+    ):
+        """
+        Create an inotify instance.
+
+        Args:
+            include_hidden: Also watch dot-directories
+            on_error: Optional function called when a directory cannot be
+                      watched (e.g. fs.inotify.max_user_watches reached)
+                      Signature: on_error(path: str, error: OSError)
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        super().__init__(include_hidden)
+        self.on_error = on_error
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._paths: Dict[int, str] = {}
+        self._descriptors: Dict[str, int] = {}
+        self._roots: Set[str] = set()
+
+    def watch(self, root: str) -> None:
+        root = os.path.abspath(root)
+        self._roots.add(root)
+        self._watch_tree(root)
+
+    def read_events(self, timeout: float) -> List[FileEvent]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events: List[FileEvent] = []
+        header = self._HEADER
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = header.unpack_from(data, offset)
+            offset += header.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                events.append(FileEvent(OVERFLOW, "", True))
+                continue
+
+            dirpath = self._paths.get(wd)
+            if dirpath is None:
+                continue
+
+            if mask & self.IN_IGNORED:
+                # Watch removed by the kernel (directory deleted or unmounted)
+                del self._paths[wd]
+                if self._descriptors.get(dirpath) == wd:
+                    del self._descriptors[dirpath]
+                continue
+
+            is_dir = bool(mask & self.IN_ISDIR)
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                # Only interesting for roots; other directories are reported
+                # by their parent
+                if dirpath in self._roots:
+                    events.append(FileEvent(DELETED, dirpath, True))
+                continue
+
+            path = os.path.join(dirpath, os.fsdecode(name))
+            if mask & self.IN_CREATE:
+                kind = CREATED
+            elif mask & self.IN_DELETE:
+                kind = DELETED
+            elif mask & self.IN_MOVED_FROM:
+                kind = MOVED_FROM
+            elif mask & self.IN_MOVED_TO:
+                kind = MOVED_TO
+            else:
+                kind = MODIFIED
+
+            if is_dir:
+                if kind in (CREATED, MOVED_TO):
+                    self._watch_tree(path)
+                elif kind == MOVED_FROM:
+                    self._unwatch_tree(path)
+
+            events.append(FileEvent(kind, path, is_dir))
+
+        return events
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._paths.clear()
+        self._descriptors.clear()
+
+    def _watch_tree(self, root: str) -> None:
+        """Add a watch for root and every directory below it."""
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            if not self._add_watch(dirpath):
+                continue
+            try:
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        if not self.include_hidden and entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError as e:
+                if self.on_error is not None:
+                    self.on_error(dirpath, e)
+
+    def _add_watch(self, dirpath: str) -> bool:
+        """Watch a single directory; returns False if that is impossible."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if self.on_error is not None:
+                self.on_error(dirpath, OSError(errno, os.strerror(errno), dirpath))
+            return False
+        self._paths[wd] = dirpath
+        self._descriptors[dirpath] = wd
+        return True
+
+    def _unwatch_tree(self, root: str) -> None:
+        """Drop the watches of a directory that moved away and its subtree."""
+        prefix = root + os.sep
+        for dirpath in [p for p in self._descriptors if p == root or p.startswith(prefix)]:
+            wd = self._descriptors.pop(dirpath)
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+
+class _QueueingHandler(FileSystemEventHandler):
+    """Translate watchdog callbacks into FileEvents on a queue."""
+
+    def __init__(self, events: "queue.Queue[FileEvent]"):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event) -> None:
+        kinds = {"created": CREATED, "deleted": DELETED, "modified": MODIFIED}
+        if event.event_type == "moved":
+            self.events.put(FileEvent(MOVED_FROM, event.src_path, event.is_directory))
+            self.events.put(FileEvent(MOVED_TO, event.dest_path, event.is_directory))
+        elif event.event_type in kinds:
+            self.events.put(FileEvent(kinds[event.event_type], event.src_path, event.is_directory))
+
+
+class WatchdogBackend(WatchBackend):
+    """Backend built on the watchdog package (FSEvents on macOS)."""
+
+    def __init__(self, include_hidden: bool = False):
+        """
+        Start a watchdog observer.
+
+        Args:
+            include_hidden: Also report changes in dot-directories
+
+        Raises:
+            ImportError: If watchdog is not installed
+        """
+        if Observer is None:
+            raise ImportError("watchdog is required: pip install watchdog")
+
+        super().__init__(include_hidden)
+        self._events: "queue.Queue[FileEvent]" = queue.Queue()
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.start()
+
+    def watch(self, root: str) -> None:
+        self._observer.schedule(_QueueingHandler(self._events), root, recursive=True)
+
+    def read_events(self, timeout: float) -> List[FileEvent]:
+        try:
+            events = [self._events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+def default_backend(
+    include_hidden: bool = False,
+    on_error: Optional[Callable[[str, OSError], None]] = None
+) -> WatchBackend:
+    """
+    Create the best available backend for this platform.
+
+    Args:
+        include_hidden: Also report changes in dot-directories
+        on_error: Optional function called when a directory cannot be watched
+
+    Returns:
+        InotifyBackend on Linux, WatchdogBackend elsewhere
+
+    Raises:
+        ImportError: If no backend is available on this platform
+    """
+    if sys.platform.startswith("linux"):
+        return InotifyBackend(include_hidden, on_error)
+    return WatchdogBackend(include_hidden)
+
+
+class IndexWatcher:
+    """Keep a ScanIndex current by applying batched file-system events."""
+
+    def __init__(
+        self,
+        index: ScanIndex,
+        roots: Roots,
+        backend: Optional[WatchBackend] = None,
+        debounce: float = 0.2,
+        max_delay: float = 2.0,
+        on_batch: Optional[Callable[[Set[str], Dict[str, int]], None]] = None,
+        on_error: Optional[Callable[[str, OSError], None]] = None
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            index: Index to maintain
+            roots: Directory to watch, or a sequence of directories
+            backend: Event source (default: default_backend())
+            debounce: Seconds without new events before a batch is applied
+            max_delay: Longest a change may wait while events keep arriving
+            on_batch: Optional function called after each applied batch
+                      Signature: on_batch(dirpaths: set, summary: dict)
+            on_error: Optional function called for every inaccessible entry
+                      Signature: on_error(path: str, error: OSError)
+        """
+        self.index = index
+        self.roots = [os.path.abspath(root) for root in _as_roots(roots)]
+        self.backend = backend
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.on_batch = on_batch
+        self.on_error = on_error
+        self.event_count = 0
+        self.batch_count = 0
+
+        self._pending: Set[str] = set()
+        self._overflow = False
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "IndexWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start watching, bring the index up to date and mark the roots live.
+
+        Watches are set up before the initial refresh, so changes made while
+        it runs are applied afterwards rather than lost.
+
+        Raises:
+            FileNotFoundError: If a root doesn't exist
+        """
+        if self.running:
+            return
+
+        if self.backend is None:
+            self.backend = default_backend(self.index.include_hidden, self.on_error)
+
+        for root in self.roots:
+            if not os.path.isdir(root):
+                raise FileNotFoundError(f"Path does not exist: {root}")
+            self.backend.watch(root)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        for root in self.roots:
+            self.index.refresh(root, on_error=self.on_error)
+            self.index.set_live(root)
+
+    def stop(self) -> None:
+        """Apply pending changes, stop watching and mark the roots stale."""
+        for root in self.roots:
+            self.index.set_live(root, False)
+
+        try:
+            if self._thread is not None:
+                self._stop.set()
+                self._thread.join()
+                self._thread = None
+                self.flush()
+        finally:
+            if self.backend is not None:
+                self.backend.close()
+                self.backend = None
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Apply pending changes now instead of waiting for the debounce.
+
+        Returns:
+            Summary of the applied batch ('scanned', 'unchanged', 'removed';
+            with exclusion rules also 'pruned')
+        """
+        with self._lock:
+            dirpaths, self._pending = self._pending, set()
+            overflow, self._overflow = self._overflow, False
+
+        summary = {"scanned": 0, "unchanged": 0, "removed": 0}
+        if overflow:
+            # Events were dropped; fall back to the mtime-based refresh
+            for root in self.roots:
+                if os.path.isdir(root):
+                    self._add_summary(summary, self.index.refresh(root, on_error=self.on_error))
+        if dirpaths:
+            self._add_summary(summary, self.index.apply_changes(dirpaths, self.on_error))
+
+        if dirpaths or overflow:
+            self.batch_count += 1
+            if self.on_batch:
+                self.on_batch(dirpaths, summary)
+        return summary
+
+    def _run(self) -> None:
+        """Read events and apply them in debounced batches."""
+        while not self._stop.is_set():
+            events = self.backend.read_events(min(self.debounce, 0.1))
+            now = time.monotonic()
+            if events:
+                self._coalesce(events, now)
+
+            with self._lock:
+                due = self._pending or self._overflow
+                due = due and (
+                    now - self._last_event >= self.debounce
+                    or now - self._first_event >= self.max_delay
+                )
+            if due:
+                try:
+                    self.flush()
+                except Exception as e:
+                    # Keep watching; the next refresh repairs the index
+                    if self.on_error is not None:
+                        self.on_error("", OSError(str(e)))
+
+    def _coalesce(self, events: List[FileEvent], now: float) -> None:
+        """Reduce events to the set of directories whose listing changed."""
+        with self._lock:
+            if not (self._pending or self._overflow):
+                self._first_event = now
+            self._last_event = now
+
+            for event in events:
+                self.event_count += 1
+                if event.kind == OVERFLOW:
+                    self._overflow = True
+                    continue
+
+                path = os.path.abspath(event.path)
+                if not self._is_relevant(path):
+                    continue
+                if path in self.roots:
+                    # The root itself was deleted or moved
+                    self._pending.add(path)
+                else:
+                    self._pending.add(os.path.dirname(path))
+
+    def _is_relevant(self, path: str) -> bool:
+        """Check that path lies under a root and is not hidden (if excluded)."""
+        for root in self.roots:
+            prefix = root.rstrip(os.sep) + os.sep
+            if path == root or path.startswith(prefix):
+                if self.index.include_hidden:
+                    return True
+                return (os.sep + '.') not in os.sep + path[len(prefix):]
+        return False
+
+    @staticmethod
+    def _add_summary(total: Dict[str, int], summary: Dict[str, int]) -> None:
+        # 'pruned' is only reported when the index has exclusion rules
+        for key, value in summary.items():
+            total[key] = total.get(key, 0) + value
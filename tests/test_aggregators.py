@@ -0,0 +1,238 @@
+"""
+Unit tests for Aggregators module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import math
+import pickle
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import aggregators as aggregators_module
+from src.aggregators import (
+    AggregatorSet, ExtensionCollector, SizeDistribution, SizeHistogram, TopNCollector,
+    TotalsCollector
+)
+
+
+class FakeStat:
+    """Minimal stand-in for os.stat_result."""
+
+    def __init__(self, size):
+        self.st_size = size
+
+
+class TestTopNCollector:
+    """Test suite for TopNCollector class."""
+
+    def test_invalid_top_n(self):
+        """Test that top_n below 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            TopNCollector(0)
+
+    def test_keeps_only_top_n(self):
+        """Test that the heap never grows beyond top_n."""
+        collector = TopNCollector(5)
+        sizes = list(range(1000))
+        random.Random(42).shuffle(sizes)
+
+        for size in sizes:
+            collector.offer(size, f"file_{size}")
+            assert len(collector) <= 5
+
+        assert [size for size, _ in collector.results()] == [999, 998, 997, 996, 995]
+
+    def test_offer_reports_changes(self):
+        """Test that offer returns whether the leaderboard changed."""
+        collector = TopNCollector(2)
+        assert collector.offer(10, "a")
+        assert collector.offer(20, "b")
+        assert not collector.offer(5, "c")
+        assert collector.offer(30, "d")
+        assert collector.threshold == 20
+
+    def test_add_batch_matches_offer(self):
+        """Test that batch insertion gives the same result as single offers."""
+        files = [(f"f{i}", FakeStat(i % 37)) for i in range(200)]
+
+        batched = TopNCollector(10)
+        batched.add_batch("/root", files)
+
+        single = TopNCollector(10)
+        for name, st in files:
+            single.offer(st.st_size, os.path.join("/root", name))
+
+        assert batched.results() == single.results()
+
+    def test_ties_broken_by_path(self):
+        """Test that equal sizes are ordered deterministically."""
+        forward = TopNCollector(2)
+        backward = TopNCollector(2)
+        names = ["a", "b", "c", "d"]
+
+        for name in names:
+            forward.offer(1, name)
+        for name in reversed(names):
+            backward.offer(1, name)
+
+        assert forward.results() == backward.results() == [(1, "d"), (1, "c")]
+
+    def test_merge(self):
+        """Test that merging partial collectors equals one collector."""
+        whole = TopNCollector(3)
+        left = TopNCollector(3)
+        right = TopNCollector(3)
+
+        for size in range(20):
+            whole.offer(size, str(size))
+            (left if size % 2 else right).offer(size, str(size))
+
+        left.merge(right)
+        assert left.results() == whole.results()
+
+
+class TestBreakdownAggregators:
+    """Test suite for totals, extension and histogram aggregators."""
+
+    FILES = [
+        ("a.TXT", FakeStat(10)),
+        ("b.txt", FakeStat(20)),
+        ("movie.mp4", FakeStat(1000)),
+        ("Makefile", FakeStat(0)),
+        (".bashrc", FakeStat(3)),
+    ]
+
+    def test_totals(self):
+        """Test that totals sum sizes and counts."""
+        totals = TotalsCollector()
+        totals.add_batch("/root", self.FILES)
+        assert totals.result() == {"total_size": 1033, "file_count": 5}
+
+    def test_extensions_case_insensitive(self):
+        """Test that extensions are lowercased and dot-files have none."""
+        extensions = ExtensionCollector()
+        extensions.add_batch("/root", self.FILES)
+        assert extensions.result() == [(".mp4", 1, 1000), (".txt", 2, 30), ("", 2, 3)]
+
+    def test_histogram_buckets(self):
+        """Test that sizes land in power-of-two buckets."""
+        histogram = SizeHistogram()
+        histogram.add_batch("/root", self.FILES)
+        assert histogram.result() == [
+            (0, 1, 1, 0),
+            (2, 4, 1, 3),
+            (8, 16, 1, 10),
+            (16, 32, 1, 20),
+            (512, 1024, 1, 1000),
+        ]
+
+    @pytest.mark.parametrize(
+        "cls", [TotalsCollector, ExtensionCollector, SizeHistogram, SizeDistribution]
+    )
+    def test_merge_equals_single_pass(self, cls):
+        """Test that merging two halves equals aggregating everything."""
+        whole = cls()
+        whole.add_batch("/root", self.FILES)
+
+        left = cls()
+        right = left.spawn()
+        left.add_batch("/root", self.FILES[:2])
+        right.add_batch("/root", self.FILES[2:])
+        left.merge(right)
+
+        assert left.result() == whole.result()
+
+    def test_aggregator_set_fans_out(self):
+        """Test that an AggregatorSet feeds every member and keys results by name."""
+        aggregators = AggregatorSet([TopNCollector(1), TotalsCollector()])
+        assert aggregators.add_batch("/root", self.FILES)
+        assert aggregators.result() == {
+            "largest_files": [(1000, os.path.join("/root", "movie.mp4"))],
+            "totals": {"total_size": 1033, "file_count": 5},
+        }
+
+    def test_aggregator_set_rejects_duplicate_names(self):
+        """Test that two aggregators with one name raise ValueError."""
+        with pytest.raises(ValueError):
+            AggregatorSet([TotalsCollector(), TotalsCollector()])
+
+
+class TestSizeDistribution:
+    """Test suite for the batched size distribution."""
+
+    @pytest.fixture
+    def sizes(self):
+        """Log-normal sizes spanning bytes to gigabytes."""
+        rng = random.Random(7)
+        return [int(rng.lognormvariate(10, 3)) for _ in range(20000)] + [0, 1, 255, 256, 2 ** 40]
+
+    def _distribution(self, sizes, batch=50):
+        distribution = SizeDistribution()
+        files = [("f", FakeStat(size)) for size in sizes]
+        for start in range(0, len(files), batch):
+            distribution.add_batch("/root", files[start:start + batch])
+        return distribution
+
+    def test_buckets_match_histogram(self, sizes):
+        """Test that the log2 buckets equal SizeHistogram's."""
+        histogram = SizeHistogram()
+        histogram.add_batch("/root", [("f", FakeStat(size)) for size in sizes])
+        assert self._distribution(sizes).result()["buckets"] == histogram.result()
+
+    def test_small_sizes_are_exact(self):
+        """Test nearest-rank percentiles below 256 bytes."""
+        distribution = self._distribution(range(1, 101))
+        assert [distribution.percentile(q) for q in (50, 90, 99, 100)] == [50, 90, 99, 100]
+        with pytest.raises(ValueError):
+            distribution.percentile(101)
+
+    def test_percentiles_within_bin_precision(self, sizes):
+        """Test percentiles and the top-1% share against a full sort."""
+        result = self._distribution(sizes).result()
+        ordered = sorted(sizes)
+        for q in (50, 90, 99):
+            exact = ordered[math.ceil(len(ordered) * q / 100) - 1]
+            assert abs(result[f"p{q}"] - exact) <= exact / 128
+
+        top = ordered[-math.ceil(len(ordered) * 0.01):]
+        assert abs(result["top1_size"] - sum(top)) <= sum(top) / 128
+        assert result["top1_share"] == pytest.approx(sum(top) / sum(ordered), rel=0.01)
+        assert result["total_size"] == sum(sizes)
+        assert result["file_count"] == len(sizes)
+
+    def test_top_share_of_one_large_file(self):
+        """Test that one file among 100 makes up the top 1%."""
+        result = self._distribution([1024] * 99 + [10 ** 6]).result()
+        assert result["top1_size"] == 10 ** 6
+        assert result["top1_share"] == pytest.approx(10 ** 6 / (10 ** 6 + 99 * 1024))
+
+    def test_sources_and_merges_agree(self, sizes):
+        """Test add_sizes(), pickled merges and the NumPy-free path."""
+        expected = self._distribution(sizes).result()
+
+        direct = SizeDistribution()
+        direct.add_sizes(iter(sizes))
+        assert direct.result() == expected
+
+        left, right = SizeDistribution(), SizeDistribution()
+        left.add_sizes(sizes[:7000])
+        right.add_sizes(sizes[7000:])
+        left.merge(pickle.loads(pickle.dumps(right)))
+        assert left.result() == expected
+
+    def test_pure_python_fallback(self, sizes, monkeypatch):
+        """Test that binning without NumPy gives the same answer."""
+        expected = self._distribution(sizes).result()
+        monkeypatch.setattr(aggregators_module, "np", None)
+        assert self._distribution(sizes).result() == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
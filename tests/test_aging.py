@@ -0,0 +1,118 @@
+"""
+Unit tests for Aging module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.aging import DAY, AgeCollector
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestAgeCollector:
+    """Test suite for age buckets, the size x age matrix and stale files."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create files with known sizes, modification and access times."""
+        temp_path = tempfile.mkdtemp()
+        now = time.time()
+        # name: (size, mtime age in days, atime age in days)
+        files = {
+            'new/draft.txt': (100, 1, 1),
+            'new/recent.mov': (3000, 10, 10),
+            'old/archive.zip': (9000, 400, 400),
+            'old/photos.tar': (5000, 800, 2),
+            'old/notes.txt': (50, 2000, 2000),
+        }
+        for relpath, (size, mtime_age, atime_age) in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+            os.utime(path, (now - atime_age * DAY, now - mtime_age * DAY))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _buckets(self, report):
+        return {bucket['label']: (bucket['file_count'], bucket['total_size'])
+                for bucket in report['buckets'] if bucket['file_count']}
+
+    def test_buckets_by_modification_age(self, temp_dir):
+        """Test default buckets and the largest files per bucket."""
+        report = FileOrganizer().get_age_report(temp_dir, top_n=1)
+        assert self._buckets(report) == {
+            '<30d': (2, 3100),
+            '1y-2y': (1, 9000),
+            '2y-5y': (1, 5000),
+            '>5y': (1, 50),
+        }
+        youngest = report['buckets'][0]['largest']
+        assert [os.path.basename(path) for _, path in youngest] == ['recent.mov']
+
+    def test_size_by_age_matrix(self, temp_dir):
+        """Test that matrix rows follow the size classes and add up to the buckets."""
+        report = FileOrganizer().get_age_report(temp_dir, age_edges=(365,))
+        assert report['size_classes'][0] == (0, 1024 ** 2)
+        # Every file is below 1 MB
+        assert report['matrix'][0] == [(2, 3100), (3, 14050)]
+        assert all(cell == (0, 0) for row in report['matrix'][1:] for cell in row)
+
+    def test_clocks(self, temp_dir):
+        """Test that access times and 'touched' change which files are stale."""
+        organizer = FileOrganizer()
+        by_mtime = organizer.find_stale_files(temp_dir, older_than_days=365, top_n=10)
+        by_touch = organizer.find_stale_files(temp_dir, older_than_days=365, top_n=10,
+                                              clock='touched')
+        assert [size for size, _ in by_mtime] == [9000, 5000, 50]
+        # photos.tar was read two days ago
+        assert [size for size, _ in by_touch] == [9000, 50]
+        with pytest.raises(ValueError):
+            AgeCollector(clock='ctime')
+
+    def test_min_size_only_limits_the_listing(self, temp_dir):
+        """Test that small files are counted but not listed."""
+        report = FileOrganizer().get_age_report(temp_dir, age_edges=(365,), min_size=1000)
+        stale = report['buckets'][-1]
+        assert stale['file_count'] == 3
+        assert [size for size, _ in stale['largest']] == [9000, 5000]
+
+    def test_parallel_and_index_match_serial(self, temp_dir):
+        """Test threads, processes and the index against a serial scan."""
+        collector = AgeCollector(top_n=3, now=1000.0)
+        assert pickle.loads(pickle.dumps(collector)).spawn().now == 1000.0
+
+        organizer = FileOrganizer()
+        now = time.time()
+        serial = organizer.get_age_report(temp_dir)
+        for report in (organizer.get_age_report(temp_dir, workers=3),
+                       organizer.get_age_report(temp_dir, workers=2, use_processes=True)):
+            assert report['matrix'] == serial['matrix']
+            assert report['buckets'] == serial['buckets']
+
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            indexed = FileOrganizer(index=index).get_age_report(temp_dir)
+            assert indexed['matrix'] == serial['matrix']
+            assert indexed['buckets'] == serial['buckets']
+            assert indexed['now'] >= now
+        finally:
+            index.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Unit tests for AsyncScan module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import tempfile
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.async_scan import (
+    AsyncFileOrganizer, BackgroundLoop, CancellationToken, DeadlineExceeded, ScanCancelled
+)
+from src.file_organizer import FileOrganizer
+
+
+class TestAsyncFileOrganizer:
+    """Test suite for AsyncFileOrganizer class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary tree with a few hundred files."""
+        temp_path = tempfile.mkdtemp()
+
+        for i in range(20):
+            subdir = os.path.join(temp_path, f"dir_{i}")
+            os.makedirs(subdir)
+            for j in range(15):
+                with open(os.path.join(subdir, f"file_{j}.bin"), 'wb') as f:
+                    f.write(b'0' * (i * 15 + j))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def test_analyze_matches_sync(self, temp_dir):
+        """Test that the async API returns the same report as FileOrganizer."""
+        report = asyncio.run(AsyncFileOrganizer().analyze_directory(temp_dir, top_n=5))
+        assert report == FileOrganizer().analyze_directory(temp_dir, top_n=5)
+
+    def test_progress_events_arrive_on_loop(self, temp_dir):
+        """Test that sync and async progress handlers run on the event loop."""
+        events = []
+
+        async def run():
+            loop_thread = threading.get_ident()
+
+            async def handler(event):
+                events.append((event, threading.get_ident() == loop_thread))
+
+            organizer = AsyncFileOrganizer()
+            stats = await organizer.get_directory_stats(temp_dir, on_progress=handler)
+            await asyncio.sleep(0.05)   # let scheduled handlers finish
+            return stats
+
+        stats = asyncio.run(run())
+        assert stats["file_count"] == 300
+        assert events
+        assert all(on_loop for _, on_loop in events)
+        assert events[-1][0].files_scanned <= 300
+
+    def test_cancel_mid_scan(self, temp_dir):
+        """Test that cancelling from a progress handler stops the scan."""
+        # Enough files that the scan thread yields to the loop before it ends
+        bulk = os.path.join(temp_dir, "bulk")
+        os.makedirs(bulk)
+        for i in range(5000):
+            open(os.path.join(bulk, f"empty_{i}"), 'wb').close()
+
+        async def run():
+            organizer = AsyncFileOrganizer()
+            with pytest.raises(ScanCancelled):
+                await organizer.find_largest_files(
+                    temp_dir, on_progress=lambda event: organizer.cancel()
+                )
+
+        asyncio.run(run())
+
+    def test_deadline(self, temp_dir):
+        """Test that an expired deadline raises DeadlineExceeded."""
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(AsyncFileOrganizer().analyze_directory(temp_dir, timeout=0))
+
+    def test_newer_request_supersedes_older(self, temp_dir):
+        """Test that starting a new request cancels the previous token."""
+        organizer = AsyncFileOrganizer()
+        old = organizer.new_token()
+        new = organizer.new_token()
+        assert old.cancelled and not new.cancelled
+        assert "superseded" in old.reason
+
+        with pytest.raises(ScanCancelled):
+            asyncio.run(organizer.find_largest_files(temp_dir, token=old))
+        assert asyncio.run(organizer.find_largest_files(temp_dir, 1, token=new))
+
+    def test_task_cancellation_cancels_token(self, temp_dir):
+        """Test that cancelling the awaiting task also stops the scan thread."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        # Occupy the only worker so the scan is still queued when cancelled
+        executor.submit(release.wait)
+        token = CancellationToken()
+
+        async def run():
+            organizer = AsyncFileOrganizer(executor=executor)
+            task = asyncio.ensure_future(organizer.analyze_directory(temp_dir, token=token))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        try:
+            asyncio.run(run())
+        finally:
+            release.set()
+            executor.shutdown()
+        assert token.cancelled
+
+    def test_background_loop(self, temp_dir):
+        """Test that coroutines can be run from non-async code."""
+        loop = BackgroundLoop()
+        try:
+            future = loop.submit(AsyncFileOrganizer().get_directory_stats(temp_dir))
+            assert future.result(timeout=10)["file_count"] == 300
+        finally:
+            loop.stop()
+
+
+class TestCancellationToken:
+    """Test suite for CancellationToken class."""
+
+    def test_cancel(self):
+        token = CancellationToken()
+        assert not token.cancelled
+        assert token.remaining() is None
+        token.raise_if_cancelled()
+
+        token.cancel("stop")
+        assert token.cancelled
+        with pytest.raises(ScanCancelled, match="stop"):
+            token.raise_if_cancelled()
+
+    def test_deadline(self):
+        token = CancellationToken(timeout=3600)
+        assert 0 < token.remaining() <= 3600
+        assert not CancellationToken(timeout=3600).cancelled
+        assert CancellationToken(timeout=0).cancelled
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+Unit tests for Categories module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.categories import CATEGORIES, PROJECT_TYPES, CategoryCollector
+from src.filters import FileFilter
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestCategoryCollector:
+    """Test suite for the per-category breakdown."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create media, archives, code and files without an extension."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'movies/trip.MP4': 9000,
+            'movies/clip.mov': 3000,
+            'backups/site.tar.gz': 4000,
+            'backups/old.ZIP': 2000,
+            'code/app.py': 300,
+            'code/README.md': 200,
+            'code/Makefile': 100,
+            'misc/model.blend': 700,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def test_categories_and_extensions(self, temp_dir):
+        """Test totals per category and per lowercase extension."""
+        breakdown = FileOrganizer().get_category_breakdown(temp_dir)
+        assert breakdown['categories'] == [
+            ('video', 2, 12000),
+            ('archives', 2, 6000),
+            ('other', 1, 700),
+            ('python', 1, 300),
+            ('docs', 1, 200),
+            ('no_extension', 1, 100),
+        ]
+        assert breakdown['extensions'][:3] == [
+            ('.mp4', 'video', 1, 9000),
+            ('.gz', 'archives', 1, 4000),
+            ('.mov', 'video', 1, 3000),
+        ]
+        assert ('', 'no_extension', 1, 100) in breakdown['extensions']
+
+    def test_extends_sorter_project_types(self):
+        """Test that every sorter.py mapping is kept."""
+        for ext, category in PROJECT_TYPES.items():
+            assert CATEGORIES[ext] == category
+        assert CATEGORIES['.mkv'] == 'video'
+        assert CATEGORIES['.dmg'] == 'disk_images'
+
+    def test_custom_categories(self, temp_dir):
+        """Test extra mappings in any case, with or without the dot."""
+        breakdown = FileOrganizer().get_category_breakdown(
+            temp_dir, categories={'BLEND': '3d', '.py': 'code'}
+        )
+        totals = {category: size for category, _, size in breakdown['categories']}
+        assert totals['3d'] == 700
+        assert totals['code'] == 300
+        assert 'other' not in totals
+
+    def test_parallel_and_index_match_serial(self, temp_dir):
+        """Test threads, processes and the index against a serial scan."""
+        collector = CategoryCollector({'.blend': '3d'})
+        assert pickle.loads(pickle.dumps(collector)).spawn().category_of('.blend') == '3d'
+
+        organizer = FileOrganizer()
+        serial = organizer.get_category_breakdown(temp_dir)
+        assert organizer.get_category_breakdown(temp_dir, workers=3) == serial
+        assert organizer.get_category_breakdown(temp_dir, workers=2, use_processes=True) == serial
+
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            indexed = FileOrganizer(index=index)
+            assert indexed.get_category_breakdown(temp_dir) == serial
+            videos = FileFilter(extensions=['.mp4', '.mov'])
+            assert indexed.get_category_breakdown(temp_dir, file_filter=videos) == \
+                organizer.get_category_breakdown(temp_dir, file_filter=videos)
+        finally:
+            index.close()
+
+    def test_analyze_directory_collects_in_same_pass(self, temp_dir):
+        """Test the collector as an extra aggregator of analyze_directory()."""
+        report = FileOrganizer().analyze_directory(temp_dir, aggregators=[CategoryCollector()])
+        assert report['categories']['categories'][0] == ('video', 2, 12000)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
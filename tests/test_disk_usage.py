@@ -0,0 +1,215 @@
+"""
+Unit tests for DiskUsage module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.disk_usage import BLOCK_SIZE, DirectoryTreeCollector, LargestDirectoriesCollector
+from src.file_organizer import FileOrganizer, main
+from src.pipeline import ScanPipeline
+from src.scan_index import ScanIndex
+from src.scanner import Scanner
+
+
+class TestDirectoryTree:
+    """Test suite for the du-style directory tree."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a small nested tree with known sizes."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'top.txt': 100,
+            'a/one.bin': 1000,
+            'a/deep/two.bin': 2000,
+            'a/deep/er/three.bin': 3000,
+            'b/four.bin': 4000,
+            'c/only/dirs/five.bin': 500,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _allocated(self, *paths):
+        return sum(os.stat(path).st_blocks * BLOCK_SIZE for path in paths)
+
+    def test_totals_roll_up(self, temp_dir):
+        """Test that every directory holds the sum of everything below it."""
+        tree = FileOrganizer().get_directory_tree(temp_dir)
+
+        assert tree.usage(temp_dir).apparent_size == 10600
+        assert tree.usage(temp_dir).file_count == 6
+        assert tree.usage(os.path.join(temp_dir, 'a')).apparent_size == 6000
+        assert tree.usage(os.path.join(temp_dir, 'a', 'deep')).file_count == 2
+        # Directories holding only subdirectories are part of the tree
+        assert tree.usage(os.path.join(temp_dir, 'c')).apparent_size == 500
+        assert os.path.join(temp_dir, 'c', 'only') in tree
+
+    def test_relative_root(self, temp_dir, monkeypatch):
+        """Test that a relative root still rolls up to the root."""
+        monkeypatch.chdir(temp_dir)
+        tree = FileOrganizer().get_directory_tree('.')
+        assert tree.usage('.').apparent_size == 10600
+        assert tree.usage('a').file_count == 3
+
+    def test_allocated_size_uses_blocks(self, temp_dir):
+        """Test that allocated size comes from st_blocks, like du."""
+        tree = FileOrganizer().get_directory_tree(temp_dir)
+        deep = os.path.join(temp_dir, 'a', 'deep')
+        expected = self._allocated(os.path.join(deep, 'two.bin'),
+                                   os.path.join(deep, 'er', 'three.bin'))
+        assert tree.usage(deep).allocated_size == expected
+
+    def test_hard_links_and_symlinks_count_once(self, temp_dir):
+        """Test that extra names for a file do not add to the totals."""
+        target = os.path.join(temp_dir, 'b', 'four.bin')
+        os.link(target, os.path.join(temp_dir, 'a', 'hard.bin'))
+        os.symlink(target, os.path.join(temp_dir, 'c', 'soft.bin'))
+
+        tree = FileOrganizer().get_directory_tree(temp_dir)
+        assert tree.usage(temp_dir).apparent_size == 10600 + len(target)
+        # The link is attributed to its first path in sort order
+        assert tree.usage(os.path.join(temp_dir, 'a')).apparent_size == 10000
+        assert tree.usage(os.path.join(temp_dir, 'b')).apparent_size == 0
+
+    def test_cli_du_leaves_other_reports_alone(self, temp_dir, monkeypatch, capsys):
+        """Test that --du lstats only its own tree; the other reports follow symlinks."""
+        os.symlink(os.path.join(temp_dir, 'b', 'four.bin'), os.path.join(temp_dir, 'soft.bin'))
+
+        def run(*extra):
+            monkeypatch.setattr(sys, 'argv', ['file_organizer', temp_dir, '--quiet', *extra])
+            main()
+            return capsys.readouterr().out
+
+        plain = run()
+        with_du = run('--du', '1')
+        # The symlink counts as its target everywhere but in the du section
+        assert 'Total size: 14.26 KB' in plain
+        assert with_du.startswith(plain)
+        assert 'Largest Directories' in with_du[len(plain):]
+
+    def test_largest_at_depth(self, temp_dir):
+        """Test ranking directories a fixed number of levels down."""
+        tree = FileOrganizer().get_directory_tree(temp_dir)
+
+        top = tree.largest(temp_dir, top_n=2, depth=1, key='apparent_size')
+        assert [path for path, _ in top] == [
+            os.path.join(temp_dir, 'a'), os.path.join(temp_dir, 'b')
+        ]
+        second = tree.largest(temp_dir, top_n=10, depth=2, key='apparent_size')
+        assert [path for path, _ in second] == [
+            os.path.join(temp_dir, 'a', 'deep'), os.path.join(temp_dir, 'c', 'only')
+        ]
+        assert [path for path, _ in tree.children(os.path.join(temp_dir, 'a'))] == \
+            [os.path.join(temp_dir, 'a', 'deep')]
+
+    def test_parallel_scan_matches_serial(self, temp_dir):
+        """Test that per-worker trees merge into the serial result."""
+        os.link(os.path.join(temp_dir, 'b', 'four.bin'), os.path.join(temp_dir, 'a', 'hard.bin'))
+        trees = []
+        for workers in (1, 3):
+            collector = DirectoryTreeCollector(temp_dir)
+            pipeline = ScanPipeline([collector], Scanner(follow_symlinks=False), workers=workers)
+            trees.append(pipeline.run(temp_dir)['directory_tree'])
+
+        serial, parallel = trees
+        assert len(serial) == len(parallel)
+        for dirpath, _, _ in os.walk(temp_dir):
+            assert serial.usage(dirpath) == parallel.usage(dirpath)
+
+
+class TestLargestDirectories:
+    """Test suite for ranking directories by recursive totals."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create one folder of many small files and one holding a big file."""
+        temp_path = tempfile.mkdtemp()
+        files = {'media/movie.mp4': 50000, 'media/extra/clip.mp4': 8000}
+        for i in range(40):
+            files[f'project/node_modules/pkg{i % 4}/f{i}.js'] = 100
+        files['project/main.py'] = 300
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _rows(self, entries):
+        return [(entry.path, entry.size, entry.file_count) for entry in entries]
+
+    def test_ranks_by_size_and_count(self, temp_dir):
+        """Test both leaderboards against known totals."""
+        ranking = FileOrganizer().find_largest_directories(temp_dir, top_n=3)
+
+        join = os.path.join
+        assert self._rows(ranking['by_size']) == [
+            (join(temp_dir, 'media'), 58000, 2),
+            (join(temp_dir, 'media', 'extra'), 8000, 1),
+            (join(temp_dir, 'project'), 4300, 41),
+        ]
+        assert self._rows(ranking['by_count']) == [
+            (join(temp_dir, 'project'), 4300, 41),
+            (join(temp_dir, 'project', 'node_modules'), 4000, 40),
+            (join(temp_dir, 'project', 'node_modules', 'pkg3'), 1000, 10),
+        ]
+
+    def test_parallel_and_index_match_serial(self, temp_dir):
+        """Test that worker merges and the index give the serial ranking."""
+        serial = FileOrganizer().find_largest_directories(temp_dir, top_n=5)
+        threaded = FileOrganizer().find_largest_directories(temp_dir, top_n=5, workers=3)
+
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            indexed = FileOrganizer(index=index).find_largest_directories(temp_dir, top_n=5)
+            filtered = FileOrganizer(index=index).find_largest_directories(
+                temp_dir, top_n=5, file_extension='.mp4'
+            )
+        finally:
+            index.close()
+
+        assert threaded == serial
+        assert indexed == serial
+        assert filtered == FileOrganizer().find_largest_directories(
+            temp_dir, top_n=5, file_extension='.mp4'
+        )
+
+    def test_memory_is_bounded_by_depth(self, temp_dir):
+        """Test that a depth-first scan only keeps the open directories."""
+        collector = LargestDirectoriesCollector(temp_dir, top_n=2)
+        depth = 0
+        for dirpath, files in Scanner().scan(temp_dir):
+            collector.add_batch(dirpath, files)
+            depth = max(depth, len(collector._chain))
+            assert len(collector._by_size) <= 2
+        assert collector._partial is None
+        assert depth == 4   # root/project/node_modules/pkgN
+
+    def test_invalid_top_n(self, temp_dir):
+        """Test that an empty leaderboard raises ValueError."""
+        with pytest.raises(ValueError):
+            LargestDirectoriesCollector(temp_dir, top_n=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+"""
+Unit tests for Duplicates module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.duplicates import DuplicateFinder, SizeGroupCollector
+from src.file_organizer import FileOrganizer
+from src.hashing import hash_file, hash_sample
+
+
+class TestDuplicateFinder:
+    """Test suite for duplicate detection."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a tree with duplicates, near-duplicates and unique files."""
+        temp_path = tempfile.mkdtemp()
+
+        big = os.urandom(64 * 1024)
+        # Same size, same first and last 4 KB, different middle
+        near = big[:30000] + bytes(1 if b == 0 else 0 for b in big[30000:30010]) + big[30010:]
+        files = {
+            'a/photo.jpg': b'x' * 5000,
+            'b/photo copy.jpg': b'x' * 5000,
+            'c/photo.jpg': b'x' * 5000,
+            'a/other.jpg': b'y' * 5000,          # same size, different content
+            'a/movie.mp4': big,
+            'b/movie.mp4': big,
+            'b/movie-edit.mp4': near,            # caught only by the full hash
+            'unique.txt': b'z' * 123,            # never read
+        }
+        for relpath, data in files.items():
+            path = os.path.join(temp_path, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _path(self, root, relpath):
+        return os.path.join(root, *relpath.split('/'))
+
+    def test_finds_duplicate_groups(self, temp_dir):
+        """Test groups, ordering and reclaimable space."""
+        report = FileOrganizer().find_duplicates(temp_dir)
+
+        groups = [(group.size, group.paths) for group in report['groups']]
+        assert groups == [
+            (64 * 1024, [self._path(temp_dir, 'a/movie.mp4'),
+                         self._path(temp_dir, 'b/movie.mp4')]),
+            (5000, [self._path(temp_dir, 'a/photo.jpg'),
+                    self._path(temp_dir, 'b/photo copy.jpg'),
+                    self._path(temp_dir, 'c/photo.jpg')]),
+        ]
+        assert report['duplicate_files'] == 3
+        assert report['reclaimable_bytes'] == 64 * 1024 + 2 * 5000
+
+    def test_reads_only_what_is_needed(self, temp_dir):
+        """Test that unique sizes are never read and small files are read once."""
+        report = FileOrganizer().find_duplicates(temp_dir)
+
+        assert report['candidates'] == 7
+        assert report['sample_hashed'] == 7
+        # Only the three 64 KB files share a sample that is not the whole file
+        assert report['fully_hashed'] == 3
+        assert report['bytes_read'] == 4 * 5000 + 3 * 8192 + 3 * 64 * 1024
+
+    def test_hard_links_are_not_duplicates(self, temp_dir):
+        """Test that several names for one inode are collapsed."""
+        target = self._path(temp_dir, 'unique.txt')
+        os.link(target, self._path(temp_dir, 'a/unique-link.txt'))
+
+        collector = SizeGroupCollector()
+        collector.add_batch(temp_dir, [('unique.txt', os.stat(target))])
+        collector.add_batch(os.path.join(temp_dir, 'a'),
+                            [('unique-link.txt', os.stat(target))])
+        assert collector.result() == {}
+
+        report = FileOrganizer().find_duplicates(temp_dir)
+        assert report['duplicate_files'] == 3
+
+    def test_min_size_and_extension(self, temp_dir):
+        """Test that filters narrow the candidates."""
+        report = FileOrganizer().find_duplicates(temp_dir, min_size=10000)
+        assert [group.size for group in report['groups']] == [64 * 1024]
+
+        report = FileOrganizer().find_duplicates(temp_dir, file_extension='.jpg')
+        assert [group.size for group in report['groups']] == [5000]
+
+    def test_vanished_file_is_reported(self, temp_dir):
+        """Test that files deleted after the scan are reported, not fatal."""
+        errors = []
+        finder = DuplicateFinder(on_error=lambda path, e: errors.append(path))
+        missing = self._path(temp_dir, 'gone.bin')
+        report = finder.find({5000: [self._path(temp_dir, 'a/photo.jpg'), missing]})
+        assert report['groups'] == []
+        assert errors == [missing]
+
+    def test_invalid_workers(self):
+        """Test that fewer than one hashing thread raises ValueError."""
+        with pytest.raises(ValueError):
+            DuplicateFinder(workers=0)
+
+
+class TestHashing:
+    """Test suite for hashing helpers."""
+
+    def test_sample_of_small_file_equals_full_hash(self, tmp_path):
+        path = tmp_path / "small.bin"
+        path.write_bytes(b'abc' * 1000)
+        assert hash_sample(str(path), 3000, sample_size=4096) == hash_file(str(path))
+
+    def test_mmap_and_read_agree(self, tmp_path):
+        path = tmp_path / "big.bin"
+        path.write_bytes(os.urandom(200000))
+        assert hash_file(str(path), mmap_threshold=0) == hash_file(str(path), mmap_threshold=10**9)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+Unit tests for Error Ledger module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import errno
+import pickle
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.error_ledger import ErrorLedger
+from src.file_organizer import FileOrganizer
+
+
+def _denied(path):
+    return PermissionError(errno.EACCES, "Permission denied", path)
+
+
+class TestErrorLedger:
+    """Test suite for the bounded, per-errno error ledger."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create readable files and dangling symlinks, which fail to stat."""
+        temp_path = tempfile.mkdtemp()
+        for folder, broken in (('ok', 0), ('cache', 4), ('mail', 1)):
+            os.makedirs(os.path.join(temp_path, folder, 'sub'))
+            with open(os.path.join(temp_path, folder, 'file.txt'), 'w') as f:
+                f.write('x' * 10)
+            for index in range(broken):
+                os.symlink(os.path.join(temp_path, 'missing'),
+                           os.path.join(temp_path, folder, 'sub', f'link{index}'))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def test_counts_by_errno_and_top_level_directory(self):
+        """Test aggregation, attribution to the nearest root and bounded examples."""
+        ledger = ErrorLedger(["/", "/data/"], max_examples=2)
+        for index in range(5):
+            ledger(f"/data/private/{index}", _denied(f"/data/private/{index}"))
+        ledger("/System/Library/x", FileNotFoundError(errno.ENOENT, "No such file"))
+        ledger("/data", OSError("no errno"))
+
+        assert len(ledger) == 7
+        assert ledger.by_errno == {errno.EACCES: 5, errno.ENOENT: 1, None: 1}
+        assert ledger.by_directory == {'/data/private': 5, '/System': 1, '/data': 1}
+        assert len(ledger.examples()) == 4
+
+        summary = ledger.summary(top_directories=1)
+        assert summary['by_errno'][0] == ('EACCES', os.strerror(errno.EACCES), 5)
+        assert summary['by_directory'] == [('/data/private', 5)]
+
+        lines = ledger.lines()
+        assert lines[0].startswith("7 entries")
+        assert any('/data/private' in line for line in lines)
+        assert ErrorLedger().lines() == []
+
+    def test_merge_and_pickle(self):
+        """Test that spawned ledgers merge back and survive a process boundary."""
+        ledger = ErrorLedger(["/srv"], max_examples=3)
+        shard = ledger.spawn()
+        for index in range(4):
+            shard(f"/srv/a/{index}", _denied(f"/srv/a/{index}"))
+        ledger("/srv/b/1", _denied("/srv/b/1"))
+
+        ledger.merge(pickle.loads(pickle.dumps(shard)))
+        assert len(ledger) == 5
+        assert ledger.by_directory == {'/srv/a': 4, '/srv/b': 1}
+        assert len(ledger.examples()) == 3
+
+    def test_scan_errors(self, temp_dir, capsys):
+        """Test the organizer's ledger for serial, threaded and process scans."""
+        organizer = FileOrganizer()
+        for options in ({}, {'workers': 3}, {'workers': 2, 'use_processes': True}):
+            organizer.find_largest_files(temp_dir, top_n=5, **options)
+            assert organizer.error_count == 5
+            assert organizer.error_ledger.by_errno == {errno.ENOENT: 5}
+            assert organizer.error_ledger.by_directory == {
+                os.path.join(temp_dir, 'cache'): 4,
+                os.path.join(temp_dir, 'mail'): 1,
+            }
+            assert len(organizer.errors) == 5
+
+        capsys.readouterr()
+        organizer.print_results([(10, "a")])
+        output = capsys.readouterr().out
+        assert "5 entries could not be read" in output
+        assert os.path.join(temp_dir, 'cache') in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,177 @@
+"""
+Unit tests for Exclusions module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.exclusions import COMMON_PATTERNS, RULE_FILE, Exclusions, RuleSet
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+from src.scanner import Scanner
+
+
+class TestRuleSyntax:
+    """Test suite for .gitignore pattern semantics."""
+
+    def _verdict(self, lines, relpath, is_dir=False):
+        prefix, _, name = relpath.rpartition('/')
+        return RuleSet(lines).verdict(prefix + '/' if prefix else '', name, is_dir)
+
+    def test_unanchored_patterns_match_at_any_depth(self):
+        """Test that patterns without a slash match the name anywhere."""
+        assert self._verdict(['*.log'], 'a/b/app.log')
+        assert self._verdict(['build'], 'src/build', is_dir=True)
+        assert self._verdict(['*.log'], 'app.log.1') is None
+
+    def test_anchored_patterns(self):
+        """Test that a leading or inner slash anchors to the base directory."""
+        assert self._verdict(['/build'], 'build', is_dir=True)
+        assert self._verdict(['/build'], 'src/build', is_dir=True) is None
+        assert self._verdict(['doc/*.txt'], 'doc/notes.txt')
+        assert self._verdict(['doc/*.txt'], 'doc/sub/notes.txt') is None
+
+    def test_double_star(self):
+        """Test leading, inner and trailing '**'."""
+        assert self._verdict(['**/cache'], 'a/b/cache', is_dir=True)
+        assert self._verdict(['docs/**/*.md'], 'docs/a/b/x.md')
+        assert self._verdict(['docs/**/*.md'], 'docs/x.md')
+        assert self._verdict(['out/**'], 'out/a/b')
+
+    def test_directory_only_and_negation(self):
+        """Test trailing slashes and last-match-wins re-inclusion."""
+        assert self._verdict(['tmp/'], 'tmp', is_dir=False) is None
+        assert self._verdict(['tmp/'], 'tmp', is_dir=True)
+        rules = ['*.log', '!keep.log']
+        assert self._verdict(rules, 'x/keep.log') is False
+        assert self._verdict(rules, 'x/drop.log') is True
+
+    def test_comments_escapes_and_classes(self):
+        """Test comments, escaped specials and character classes."""
+        assert len(RuleSet(['# comment', '', '   '])) == 0
+        assert self._verdict([r'\#notes'], '#notes')
+        assert self._verdict(['file[0-9].txt'], 'file7.txt')
+        assert self._verdict(['file[!0-9].txt'], 'file7.txt') is None
+
+
+class TestExclusions:
+    """Test suite for pruning scans with exclusion rules."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a project with dependency and cache folders."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'app/main.py': 100,
+            'app/node_modules/pkg/index.js': 5000,
+            'app/node_modules/pkg/deep/more.js': 5000,
+            'app/__pycache__/main.pyc': 300,
+            'app/logs/run.log': 700,
+            'app/logs/keep.log': 800,
+            'vm/disk.vmdk': 9000,
+            'media/movie.mp4': 4000,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _names(self, organizer, root, **options):
+        return sorted(os.path.basename(path) for _, path in
+                      organizer.find_largest_files(root, top_n=50, **options))
+
+    def test_excluded_directories_are_pruned(self, temp_dir):
+        """Test that excluded subtrees are never listed and are counted."""
+        listed = []
+        scanner = Scanner(exclusions=Exclusions(patterns=COMMON_PATTERNS))
+        original = scanner.scan_directory
+        scanner.scan_directory = lambda path: listed.append(path) or original(path)
+
+        files = sorted(name for _, batch in scanner.scan(temp_dir) for name, _ in batch)
+        assert files == ['keep.log', 'main.py', 'movie.mp4', 'run.log']
+        assert not any('node_modules' in path or '__pycache__' in path for path in listed)
+        # node_modules, __pycache__ and disk.vmdk
+        assert scanner.pruned_count == 3
+
+    def test_rule_files_are_read_per_directory(self, temp_dir):
+        """Test that .scanignore rules apply below their directory and can re-include."""
+        with open(os.path.join(temp_dir, RULE_FILE), 'w') as f:
+            f.write("*.log\nnode_modules/\n")
+        with open(os.path.join(temp_dir, 'app', 'logs', RULE_FILE), 'w') as f:
+            f.write("!keep.log\n")
+
+        organizer = FileOrganizer(exclusions=Exclusions())
+        assert self._names(organizer, temp_dir) == \
+            ['disk.vmdk', 'keep.log', 'main.py', 'main.pyc', 'movie.mp4']
+        assert organizer.pruned_count == 2
+
+        # Turned off, the rule files are just files
+        plain = FileOrganizer(exclusions=Exclusions(rule_file=None))
+        assert 'run.log' in self._names(plain, temp_dir)
+
+    def test_global_and_per_root_patterns(self, temp_dir):
+        """Test absolute global patterns and patterns relative to a root."""
+        media = os.path.join(temp_dir, 'media')
+        organizer = FileOrganizer(exclusions=Exclusions(
+            patterns=[media + '/'],
+            root_patterns={temp_dir: ['/app/', 'vm/*.vmdk']}
+        ))
+        assert self._names(organizer, temp_dir) == []
+
+        organizer = FileOrganizer(exclusions=Exclusions(root_patterns={temp_dir: ['/logs/']}))
+        # Anchored to the root, so app/logs is not affected
+        assert 'run.log' in self._names(organizer, temp_dir)
+
+    def test_threads_and_processes_match_serial(self, temp_dir):
+        """Test that rules and rule files reach every worker."""
+        with open(os.path.join(temp_dir, 'app', RULE_FILE), 'w') as f:
+            f.write("logs/\n")
+        rules = Exclusions(patterns=['node_modules/'])
+        assert pickle.loads(pickle.dumps(rules)).is_excluded('/x/node_modules', is_dir=True)
+
+        serial = FileOrganizer(exclusions=rules).find_largest_files(temp_dir, 50)
+        threaded = FileOrganizer(exclusions=rules)
+        assert threaded.find_largest_files(temp_dir, 50, workers=3) == serial
+        assert threaded.pruned_count == 2
+        pooled = FileOrganizer(exclusions=rules)
+        assert pooled.find_largest_files(temp_dir, 50, workers=2, use_processes=True) == serial
+        assert pooled.pruned_count == 2
+
+    def test_index_skips_excluded_entries(self, temp_dir):
+        """Test that an index never stores excluded subtrees and resets on new rules."""
+        db_path = os.path.join(tempfile.mkdtemp(), 'index.db')
+        index = ScanIndex(db_path, exclusions=Exclusions(patterns=['node_modules/', '*.vmdk']))
+        try:
+            summary = index.refresh(temp_dir)
+            assert summary['pruned'] == 2
+            indexed = [path for _, path in index.largest_files(temp_dir, 50)]
+            assert not any('node_modules' in path or path.endswith('.vmdk') for path in indexed)
+            assert index.refresh(temp_dir)['scanned'] == 0
+        finally:
+            index.close()
+
+        reopened = ScanIndex(db_path)
+        try:
+            # Built with other rules, so the index starts over
+            assert reopened.largest_files(temp_dir, 1) == []
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Unit tests for Export module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import io
+import csv
+import gzip
+import json
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.export import ExportWriter, FileExporter, detect_format, export_rows
+from src.disk_usage import RankedDirectory
+from src.file_organizer import FileOrganizer
+from src.pipeline import ScanPipeline
+from src.scan_index import ScanIndex
+
+
+class TestExport:
+    """Test suite for the streaming NDJSON/CSV export."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a tree to scan and a separate directory for the exports."""
+        temp_path = tempfile.mkdtemp()
+        tree = os.path.join(temp_path, 'tree')
+        files = {
+            'a.txt': 10,
+            'b, with comma.bin': 20,
+            'sub/c.log': 30,
+            'sub/deeper/d "quoted".dat': 40,
+            'other/e.bin': 50,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(tree, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _read(self, path):
+        """Read an export back as a list of dicts."""
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8', newline='') as f:
+            if '.csv' in path:
+                return list(csv.DictReader(f))
+            return [json.loads(line) for line in f]
+
+    def _expected(self, temp_dir):
+        tree = os.path.join(temp_dir, 'tree')
+        return sorted(
+            (os.path.join(dirpath, name), os.path.getsize(os.path.join(dirpath, name)))
+            for dirpath, _, names in os.walk(tree) for name in names
+        )
+
+    def test_detect_format(self):
+        """Test that the format and compression follow the file name."""
+        assert detect_format("files.CSV") == ("csv", False)
+        assert detect_format("files.ndjson.gz") == ("ndjson", True)
+        assert detect_format("files.jsonl") == ("ndjson", False)
+        with pytest.raises(ValueError):
+            detect_format("files.txt")
+        with pytest.raises(ValueError):
+            ExportWriter(io.BytesIO(), ["a"])
+
+    def test_writer_formats(self, temp_dir):
+        """Test CSV quoting, NDJSON values and gzip across batch boundaries."""
+        rows = [(f"/tmp/file {i}, \"{i}\"", i, i / 2) for i in range(10000)]
+        for name in ['rows.csv', 'rows.ndjson.gz']:
+            path = os.path.join(temp_dir, name)
+            with ExportWriter(path, ['path', 'size', 'mtime']) as writer:
+                assert writer.write_rows(rows) == len(rows)
+            back = self._read(path)
+            assert len(back) == len(rows)
+            if name.endswith('.csv'):
+                assert back[7] == {'path': rows[7][0], 'size': '7', 'mtime': '3.5'}
+            else:
+                assert back[7] == {'path': rows[7][0], 'size': 7, 'mtime': 3.5}
+
+        # A file object is flushed but left open
+        buffer = io.BytesIO()
+        with ExportWriter(buffer, ['size'], format='csv', header=False) as writer:
+            writer.write_row((1,))
+        assert buffer.getvalue() == b'1\r\n'
+
+    def test_export_rows_namedtuples(self, temp_dir):
+        """Test that NamedTuple rows supply the column names."""
+        path = os.path.join(temp_dir, 'folders.ndjson')
+        ranking = [RankedDirectory('/a', 300, 3), RankedDirectory('/b', 200, 1)]
+        assert export_rows(path, ranking) == 2
+        assert self._read(path)[0] == {'path': '/a', 'size': 300, 'file_count': 3}
+
+        assert export_rows(os.path.join(temp_dir, 'empty.csv'), []) == 0
+        with pytest.raises(ValueError):
+            export_rows(path, [(1, '/a')])
+
+    @pytest.mark.parametrize("workers,use_processes", [(1, False), (3, False), (2, True)])
+    def test_file_exporter_parallel(self, temp_dir, workers, use_processes):
+        """Test that serial, threaded and process scans export every file once."""
+        path = os.path.join(temp_dir, 'files.csv.gz')
+        with FileExporter(path, spill_dir=temp_dir) as exporter:
+            ScanPipeline([exporter], workers=workers, use_processes=use_processes).run(
+                os.path.join(temp_dir, 'tree'))
+        assert exporter.result() == 5
+
+        rows = self._read(path)
+        assert sorted((row['path'], int(row['size'])) for row in rows) == self._expected(temp_dir)
+        assert all(float(row['mtime']) > 0 for row in rows)
+        # Part files are appended and removed
+        assert not [name for name in os.listdir(temp_dir) if name.endswith('.part')]
+
+    def test_export_files_scan_and_index(self, temp_dir):
+        """Test that the organizer exports the same rows with and without an index."""
+        tree = os.path.join(temp_dir, 'tree')
+        organizer = FileOrganizer(quiet=True)
+        path = os.path.join(temp_dir, 'scan.ndjson')
+        assert organizer.export_files(tree, path) == 5
+        scanned = sorted((row['path'], row['size']) for row in self._read(path))
+        assert scanned == self._expected(temp_dir)
+
+        index = ScanIndex(os.path.join(temp_dir, 'index.db'))
+        try:
+            organizer = FileOrganizer(index=index, quiet=True)
+            path = os.path.join(temp_dir, 'index.ndjson')
+            assert organizer.export_files(tree, path, file_extension='.bin') == 2
+            indexed = sorted((row['path'], row['size']) for row in self._read(path))
+            assert indexed == [entry for entry in scanned if entry[0].endswith('.bin')]
+        finally:
+            index.close()
+
+    def test_file_exporter_records(self, temp_dir):
+        """Test that collected FileRecords export like scanned files."""
+        tree = os.path.join(temp_dir, 'tree')
+        index = ScanIndex(os.path.join(temp_dir, 'index.db'))
+        try:
+            largest = FileOrganizer(index=index, quiet=True).find_largest_records(tree, top_n=2)
+        finally:
+            index.close()
+
+        path = os.path.join(temp_dir, 'largest.csv')
+        with FileExporter(path) as exporter:
+            assert exporter.add_records(largest) == 2
+        assert exporter.result() == 2
+
+        rows = self._read(path)
+        assert [row['path'] for row in rows] == [record.path for record in largest]
+        assert [int(row['size']) for row in rows] == [50, 40]
+        mtime = os.stat(os.path.join(tree, 'other', 'e.bin')).st_mtime
+        assert float(rows[0]['mtime']) == pytest.approx(mtime)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Unit tests for External Sort module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import random
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.external_sort import SortedFiles
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestSortedFiles:
+    """Test suite for size-ordered listings that spill to disk."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a few hundred files of random sizes in nested folders."""
+        temp_path = tempfile.mkdtemp()
+        rng = random.Random(7)
+        for index in range(300):
+            folder = os.path.join(temp_path, f"d{index % 7}", f"e{index % 3}")
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, f"f{index}.bin"), 'wb') as f:
+                f.write(b'x' * rng.randrange(0, 4000))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def spill_dir(self):
+        """Directory holding the run files, to check they are cleaned up."""
+        path = tempfile.mkdtemp()
+        yield path
+        shutil.rmtree(path)
+
+    def _expected(self, root):
+        pairs = []
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                pairs.append((os.path.getsize(path), path))
+        return sorted(pairs, reverse=True)
+
+    def test_spilled_runs_merge_in_order(self, spill_dir):
+        """Test ordering across runs, including odd paths and equal sizes."""
+        rng = random.Random(1)
+        pairs = [(rng.randrange(50), f"/x/{i}\n\udcff-ü") for i in range(2000)]
+        with SortedFiles(memory_budget=4096, spill_dir=spill_dir) as listing:
+            listing.add_pairs(pairs)
+            assert listing.run_count > 5
+            assert list(listing) == sorted(pairs, reverse=True)
+            # Iterating again reads the runs again
+            assert len(list(listing)) == len(listing) == 2000
+        assert os.listdir(spill_dir) == []
+
+    def test_limit_truncates_runs(self, spill_dir):
+        """Test that a limit keeps the exact top entries and rejects small files early."""
+        pairs = [(size, f"/f{size}") for size in range(5000)]
+        random.Random(2).shuffle(pairs)
+        with SortedFiles(limit=50, memory_budget=8192, spill_dir=spill_dir) as listing:
+            listing.add_pairs(pairs)
+            assert list(listing) == sorted(pairs, reverse=True)[:50]
+            assert len(listing) == 50
+
+        with pytest.raises(ValueError):
+            SortedFiles(limit=0)
+
+    def test_all_files_from_scan(self, temp_dir, spill_dir):
+        """Test find_largest_files('all') and a tiny budget against os.walk."""
+        organizer = FileOrganizer()
+        expected = self._expected(temp_dir)
+        assert organizer.find_largest_files(temp_dir, top_n="all") == expected
+        assert organizer.find_largest_files(temp_dir, top_n=250) == expected[:250]
+
+        with organizer.iter_sorted_files(temp_dir, memory_budget=2048,
+                                         spill_dir=spill_dir) as listing:
+            assert listing.run_count > 1
+            assert list(listing) == expected
+        assert os.listdir(spill_dir) == []
+
+    def test_large_top_n_sorts_on_disk(self, temp_dir, monkeypatch):
+        """Test that a top_n above the heap limit goes through the external sort."""
+        expected = self._expected(temp_dir)
+        organizer = FileOrganizer()
+        calls = []
+        iter_sorted_files = organizer.iter_sorted_files
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return iter_sorted_files(*args, **kwargs)
+
+        monkeypatch.setattr(organizer, 'iter_sorted_files', spy)
+        monkeypatch.setattr('src.file_organizer._HEAP_LIMIT', 100)
+        assert organizer.find_largest_files(temp_dir, top_n=150) == expected[:150]
+        assert organizer.find_largest_files(temp_dir, top_n=100) == expected[:100]
+        assert calls == [(temp_dir, 150)]
+
+    def test_threads_and_processes_hand_over_runs(self, temp_dir, spill_dir):
+        """Test that run files written by workers survive until the merge."""
+        expected = self._expected(temp_dir)
+        organizer = FileOrganizer()
+        for options in ({'workers': 3}, {'workers': 2, 'use_processes': True}):
+            with organizer.iter_sorted_files(temp_dir, memory_budget=2048, spill_dir=spill_dir,
+                                             **options) as listing:
+                assert list(listing) == expected
+            assert os.listdir(spill_dir) == []
+
+        listing = SortedFiles(memory_budget=512, spill_dir=spill_dir)
+        listing.add_pairs((size, f"/p{size}") for size in range(100))
+        copy = pickle.loads(pickle.dumps(listing))
+        # The runs moved to the copy
+        assert listing.run_count == 0 and copy.run_count > 0
+        del listing
+        assert len(list(copy)) == 100
+        del copy
+        assert os.listdir(spill_dir) == []
+
+    def test_index_listing(self, temp_dir):
+        """Test all files and top N from an index."""
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            organizer = FileOrganizer(index=index)
+            expected = self._expected(temp_dir)
+            assert organizer.find_largest_files(temp_dir, top_n="all") == expected
+            assert organizer.find_largest_files(temp_dir, top_n=150) == expected[:150]
+        finally:
+            index.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -15,6 +15,7 @@ import shutil
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
 
 
 class TestFileOrganizer:
@@ -117,6 +118,63 @@ class TestFileOrganizer:
         assert len(result) == 1
         assert result[0][1].endswith('.pdf')
 
+    def test_iter_largest_files_final_snapshot(self, temp_dir):
+        """Test that the last leaderboard snapshot matches find_largest_files."""
+        organizer = FileOrganizer()
+        snapshots = list(organizer.iter_largest_files(temp_dir, top_n=3))
+
+        assert snapshots
+        assert all(len(snapshot) <= 3 for snapshot in snapshots)
+        assert snapshots[-1] == organizer.find_largest_files(temp_dir, top_n=3)
+
+    def test_iter_largest_files_validates_eagerly(self, temp_dir):
+        """Test that invalid arguments raise before iteration starts."""
+        organizer = FileOrganizer()
+
+        with pytest.raises(ValueError):
+            organizer.iter_largest_files(temp_dir, top_n=0)
+
+    def test_find_largest_files_workers_match_serial(self, temp_dir):
+        """Test that the threaded scan returns exactly the serial results."""
+        organizer = FileOrganizer()
+        serial = organizer.find_largest_files(temp_dir, top_n=4)
+        threaded = organizer.find_largest_files(temp_dir, top_n=4, workers=4)
+        assert threaded == serial
+        assert organizer.scan_count == 6
+
+    def test_find_largest_files_processes_match_serial(self, temp_dir):
+        """Test that the process-pool scan returns exactly the serial results."""
+        organizer = FileOrganizer()
+        serial = organizer.find_largest_files(temp_dir, top_n=4, file_extension='.txt')
+        sharded = organizer.find_largest_files(
+            temp_dir, top_n=4, file_extension='.txt', workers=2, use_processes=True
+        )
+        assert sharded == serial
+
+    def test_find_largest_files_multiple_roots(self, temp_dir):
+        """Test scanning several roots in one call."""
+        other = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(other, 'giant.bin'), 'wb') as f:
+                f.write(b'0' * 200000)
+
+            organizer = FileOrganizer()
+            result = organizer.find_largest_files([temp_dir, other], top_n=2)
+            assert result[0] == (200000, os.path.join(other, 'giant.bin'))
+            assert organizer.scan_count == 7
+
+            with pytest.raises(FileNotFoundError):
+                organizer.find_largest_files([temp_dir, "/nonexistent/path"])
+        finally:
+            shutil.rmtree(other)
+
+    def test_find_largest_files_invalid_workers(self, temp_dir):
+        """Test that workers below 1 raises ValueError."""
+        organizer = FileOrganizer()
+
+        with pytest.raises(ValueError):
+            organizer.find_largest_files(temp_dir, workers=0)
+
     def test_find_largest_files_invalid_top_n(self, temp_dir):
         """Test that invalid top_n raises ValueError."""
         organizer = FileOrganizer()
@@ -125,7 +183,11 @@ class TestFileOrganizer:
             organizer.find_largest_files(temp_dir, top_n=0)
 
         with pytest.raises(ValueError):
-            organizer.find_largest_files(temp_dir, top_n=101)
+            organizer.find_largest_files(temp_dir, top_n="most")
+
+        # There is no upper cap any more
+        assert len(organizer.find_largest_files(temp_dir, top_n=1000)) == \
+            len(organizer.find_largest_files(temp_dir, top_n="all"))
 
     def test_find_largest_files_invalid_path(self):
         """Test that invalid path raises FileNotFoundError."""
@@ -195,6 +257,57 @@ class TestFileOrganizer:
         # Average should be total / count
         assert stats['average_file_size'] == expected_size / 6
 
+    def test_get_directory_stats_workers_match_serial(self, temp_dir):
+        """Test that threaded directory stats equal the serial ones."""
+        organizer = FileOrganizer()
+        assert organizer.get_directory_stats(temp_dir, workers=3) == \
+            organizer.get_directory_stats(temp_dir)
+
+    def test_analyze_directory_single_pass(self, temp_dir):
+        """Test that analyze_directory matches the two separate scans."""
+        organizer = FileOrganizer()
+        report = organizer.analyze_directory(temp_dir, top_n=3)
+
+        assert report['largest_files'] == organizer.find_largest_files(temp_dir, top_n=3)
+        assert report['stats'] == organizer.get_directory_stats(temp_dir)
+        assert dict((ext, count) for ext, count, _ in report['extensions']) == {
+            '.txt': 4, '.pdf': 1, '.mp4': 1
+        }
+        assert sum(count for _, _, count, _ in report['histogram']) == 6
+
+    def test_size_distribution(self, temp_dir):
+        """Test percentiles from a scan, from the index and in analyze_directory."""
+        organizer = FileOrganizer()
+        distribution = organizer.get_size_distribution(temp_dir, include_hidden=False)
+        sizes = sorted(size for size, _ in organizer.find_largest_files(temp_dir, top_n=10))
+
+        assert distribution['file_count'] == 6
+        assert distribution['total_size'] == sum(sizes)
+        # Nearest rank: the 3rd of 6 sizes (within the 0.8% bin precision)
+        assert distribution['p50'] == pytest.approx(sizes[2], rel=1 / 128)
+        assert distribution['top1_size'] == pytest.approx(sizes[-1], rel=1 / 128)
+        assert organizer.analyze_directory(temp_dir)['distribution'] == distribution
+
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            assert FileOrganizer(index=index).get_size_distribution(temp_dir) == distribution
+        finally:
+            index.close()
+
+    def test_analyze_directory_hidden_files_consistent(self, temp_dir):
+        """Test that leaderboard and stats agree on hidden files."""
+        with open(os.path.join(temp_dir, '.secret'), 'wb') as f:
+            f.write(b'0' * 500000)
+
+        organizer = FileOrganizer()
+        report = organizer.analyze_directory(temp_dir, top_n=1)
+        assert report['stats']['file_count'] == 6
+        assert 'huge.pdf' in report['largest_files'][0][1]
+
+        report = organizer.analyze_directory(temp_dir, top_n=1, include_hidden=True)
+        assert report['stats']['file_count'] == 7
+        assert '.secret' in report['largest_files'][0][1]
+
     def test_print_results_no_exception(self, temp_dir):
         """Test that print_results doesn't raise exceptions."""
         organizer = FileOrganizer()
@@ -0,0 +1,175 @@
+"""
+Unit tests for Filters module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.filters import FileFilter, as_filter, parse_size, parse_time
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+from src.scanner import Scanner
+
+
+class TestFileFilter:
+    """Test suite for compiled file filters."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create files with mixed-case names, sizes and ages."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'photos/IMG_0001.JPG': 3000,
+            'photos/IMG_0002.jpg': 1000,
+            'photos/IMG_0003.heic': 5000,
+            'photos/screenshot.png': 2000,
+            'logs/app.log.1': 400,
+            'logs/app.log': 600,
+            'docs/report.PDF': 7000,
+            'docs/notes.txt': 50,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+        # A week-old file for the time bounds
+        old = os.path.join(temp_path, 'docs', 'notes.txt')
+        week_ago = time.time() - 7 * 86400
+        os.utime(old, (week_ago, week_ago))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _names(self, results):
+        return sorted(os.path.basename(path) for _, path in results)
+
+    def test_extensions_ignore_case(self, temp_dir):
+        """Test several extensions matched in any case."""
+        photos = FileFilter(extensions=['.jpg', 'heic'])
+        results = FileOrganizer().find_largest_files(temp_dir, top_n=20, file_filter=photos)
+        assert self._names(results) == ['IMG_0001.JPG', 'IMG_0002.jpg', 'IMG_0003.heic']
+
+        exact = FileFilter(extensions=['.jpg'], case_sensitive=True)
+        assert not exact.match_name('IMG_0001.JPG')
+        assert exact.match_name('IMG_0002.jpg')
+
+    def test_globs_and_regex(self, temp_dir):
+        """Test shell patterns and regular expressions on the name."""
+        organizer = FileOrganizer()
+        by_glob = FileFilter(globs=['img_*', '*.png'])
+        assert self._names(organizer.find_largest_files(temp_dir, 20, file_filter=by_glob)) == \
+            ['IMG_0001.JPG', 'IMG_0002.jpg', 'IMG_0003.heic', 'screenshot.png']
+
+        rotated = FileFilter(regex=r'\.log\.\d+$')
+        assert self._names(organizer.find_largest_files(temp_dir, 20, file_filter=rotated)) == \
+            ['app.log.1']
+
+        # Different kinds of conditions must all hold
+        both = FileFilter(extensions=['.jpg'], globs=['*0001*'])
+        assert self._names(organizer.find_largest_files(temp_dir, 20, file_filter=both)) == \
+            ['IMG_0001.JPG']
+
+    def test_size_and_time_bounds(self, temp_dir):
+        """Test inclusive size bounds and modification-time bounds."""
+        organizer = FileOrganizer()
+        mid = FileFilter(min_size=1000, max_size=3000)
+        largest = organizer.find_largest_files(temp_dir, 20, file_filter=mid)
+        assert [size for size, _ in largest] == [3000, 2000, 1000]
+
+        yesterday = time.time() - 86400
+        recent = organizer.find_largest_files(
+            temp_dir, 20, file_filter=FileFilter(modified_after=yesterday)
+        )
+        old = organizer.find_largest_files(
+            temp_dir, 20, file_filter=FileFilter(modified_before=yesterday)
+        )
+        assert len(recent) == 7
+        assert self._names(old) == ['notes.txt']
+
+    def test_name_predicate_runs_before_stat(self, temp_dir):
+        """Test that files rejected by name never reach the stat predicate."""
+        seen = []
+        photos = FileFilter(extensions=['.jpg'])
+
+        def stat_filter(st):
+            seen.append(st.st_size)
+            return True
+
+        scanner = Scanner(file_filter=photos.name_predicate(), stat_filter=stat_filter)
+        files = [name for _, batch in scanner.scan(temp_dir) for name, _ in batch]
+        assert sorted(files) == ['IMG_0001.JPG', 'IMG_0002.jpg']
+        assert sorted(seen) == [1000, 3000]
+
+    def test_process_scan_matches_serial(self, temp_dir):
+        """Test that the filter is shipped to worker processes."""
+        wanted = FileFilter(extensions=['.jpg', '.pdf'], min_size=2000)
+        assert pickle.loads(pickle.dumps(wanted)).match_name('REPORT.pdf')
+
+        organizer = FileOrganizer()
+        serial = organizer.find_largest_files(temp_dir, 20, file_filter=wanted)
+        pooled = organizer.find_largest_files(temp_dir, 20, workers=2, use_processes=True,
+                                              file_filter=wanted)
+        assert pooled == serial
+        assert self._names(serial) == ['IMG_0001.JPG', 'report.PDF']
+
+    def test_index_matches_scan(self, temp_dir):
+        """Test that index queries apply the same filters as a scan."""
+        filters = [
+            FileFilter(extensions=['.jpg', '.PDF']),
+            FileFilter(globs=['IMG_*'], max_size=3000),
+            FileFilter(regex=r'^app\.log'),
+            FileFilter(min_size=500, modified_after=time.time() - 86400),
+        ]
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            indexed = FileOrganizer(index=index)
+            for file_filter in filters:
+                expected = FileOrganizer().find_largest_files(temp_dir, 20, file_filter=file_filter)
+                assert indexed.find_largest_files(temp_dir, 20, file_filter=file_filter) == expected
+                assert indexed.find_largest_directories(temp_dir, 5, file_filter=file_filter) == \
+                    FileOrganizer().find_largest_directories(temp_dir, 5, file_filter=file_filter)
+        finally:
+            index.close()
+
+    def test_legacy_extension_argument(self, temp_dir):
+        """Test that file_extension stays a single case-sensitive suffix."""
+        results = FileOrganizer().find_largest_files(temp_dir, 20, file_extension='.jpg')
+        assert self._names(results) == ['IMG_0002.jpg']
+        with pytest.raises(ValueError):
+            as_filter('.jpg', FileFilter(extensions=['.png']))
+
+    def test_invalid_filters(self):
+        """Test that inverted bounds and bad patterns raise ValueError."""
+        with pytest.raises(ValueError):
+            FileFilter(min_size=10, max_size=5)
+        with pytest.raises(ValueError):
+            FileFilter(regex='(unclosed')
+        with pytest.raises(ValueError):
+            FileFilter(modified_after=parse_time('2025-02-01'),
+                       modified_before=parse_time('2025-01-01'))
+
+    def test_parse_size(self):
+        """Test human-readable sizes in binary units."""
+        assert parse_size('500') == 500
+        assert parse_size('10K') == 10 * 1024
+        assert parse_size('1.5g') == int(1.5 * 1024 ** 3)
+        assert parse_size('2 MB') == 2 * 1024 ** 2
+        with pytest.raises(ValueError):
+            parse_size('lots')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
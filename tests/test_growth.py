@@ -0,0 +1,139 @@
+"""
+Unit tests for Growth module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import time
+import shutil
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.growth import DAY, FOLDER, VOLUME, FolderTotals, GrowthStore, fit_rate, mount_point
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestGrowth:
+    """Test suite for folder totals, the ring-buffer store and forecasts."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a two-level tree with files at every level."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'top.bin': 1,
+            'a/x.bin': 2,
+            'a/b/y.bin': 5,
+            'a/b/c/z.bin': 10,
+            'd/w.bin': 20,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def store(self):
+        """In-memory growth store."""
+        with GrowthStore(":memory:", capacity=4) as store:
+            yield store
+
+    def test_folder_totals_depth(self, temp_dir):
+        """Test that totals are recursive and stop at the requested depth."""
+        totals = FolderTotals(temp_dir, depth=2)
+        for dirpath, size in [(temp_dir, 1), (os.path.join(temp_dir, 'a'), 2),
+                              (os.path.join(temp_dir, 'a', 'b'), 5),
+                              (os.path.join(temp_dir, 'a', 'b', 'c'), 10),
+                              (os.path.join(temp_dir, 'd'), 20), ('/elsewhere', 99)]:
+            totals.add_totals(dirpath, size)
+
+        other = totals.spawn()
+        other.add_totals(os.path.join(temp_dir, 'd'), 100)
+        totals.merge(other)
+
+        assert totals.result() == {
+            temp_dir: 138,
+            os.path.join(temp_dir, 'a'): 17,
+            os.path.join(temp_dir, 'a', 'b'): 15,
+            os.path.join(temp_dir, 'd'): 120,
+        }
+        with pytest.raises(ValueError):
+            FolderTotals(temp_dir, depth=-1)
+
+    def test_ring_buffer_keeps_latest_samples(self, store):
+        """Test that a full series overwrites its oldest samples."""
+        for day in range(6):
+            store.record_volume("/data", used=1000 * day, capacity=10 ** 6, when=day * DAY)
+
+        assert store.series("/data", VOLUME) == [(2 * DAY, 2000), (3 * DAY, 3000),
+                                                 (4 * DAY, 4000), (5 * DAY, 5000)]
+        assert store.series("/data", VOLUME, since=4 * DAY) == [(4 * DAY, 4000), (5 * DAY, 5000)]
+        assert store.series("/data", FOLDER) == []
+
+    def test_fit_rate(self):
+        """Test the least-squares slope in bytes per day."""
+        assert fit_rate([]) == 0.0
+        assert fit_rate([(0.0, 5)]) == 0.0
+        assert fit_rate([(DAY, 5), (DAY, 9)]) == 0.0
+        assert fit_rate([(2 * DAY, 300), (0.0, 100), (DAY, 200)]) == pytest.approx(100.0)
+        assert fit_rate([(0.0, 500), (DAY, 0)]) == pytest.approx(-500.0)
+
+    def test_forecast(self, store, temp_dir):
+        """Test the days left and the growing folders on the volume."""
+        volume = mount_point(temp_dir)
+        now = time.time()
+        for day in range(3):
+            store.record_volume(volume, used=day * 10 ** 9, capacity=10 ** 12,
+                                when=now - (2 - day) * DAY)
+
+        forecast = store.forecast(temp_dir, top_n=5)
+        usage = shutil.disk_usage(volume)
+        assert forecast.volume == volume
+        assert forecast.samples == 3
+        assert forecast.rate == pytest.approx(10 ** 9)
+        assert forecast.days_left == pytest.approx((usage.total - usage.used) / 10 ** 9, rel=0.01)
+        assert forecast.folders == []
+
+        # Folder series fitted over the same window; shrinking ones are left out
+        grows = os.path.join(temp_dir, 'a')
+        shrinks = os.path.join(temp_dir, 'd')
+        store.record({grows: 100, shrinks: 900}, when=now - DAY)
+        store.record({grows: 400, shrinks: 600}, when=now)
+        trends = store.forecast(temp_dir).folders
+        assert [(trend.path, trend.size, trend.samples) for trend in trends] == [(grows, 400, 2)]
+        assert trends[0].rate == pytest.approx(300.0)
+
+    def test_record_growth_scan_and_index(self, temp_dir, store):
+        """Test that scanning and the scan index record the same totals."""
+        expected = {
+            temp_dir: 38,
+            os.path.join(temp_dir, 'a'): 17,
+            os.path.join(temp_dir, 'd'): 20,
+        }
+        assert FileOrganizer(quiet=True).record_growth(temp_dir, store=store) == expected
+
+        index = ScanIndex(":memory:")
+        try:
+            organizer = FileOrganizer(index=index, quiet=True)
+            assert organizer.record_growth(temp_dir, store=store) == expected
+        finally:
+            index.close()
+
+        assert [size for _, size in store.series(os.path.join(temp_dir, 'a'))] == [17, 17]
+        assert len(store.series(mount_point(temp_dir), VOLUME)) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
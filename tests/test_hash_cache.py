@@ -0,0 +1,123 @@
+"""
+Unit tests for HashCache module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.hash_cache import HashCache
+from src.hashing import hash_file, hash_sample
+from src.file_organizer import FileOrganizer
+
+
+class TestHashCache:
+    """Test suite for HashCache class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a directory with a few files and room for a cache database."""
+        temp_path = tempfile.mkdtemp()
+        for name, data in [('a.bin', b'a' * 20000), ('b.bin', b'a' * 20000),
+                           ('c.bin', b'c' * 20000)]:
+            with open(os.path.join(temp_path, name), 'wb') as f:
+                f.write(data)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def cache_path(self, temp_dir):
+        return os.path.join(temp_dir, 'cache.db')
+
+    def test_second_lookup_is_a_hit(self, temp_dir, cache_path):
+        """Test that a cached file is not hashed again."""
+        path = os.path.join(temp_dir, 'a.bin')
+        calls = []
+
+        def compute():
+            calls.append(path)
+            return hash_file(path)
+
+        with HashCache(cache_path) as cache:
+            assert cache.digest(path, "blake2b", compute) == (hash_file(path), False)
+            assert cache.digest(path, "blake2b", compute) == (hash_file(path), True)
+            assert len(calls) == 1
+            assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_digests_match_hashing(self, temp_dir, cache_path):
+        """Test that cached digests equal the uncached helpers."""
+        path = os.path.join(temp_dir, 'c.bin')
+        with HashCache(cache_path) as cache:
+            assert cache.file_digest(path) == hash_file(path)
+            assert cache.sample_digest(path, 1024) == hash_sample(path, 20000, 1024)
+            # Different kinds are separate entries
+            assert len(cache) == 2
+
+    def test_modified_file_misses(self, temp_dir, cache_path):
+        """Test that a new mtime or size invalidates the entry."""
+        path = os.path.join(temp_dir, 'a.bin')
+        with HashCache(cache_path) as cache:
+            old = cache.file_digest(path)
+            with open(path, 'ab') as f:
+                f.write(b'more')
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+            assert cache.file_digest(path) != old
+            assert cache.misses == 2
+
+    def test_persists_across_runs(self, temp_dir, cache_path):
+        """Test that entries survive closing and reopening."""
+        path = os.path.join(temp_dir, 'a.bin')
+        with HashCache(cache_path) as cache:
+            cache.file_digest(path)
+
+        with HashCache(cache_path) as cache:
+            cache.file_digest(path)
+            assert cache.hits == 1
+
+    def test_least_recently_used_is_evicted(self, temp_dir, cache_path):
+        """Test that the entry used longest ago goes first."""
+        with HashCache(cache_path, max_entries=2, flush_every=1) as cache:
+            keys = [(0, inode, 1, 1, "blake2b") for inode in range(3)]
+            cache.put(keys[0], "zero")
+            cache.put(keys[1], "one")
+            assert cache.get(keys[0]) == "zero"   # now more recent than keys[1]
+            cache.put(keys[2], "two")
+
+            assert len(cache) == 2
+            assert cache.get(keys[1]) is None
+            assert cache.get(keys[0]) == "zero"
+            assert cache.get(keys[2]) == "two"
+
+    def test_invalid_max_entries(self, cache_path):
+        """Test that a cache without room raises ValueError."""
+        with pytest.raises(ValueError):
+            HashCache(cache_path, max_entries=0)
+
+    def test_repeat_duplicate_scan_reads_nothing(self, temp_dir, cache_path):
+        """Test that a second duplicate search over an unchanged tree does no reads."""
+        with HashCache(cache_path) as cache:
+            organizer = FileOrganizer(hash_cache=cache)
+            first = organizer.find_duplicates(temp_dir)
+            second = organizer.find_duplicates(temp_dir)
+
+        assert first['bytes_read'] > 0
+        assert second['bytes_read'] == 0
+        assert second['cache_hits'] == second['sample_hashed'] + second['fully_hashed']
+        assert second['groups'] == first['groups']
+        assert [len(group.paths) for group in second['groups']] == [2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Unit tests for Scan Pipeline module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scanner import Scanner
+from src.pipeline import ScanPipeline
+from src.aggregators import (
+    Aggregator, ExtensionCollector, SizeHistogram, TopNCollector, TotalsCollector
+)
+
+
+class EmptyFileCounter(Aggregator):
+    """Custom aggregator used to exercise the public interface."""
+
+    name = "empty_files"
+
+    def __init__(self):
+        self.count = 0
+
+    def add_batch(self, dirpath, files):
+        empty = sum(1 for _, st in files if st.st_size == 0)
+        self.count += empty
+        return empty > 0
+
+    def merge(self, other):
+        self.count += other.count
+
+    def spawn(self):
+        return EmptyFileCounter()
+
+    def result(self):
+        return self.count
+
+
+class TestScanPipeline:
+    """Test suite for ScanPipeline class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary tree with a few sizes and extensions."""
+        temp_path = tempfile.mkdtemp()
+
+        for i in range(20):
+            subdir = os.path.join(temp_path, f"dir_{i % 4}")
+            os.makedirs(subdir, exist_ok=True)
+            ext = ['.txt', '.pdf', '.MP4'][i % 3]
+            with open(os.path.join(subdir, f"file_{i}{ext}"), 'wb') as f:
+                f.write(b'0' * (i * 100))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _aggregators(self):
+        return [
+            TopNCollector(5), TotalsCollector(), ExtensionCollector(),
+            SizeHistogram(), EmptyFileCounter()
+        ]
+
+    def test_single_pass_feeds_every_aggregator(self, temp_dir):
+        """Test that one run fills all aggregators."""
+        results = ScanPipeline(self._aggregators()).run(temp_dir)
+
+        assert results["totals"] == {"file_count": 20, "total_size": sum(range(20)) * 100}
+        assert results["largest_files"][0][0] == 1900
+        assert {ext for ext, _, _ in results["extensions"]} == {'.txt', '.pdf', '.mp4'}
+        assert sum(count for _, _, count, _ in results["histogram"]) == 20
+        assert results["empty_files"] == 1
+
+    def test_each_file_is_scanned_once(self, temp_dir):
+        """Test that the pipeline walks the tree a single time."""
+        scanner = Scanner()
+        ScanPipeline(self._aggregators(), scanner).run(temp_dir)
+        assert scanner.file_count == 20
+
+    @pytest.mark.parametrize("workers,use_processes", [(3, False), (2, True)])
+    def test_concurrent_modes_match_serial(self, temp_dir, workers, use_processes):
+        """Test that threads and processes give the serial results."""
+        serial = ScanPipeline(self._aggregators()).run(temp_dir)
+        concurrent = ScanPipeline(
+            self._aggregators(), workers=workers, use_processes=use_processes
+        ).run(temp_dir)
+        assert concurrent == serial
+
+    def test_results_merged_into_given_aggregators(self, temp_dir):
+        """Test that the caller's aggregator objects hold the final result."""
+        totals = TotalsCollector()
+        ScanPipeline([totals], workers=2).run(temp_dir)
+        assert totals.file_count == 20
+
+    def test_invalid_workers(self):
+        """Test that workers below 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            ScanPipeline([TotalsCollector()], workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,134 @@
+"""
+Unit tests for Profiling module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.profiling import AGGREGATE, LIST, PHASES, STAT, ScanProfiler
+from src.aggregators import TopNCollector, TotalsCollector
+from src.file_organizer import FileOrganizer
+from src.pipeline import ScanPipeline
+from src.scanner import Scanner
+
+
+class TestProfiling:
+    """Test suite for the opt-in scan profiler."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a tree of 4 directories and 7 files."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'a.txt': 10,
+            'b.bin': 20,
+            'sub/c.log': 30,
+            'sub/d.txt': 40,
+            'sub/deeper/e.bin': 50,
+            'other/f.txt': 60,
+            'other/g.txt': 70,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def test_profiled_scan_matches_plain_scan(self, temp_dir):
+        """Test that profiling changes nothing but the profile."""
+        plain = Scanner()
+        expected = sorted(
+            (d, name, st.st_size) for d, files in plain.scan(temp_dir) for name, st in files
+        )
+
+        profiler = ScanProfiler()
+        scanner = Scanner(profiler=profiler, file_filter=lambda name: not name.endswith('.log'))
+        found = sorted(
+            (d, name, st.st_size) for d, files in scanner.scan(temp_dir) for name, st in files
+        )
+
+        assert found == [entry for entry in expected if not entry[1].endswith('.log')]
+        # The root is listed but not counted as a directory
+        assert scanner.counts()[:2] == (6, 3)
+        assert profiler.directories == profiler.calls['scandir'] == 4
+        # Filtered-out files are never stat'ed
+        assert profiler.calls['stat'] == 6
+        assert profiler.phase_ns[LIST] > 0 and profiler.phase_ns[STAT] > 0
+        assert sum(profiler.histogram) == 4
+        assert len(profiler.slowest()) == 4
+
+    def test_errors_counted(self, temp_dir):
+        """Test that a directory that cannot be listed counts as an error."""
+        profiler = ScanProfiler()
+        scanner = Scanner(profiler=profiler)
+        list(scanner.scan([temp_dir, os.path.join(temp_dir, 'missing')]))
+        assert profiler.calls['errors'] == scanner.error_count == 1
+        assert profiler.calls['scandir'] == 5
+
+    @pytest.mark.parametrize("workers,use_processes", [(1, False), (3, False), (2, True)])
+    def test_pipeline_profiles(self, temp_dir, workers, use_processes):
+        """Test that serial, threaded and process scans merge every worker's profile."""
+        profiler = ScanProfiler()
+        totals = TotalsCollector()
+        ScanPipeline([totals, TopNCollector(3)], Scanner(profiler=profiler),
+                     workers=workers, use_processes=use_processes).run(temp_dir)
+
+        assert totals.file_count == 7
+        assert profiler.calls['scandir'] == profiler.directories == 4
+        assert profiler.calls['stat'] == 7
+        assert profiler.phase_ns[AGGREGATE] > 0
+
+    def test_merge_and_slowest(self):
+        """Test the histogram buckets, the slowest list and merging."""
+        first, second = ScanProfiler(slowest=2), ScanProfiler(slowest=2)
+        first.record_directory('/fast', 500)
+        first.record_directory('/slow', 3_000_000)
+        second.record_directory('/slowest', 2_000_000_000)
+        second.add(STAT, 1000)
+
+        first.merge(pickle.loads(pickle.dumps(second)))
+        assert first.directories == 3
+        assert first.histogram[0] == 1
+        assert first.histogram[(3000).bit_length()] == 1
+        assert first.phase_ns[STAT] == 1000
+        assert [path for _, path in first.slowest()] == ['/slowest', '/slow']
+
+        first.reset()
+        assert first.directories == 0 and not first.slowest()
+
+    def test_organizer_profile(self, temp_dir):
+        """Test the organizer's per-scan profile and its report."""
+        profiler = ScanProfiler()
+        organizer = FileOrganizer(quiet=True, profiler=profiler)
+        organizer.find_largest_files(temp_dir, top_n=3)
+        organizer.get_directory_stats(temp_dir, workers=2)
+
+        # Reset for every scan: the profile describes the latest one
+        report = profiler.report()
+        assert report['directories'] == 4
+        assert set(report['phases']) == set(PHASES) | {'other'}
+        assert report['wall_seconds'] > 0
+        assert report['calls'] == {'scandir': 4, 'stat': 7, 'errors': 0}
+
+        lines = profiler.lines()
+        assert lines[0].startswith('Scan profile:')
+        assert any('Slowest directories' in line for line in lines)
+        assert any(temp_dir in line for line in lines)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
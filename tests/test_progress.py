@@ -0,0 +1,111 @@
+"""
+Unit tests for Progress module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import threading
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.progress import ProgressChannel, ProgressEvent, ProgressReporter
+from src.file_organizer import FileOrganizer
+
+
+class TestProgress:
+    """Test suite for throttled progress events and the progress channel."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create 120 files of 100 bytes in 12 folders."""
+        temp_path = tempfile.mkdtemp()
+        for index in range(120):
+            folder = os.path.join(temp_path, f"d{index % 12}")
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, f"f{index}.bin"), 'wb') as f:
+                f.write(b'x' * 100)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def test_reporter_throttles_and_always_finishes(self):
+        """Test that updates inside the interval are dropped but the final event is not."""
+        events = []
+        reporter = ProgressReporter([events.append], interval=60)
+        assert reporter.due()
+        assert reporter.update(10, 1, 1000, "/a") is not None
+        assert not reporter.due()
+        assert reporter.update(20, 2, 2000, "/b") is None
+
+        final = reporter.finish(30, 3, 3000, "/c")
+        assert [event.files_scanned for event in events] == [10, 30]
+        assert final.final and not events[0].final
+        assert final.bytes_seen == 3000 and final.dirs_scanned == 3
+
+    def test_channel_drops_oldest_without_blocking(self):
+        """Test that a full channel keeps the newest events."""
+        channel = ProgressChannel(maxsize=3)
+        for count in range(5):
+            channel(ProgressEvent(count, "", 0.0))
+        assert [event.files_scanned for event in channel.drain()] == [2, 3, 4]
+        assert channel.dropped == 2
+        assert channel.get(timeout=0.01) is None
+
+        with pytest.raises(ValueError):
+            ProgressChannel(maxsize=0)
+
+    def test_channel_dispatcher_thread(self):
+        """Test that the callback runs off the calling thread and survives errors."""
+        seen = []
+
+        def callback(event):
+            seen.append((event.files_scanned, threading.current_thread()))
+            if event.files_scanned == 0:
+                raise RuntimeError("consumer bug")
+
+        channel = ProgressChannel(callback=callback)
+        for count in range(3):
+            channel(ProgressEvent(count, "", 0.0))
+        channel.close()
+
+        assert [count for count, _ in seen] == [0, 1, 2]
+        assert all(thread is not threading.current_thread() for _, thread in seen)
+
+    def test_organizer_events(self, temp_dir):
+        """Test final counters for serial, threaded and process scans."""
+        for options in ({}, {'workers': 3}, {'workers': 2, 'use_processes': True}):
+            events = []
+            organizer = FileOrganizer(progress_listener=events.append, progress_interval=0)
+            organizer.find_largest_files(temp_dir, top_n=5, **options)
+
+            final = events[-1]
+            assert final.final and not any(event.final for event in events[:-1])
+            assert final.files_scanned == 120
+            assert final.dirs_scanned == 12
+            assert final.bytes_seen == 12000
+            counts = [event.files_scanned for event in events]
+            assert counts == sorted(counts)
+
+    def test_quiet_and_legacy_callback(self, temp_dir, capsys):
+        """Test that quiet scans print nothing and the old callback still fires."""
+        calls = []
+        organizer = FileOrganizer(progress_callback=lambda count, path: calls.append(count),
+                                  quiet=True)
+        organizer.analyze_directory(temp_dir, top_n=5)
+        assert capsys.readouterr().out == ""
+        assert calls and calls[-1] == 120
+
+        FileOrganizer(progress_interval=60).find_largest_files(temp_dir, top_n=5)
+        assert "Scan complete" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+"""
+Unit tests for Records module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import records as records_module
+from src.records import FileRecords
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestFileRecords:
+    """Test suite for the columnar record store."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a small tree with files of distinct sizes."""
+        temp_path = tempfile.mkdtemp()
+        for i in range(4):
+            subdir = os.path.join(temp_path, f"dir_{i}")
+            os.makedirs(subdir)
+            for j in range(5):
+                with open(os.path.join(subdir, f"file_{j}.txt"), 'wb') as f:
+                    f.write(b'x' * (i * 100 + j * 7))
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _walk(self, root):
+        found = set()
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                st = os.stat(path)
+                found.add((st.st_size, path, st.st_mtime_ns, st.st_ino))
+        return found
+
+    def test_collects_every_file(self, temp_dir):
+        """Test that records carry size, path, mtime and inode of each file."""
+        records = FileOrganizer().collect_records(temp_dir)
+
+        assert len(records) == 20
+        assert set(records) == self._walk(temp_dir)
+        # Directories are interned once
+        assert len(records.directories) == 4
+
+    def test_parallel_and_process_scans_agree(self, temp_dir):
+        """Test that merged worker stores hold the same records."""
+        expected = self._walk(temp_dir)
+        assert set(FileOrganizer().collect_records(temp_dir, workers=3)) == expected
+        processes = FileOrganizer().collect_records(temp_dir, workers=2, use_processes=True)
+        assert set(processes) == expected
+
+    def test_index_records_match_scan(self, temp_dir):
+        """Test that the index produces the same records as a scan."""
+        index = ScanIndex(os.path.join(tempfile.mkdtemp(), 'index.db'))
+        try:
+            records = FileOrganizer(index=index).collect_records(temp_dir, file_extension='.txt')
+        finally:
+            index.close()
+        assert set(records) == self._walk(temp_dir)
+
+    def test_largest_matches_find_largest_files(self, temp_dir):
+        """Test top-N and full ordering against the leaderboard."""
+        organizer = FileOrganizer()
+        records = organizer.collect_records(temp_dir)
+
+        expected = organizer.find_largest_files(temp_dir, top_n=5)
+        assert [(record.size, record.path) for record in records.largest(5)] == expected
+
+        sizes = [records.sizes[index] for index in records.order_by_size()]
+        assert sizes == sorted(records.sizes, reverse=True)
+
+        # The top records keep the scan's mtimes and inodes without a stat
+        top = FileRecords.from_records(records.largest(5))
+        assert list(top) == records.largest(5)
+
+    def test_undecodable_names_round_trip(self):
+        """Test that names that are not valid UTF-8 survive the byte buffer."""
+        name = os.fsdecode(b'caf\xe9.txt')
+        records = FileRecords()
+        records.append('/data', name, 10)
+        records.append('/data', 'second.txt', 20)
+        assert records.basename(0) == name
+        assert records.path(1) == os.path.join('/data', 'second.txt')
+
+    def test_from_pairs_and_pairs(self):
+        """Test conversion to and from (size, path) tuples."""
+        pairs = [(30, '/a/x.bin'), (20, '/b/y.bin'), (10, '/a/z.bin')]
+        records = FileRecords.from_pairs(pairs)
+        assert list(records.pairs()) == pairs
+        assert records.directories == ['/a', '/b']
+
+    def test_compact_representation(self):
+        """Test that a record costs a few dozen bytes plus its name."""
+        records = FileRecords()
+        for i in range(10000):
+            records.append(f'/data/dir_{i % 10}', f'file_{i:05d}.bin', i, i, i)
+        # 36 bytes of columns per record, 14 bytes of name, 10 short directories
+        assert records.nbytes < 10000 * 52
+
+    def test_numpy_is_optional(self):
+        """Test that NumPy views are zero-copy or report the missing dependency."""
+        records = FileRecords.from_pairs([(5, '/a/b')])
+        if records_module.np is None:
+            with pytest.raises(ImportError):
+                records.to_numpy()
+        else:
+            assert records.to_numpy()['sizes'].tolist() == [5]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,194 @@
+"""
+Unit tests for ScanIndex module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scan_index import ScanIndex
+from src.scanner import Scanner
+from src.aggregators import TopNCollector, TotalsCollector
+from src.file_organizer import FileOrganizer
+
+
+class TestScanIndex:
+    """Test suite for ScanIndex class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory tree and a separate index location."""
+        temp_path = tempfile.mkdtemp()
+        tree = os.path.join(temp_path, 'tree')
+
+        test_files = [
+            ('a.txt', 100),
+            ('b.pdf', 2000),
+            ('.hidden', 30),
+            (os.path.join('docs', 'c.pdf'), 5000),
+            (os.path.join('docs', 'old', 'd.txt'), 300),
+            (os.path.join('media', 'e.mp4'), 9000),
+            (os.path.join('media', 'f.mp4'), 9000),
+        ]
+
+        for relpath, size in test_files:
+            self._write(os.path.join(tree, relpath), size)
+
+        yield tree
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def index(self, temp_dir):
+        """Open an index stored next to (not inside) the scanned tree."""
+        index = ScanIndex(os.path.join(os.path.dirname(temp_dir), 'index.db'))
+        yield index
+        index.close()
+
+    def _write(self, path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'0' * size)
+
+    def _touch_dir(self, path):
+        """Bump a directory's mtime so the change is visible on coarse clocks."""
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def _scan(self, root, top_n=10):
+        largest = TopNCollector(top_n)
+        totals = TotalsCollector()
+        for dirpath, files in Scanner().scan(root):
+            largest.add_batch(dirpath, files)
+            totals.add_batch(dirpath, files)
+        return largest.results(), totals
+
+    def test_first_refresh_matches_scanner(self, temp_dir, index):
+        """Test that index queries equal a fresh scan."""
+        summary = index.refresh(temp_dir)
+        assert summary == {"scanned": 4, "unchanged": 0, "removed": 0}
+
+        expected, totals = self._scan(temp_dir)
+        assert index.largest_files(temp_dir, 10) == expected
+
+        stats = index.directory_stats(temp_dir)
+        assert stats["total_size"] == totals.total_size
+        assert stats["file_count"] == totals.file_count
+        assert stats["directory_count"] == 3
+
+    def test_second_refresh_reuses_unchanged_directories(self, temp_dir, index):
+        """Test that an unchanged tree is not re-listed."""
+        index.refresh(temp_dir)
+        summary = index.refresh(temp_dir)
+        assert summary == {"scanned": 0, "unchanged": 4, "removed": 0}
+        assert index.last_refreshed(temp_dir) is not None
+
+    def test_refresh_picks_up_changes(self, temp_dir, index):
+        """Test that added files and removed directories are reflected."""
+        index.refresh(temp_dir)
+
+        self._write(os.path.join(temp_dir, 'docs', 'huge.iso'), 20000)
+        self._touch_dir(os.path.join(temp_dir, 'docs'))
+        shutil.rmtree(os.path.join(temp_dir, 'media'))
+        self._touch_dir(temp_dir)
+
+        summary = index.refresh(temp_dir)
+        assert summary == {"scanned": 2, "unchanged": 1, "removed": 1}
+
+        expected, totals = self._scan(temp_dir)
+        assert index.largest_files(temp_dir, 10) == expected
+        assert index.largest_files(temp_dir, 1)[0][1].endswith('huge.iso')
+        assert index.directory_stats(temp_dir)["total_size"] == totals.total_size
+
+    def test_subdirectory_and_extension_queries(self, temp_dir, index):
+        """Test queries on part of the tree and with an extension filter."""
+        index.refresh(temp_dir)
+
+        docs = os.path.join(temp_dir, 'docs')
+        assert [path for _, path in index.largest_files(docs, 10)] == [
+            os.path.join(docs, 'c.pdf'),
+            os.path.join(docs, 'old', 'd.txt'),
+        ]
+        assert [size for size, _ in index.largest_files(temp_dir, 10, '.pdf')] == [5000, 2000]
+        assert index.directory_stats(docs)["file_count"] == 2
+
+    def test_unknown_root_is_empty(self, temp_dir, index):
+        """Test that a directory that was never indexed returns nothing."""
+        assert index.largest_files(temp_dir) == []
+        assert index.directory_stats(temp_dir)["file_count"] == 0
+        assert index.last_refreshed(temp_dir) is None
+
+    def test_refresh_missing_root_raises(self, index):
+        """Test that refreshing a missing directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            index.refresh("/nonexistent/path")
+
+    def test_include_hidden_change_clears_index(self, temp_dir, index):
+        """Test that reopening with another hidden-file setting starts over."""
+        index.refresh(temp_dir)
+        index.close()
+
+        reopened = ScanIndex(index.db_path, include_hidden=True)
+        try:
+            assert reopened.largest_files(temp_dir) == []
+            reopened.refresh(temp_dir)
+            assert reopened.directory_stats(temp_dir)["file_count"] == 7
+        finally:
+            reopened.close()
+
+    def test_file_organizer_uses_index(self, temp_dir, index):
+        """Test that an index-backed organizer returns the same answers."""
+        indexed = FileOrganizer(index=index, index_max_age=60)
+        plain = FileOrganizer()
+
+        assert indexed.find_largest_files(temp_dir, 3) == plain.find_largest_files(temp_dir, 3)
+        assert indexed.scan_count == plain.scan_count
+        assert indexed.get_directory_stats(temp_dir) == plain.get_directory_stats(
+            temp_dir, include_hidden=False
+        )
+
+    def test_largest_records(self, temp_dir, index):
+        """Test that the top files come with the mtimes and inodes of a full collection."""
+        organizer = FileOrganizer(index=index, index_max_age=60)
+        expected = organizer.collect_records(temp_dir).largest(3)
+
+        largest = organizer.find_largest_records(temp_dir, 3)
+        assert list(largest) == expected
+        assert [(r.size, r.path) for r in largest] == organizer.find_largest_files(temp_dir, 3)
+        # Several roots: each root's top files, then the overall top
+        roots = [os.path.join(temp_dir, 'docs'), os.path.join(temp_dir, 'media')]
+        assert list(organizer.find_largest_records(roots, 2)) == \
+            organizer.collect_records(roots).largest(2)
+        # Without an index only the top files are stat'ed
+        assert list(FileOrganizer().find_largest_records(temp_dir, 3)) == expected
+
+    def test_full_refresh_catches_growth_in_place(self, temp_dir, index):
+        """Test that index_full_every re-lists directories whose mtime did not change."""
+        path = os.path.join(temp_dir, 'docs', 'old', 'd.txt')
+        FileOrganizer(index=index).find_largest_files(temp_dir, 1)
+        directory = os.stat(os.path.dirname(path))
+        with open(path, 'ab') as f:
+            f.write(b'0' * 50000)   # appended: the directory's mtime stays the same
+        os.utime(os.path.dirname(path), ns=(directory.st_atime_ns, directory.st_mtime_ns))
+
+        # An mtime-based refresh keeps the old size
+        stale = FileOrganizer(index=index).find_largest_files(temp_dir, 1)
+        assert stale == [(9000, os.path.join(temp_dir, 'media', 'f.mp4'))]
+
+        organizer = FileOrganizer(index=index, index_max_age=3600, index_full_every=3600)
+        assert organizer.find_largest_files(temp_dir, 1) == [(50300, path)]
+        full_at = index.last_refreshed(temp_dir, full=True)
+        assert full_at is not None
+        # Not due again for an hour
+        organizer.find_largest_files(temp_dir, 1)
+        assert index.last_refreshed(temp_dir, full=True) == full_at
+
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,221 @@
+"""
+Unit tests for Scanner module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+from functools import partial
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scanner import Scanner
+from src.aggregators import TopNCollector, TotalsCollector
+
+
+class TestScanner:
+    """Test suite for Scanner class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory tree with visible and hidden entries."""
+        temp_path = tempfile.mkdtemp()
+
+        test_files = [
+            ('a.txt', 10),
+            ('b.pdf', 20),
+            ('.hidden', 30),
+            (os.path.join('sub', 'c.txt'), 40),
+            (os.path.join('sub', 'deeper', 'd.mp4'), 50),
+            (os.path.join('.git', 'config'), 60),
+        ]
+
+        for relpath, size in test_files:
+            filepath = os.path.join(temp_path, relpath)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, 'wb') as f:
+                f.write(b'0' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    def _collect(self, scanner, root):
+        return {
+            os.path.relpath(os.path.join(dirpath, name), root): st.st_size
+            for dirpath, files in scanner.scan(root)
+            for name, st in files
+        }
+
+    def test_skips_hidden_by_default(self, temp_dir):
+        """Test that dot-files and dot-directories are pruned by default."""
+        found = self._collect(Scanner(), temp_dir)
+        assert found == {
+            'a.txt': 10,
+            'b.pdf': 20,
+            os.path.join('sub', 'c.txt'): 40,
+            os.path.join('sub', 'deeper', 'd.mp4'): 50,
+        }
+
+    def test_include_hidden(self, temp_dir):
+        """Test that include_hidden reports every file."""
+        scanner = Scanner(include_hidden=True)
+        found = self._collect(scanner, temp_dir)
+        assert len(found) == 6
+        assert scanner.file_count == 6
+        assert scanner.dir_count == 3
+
+    def test_matches_os_walk(self, temp_dir):
+        """Test that results match os.walk + os.path.getsize."""
+        expected = {}
+        for dirpath, _, filenames in os.walk(temp_dir):
+            for filename in filenames:
+                filepath = os.path.join(dirpath, filename)
+                expected[os.path.relpath(filepath, temp_dir)] = os.path.getsize(filepath)
+
+        assert self._collect(Scanner(include_hidden=True), temp_dir) == expected
+
+    def test_file_filter_runs_before_stat(self, temp_dir):
+        """Test that rejected names are never stat'ed or counted."""
+        seen = []
+
+        def only_txt(name):
+            seen.append(name)
+            return name.endswith('.txt')
+
+        scanner = Scanner(file_filter=only_txt)
+        found = self._collect(scanner, temp_dir)
+        assert sorted(found) == ['a.txt', os.path.join('sub', 'c.txt')]
+        assert scanner.file_count == 2
+        assert 'b.pdf' in seen
+
+    def test_missing_root_reports_error(self):
+        """Test that an unreadable root is reported, not raised."""
+        errors = []
+        scanner = Scanner(on_error=lambda path, e: errors.append(path))
+        assert list(scanner.scan("/nonexistent/path")) == []
+        assert scanner.error_count == 1
+        assert errors == ["/nonexistent/path"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_symlinked_directory_not_followed(self, temp_dir):
+        """Test that symlinked directories are counted but not descended."""
+        os.symlink(os.path.join(temp_dir, 'sub'), os.path.join(temp_dir, 'link'))
+        scanner = Scanner()
+        found = self._collect(scanner, temp_dir)
+        assert not any(path.startswith('link') for path in found)
+        assert scanner.dir_count == 3
+
+    @pytest.mark.parametrize("workers", [1, 2, 4])
+    def test_scan_parallel_matches_serial(self, temp_dir, workers):
+        """Test that the threaded scan produces exactly the serial results."""
+        self._build_wide_tree(temp_dir)
+
+        serial = Scanner()
+        expected = TopNCollector(15)
+        for dirpath, files in serial.scan(temp_dir):
+            expected.add_batch(dirpath, files)
+
+        parallel = Scanner()
+        partials = parallel.scan_parallel(temp_dir, workers, lambda: TopNCollector(15))
+        assert len(partials) == workers
+        merged = partials[0]
+        for other in partials[1:]:
+            merged.merge(other)
+
+        assert merged.results() == expected.results()
+        assert parallel.file_count == serial.file_count
+        assert parallel.dir_count == serial.dir_count
+
+    def _build_wide_tree(self, root):
+        for i in range(30):
+            subdir = os.path.join(root, f"tree_{i % 5}", f"leaf_{i}")
+            os.makedirs(subdir, exist_ok=True)
+            for j in range(i % 4 + 1):
+                with open(os.path.join(subdir, f"f{j}.bin"), 'wb') as f:
+                    f.write(b'0' * (i * 10 + j))
+
+    @pytest.mark.parametrize("split_depth", [1, 3])
+    def test_scan_processes_matches_serial(self, temp_dir, split_depth):
+        """Test that the sharded process scan produces exactly the serial results."""
+        self._build_wide_tree(temp_dir)
+
+        serial = Scanner()
+        expected = TopNCollector(15)
+        for dirpath, files in serial.scan(temp_dir):
+            expected.add_batch(dirpath, files)
+
+        sharded = Scanner()
+        partials = sharded.scan_processes(
+            temp_dir, 2, partial(TopNCollector, 15), max_split_depth=split_depth
+        )
+        merged = partials[0]
+        for other in partials[1:]:
+            merged.merge(other)
+
+        assert merged.results() == expected.results()
+        assert sharded.file_count == serial.file_count
+        assert sharded.dir_count == serial.dir_count
+
+    def test_scan_processes_multiple_roots(self, temp_dir):
+        """Test that several roots are scanned as one combined tree."""
+        roots = [os.path.join(temp_dir, 'sub'), os.path.join(temp_dir, '.git')]
+        partials = Scanner(include_hidden=True).scan_processes(roots, 2, TotalsCollector)
+        assert sum(p.file_count for p in partials) == 3
+        assert sum(p.total_size for p in partials) == 40 + 50 + 60
+
+    def test_scan_processes_invalid_processes(self, temp_dir):
+        """Test that fewer than one process raises ValueError."""
+        with pytest.raises(ValueError):
+            Scanner().scan_processes(temp_dir, 0, TotalsCollector)
+
+    def test_scan_parallel_reports_errors(self):
+        """Test that errors from worker threads reach the error handler."""
+        errors = []
+        scanner = Scanner(on_error=lambda path, e: errors.append(path))
+        partials = scanner.scan_parallel("/nonexistent/path", 3, TotalsCollector)
+        assert sum(p.file_count for p in partials) == 0
+        assert scanner.error_count == 1
+        assert errors == ["/nonexistent/path"]
+
+    def test_scan_parallel_invalid_workers(self, temp_dir):
+        """Test that fewer than one worker raises ValueError."""
+        with pytest.raises(ValueError):
+            Scanner().scan_parallel(temp_dir, 0, TotalsCollector)
+
+    def test_check_cancelled_stops_scan(self, temp_dir):
+        """Test that raising from check_cancelled aborts serial and threaded scans."""
+        self._build_wide_tree(temp_dir)
+        calls = []
+
+        def check():
+            calls.append(1)
+            if len(calls) > 3:
+                raise KeyboardInterrupt
+
+        scanner = Scanner(check_cancelled=check)
+        with pytest.raises(KeyboardInterrupt):
+            list(scanner.scan(temp_dir))
+        assert len(calls) == 4
+
+        with pytest.raises(KeyboardInterrupt):
+            Scanner(check_cancelled=check).scan_parallel(temp_dir, 2, TotalsCollector)
+
+    def test_scan_parallel_propagates_sink_failure(self, temp_dir):
+        """Test that an exception in a worker is re-raised, not swallowed."""
+        class BrokenSink:
+            def add_batch(self, dirpath, files):
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            Scanner().scan_parallel(temp_dir, 2, BrokenSink)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,147 @@
+"""
+Unit tests for Snapshots module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.snapshots import Snapshot, diff_snapshots
+from src.file_organizer import FileOrganizer
+from src.scan_index import ScanIndex
+
+
+class TestSnapshots:
+    """Test suite for saved snapshots and the streaming diff."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a small tree whose names interleave files and folders."""
+        temp_path = tempfile.mkdtemp()
+        files = {
+            'a/x.log': 100,
+            'a/b/y.bin': 200,
+            'a/b-c/z.bin': 300,
+            'a/b/d/deep.bin': 400,
+            'e/keep.txt': 50,
+            'e/old.tmp': 700,
+        }
+        for relpath, size in files.items():
+            path = os.path.join(temp_path, *relpath.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+
+        yield temp_path
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def store(self):
+        """Directory for saved snapshots and spilled runs."""
+        path = tempfile.mkdtemp()
+        yield path
+        shutil.rmtree(path)
+
+    def _change_tree(self, root):
+        """Grow, shrink, add and remove files below a/b and e."""
+        with open(os.path.join(root, 'a', 'b', 'y.bin'), 'ab') as f:
+            f.write(b'x' * 5000)
+        with open(os.path.join(root, 'a', 'b', 'd', 'new.bin'), 'wb') as f:
+            f.write(b'x' * 1000)
+        with open(os.path.join(root, 'a', 'x.log'), 'wb') as f:
+            f.write(b'x' * 10)
+        os.remove(os.path.join(root, 'e', 'old.tmp'))
+
+    def test_save_and_read_in_subtree_order(self, temp_dir, store):
+        """Test the round trip and that spilled runs produce the same order."""
+        organizer = FileOrganizer()
+        saved = organizer.save_snapshot(temp_dir, os.path.join(store, 'one.snap'))
+        entries = list(saved)
+        assert saved.file_count == len(entries) == 6
+        assert saved.total_size == 1750
+        assert saved.roots == [os.path.abspath(temp_dir)]
+
+        relative = [os.path.relpath(path, temp_dir) for path, _, _ in entries]
+        # a/b's subtree is contiguous even though "b-c" sorts before "b/" as text
+        assert (relative.index(os.path.join('a', 'b', 'y.bin'))
+                < relative.index(os.path.join('a', 'b-c', 'z.bin')))
+        assert relative == sorted(relative, key=lambda path: path.split(os.sep))
+
+        with organizer.take_snapshot(temp_dir, memory_budget=300, spill_dir=store) as spilled:
+            assert spilled.run_count > 1
+            assert list(spilled) == entries
+        assert sorted(os.listdir(store)) == ['one.snap']
+
+        with open(os.path.join(store, 'bogus.snap'), 'wb') as f:
+            f.write(b'not a snapshot')
+        with pytest.raises(ValueError):
+            Snapshot(os.path.join(store, 'bogus.snap'))
+
+    def test_diff_reports_files_and_directories(self, temp_dir, store):
+        """Test added, removed, resized files and ranked directory deltas."""
+        organizer = FileOrganizer()
+        organizer.save_snapshot(temp_dir, os.path.join(store, 'before.snap'))
+        self._change_tree(temp_dir)
+
+        diff = organizer.compare_snapshot(os.path.join(store, 'before.snap'), top_n=5)
+
+        def join(*parts):
+            return os.path.join(temp_dir, *parts)
+
+        assert diff['counts'] == {'added': 1, 'removed': 1, 'grown': 1, 'shrunk': 1,
+                                  'modified': 0, 'unchanged': 3}
+        assert diff['added'] == [(1000, join('a', 'b', 'd', 'new.bin'))]
+        assert diff['removed'] == [(700, join('e', 'old.tmp'))]
+        assert [(c.path, c.delta) for c in diff['grown']] == [(join('a', 'b', 'y.bin'), 5000)]
+        assert [(c.path, c.delta) for c in diff['shrunk']] == [(join('a', 'x.log'), -90)]
+        assert diff['net_change'] == 5000 + 1000 - 90 - 700
+
+        # Recursive: a/ gained 6000 below a/b and lost 90 in x.log
+        assert [(d.path, d.size, d.file_count) for d in diff['directories_grown']] == [
+            (join('a', 'b'), 6000, 2), (join('a'), 5910, 3), (join('a', 'b', 'd'), 1000, 1),
+        ]
+        assert [(d.path, d.size) for d in diff['directories_shrunk']] == [(join('e'), 700)]
+
+        with pytest.raises(ValueError):
+            diff_snapshots(Snapshot(os.path.join(store, 'before.snap')), [], top_n=0)
+
+    def test_save_to_and_parallel_scans(self, temp_dir, store):
+        """Test that save_to replaces the baseline and workers give the same diff."""
+        organizer = FileOrganizer()
+        baseline = os.path.join(store, 'baseline.snap')
+        organizer.save_snapshot(temp_dir, baseline)
+        self._change_tree(temp_dir)
+
+        serial = organizer.compare_snapshot(baseline)
+        for options in ({'workers': 3}, {'workers': 2, 'use_processes': True}):
+            diff = organizer.compare_snapshot(baseline, **options)
+            assert {k: v for k, v in diff.items() if k != 'new'} == \
+                {k: v for k, v in serial.items() if k != 'new'}
+
+        organizer.compare_snapshot(baseline, save_to=baseline)
+        again = organizer.compare_snapshot(baseline)
+        assert again['counts']['unchanged'] == 6
+        assert again['added'] == again['removed'] == again['directories_grown'] == []
+
+    def test_index_snapshot_matches_scan(self, temp_dir, store):
+        """Test that snapshots answered from an index equal scanned ones."""
+        scanned = list(FileOrganizer().take_snapshot(temp_dir))
+        index = ScanIndex(os.path.join(store, 'index.db'))
+        try:
+            with FileOrganizer(index=index).take_snapshot(temp_dir) as indexed:
+                assert list(indexed) == scanned
+        finally:
+            index.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
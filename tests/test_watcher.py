@@ -0,0 +1,203 @@
+"""
+Unit tests for Watcher module.
+
+MIT License
+Copyright (c) 2025 Daniel
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scan_index import ScanIndex
+from src.exclusions import Exclusions
+from src.file_organizer import FileOrganizer
+from src.watcher import (
+    CREATED, DELETED, MODIFIED, OVERFLOW, FileEvent, IndexWatcher, InotifyBackend, WatchBackend
+)
+
+
+class FakeBackend(WatchBackend):
+    """Backend fed by the test instead of the operating system."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+        self.watched = []
+        self.closed = False
+
+    def watch(self, root):
+        self.watched.append(root)
+
+    def read_events(self, timeout):
+        events, self.events = self.events, []
+        if not events:
+            time.sleep(timeout)
+        return events
+
+    def close(self):
+        self.closed = True
+
+
+class TestIndexWatcher:
+    """Test suite for IndexWatcher class."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory tree next to an index file."""
+        temp_path = tempfile.mkdtemp()
+        tree = os.path.join(temp_path, 'tree')
+
+        for relpath, size in [('a.txt', 100), (os.path.join('sub', 'b.bin'), 500)]:
+            self._write(os.path.join(tree, relpath), size)
+
+        yield tree
+
+        shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def index(self, temp_dir):
+        index = ScanIndex(os.path.join(os.path.dirname(temp_dir), 'index.db'))
+        yield index
+        index.close()
+
+    def _write(self, path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'0' * size)
+
+    def test_events_coalesce_into_directories(self, temp_dir, index):
+        """Test that many events become one batch of changed directories."""
+        batches = []
+        backend = FakeBackend()
+        watcher = IndexWatcher(
+            index, temp_dir, backend, debounce=60, on_batch=lambda d, s: batches.append(d)
+        )
+        watcher.start()
+        try:
+            sub = os.path.join(temp_dir, 'sub')
+            self._write(os.path.join(sub, 'c.bin'), 900)
+            with open(os.path.join(temp_dir, 'a.txt'), 'ab') as f:
+                f.write(b'0' * 50)   # rewritten in place: no directory mtime change
+
+            watcher._coalesce([
+                FileEvent(CREATED, os.path.join(sub, 'c.bin'), False),
+                FileEvent(MODIFIED, os.path.join(sub, 'c.bin'), False),
+                FileEvent(MODIFIED, os.path.join(temp_dir, 'a.txt'), False),
+                FileEvent(MODIFIED, os.path.join(temp_dir, '.hidden'), False),
+                FileEvent(CREATED, '/elsewhere/x', False),
+            ], 0.0)
+
+            assert watcher._pending == {temp_dir, sub}
+            summary = watcher.flush()
+            assert summary["scanned"] == 2
+            assert batches == [{temp_dir, sub}]
+            assert index.largest_files(temp_dir, 2) == [
+                (900, os.path.join(sub, 'c.bin')),
+                (500, os.path.join(sub, 'b.bin')),
+            ]
+            assert index.directory_stats(temp_dir)["total_size"] == 150 + 500 + 900
+        finally:
+            watcher.stop()
+
+        assert backend.watched == [temp_dir]
+        assert backend.closed
+        assert not index.is_live(temp_dir)
+
+    def test_deleted_directory_is_pruned(self, temp_dir, index):
+        """Test that deleting a directory removes its subtree from the index."""
+        with IndexWatcher(index, temp_dir, FakeBackend(), debounce=60) as watcher:
+            sub = os.path.join(temp_dir, 'sub')
+            shutil.rmtree(sub)
+            watcher._coalesce([FileEvent(DELETED, sub, True)], 0.0)
+            assert watcher.flush()["removed"] == 1
+            assert index.directory_stats(temp_dir)["file_count"] == 1
+
+    def test_overflow_falls_back_to_refresh(self, temp_dir, index):
+        """Test that a lost-events marker triggers an incremental refresh."""
+        with IndexWatcher(index, temp_dir, FakeBackend(), debounce=60) as watcher:
+            watcher._coalesce([FileEvent(OVERFLOW, "", True)], 0.0)
+            assert watcher.flush()["unchanged"] == 2
+
+    def test_batches_with_exclusions(self, temp_dir):
+        """Test that batches on an index with exclusion rules report what was pruned."""
+        batches = []
+        index = ScanIndex(os.path.join(os.path.dirname(temp_dir), 'excluding.db'),
+                          exclusions=Exclusions(patterns=['*.log']))
+        try:
+            backend = FakeBackend()
+            watcher = IndexWatcher(index, temp_dir, backend, debounce=60,
+                                   on_batch=lambda d, s: batches.append(s),
+                                   on_error=lambda path, e: pytest.fail(f"{path}: {e}"))
+            watcher.start()
+            try:
+                self._write(os.path.join(temp_dir, 'sub', 'skip.log'), 700)
+                self._write(os.path.join(temp_dir, 'sub', 'keep.bin'), 300)
+                watcher._coalesce([
+                    FileEvent(CREATED, os.path.join(temp_dir, 'sub', 'skip.log'), False),
+                    FileEvent(CREATED, os.path.join(temp_dir, 'sub', 'keep.bin'), False),
+                ], 0.0)
+                summary = watcher.flush()
+                assert summary["scanned"] == 1
+                assert summary["pruned"] == 1
+                assert batches == [summary]
+                assert index.directory_stats(temp_dir)["total_size"] == 100 + 500 + 300
+            finally:
+                watcher.stop()
+            assert backend.closed
+        finally:
+            index.close()
+
+    def test_organizer_skips_refresh_while_live(self, temp_dir, index):
+        """Test that queries on a watched tree are answered without a refresh."""
+        organizer = FileOrganizer(index=index)
+        with IndexWatcher(index, temp_dir, FakeBackend(), debounce=60):
+            assert index.is_live(os.path.join(temp_dir, 'sub'))
+            refreshed = index.last_refreshed(temp_dir)
+            assert organizer.find_largest_files(temp_dir, 1) == [
+                (500, os.path.join(temp_dir, 'sub', 'b.bin'))
+            ]
+            assert index.last_refreshed(temp_dir) == refreshed
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_end_to_end(self, temp_dir, index):
+        """Test that real file-system events reach the index."""
+        applied = threading.Event()
+        watcher = IndexWatcher(
+            index, temp_dir, InotifyBackend(), debounce=0.05,
+            on_batch=lambda d, s: applied.set()
+        )
+        with watcher:
+            new_dir = os.path.join(temp_dir, 'new', 'deeper')
+            self._write(os.path.join(new_dir, 'big.iso'), 4000)
+
+            for _ in range(50):
+                assert applied.wait(5)
+                applied.clear()
+                if index.largest_files(temp_dir, 1) == [(4000, os.path.join(new_dir, 'big.iso'))]:
+                    break
+            else:
+                pytest.fail("created file never reached the index")
+
+            os.rename(os.path.join(temp_dir, 'new'), os.path.join(temp_dir, 'moved'))
+            moved = os.path.join(temp_dir, 'moved', 'deeper', 'big.iso')
+            for _ in range(50):
+                assert applied.wait(5)
+                applied.clear()
+                if index.largest_files(temp_dir, 1) == [(4000, moved)]:
+                    break
+            else:
+                pytest.fail("moved directory never reached the index")
+
+        assert index.directory_stats(temp_dir)["file_count"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])